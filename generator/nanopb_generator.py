@@ -9,23 +9,23 @@ nanopb_version = "nanopb-0.4.0-dev"
 import sys
 import re
 import codecs
-import copy
-from functools import reduce
+import struct
 
-try:
+if getattr(sys, 'frozen', False):
     # Add some dummy imports to keep packaging tools happy.
-    import google, distutils.util # bbfreeze seems to need these
-    import pkg_resources # pyinstaller / protobuf 2.5 seem to need these
-except:
-    # Don't care, we will error out later if it is actually important.
-    pass
-
+    # They are slow to import, so skip them when not running frozen.
+    try:
+        import google, distutils.util # bbfreeze seems to need these
+        import pkg_resources # pyinstaller / protobuf 2.5 seem to need these
+        import google.protobuf.text_format, google.protobuf.compiler.plugin_pb2
+    except:
+        # Don't care, we will error out later if it is actually important.
+        pass
+
+# The text_format and plugin_pb2 modules are imported only where needed,
+# to keep the startup fast for the common case.
 try:
-    import google.protobuf.text_format as text_format
     import google.protobuf.descriptor_pb2 as descriptor
-    import google.protobuf.compiler.plugin_pb2 as plugin_pb2
-    import google.protobuf.reflection as reflection
-    import google.protobuf.descriptor
 except:
     sys.stderr.write('''
          *************************************************************
@@ -36,6 +36,10 @@ except:
     raise
 
 try:
+    import proto
+    # Also when imported as a module, e.g. by nanopb_server.py or for the
+    # generate() function. The check is only a comparison of file dates.
+    proto.rebuild_if_needed()
     import proto.nanopb_pb2 as nanopb_pb2
 except TypeError:
     sys.stderr.write('''
@@ -63,6 +67,171 @@ except:
     ''' + '\n')
     raise
 
+# ---------------------------------------------------------------------------
+#                     Timing of generator phases
+# ---------------------------------------------------------------------------
+# Enabled by the --timings and --profile options. The phases are measured
+# with a stack, so that the time spent in nested phases (such as
+# get_nanopb_suboptions() inside ProtoFile.parse()) can be reported both
+# as part of the outer phase and separately.
+
+import timeit
+import threading
+
+class Timings:
+    '''Collects wall time and number of allocated memory blocks for each
+    generator phase, and the time spent on each message.'''
+    def __init__(self):
+        self.phases = {} # name: [calls, total time, self time, blocks]
+        self.order = []
+        self.messages = {} # message name: time
+        self.stack = []
+
+    def start(self, phase):
+        self.stack.append([phase, timeit.default_timer(), allocated_blocks(), 0.0])
+
+    def stop(self):
+        phase, start, blocks, child_time = self.stack.pop()
+        elapsed = timeit.default_timer() - start
+        if blocks is not None:
+            blocks = allocated_blocks() - blocks
+
+        if self.stack:
+            self.stack[-1][3] += elapsed
+
+        self.add_phase(phase, elapsed, elapsed - child_time, blocks)
+
+    def add_phase(self, phase, elapsed, self_time, blocks):
+        '''Add one measurement of the phase. Used also for phases that
+        have to be measured before timings are enabled.'''
+        if phase not in self.phases:
+            self.phases[phase] = [0, 0.0, 0.0, 0]
+            self.order.append(phase)
+        stats = self.phases[phase]
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] += self_time
+        if blocks is None:
+            stats[3] = None
+        elif stats[3] is not None:
+            stats[3] += blocks
+
+    def add_message_time(self, name, elapsed):
+        self.messages[name] = self.messages.get(name, 0.0) + elapsed
+
+    def slowest_messages(self, count):
+        '''Returns list of (name, time) for the slowest messages.'''
+        items = sorted(self.messages.items(), key = lambda x: (-x[1], x[0]))
+        return items[:count]
+
+    def to_dict(self):
+        '''Returns the results in a form suitable for JSON output.'''
+        phases = []
+        for phase in self.order:
+            calls, total, self_time, blocks = self.phases[phase]
+            phases.append({'phase': phase, 'calls': calls,
+                           'total_seconds': total, 'self_seconds': self_time,
+                           'allocated_blocks': blocks})
+        messages = [{'message': name, 'seconds': elapsed}
+                    for name, elapsed in self.slowest_messages(len(self.messages))]
+        return {'phases': phases, 'messages': messages}
+
+    def format_phases(self):
+        '''Returns the phase timings as a text table.'''
+        lines = ['%-24s %8s %10s %10s %12s\n' % ('Phase', 'Calls', 'Total ms', 'Self ms', 'Blocks')]
+        for phase in self.order:
+            calls, total, self_time, blocks = self.phases[phase]
+            if blocks is None:
+                blocks = '-'
+            lines.append('%-24s %8d %10.1f %10.1f %12s\n'
+                         % (phase, calls, total * 1000, self_time * 1000, blocks))
+        return ''.join(lines)
+
+    def format_messages(self, count):
+        '''Returns the slowest messages as a text table.'''
+        lines = ['%-40s %10s\n' % ('Message', 'Time ms')]
+        for name, elapsed in self.slowest_messages(count):
+            lines.append('%-40s %10.1f\n' % (name, elapsed * 1000))
+        return ''.join(lines)
+
+def allocated_blocks():
+    '''Number of memory blocks currently allocated by the interpreter,
+    or None if not available (Python 2).'''
+    try:
+        return sys.getallocatedblocks()
+    except AttributeError:
+        return None
+
+class TimedPhase:
+    '''Context manager for measuring one phase.'''
+    def __init__(self, timings, phase):
+        self.timings = timings
+        self.phase = phase
+
+    def __enter__(self):
+        self.timings.start(self.phase)
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.timings.stop()
+
+class TimedMessage:
+    '''Context manager for adding the time spent on a message.
+    Does not affect the phase timings.'''
+    def __init__(self, timings, name):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.start = timeit.default_timer()
+
+    def __exit__(self, exc_type, exc_value, tb):
+        elapsed = timeit.default_timer() - self.start
+        self.timings.add_message_time(str(self.name), elapsed)
+
+class NotTimed:
+    '''Context manager used when timings are not enabled.'''
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc_value, tb):
+        pass
+
+not_timed = NotTimed()
+
+class TimingState(threading.local):
+    '''The Timings collected by the current thread, or None if not enabled.'''
+    timings = None
+
+timing_state = TimingState()
+
+def timed(phase):
+    '''Returns a context manager that measures the phase if timings are
+    enabled.'''
+    if timing_state.timings is None:
+        return not_timed
+    return TimedPhase(timing_state.timings, phase)
+
+def timed_message(name):
+    '''Returns a context manager that adds the time spent inside it to
+    the message, if timings are enabled.'''
+    if timing_state.timings is None:
+        return not_timed
+    return TimedMessage(timing_state.timings, name)
+
+def timed_function(phase):
+    '''Decorator that measures every call to the function as the phase.'''
+    def decorator(func):
+        def wrapper(*args, **kwargs):
+            timings = timing_state.timings
+            if timings is None:
+                return func(*args, **kwargs)
+            with TimedPhase(timings, phase):
+                return func(*args, **kwargs)
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        return wrapper
+    return decorator
+
 # ---------------------------------------------------------------------------
 #                     Generation of single fields
 # ---------------------------------------------------------------------------
@@ -121,17 +290,178 @@ except NameError:
     strtypes = (str, )
 
 
-class Names:
-    '''Keeps a set of nested names and formats them to C identifier.'''
+# Initializer literals that set all of the memory to zero
+zero_initializers = ('0', 'false', '""', '{0}', '{0, {0}}', '0u', '0ull', '0ll')
+
+# Low-level encoding of each field type, as handled by the specialized
+# encoder and decoder functions. Matches the PB_LTYPE_MAP_* in pb.h, except
+# that bool is handled separately from other varints.
+specialized_ltypes = {
+    'BOOL': 'BOOL', 'INT32': 'VARINT', 'INT64': 'VARINT', 'ENUM': 'VARINT',
+    'UINT32': 'UVARINT', 'UINT64': 'UVARINT', 'UENUM': 'UVARINT',
+    'SINT32': 'SVARINT', 'SINT64': 'SVARINT',
+    'FIXED32': 'FIXED32', 'SFIXED32': 'FIXED32', 'FLOAT': 'FIXED32',
+    'FIXED64': 'FIXED64', 'SFIXED64': 'FIXED64', 'DOUBLE': 'FIXED64',
+    'STRING': 'STRING', 'BYTES': 'BYTES', 'MESSAGE': 'SUBMESSAGE',
+    'FIXED_LENGTH_BYTES': 'FIXED_LENGTH_BYTES',
+}
+
+def indent(lines, levels = 1):
+    '''Indent lines of C code by 4 spaces per level.'''
+    return [('    ' * levels + line) if line else line for line in lines]
+
+def code_block(header, statements):
+    '''Return C statement such as if or for, with statements as the body.'''
+    if len(statements) == 1:
+        return [header] + indent(statements)
+    elif statements[0] == '{' and '}' not in statements[1:-1]:
+        # Already a single block
+        return [header] + statements
+    else:
+        return [header, '{'] + indent(statements) + ['}']
+
+def if_block(condition, statements):
+    '''Return C if statement that executes statements if condition is true.'''
+    return code_block('if (%s)' % condition, statements)
+
+def check_call(call, fail = ['return false;']):
+    '''Return C statements that execute fail if call returns false.'''
+    return if_block('!' + call, fail)
+
+def unused_parameters(statements, parameters):
+    '''Return PB_UNUSED() statements for the function parameters that
+    are not referred to in statements.'''
+    result = []
+    for parameter in parameters:
+        pattern = re.compile(r'\b%s\b' % parameter)
+        if not [line for line in statements if pattern.search(line)]:
+            result.append('PB_UNUSED(%s);' % parameter)
+    return result
+
+class TargetABI(object):
+    '''Sizes and alignments of the C types used in the generated structs,
+    as (size, alignment) tuples. These are used for ordering the struct
+    members and for choosing the field descriptor width.
+
+    The spec is a preset name optionally followed by overrides, for
+    example "ilp32" or "lp64,pb_size_t=4,int64=8:4". The default preset is
+    an upper bound of the common targets, so that it is correct also when
+    compiling with PB_FIELD_32BIT. The other presets assume that pb_size_t
+    is 16 bits, unless it is overridden to 4 bytes.
+    '''
+    __slots__ = ('name', 'overrides', 'types', 'field_32bit')
+
+    base_types = {'bool': (1, 1), 'int8': (1, 1), 'int16': (2, 2), 'int32': (4, 4),
+                  'float': (4, 4), 'enum': (4, 4)}
+
+    presets = {
+        'default': {'pointer': (8, 8), 'int64': (8, 8), 'double': (8, 8), 'pb_size_t': (4, 4)},
+        'lp64':    {'pointer': (8, 8), 'int64': (8, 8), 'double': (8, 8), 'pb_size_t': (2, 2)},
+        'ilp32':   {'pointer': (4, 4), 'int64': (8, 8), 'double': (8, 8), 'pb_size_t': (2, 2)},
+        'i386':    {'pointer': (4, 4), 'int64': (8, 4), 'double': (8, 4), 'pb_size_t': (2, 2)},
+    }
+
+    def __init__(self, spec = 'default'):
+        parts = spec.split(',')
+        name = parts[0].strip() or 'default'
+        if name not in self.presets:
+            raise Exception("Unknown target ABI '%s', valid choices are: %s"
+                            % (name, ', '.join(sorted(self.presets))))
+
+        self.name = name
+        self.overrides = [part.strip() for part in parts[1:]]
+        self.types = dict(self.base_types)
+        self.types.update(self.presets[name])
+
+        for override in self.overrides:
+            try:
+                typename, value = override.split('=')
+                typename = typename.strip()
+                if ':' in value:
+                    size, align = [int(x) for x in value.split(':')]
+                else:
+                    size = align = int(value)
+            except ValueError:
+                raise Exception("Invalid target ABI override '%s', expected TYPE=SIZE[:ALIGN]" % override)
+
+            if typename not in self.types:
+                raise Exception("Unknown type '%s' in target ABI, valid choices are: %s"
+                                % (typename, ', '.join(sorted(self.types))))
+            if size <= 0 or align <= 0 or align & (align - 1):
+                raise Exception("Invalid size or alignment in target ABI override '%s'" % override)
+            self.types[typename] = (size, align)
+
+        self.field_32bit = (name != 'default' and self.types['pb_size_t'][0] == 4)
+
+    def __str__(self):
+        return ','.join([self.name] + self.overrides)
+
+    def layout(self, typename):
+        return self.types[typename]
+
+    def ordering_abi(self):
+        '''Return the ABI used for ordering the struct members. The default
+        preset does not match any real target, so lp64 is used instead.'''
+        if self.name != 'default':
+            return self
+        return TargetABI(','.join(['lp64'] + self.overrides))
+
+    def callback_layout(self):
+        return struct_layout([self.types['pointer'], self.types['pointer']])
+
+def align_up(offset, alignment):
+    return (offset + alignment - 1) // alignment * alignment
+
+def struct_layout(members):
+    '''Return (size, alignment) of a C struct that has the given
+    (size, alignment) members in order.'''
+    offset = 0
+    alignment = 1
+    for size, align in members:
+        offset = align_up(offset, align) + size
+        alignment = max(alignment, align)
+    return (align_up(offset, alignment), alignment)
+
+def descriptor_fits(width, tag, data_offset, data_size, size_offset, array_size, field_32bit = False):
+    '''Check the field descriptor values against PB_FIELDINFO_ASSERT_* in pb.h.'''
+    if width == 1:
+        limits = (6, 8, 4, 4, 1)
+    elif width == 2:
+        limits = (10, 16, 4, 12, 12)
+    elif not field_32bit:
+        limits = (16, 16, 7, 16, 16)
+    elif width == 4:
+        limits = (30, 31, 7, 31, 16)
+    else:
+        limits = (30, 31, 7, 31, 31)
+
+    values = (tag, data_offset, size_offset, data_size, array_size)
+    return all(0 <= value < 2**bits for value, bits in zip(values, limits))
+
+def union_layout(members):
+    '''Return (size, alignment) of a C union that has the given members.'''
+    alignment = max([align for size, align in members] + [1])
+    size = max([size for size, align in members] + [0])
+    return (align_up(size, alignment), alignment)
+
+class Names(object):
+    '''Keeps a set of nested names and formats them to C identifier.
+    Names are immutable, so the C identifier is cached after it has been
+    formatted once.'''
+    __slots__ = ('parts', 'joined')
+
     def __init__(self, parts = ()):
         if isinstance(parts, Names):
             parts = parts.parts
         elif isinstance(parts, strtypes):
             parts = (parts,)
         self.parts = tuple(parts)
+        self.joined = None
 
     def __str__(self):
-        return '_'.join(self.parts)
+        if self.joined is None:
+            self.joined = '_'.join(self.parts)
+        return self.joined
 
     def __add__(self, other):
         if isinstance(other, strtypes):
@@ -146,6 +476,12 @@ class Names:
     def __eq__(self, other):
         return isinstance(other, Names) and self.parts == other.parts
 
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.parts)
+
 def names_from_type_name(type_name):
     '''Parse Names() from FieldDescriptorProto type_name'''
     if type_name[0] != '.':
@@ -166,41 +502,96 @@ assert varint_max_size(0) == 1
 assert varint_max_size(127) == 1
 assert varint_max_size(128) == 2
 
-class EncodedSize:
+def encode_varint(value):
+    '''Encode an integer as protobuf varint. Negative values are encoded
+    as 64-bit two's complement, the same way as protobuf encodes them.'''
+    if value < 0:
+        value += 2**64
+    result = bytearray()
+    while value > 0x7F:
+        result.append((value & 0x7F) | 0x80)
+        value >>= 7
+    result.append(value)
+    return bytes(result)
+
+assert encode_varint(0) == b'\x00'
+assert encode_varint(300) == b'\xac\x02'
+assert encode_varint(-1) == b'\xff' * 9 + b'\x01'
+
+class EncodedSize(object):
     '''Class used to represent the encoded size of a field or a message.
-    Consists of a combination of symbolic sizes and integer sizes.'''
-    def __init__(self, value = 0, symbols = []):
+    Consists of an integer constant and a dictionary of symbolic sizes,
+    mapping each symbol to its multiplier. Constants are folded and
+    repeated symbols are combined on every operation, so the result is
+    the same regardless of the order in which sizes are added.
+    EncodedSize objects are never modified after construction.'''
+    __slots__ = ('value', 'symbols')
+
+    def __init__(self, value = 0, symbols = None):
         if isinstance(value, EncodedSize):
             self.value = value.value
             self.symbols = value.symbols
         elif isinstance(value, strtypes + (Names,)):
-            self.symbols = [str(value)]
+            self.symbols = {str(value): 1}
             self.value = 0
         else:
             self.value = value
-            self.symbols = symbols
+            if symbols is None:
+                self.symbols = {}
+            elif isinstance(symbols, dict):
+                self.symbols = symbols
+            else:
+                self.symbols = {}
+                for symbol in symbols:
+                    self.symbols[symbol] = self.symbols.get(symbol, 0) + 1
+
+    @staticmethod
+    def sum(sizes):
+        '''Add up an iterable of EncodedSize objects and integers without
+        creating the intermediate results.'''
+        value = 0
+        symbols = {}
+        for size in sizes:
+            if isinstance(size, EncodedSize):
+                value += size.value
+                for symbol, count in size.symbols.items():
+                    symbols[symbol] = symbols.get(symbol, 0) + count
+            else:
+                value += size
+        return EncodedSize(value, symbols)
 
     def __add__(self, other):
         if isinstance(other, int):
             return EncodedSize(self.value + other, self.symbols)
         elif isinstance(other, strtypes + (Names,)):
-            return EncodedSize(self.value, self.symbols + [str(other)])
+            return EncodedSize.sum([self, EncodedSize(other)])
         elif isinstance(other, EncodedSize):
-            return EncodedSize(self.value + other.value, self.symbols + other.symbols)
+            return EncodedSize.sum([self, other])
         else:
             raise ValueError("Cannot add size: " + repr(other))
 
     def __mul__(self, other):
         if isinstance(other, int):
-            return EncodedSize(self.value * other, [str(other) + '*' + s for s in self.symbols])
+            symbols = dict((s, c * other) for s, c in self.symbols.items() if c * other)
+            return EncodedSize(self.value * other, symbols)
         else:
             raise ValueError("Cannot multiply size: " + repr(other))
 
+    def terms(self):
+        '''Return the symbolic part as a list of strings, sorted by symbol.'''
+        result = []
+        for symbol, count in sorted(self.symbols.items()):
+            if count == 1:
+                result.append(symbol)
+            else:
+                result.append('%d*%s' % (count, symbol))
+        return result
+
     def __str__(self):
         if not self.symbols:
             return str(self.value)
         else:
-            return '(' + str(self.value) + ' + ' + ' + '.join(self.symbols) + ')'
+            return '(' + str(self.value) + ' + ' + ' + '.join(self.terms()) + ')'
 
     def upperlimit(self):
         if not self.symbols:
@@ -226,6 +617,11 @@ class Enum:
         self.value_longnames = [self.names + x.name for x in desc.value]
         self.packed = enum_options.packed_enum
 
+        # Lookup from the parts of a long value name to the C name of the value
+        self.longname_values = {}
+        for longname, (name, number) in zip(self.value_longnames, self.values):
+            self.longname_values.setdefault(longname.parts, name)
+
     def has_negative(self):
         for n, v in self.values:
             if v < 0:
@@ -235,6 +631,19 @@ class Enum:
     def encoded_size(self):
         return max([varint_max_size(v) for n,v in self.values])
 
+    def packed_size(self):
+        '''Return the size of the smallest integer type that can hold
+        the values, which is the size of a packed enum.'''
+        low = min([v for n,v in self.values])
+        high = max([v for n,v in self.values])
+        for size in (1, 2, 4):
+            bits = size * 8
+            if low >= 0 and high < 2**bits:
+                return size
+            elif low >= -2**(bits - 1) and high < 2**(bits - 1):
+                return size
+        return 8
+
     def __str__(self):
         result = 'typedef enum _%s {\n' % self.names
         result += ',\n'.join(["    %s = %d" % x for x in self.values])
@@ -278,7 +687,9 @@ class Enum:
 
         return result
 
-class FieldMaxSize:
+class FieldMaxSize(object):
+    __slots__ = ('worst', 'worst_field', 'checks')
+
     def __init__(self, worst = 0, checks = [], field_name = 'undefined'):
         if isinstance(worst, list):
             self.worst = max(i for i in worst if i is not None)
@@ -296,7 +707,13 @@ class FieldMaxSize:
 
         self.checks.extend(extend.checks)
 
-class Field:
+class Field(object):
+    __slots__ = ('tag', 'struct_name', 'union_name', 'name', 'default',
+                 'max_size', 'max_count', 'array_decl', 'enc_size',
+                 'data_item_size', 'ctype', 'fixed_count', 'callback_datatype',
+                 'rules', 'allocation', 'pbtype', 'submsgname', 'anonymous',
+                 'compact_init')
+
     def __init__(self, struct_name, desc, field_options):
         '''desc is FieldDescriptorProto'''
         self.tag = desc.number
@@ -312,13 +729,19 @@ class Field:
         self.ctype = None
         self.fixed_count = False
         self.callback_datatype = field_options.callback_datatype
+        self.compact_init = field_options.compact_initializers
+
+        # The options object is shared and read-only, so the values that
+        # need to be adjusted are kept in local variables.
+        field_type = field_options.type
+        fixed_length = field_options.fixed_length
 
-        if field_options.type == nanopb_pb2.FT_INLINE:
+        if field_type == nanopb_pb2.FT_INLINE:
             # Before nanopb-0.3.8, fixed length bytes arrays were specified
             # by setting type to FT_INLINE. But to handle pointer typed fields,
             # it makes sense to have it as a separate option.
-            field_options.type = nanopb_pb2.FT_STATIC
-            field_options.fixed_length = True
+            field_type = nanopb_pb2.FT_STATIC
+            fixed_length = True
 
         # Parse field options
         if field_options.HasField("max_size"):
@@ -363,13 +786,13 @@ class Field:
             can_be_static = False
 
         # Decide how the field data will be allocated
-        if field_options.type == nanopb_pb2.FT_DEFAULT:
+        if field_type == nanopb_pb2.FT_DEFAULT:
             if can_be_static:
-                field_options.type = nanopb_pb2.FT_STATIC
+                field_type = nanopb_pb2.FT_STATIC
             else:
-                field_options.type = nanopb_pb2.FT_CALLBACK
+                field_type = nanopb_pb2.FT_CALLBACK
 
-        if field_options.type == nanopb_pb2.FT_STATIC and not can_be_static:
+        if field_type == nanopb_pb2.FT_STATIC and not can_be_static:
             raise Exception("Field '%s' is defined as static, but max_size or "
                             "max_count is not given." % self.name)
 
@@ -377,14 +800,14 @@ class Field:
             raise Exception("Field '%s' is defined as fixed count, "
                             "but max_count is not given." % self.name)
 
-        if field_options.type == nanopb_pb2.FT_STATIC:
+        if field_type == nanopb_pb2.FT_STATIC:
             self.allocation = 'STATIC'
-        elif field_options.type == nanopb_pb2.FT_POINTER:
+        elif field_type == nanopb_pb2.FT_POINTER:
             self.allocation = 'POINTER'
-        elif field_options.type == nanopb_pb2.FT_CALLBACK:
+        elif field_type == nanopb_pb2.FT_CALLBACK:
             self.allocation = 'CALLBACK'
         else:
-            raise NotImplementedError(field_options.type)
+            raise NotImplementedError(field_type)
 
         # Decide the C data type to use in the struct.
         if desc.type in datatypes:
@@ -410,7 +833,7 @@ class Field:
                 # check the presence of it.
                 self.enc_size = varint_max_size(self.max_size) + self.max_size - 1
         elif desc.type == FieldD.TYPE_BYTES:
-            if field_options.fixed_length:
+            if fixed_length:
                 self.pbtype = 'FIXED_LENGTH_BYTES'
 
                 if self.max_size is None:
@@ -478,11 +901,15 @@ class Field:
         else:
             return []
 
-    def get_initializer(self, null_init, inner_init_only = False):
+    def get_initializer(self, null_init, inner_init_only = False, dependencies = None):
         '''Return literal expression for this field's default value.
         null_init: If True, initialize to a 0 value instead of default from .proto
         inner_init_only: If True, exclude initialization for any count/has fields
+        dependencies: Known messages and enums, used for checking whether
+                      arrays can be initialized compactly.
         '''
+        if dependencies is None:
+            dependencies = {}
 
         inner_init = None
         if self.pbtype == 'MESSAGE':
@@ -533,10 +960,17 @@ class Field:
 
         outer_init = None
         if self.allocation == 'STATIC':
-            if self.rules == 'REPEATED':
-                outer_init = '0, {' + ', '.join([inner_init] * self.max_count) + '}'
-            elif self.rules == 'FIXARRAY':
-                outer_init = '{' + ', '.join([inner_init] * self.max_count) + '}'
+            if self.rules in ('REPEATED', 'FIXARRAY'):
+                if self.compact_init and self.has_zero_init(null_init, dependencies):
+                    # Rest of the array is zero-initialized by the compiler
+                    elements = inner_init
+                else:
+                    elements = ', '.join([inner_init] * self.max_count)
+
+                if self.rules == 'REPEATED':
+                    outer_init = '0, {' + elements + '}'
+                else:
+                    outer_init = '{' + elements + '}'
             elif self.rules == 'OPTIONAL':
                 outer_init = 'false, ' + inner_init
             else:
@@ -554,6 +988,22 @@ class Field:
 
         return outer_init
 
+    def has_zero_init(self, null_init, dependencies):
+        '''Return True if the initializer of this field sets all of its
+        memory to zero. Returns False if this cannot be determined.'''
+        if self.allocation != 'STATIC':
+            return True # NULL pointers and callbacks
+        elif self.pbtype == 'MESSAGE':
+            submsg = dependencies.get(str(self.submsgname))
+            return submsg is not None and submsg.has_zero_init(null_init, dependencies)
+        elif self.pbtype in ('ENUM', 'UENUM'):
+            enumtype = dependencies.get(str(self.ctype))
+            if enumtype is None or (self.default is not None and not null_init):
+                return False
+            return enumtype.values[0][1] == 0 # Value of _EnumName_MIN
+        else:
+            return self.get_initializer(null_init, True) in zero_initializers
+
     def tags(self):
         '''Return the #define for the tag number of this field.'''
         identifier = '%s_%s_tag' % (self.struct_name, self.name)
@@ -575,18 +1025,595 @@ class Field:
 
         return 'X(a, %s, %s, %s, %s, %d)' % (self.allocation, self.rules, self.pbtype, name, self.tag)
 
-    def data_size(self, dependencies):
+    def specialized_ltype(self):
+        '''Return the low-level encoding of this field, see specialized_ltypes.'''
+        return specialized_ltypes[self.pbtype]
+
+    def is_packable(self):
+        '''Return True if repeated values of this field are encoded as a packed array.'''
+        return self.specialized_ltype() in ('BOOL', 'VARINT', 'UVARINT', 'SVARINT',
+                                            'FIXED32', 'FIXED64')
+
+    def wire_type(self):
+        '''Return the wire type used for a single value of this field.'''
+        ltype = self.specialized_ltype()
+        if ltype in ('BOOL', 'VARINT', 'UVARINT', 'SVARINT'):
+            return 'PB_WT_VARINT'
+        elif ltype == 'FIXED32':
+            return 'PB_WT_32BIT'
+        elif ltype == 'FIXED64':
+            return 'PB_WT_64BIT'
+        else:
+            return 'PB_WT_STRING'
+
+    def member(self, prefix = 'msg->'):
+        '''Return C expression for accessing this field in the message struct.'''
+        if self.rules == 'ONEOF' and not self.anonymous:
+            return prefix + self.union_name + '.' + self.name
+        else:
+            return prefix + self.name
+
+    def proto3_nonzero(self, prefix, dependencies):
+        '''Return C expression that is true if this field does not have the
+        zero value, i.e. the negation of pb_check_proto3_default_value().'''
+        member = self.member(prefix)
+        ltype = self.specialized_ltype()
+        if self.rules == 'REQUIRED' or self.rules == 'FIXARRAY':
+            return '1'
+        elif self.rules == 'REPEATED':
+            return member + '_count != 0'
+        elif self.rules == 'ONEOF':
+            return '%swhich_%s != 0' % (prefix, self.union_name)
+        elif self.rules == 'OPTIONAL':
+            return prefix + 'has_' + self.name
+        elif ltype == 'BYTES':
+            return member + '.size != 0'
+        elif ltype == 'STRING':
+            return member + "[0] != '\\0'"
+        elif ltype == 'FIXED_LENGTH_BYTES':
+            return '1'
+        elif ltype == 'SUBMESSAGE':
+            submsg = dependencies[str(self.submsgname)]
+            return submsg.proto3_nonzero(member + '.', dependencies)
+        elif self.pbtype in ('FLOAT', 'DOUBLE'):
+            # Negative zero is not the default value, so compare the bytes
+            # against a string literal of 8 zero bytes.
+            return 'memcmp(&%s, "\\0\\0\\0\\0\\0\\0\\0", sizeof(%s)) != 0' % (member, member)
+        else:
+            return member + ' != 0'
+
+    def encode_value(self, value, dependencies, stream = 'stream'):
+        '''Return C statements that encode a single value of this field,
+        without the tag. Matches the pb_enc_*() functions in pb_encode.c.'''
+        ltype = self.specialized_ltype()
+        if ltype == 'BOOL':
+            return check_call('pb_encode_varint(%s, %s ? 1 : 0)' % (stream, value))
+        elif ltype == 'VARINT':
+            return check_call('pb_encode_varint(%s, (pb_uint64_t)(pb_int64_t)%s)' % (stream, value))
+        elif ltype == 'UVARINT':
+            return check_call('pb_encode_varint(%s, (pb_uint64_t)%s)' % (stream, value))
+        elif ltype == 'SVARINT':
+            return check_call('pb_encode_svarint(%s, (pb_int64_t)%s)' % (stream, value))
+        elif ltype == 'FIXED32':
+            return check_call('pb_encode_fixed32(%s, &%s)' % (stream, value))
+        elif ltype == 'FIXED64':
+            return check_call('pb_encode_fixed64(%s, &%s)' % (stream, value))
+        elif ltype == 'FIXED_LENGTH_BYTES':
+            return check_call('pb_encode_string(stream, %s, %d)' % (value, self.max_size))
+        elif ltype == 'BYTES':
+            return (['if (PB_BYTES_ARRAY_T_ALLOCSIZE(%s.size) > sizeof(%s))' % (value, value),
+                     '    PB_RETURN_ERROR(stream, "bytes size exceeded");'] +
+                    check_call('pb_encode_string(stream, %s.bytes, %s.size)' % (value, value)))
+        elif ltype == 'STRING':
+            return (['{',
+                     '    size_t size = 0;',
+                     "    while (size < %d && %s[size] != '\\0')" % (self.max_size - 1, value),
+                     '        size++;',
+                     "    if (%s[size] != '\\0')" % value,
+                     '        PB_RETURN_ERROR(stream, "unterminated string");'] +
+                    indent(check_call('pb_encode_string(stream, (const pb_byte_t*)%s, size)' % value)) +
+                    ['}'])
+
+        submsg = dependencies.get(str(self.submsgname))
+        if submsg is None or not submsg.has_specialized_functions(dependencies):
+            return check_call('pb_encode_submessage(stream, %s_fields, &%s)' % (self.submsgname, value))
+
+        # Same as pb_encode_submessage(): calculate the size first
+        # using a sizing stream, then encode the actual data.
+        return (['{',
+                 '    pb_ostream_t substream = PB_OSTREAM_SIZING;'] +
+                indent(check_call('%s_encode(&substream, &%s)' % (self.submsgname, value),
+                                  ['PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));'])) +
+                indent(check_call('pb_encode_varint(stream, (pb_uint64_t)substream.bytes_written)')) +
+                ['    if (stream->callback == NULL)',
+                 '    {',
+                 '        /* Just sizing */'] +
+                indent(check_call('pb_write(stream, NULL, substream.bytes_written)'), 2) +
+                ['    }',
+                 '    else if (!%s_encode(stream, &%s))' % (self.submsgname, value),
+                 '    {',
+                 '        return false;',
+                 '    }',
+                 '}'])
+
+    def decode_value(self, value, dependencies, stream = 'stream',
+                     fail = ['return false;'], error = None, init = False):
+        '''Return C statements that decode a single value of this field.
+        Matches the pb_dec_*() functions in pb_decode.c.
+        fail: Statements to execute if decoding fails.
+        error: Function returning statements for setting an error message.
+        init: Initialize submessages before decoding.
+        '''
+        if error is None:
+            error = lambda msg: ['PB_RETURN_ERROR(stream, "%s");' % msg]
+
+        def checked(condition, msg):
+            return if_block(condition, error(msg))
+
+        ltype = self.specialized_ltype()
+        if ltype == 'BOOL':
+            body = (['pb_uint64_t value;'] +
+                    check_call('pb_decode_varint(%s, &value)' % stream, fail) +
+                    ['%s = (value != 0);' % value])
+        elif ltype == 'VARINT':
+            if self.data_item_size == 8:
+                extend = 'svalue = (pb_int64_t)value;'
+            else:
+                # See issue 97 in pb_dec_varint()
+                extend = 'svalue = (int32_t)value;'
+            body = (['pb_uint64_t value;',
+                     'pb_int64_t svalue;'] +
+                    check_call('pb_decode_varint(%s, &value)' % stream, fail) +
+                    [extend,
+                     '%s = (%s)svalue;' % (value, self.ctype)] +
+                    checked('(pb_int64_t)%s != svalue' % value, 'integer too large'))
+        elif ltype == 'UVARINT':
+            body = (['pb_uint64_t value;'] +
+                    check_call('pb_decode_varint(%s, &value)' % stream, fail) +
+                    ['%s = (%s)value;' % (value, self.ctype)] +
+                    checked('(pb_uint64_t)%s != value' % value, 'integer too large'))
+        elif ltype == 'SVARINT':
+            body = (['pb_int64_t svalue;'] +
+                    check_call('pb_decode_svarint(%s, &svalue)' % stream, fail) +
+                    ['%s = (%s)svalue;' % (value, self.ctype)] +
+                    checked('(pb_int64_t)%s != svalue' % value, 'integer too large'))
+        elif ltype == 'FIXED32':
+            return check_call('pb_decode_fixed32(%s, &%s)' % (stream, value), fail)
+        elif ltype == 'FIXED64':
+            return check_call('pb_decode_fixed64(%s, &%s)' % (stream, value), fail)
+        elif ltype == 'STRING':
+            body = (['uint32_t size;'] +
+                    check_call('pb_decode_varint32(%s, &size)' % stream, fail) +
+                    checked('size >= %d' % self.max_size, 'string overflow') +
+                    ["%s[size] = '\\0';" % value] +
+                    check_call('pb_read(%s, (pb_byte_t*)%s, size)' % (stream, value), fail))
+        elif ltype == 'BYTES':
+            body = (['uint32_t size;'] +
+                    check_call('pb_decode_varint32(%s, &size)' % stream, fail) +
+                    checked('size > PB_SIZE_MAX || PB_BYTES_ARRAY_T_ALLOCSIZE(size) > sizeof(%s)' % value,
+                            'bytes overflow') +
+                    ['%s.size = (pb_size_t)size;' % value] +
+                    check_call('pb_read(%s, %s.bytes, size)' % (stream, value), fail))
+        elif ltype == 'FIXED_LENGTH_BYTES':
+            # As a special case, empty bytes string is treated as all zeros.
+            body = (['uint32_t size;'] +
+                    check_call('pb_decode_varint32(%s, &size)' % stream, fail) +
+                    ['if (size == 0)',
+                     '{',
+                     '    memset(%s, 0, %d);' % (value, self.max_size),
+                     '}',
+                     'else',
+                     '{'] +
+                    indent(checked('size != %d' % self.max_size, 'incorrect fixed length bytes size') +
+                           check_call('pb_read(%s, %s, %d)' % (stream, value, self.max_size), fail)) +
+                    ['}'])
+        else:
+            submsg = dependencies.get(str(self.submsgname))
+            if submsg is not None and submsg.has_specialized_functions(dependencies):
+                if init:
+                    call = '%s_decode(&substream, &%s)' % (self.submsgname, value)
+                else:
+                    call = '%s_decode_noinit(&substream, &%s)' % (self.submsgname, value)
+            else:
+                if init:
+                    call = 'pb_decode(&substream, %s_fields, &%s)' % (self.submsgname, value)
+                else:
+                    call = 'pb_decode_noinit(&substream, %s_fields, &%s)' % (self.submsgname, value)
+
+            body = (['pb_istream_t substream;',
+                     'bool status;'] +
+                    check_call('pb_make_string_substream(stream, &substream)') +
+                    ['status = %s;' % call] +
+                    check_call('pb_close_string_substream(stream, &substream)') +
+                    ['if (!status)',
+                     '    return false;'])
+
+        return ['{'] + indent(body) + ['}']
+
+    def encode_statements(self, dependencies):
+        '''Return C statements for encoding this field in the specialized
+        encoder function. Matches encode_field() in pb_encode.c.'''
+        member = self.member()
+        ltype = self.specialized_ltype()
+
+        if self.rules not in ('REPEATED', 'FIXARRAY'):
+            lines = (check_call('pb_encode_tag(stream, %s, %d)' % (self.wire_type(), self.tag)) +
+                     self.encode_value(member, dependencies))
+
+            if self.rules == 'OPTIONAL':
+                condition = 'msg->has_' + self.name
+            elif self.rules == 'SINGULAR':
+                condition = self.proto3_nonzero('msg->', dependencies)
+            else:
+                condition = '1'
+
+            if condition == '0':
+                return []
+            elif condition == '1':
+                return lines
+            else:
+                return ['if (%s)' % condition, '{'] + indent(lines) + ['}']
+
+        if self.rules == 'REPEATED':
+            count = member + '_count'
+            lines = ['if (%s > %d)' % (count, self.max_count),
+                     '    PB_RETURN_ERROR(stream, "array max size exceeded");']
+        else:
+            count = str(self.max_count)
+            lines = []
+
+        item = member + '[i]'
+        if not self.is_packable():
+            return lines + (['for (i = 0; i < %s; i++)' % count,
+                             '{'] +
+                            indent(check_call('pb_encode_tag(stream, %s, %d)' % (self.wire_type(), self.tag)) +
+                                   self.encode_value(item, dependencies)) +
+                            ['}'])
+
+        # Arrays are always packed if the datatype allows it
+        packed = check_call('pb_encode_tag(stream, PB_WT_STRING, %d)' % self.tag)
+        if ltype in ('FIXED32', 'FIXED64'):
+            size = '%d * (size_t)%s' % (4 if ltype == 'FIXED32' else 8, count)
+        else:
+            packed = (['pb_ostream_t sizestream = PB_OSTREAM_SIZING;'] + packed +
+                      ['for (i = 0; i < %s; i++)' % count,
+                       '{'] +
+                      indent(self.encode_value(item, dependencies, '&sizestream')) +
+                      ['}'])
+            size = 'sizestream.bytes_written'
+
+        packed += check_call('pb_encode_varint(stream, (pb_uint64_t)(%s))' % size)
+        packed += (['for (i = 0; i < %s; i++)' % count,
+                    '{'] +
+                   indent(self.encode_value(item, dependencies)) +
+                   ['}'])
+
+        if self.rules == 'REPEATED':
+            return lines + ['if (%s > 0)' % count, '{'] + indent(packed) + ['}']
+        elif self.max_count > 0:
+            return ['{'] + indent(packed) + ['}']
+        else:
+            return []
+
+    def decode_statements(self, dependencies, required_index = None):
+        '''Return C statements for decoding this field in the specialized
+        decoder function. Matches decode_static_field() in pb_decode.c.
+        required_index: Index of this field among the required fields.
+        '''
+        member = self.member()
+
+        if self.rules not in ('REPEATED', 'FIXARRAY'):
+            lines = []
+            if self.rules == 'REQUIRED':
+                lines.append('fields_seen[%d] |= (uint32_t)1 << %d;'
+                             % (required_index >> 5, required_index & 31))
+            elif self.rules == 'OPTIONAL':
+                lines.append('msg->has_%s = true;' % self.name)
+            elif self.rules == 'ONEOF':
+                lines.append('msg->which_%s = %d;' % (self.union_name, self.tag))
+            return lines + self.decode_value(member, dependencies,
+                                             init = (self.rules == 'ONEOF'))
+
+        if self.rules == 'REPEATED':
+            count = member + '_count'
+            lines = []
+        else:
+            # Fixed count arrays have no count field in the struct.
+            # Track the position of the array that is being received.
+            count = 'fixed_count_size'
+            lines = ['if (fixed_count_tag != %d)' % self.tag,
+                     '{',
+                     '    if (fixed_count_tag != 0 && fixed_count_size != fixed_count_total_size)',
+                     '        PB_RETURN_ERROR(stream, "wrong size for fixed count field");',
+                     '    fixed_count_tag = %d;' % self.tag,
+                     '    fixed_count_size = 0;',
+                     '    fixed_count_total_size = %d;' % self.max_count,
+                     '}']
+
+        item = '%s[%s]' % (member, count)
+        unpacked = (['if (%s >= %d)' % (count, self.max_count),
+                     '    PB_RETURN_ERROR(stream, "array overflow");'] +
+                    self.decode_value(item, dependencies, init = True) +
+                    ['%s++;' % count])
+
+        if not self.is_packable():
+            return lines + unpacked
+
+        fail = ['status = false;', 'break;']
+        error = lambda msg: ['PB_SET_ERROR(stream, "%s");' % msg] + fail
+        packed = (['pb_istream_t substream;',
+                   'bool status = true;'] +
+                  check_call('pb_make_string_substream(stream, &substream)') +
+                  ['while (substream.bytes_left > 0 && %s < %d)' % (count, self.max_count),
+                   '{'] +
+                  indent(self.decode_value(item, dependencies, '&substream', fail, error) +
+                         ['%s++;' % count]) +
+                  ['}',
+                   'if (!status)',
+                   '    PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));',
+                   'if (substream.bytes_left != 0)',
+                   '    PB_RETURN_ERROR(stream, "array overflow");'] +
+                  check_call('pb_close_string_substream(stream, &substream)'))
+
+        return lines + (['if (wire_type == PB_WT_STRING)',
+                         '{'] +
+                        indent(packed) +
+                        ['}',
+                         'else',
+                         '{'] +
+                        indent(unpacked) +
+                        ['}'])
+
+    def tag_size(self):
+        '''Return the encoded size of the tag of this field.'''
+        return varint_max_size(self.tag << 3)
+
+    def size_value(self, value, dependencies, target = 'total', extra = 0):
+        '''Return the encoded size of a single value of this field, without
+        the tag. If the size is known at generator time, it is returned as
+        an integer. Otherwise returns C statements that add the size and
+        extra to the target variable.'''
+        ltype = self.specialized_ltype()
+        if ltype == 'BOOL':
+            return 1
+        elif ltype == 'FIXED32':
+            return 4
+        elif ltype == 'FIXED64':
+            return 8
+        elif ltype == 'FIXED_LENGTH_BYTES':
+            return varint_max_size(self.max_size) + self.max_size
+
+        def add(expr):
+            if extra:
+                expr = '%d + %s' % (extra, expr)
+            return '%s += %s;' % (target, expr)
+
+        if ltype == 'VARINT':
+            # Negative values are sign extended to 10 bytes
+            return [add('((pb_int64_t)%s < 0 ? 10 : pb_varint_size((pb_uint64_t)%s))' % (value, value))]
+        elif ltype == 'UVARINT':
+            return [add('pb_varint_size((pb_uint64_t)%s)' % value)]
+        elif ltype == 'SVARINT':
+            return [add('pb_svarint_size((pb_int64_t)%s)' % value)]
+        elif ltype == 'BYTES':
+            return ['if (PB_BYTES_ARRAY_T_ALLOCSIZE(%s.size) > sizeof(%s))' % (value, value),
+                    '    return false;',
+                    add('pb_varint_size(%s.size) + %s.size' % (value, value))]
+        elif ltype == 'STRING':
+            return ['{',
+                    '    size_t length = 0;',
+                    "    while (length < %d && %s[length] != '\\0')" % (self.max_size - 1, value),
+                    '        length++;',
+                    "    if (%s[length] != '\\0')" % value,
+                    '        return false;',
+                    '    ' + add('pb_varint_size(length) + length'),
+                    '}']
+
+        submsg = dependencies.get(str(self.submsgname))
+        if submsg is not None:
+            constant = submsg.constant_size(dependencies)
+            if constant is not None:
+                return varint_max_size(constant) + constant
+
+        if submsg is not None and submsg.size_functions:
+            call = '%s_get_encoded_size(&subsize, &%s)' % (self.submsgname, value)
+        else:
+            call = 'pb_get_encoded_size(&subsize, %s_fields, &%s)' % (self.submsgname, value)
+        return check_call(call) + [add('pb_varint_size(subsize) + subsize')]
+
+    def constant_size(self, dependencies):
+        '''Return the encoded size of this field if it is the same for all
+        message contents, otherwise None.'''
+        if self.allocation != 'STATIC':
+            return None
+        elif self.rules == 'SINGULAR' and self.proto3_nonzero('msg->', dependencies) != '1':
+            return None
+        elif self.rules not in ('REQUIRED', 'SINGULAR', 'FIXARRAY'):
+            return None
+
+        size = self.size_value(self.member(), dependencies)
+        if not isinstance(size, int):
+            return None
+        elif self.rules != 'FIXARRAY':
+            return self.tag_size() + size
+        elif self.max_count == 0:
+            return 0
+        elif self.is_packable():
+            datasize = size * self.max_count
+            return self.tag_size() + varint_max_size(datasize) + datasize
+        else:
+            return (self.tag_size() + size) * self.max_count
+
+    def size_statements(self, dependencies):
+        '''Return C statements that add the encoded size of this field to
+        total in the size function. Matches encode_statements().'''
+        member = self.member()
+        tagsize = self.tag_size()
+
+        if self.rules not in ('REPEATED', 'FIXARRAY'):
+            size = self.size_value(member, dependencies, extra = tagsize)
+            if isinstance(size, int):
+                lines = ['total += %d;' % (tagsize + size)]
+            else:
+                lines = size
+
+            if self.rules == 'OPTIONAL':
+                condition = 'msg->has_' + self.name
+            elif self.rules == 'SINGULAR':
+                condition = self.proto3_nonzero('msg->', dependencies)
+            else:
+                condition = '1'
+
+            if condition == '0':
+                return []
+            elif condition == '1':
+                return lines
+            else:
+                return if_block(condition, lines)
+
+        constant = self.constant_size(dependencies)
+        if constant is not None:
+            return ['total += %d;' % constant]
+
+        if self.rules == 'REPEATED':
+            count = member + '_count'
+            lines = ['if (%s > %d)' % (count, self.max_count),
+                     '    return false;']
+        else:
+            count = str(self.max_count)
+            lines = []
+
+        item = member + '[i]'
+
+        if not self.is_packable():
+            size = self.size_value(item, dependencies, extra = tagsize)
+            if isinstance(size, int):
+                return lines + ['total += %d * (size_t)%s;' % (tagsize + size, count)]
+            else:
+                return lines + code_block('for (i = 0; i < %s; i++)' % count, size)
+
+        size = self.size_value(item, dependencies, target = 'datasize')
+        if size == 1:
+            packed = ['size_t datasize = (size_t)%s;' % count]
+        elif isinstance(size, int):
+            packed = ['size_t datasize = %d * (size_t)%s;' % (size, count)]
+        else:
+            packed = (['size_t datasize = 0;'] +
+                      code_block('for (i = 0; i < %s; i++)' % count, size))
+        packed += ['total += %d + pb_varint_size(datasize) + datasize;' % tagsize]
+        if self.rules == 'REPEATED':
+            lines.append('if (%s > 0)' % count)
+        return lines + ['{'] + indent(packed) + ['}']
+
+    def item_layout(self, dependencies, abi):
+        '''Return (size, alignment) of a single value of this field when
+        it is stored in the struct, i.e. of field[0] for static arrays.'''
+        if self.pbtype == 'MESSAGE':
+            submsg = dependencies.get(str(self.submsgname))
+            if submsg is not None:
+                return submsg.struct_layout(dependencies, abi)
+            else:
+                raise Exception("Unknown submessage type: %s" % self.submsgname)
+        elif self.pbtype in ('STRING', 'FIXED_LENGTH_BYTES'):
+            return (self.max_size, 1)
+        elif self.pbtype == 'BYTES':
+            return struct_layout([abi.layout('pb_size_t'), (self.max_size, 1)])
+        elif self.pbtype == 'BOOL':
+            return abi.layout('bool')
+        elif self.pbtype in ('FLOAT', 'DOUBLE'):
+            return abi.layout(self.pbtype.lower())
+        elif self.pbtype in ('ENUM', 'UENUM'):
+            enum = dependencies.get(str(self.ctype))
+            if enum is not None and enum.packed:
+                return (enum.packed_size(), enum.packed_size())
+            else:
+                return abi.layout('enum')
+        else:
+            return abi.layout('int%d' % (self.data_item_size * 8))
+
+    def value_layout(self, dependencies, abi):
+        '''Return (size, alignment) of the value member of this field in
+        the C struct, without the has_ or _count member.'''
+        if self.allocation == 'POINTER':
+            return abi.layout('pointer')
+        elif self.allocation == 'CALLBACK':
+            if self.callback_datatype == 'pb_callback_t':
+                return abi.callback_layout()
+            else:
+                return abi.layout('pointer')
+
+        size, align = self.item_layout(dependencies, abi)
+        if self.rules in ('REPEATED', 'FIXARRAY'):
+            size *= self.max_count
+
+        return (size, align)
+
+    def struct_members(self, dependencies, abi):
+        '''Return (size, alignment) of each C struct member of this field.'''
+        members = []
+        if self.allocation == 'STATIC' and self.rules == 'OPTIONAL':
+            members.append(abi.layout('bool'))
+        elif self.rules == 'REPEATED' and self.allocation in ('STATIC', 'POINTER'):
+            members.append(abi.layout('pb_size_t'))
+        members.append(self.value_layout(dependencies, abi))
+        return members
+
+    def descriptor_data_size(self, dependencies, abi):
+        '''Return the data_size value of the field descriptor, which is
+        the size of a single item, or of the pointed-to type for pointers.'''
+        if self.allocation == 'CALLBACK':
+            return self.value_layout(dependencies, abi)[0]
+        elif self.allocation == 'POINTER':
+            if self.rules in ('REPEATED', 'FIXARRAY') and self.pbtype in ('STRING', 'BYTES'):
+                return abi.layout('pointer')[0]
+            elif self.pbtype == 'STRING':
+                return 1
+            elif self.pbtype == 'BYTES':
+                return struct_layout([abi.layout('pb_size_t'), (1, 1)])[0]
+
+        return self.item_layout(dependencies, abi)[0]
+
+    def descriptor_array_size(self):
+        '''Return the array_size value of the field descriptor.'''
+        if self.allocation == 'STATIC' and self.rules in ('REPEATED', 'FIXARRAY'):
+            return self.max_count
+        else:
+            return 1
+
+    def descriptor_auto_width(self):
+        '''Return the width that PB_FIELDINFO_WIDTH_AUTO in pb.h selects
+        for this field when the message uses AUTO descriptor width.'''
+        if self.allocation == 'CALLBACK' or self.rules in ('REPEATED', 'FIXARRAY'):
+            return 2
+        elif self.pbtype in ('BYTES', 'STRING', 'MESSAGE', 'FIXED_LENGTH_BYTES'):
+            return 2
+        else:
+            return 1
+
+    def data_size(self, dependencies, sizes = None):
         '''Return estimated size of this field in the C struct.
         This is used to try to automatically pick right descriptor size.
         If the estimate is wrong, it will result in compile time error and
         user having to specify descriptor_width option.
+        If the submessage type is not known, returns None.
+        sizes: Optional dictionary of precalculated message sizes,
+               as generated by ProtoFile.analyze_sizes().
         '''
         if self.allocation == 'POINTER' or self.pbtype == 'EXTENSION':
             size = 8
         elif self.allocation == 'CALLBACK':
             size = 16
-        elif self.pbtype == 'MESSAGE' and str(self.submsgname) in dependencies:
-            size = dependencies[str(self.submsgname)].data_size(dependencies)
+        elif self.pbtype == 'MESSAGE':
+            if sizes and str(self.submsgname) in sizes:
+                size = sizes[str(self.submsgname)][1]
+            elif str(self.submsgname) in dependencies:
+                size = dependencies[str(self.submsgname)].data_size(dependencies, sizes)
+            else:
+                # Submessage from a file that has not been loaded
+                size = None
+
+            if size is None:
+                return None
         elif self.pbtype in ['STRING', 'FIXED_LENGTH_BYTES']:
             size = self.max_size
         elif self.pbtype == 'BYTES':
@@ -608,10 +1635,13 @@ class Field:
 
         return size
 
-    def encoded_size(self, dependencies):
+    def encoded_size(self, dependencies, sizes = None):
         '''Return the maximum size that this field can take when encoded,
         including the field tag. If the size cannot be determined, returns
-        None.'''
+        None.
+        sizes: Optional dictionary of precalculated message sizes,
+               as generated by ProtoFile.analyze_sizes().
+        '''
 
         if self.allocation != 'STATIC':
             return None
@@ -620,7 +1650,10 @@ class Field:
             encsize = None
             if str(self.submsgname) in dependencies:
                 submsg = dependencies[str(self.submsgname)]
-                encsize = submsg.encoded_size(dependencies)
+                if sizes and str(self.submsgname) in sizes:
+                    encsize = sizes[str(self.submsgname)][0]
+                else:
+                    encsize = submsg.encoded_size(dependencies, sizes)
                 if encsize is not None:
                     # Include submessage length prefix
                     encsize += varint_max_size(encsize.upperlimit())
@@ -681,6 +1714,8 @@ class Field:
 
 
 class ExtensionRange(Field):
+    __slots__ = ()
+
     def __init__(self, struct_name, range_start, field_options):
         '''Implements a special pb_extension_t* field in an extensible message
         structure. The range_start signifies the index at which the extensions
@@ -708,19 +1743,24 @@ class ExtensionRange(Field):
     def __str__(self):
         return '    pb_extension_t *extensions;'
 
+    def struct_members(self, dependencies, abi):
+        return [abi.layout('pointer')]
+
     def types(self):
         return ''
 
     def tags(self):
         return ''
 
-    def encoded_size(self, dependencies):
+    def encoded_size(self, dependencies, sizes = None):
         # We exclude extensions from the count, because they cannot be known
         # until runtime. Other option would be to return None here, but this
         # way the value remains useful if extensions are not used.
         return EncodedSize(0)
 
 class ExtensionField(Field):
+    __slots__ = ('fullname', 'extendee_name', 'skip', 'msg')
+
     def __init__(self, fullname, desc, field_options):
         self.fullname = fullname
         self.extendee_name = names_from_type_name(desc.extendee)
@@ -749,7 +1789,7 @@ class ExtensionField(Field):
         return ('extern const pb_extension_type_t %s; /* field type: %s */\n' %
             (self.fullname, str(self).strip()))
 
-    def extension_def(self, dependencies):
+    def extension_def(self, dependencies, abi = None):
         '''Definition of the extension type in the .pb.c file'''
 
         if self.skip:
@@ -759,7 +1799,7 @@ class ExtensionField(Field):
         result += str(self.msg)
         result += self.msg.fields_declaration(dependencies)
         result += 'pb_byte_t %s_default[] = {0x00};\n' % self.msg.name
-        result += self.msg.fields_definition(dependencies)
+        result += self.msg.fields_definition(dependencies, abi = abi)
         result += 'const pb_extension_type_t %s = {\n' % self.fullname
         result += '    NULL,\n'
         result += '    NULL,\n'
@@ -773,6 +1813,8 @@ class ExtensionField(Field):
 # ---------------------------------------------------------------------------
 
 class OneOf(Field):
+    __slots__ = ('fields',)
+
     def __init__(self, struct_name, oneof_desc):
         self.struct_name = struct_name
         self.name = oneof_desc.name
@@ -820,8 +1862,11 @@ class OneOf(Field):
             deps += f.get_dependencies()
         return deps
 
-    def get_initializer(self, null_init):
-        return '0, {' + self.fields[0].get_initializer(null_init) + '}'
+    def get_initializer(self, null_init, dependencies = None):
+        return '0, {' + self.fields[0].get_initializer(null_init, dependencies = dependencies) + '}'
+
+    def has_zero_init(self, null_init, dependencies):
+        return self.fields[0].has_zero_init(null_init, dependencies)
 
     def tags(self):
         return ''.join([f.tags() for f in self.fields])
@@ -829,46 +1874,61 @@ class OneOf(Field):
     def fieldlist(self):
         return ' \\\n'.join(field.fieldlist() for field in self.fields)
 
-    def data_size(self, dependencies):
-        return max(f.data_size(dependencies) for f in self.fields)
+    def struct_members(self, dependencies, abi):
+        if not self.fields:
+            return []
+        union = union_layout([f.value_layout(dependencies, abi) for f in self.fields])
+        return [abi.layout('pb_size_t'), union]
+
+    def data_size(self, dependencies, sizes = None):
+        fsizes = [f.data_size(dependencies, sizes) for f in self.fields]
+        if None in fsizes:
+            return None
+        return max(fsizes)
 
-    def encoded_size(self, dependencies):
+    def encoded_size(self, dependencies, sizes = None):
         '''Returns the size of the largest oneof field.'''
         largest = 0
-        symbols = []
+        symbolic = []
         for f in self.fields:
-            size = EncodedSize(f.encoded_size(dependencies))
+            size = EncodedSize(f.encoded_size(dependencies, sizes))
             if size is None or size.value is None:
                 return None
             elif size.symbols:
-                symbols.append((f.tag, size.symbols[0]))
+                symbolic.append((f.tag, size))
             elif size.value > largest:
                 largest = size.value
 
-        if not symbols:
+        if not symbolic:
             # Simple case, all sizes were known at generator time
             return largest
 
+        if len(symbolic) == 1 and largest == 0:
+            # Only one size was needed. It is kept as EncodedSize so that
+            # all of its terms are multiplied for repeated fields.
+            return symbolic[0][1]
+
         if largest > 0:
             # Some sizes were known, some were not
-            symbols.insert(0, (0, largest))
+            symbolic.insert(0, (0, largest))
 
-        if len(symbols) == 1:
-            # Only one symbol was needed
-            return EncodedSize(5, [symbols[0][1]])
-        else:
-            # Use sizeof(union{}) construct to find the maximum size of
-            # submessages.
-            union_def = ' '.join('char f%d[%s];' % s for s in symbols)
-            return EncodedSize(5, ['sizeof(union{%s})' % union_def])
+        # Use sizeof(union{}) construct to find the maximum size of
+        # submessages. Each array size is a complete parenthesized sum.
+        union_def = ' '.join('char f%d[%s];' % s for s in symbolic)
+        return EncodedSize(0, ['sizeof(union{%s})' % union_def])
 
 # ---------------------------------------------------------------------------
 #                   Generation of messages (structures)
 # ---------------------------------------------------------------------------
 
 
-class Message:
-    def __init__(self, names, desc, message_options):
+class Message(object):
+    __slots__ = ('name', 'fields', 'oneofs', 'desc', 'msgid', 'callback_function',
+                 'packed', 'descriptorsize', 'tag_index', 'specialized',
+                 'size_functions', 'minimize_padding', 'member_order', 'padding_saved', 'padding_abi',
+                 'protofile')
+
+    def __init__(self, names, desc, message_options, context = None):
         self.name = names
         self.fields = []
         self.oneofs = {}
@@ -878,7 +1938,7 @@ class Message:
             self.msgid = message_options.msgid
 
         if desc is not None:
-            self.load_fields(desc, message_options)
+            self.load_fields(desc, message_options, context)
 
         self.callback_function = message_options.callback_function
         if not message_options.HasField('callback_function'):
@@ -891,15 +1951,22 @@ class Message:
 
         self.packed = message_options.packed_struct
         self.descriptorsize = message_options.descriptorsize
-
-    def load_fields(self, desc, message_options):
+        self.tag_index = message_options.tag_index
+        self.specialized = message_options.specialized_functions
+        self.size_functions = message_options.encoded_size_functions
+        self.minimize_padding = message_options.minimize_padding
+        self.member_order = None
+        self.padding_saved = 0
+        self.padding_abi = None
+
+    def load_fields(self, desc, message_options, context = None):
         '''Load field list from DescriptorProto'''
 
         no_unions = []
 
         if hasattr(desc, 'oneof_decl'):
             for i, f in enumerate(desc.oneof_decl):
-                oneof_options = get_nanopb_suboptions(desc, message_options, self.name + f.name)
+                oneof_options = get_nanopb_suboptions(desc, message_options, self.name + f.name, context)
                 if oneof_options.no_unions:
                     no_unions.append(i) # No union, but add fields normally
                 elif oneof_options.type == nanopb_pb2.FT_IGNORE:
@@ -914,7 +1981,7 @@ class Message:
             sys.stderr.write('Note: This Python protobuf library has no OneOf support\n')
 
         for f in desc.field:
-            field_options = get_nanopb_suboptions(f, message_options, self.name + f.name)
+            field_options = get_nanopb_suboptions(f, message_options, self.name + f.name, context)
             if field_options.type == nanopb_pb2.FT_IGNORE:
                 continue
 
@@ -928,7 +1995,7 @@ class Message:
                 self.fields.append(field)
 
         if len(desc.extension_range) > 0:
-            field_options = get_nanopb_suboptions(desc, message_options, self.name + 'extensions')
+            field_options = get_nanopb_suboptions(desc, message_options, self.name + 'extensions', context)
             range_start = min([r.start for r in desc.extension_range])
             if field_options.type != nanopb_pb2.FT_IGNORE:
                 self.fields.append(ExtensionRange(self.name, range_start, field_options))
@@ -940,15 +2007,118 @@ class Message:
             deps += f.get_dependencies()
         return deps
 
+    def struct_fields(self):
+        '''Return the fields in the order of the C struct members.'''
+        if self.member_order is not None:
+            return self.member_order
+        else:
+            return sorted(self.fields)
+
+    def order_members(self, dependencies, abi):
+        '''Choose the order of the C struct members. By default they are in
+        tag order. With minimize_padding, fields are sorted by alignment if
+        that makes the struct smaller on abi.ordering_abi(). The members of a
+        single field, such as has_ flag and value, stay together because the
+        field descriptor stores the offset between them.'''
+        if self.member_order is not None:
+            return
+
+        self.member_order = sorted(self.fields)
+        if not self.minimize_padding or self.packed:
+            return
+
+        abi = abi.ordering_abi()
+        def alignment(field):
+            return max([align for size, align in field.struct_members(dependencies, abi)] + [1])
+
+        original = self.struct_layout(dependencies, abi)[0]
+        self.member_order = sorted(self.member_order, key = alignment, reverse = True)
+        reordered = self.struct_layout(dependencies, abi)[0]
+
+        if reordered < original:
+            self.padding_saved = original - reordered
+            self.padding_abi = abi
+        else:
+            self.member_order = sorted(self.fields)
+
+    def member_offsets(self, dependencies, abi):
+        '''Return a list of (field, offsets) in the C struct member order,
+        where offsets contains the offset of each of field.struct_members().
+        The second item of the returned tuple is (size, alignment) of the
+        whole struct.'''
+        self.order_members(dependencies, abi)
+        offset = 0
+        alignment = 1
+        result = []
+        for field in self.member_order:
+            offsets = []
+            for size, align in field.struct_members(dependencies, abi):
+                if not self.packed:
+                    offset = align_up(offset, align)
+                    alignment = max(alignment, align)
+                offsets.append(offset)
+                offset += size
+            result.append((field, offsets))
+
+        if offset == 0:
+            offset = 1 # dummy_field
+        return result, (align_up(offset, alignment), alignment)
+
+    def struct_layout(self, dependencies, abi):
+        '''Return (size, alignment) of the C struct on the target ABI.'''
+        return self.member_offsets(dependencies, abi)[1]
+
+    def layout_is_known(self, dependencies, visited = None):
+        '''Check that the types of all submessages are available, so that
+        the struct layout can be computed exactly.'''
+        if visited is None:
+            visited = set()
+        visited.add(str(self.name))
+        for field in self.all_fields():
+            if field.pbtype == 'MESSAGE':
+                submsg = dependencies.get(str(field.submsgname))
+                if submsg is None:
+                    return False
+                if (str(submsg.name) not in visited
+                    and not submsg.layout_is_known(dependencies, visited)):
+                    return False
+        return True
+
+    def descriptor_values(self, dependencies, abi):
+        '''Return (field, data_offset, data_size, size_offset, array_size)
+        for each field, matching the values that the macros in pb.h compute
+        for the field descriptor. Returns None if the layout is not known.'''
+        if not self.layout_is_known(dependencies):
+            return None
+
+        result = []
+        for field, offsets in self.member_offsets(dependencies, abi)[0]:
+            if isinstance(field, OneOf):
+                members = field.fields
+            else:
+                members = [field]
+
+            for member in members:
+                result.append((member, offsets[-1],
+                               member.descriptor_data_size(dependencies, abi),
+                               offsets[-1] - offsets[0],
+                               member.descriptor_array_size()))
+        return result
+
     def __str__(self):
-        result = 'typedef struct _%s {\n' % self.name
+        result = ''
+        if self.padding_saved:
+            result += '/* Struct members are ordered by alignment, which saves %d bytes of padding on %s */\n' % (
+                self.padding_saved, self.padding_abi)
+
+        result += 'typedef struct _%s {\n' % self.name
 
         if not self.fields:
             # Empty structs are not allowed in C standard.
             # Therefore add a dummy field if an empty message occurs.
             result += '    char dummy_field;'
 
-        result += '\n'.join([str(f) for f in sorted(self.fields)])
+        result += '\n'.join([str(f) for f in self.struct_fields()])
         result += '\n/* @@protoc_insertion_point(struct:%s) */' % self.name
         result += '\n}'
 
@@ -966,15 +2136,298 @@ class Message:
     def types(self):
         return ''.join([f.types() for f in self.fields])
 
-    def get_initializer(self, null_init):
+    def get_initializer(self, null_init, dependencies = None):
         if not self.fields:
             return '{0}'
 
         parts = []
-        for field in sorted(self.fields):
-            parts.append(field.get_initializer(null_init))
+        for field in self.struct_fields():
+            parts.append(field.get_initializer(null_init, dependencies = dependencies))
         return '{' + ', '.join(parts) + '}'
 
+    def has_zero_init(self, null_init, dependencies):
+        '''Return True if the initializer of this message sets all of
+        its memory to zero.'''
+        return all(f.has_zero_init(null_init, dependencies) for f in self.fields)
+
+    def is_plain(self, dependencies):
+        '''Returns True if all fields of this message and its submessages
+        are statically allocated.'''
+        for field in self.all_fields():
+            if field.allocation != 'STATIC':
+                return False
+            if field.pbtype == 'MESSAGE':
+                submsg = dependencies.get(str(field.submsgname))
+                if submsg is None or not submsg.is_plain(dependencies):
+                    return False
+        return True
+
+    def has_specialized_functions(self, dependencies):
+        '''Returns True if the encoder and decoder functions generated for
+        this message handle the fields directly. Messages with callback,
+        pointer or extension fields use the generic runtime instead.'''
+        return self.specialized and self.is_plain(dependencies)
+
+    def proto3_nonzero(self, prefix, dependencies):
+        '''Return C expression that is true if any field of this message
+        does not have the zero value.'''
+        terms = []
+        for field in self.all_fields():
+            term = field.proto3_nonzero(prefix, dependencies)
+            if term == '1':
+                return '1'
+            elif term not in terms:
+                terms.append(term)
+
+        if not terms:
+            return '0'
+        elif len(terms) == 1:
+            return terms[0]
+        else:
+            return '(' + ' || '.join(terms) + ')'
+
+    def specialized_declarations(self):
+        '''Return the prototypes of the specialized encoder and decoder functions.'''
+        if not self.specialized:
+            return ''
+
+        result = '#ifndef PB_NO_SPECIALIZED_ENCODE\n'
+        result += 'bool %s_encode(pb_ostream_t *stream, const %s *msg);\n' % (self.name, self.name)
+        result += '#endif\n'
+        result += '#ifndef PB_NO_SPECIALIZED_DECODE\n'
+        result += 'bool %s_decode(pb_istream_t *stream, %s *msg);\n' % (self.name, self.name)
+        result += 'bool %s_decode_noinit(pb_istream_t *stream, %s *msg);\n' % (self.name, self.name)
+        result += '#endif\n'
+        return result
+
+    def specialized_definitions(self, dependencies):
+        '''Return the specialized encoder and decoder functions that go in
+        .pb.c file. They produce the same results as pb_encode(),
+        pb_decode() and pb_decode_noinit(). The encoder and the decoders
+        can be left out with PB_NO_SPECIALIZED_ENCODE and
+        PB_NO_SPECIALIZED_DECODE, so that a program that only encodes or
+        only decodes does not need both pb_encode.c and pb_decode.c.'''
+        if not self.specialized:
+            return ''
+
+        name = self.name
+        encode_proto = 'bool %s_encode(pb_ostream_t *stream, const %s *msg)' % (name, name)
+        decode_proto = 'bool %s_decode(pb_istream_t *stream, %s *msg)' % (name, name)
+        noinit_proto = 'bool %s_decode_noinit(pb_istream_t *stream, %s *msg)' % (name, name)
+
+        if not self.is_plain(dependencies):
+            return '\n'.join([
+                '/* %s has callback, pointer or extension fields,' % name,
+                ' * so it is handled by the generic functions. */',
+                '#ifndef PB_NO_SPECIALIZED_ENCODE',
+                encode_proto, '{', '    return pb_encode(stream, %s_fields, msg);' % name, '}',
+                '#endif',
+                '#ifndef PB_NO_SPECIALIZED_DECODE',
+                decode_proto, '{', '    return pb_decode(stream, %s_fields, msg);' % name, '}', '',
+                noinit_proto, '{', '    return pb_decode_noinit(stream, %s_fields, msg);' % name, '}',
+                '#endif', ''])
+
+        fields = sorted(self.fields)
+
+        # Encoder, fields are encoded in the same order as in FIELDLIST
+        body = []
+        for field in fields:
+            if isinstance(field, OneOf):
+                if field.fields:
+                    body += ['switch (msg->which_%s)' % field.name, '{']
+                    for member in field.fields:
+                        body += indent(['case %d:' % member.tag] +
+                                       indent(member.encode_statements(dependencies) + ['break;']))
+                    body += ['}']
+            else:
+                body += field.encode_statements(dependencies)
+
+        if [line for line in body if line.strip().startswith('for (i = 0;')]:
+            body = ['pb_size_t i;', ''] + body
+        body += unused_parameters(body, ['stream', 'msg']) + ['return true;']
+
+        encoder = ['#ifndef PB_NO_SPECIALIZED_ENCODE', encode_proto, '{']
+        if [f for f in self.all_fields() if f.specialized_ltype() == 'VARINT']:
+            # Negative values are sign extended to 64 bits, which the
+            # public pb_encode_varint() cannot do without 64-bit types.
+            encoder += ['#ifdef PB_WITHOUT_64BIT',
+                        '    return pb_encode(stream, %s_fields, msg);' % name,
+                        '#else'] + indent(body) + ['#endif']
+        else:
+            encoder += indent(body)
+        encoder += ['}', '#endif']
+
+        # Decoder, initialization sets default values like
+        # pb_message_set_to_defaults() does.
+        init = ['memset(msg, 0, sizeof(%s));' % name]
+        for field in fields:
+            if field.rules in ('REQUIRED', 'OPTIONAL', 'SINGULAR') and not field.has_zero_init(False, dependencies):
+                value = field.get_initializer(False, inner_init_only = True)
+                ltype = field.specialized_ltype()
+                if ltype == 'STRING':
+                    decl = 'char init[%d]' % field.max_size
+                elif ltype == 'FIXED_LENGTH_BYTES':
+                    decl = 'pb_byte_t init[%d]' % field.max_size
+                elif ltype in ('BYTES', 'SUBMESSAGE'):
+                    decl = '%s init' % field.ctype
+                else:
+                    init.append('%s = %s;' % (field.member(), value))
+                    continue
+
+                init += ['{',
+                         '    static const %s = %s;' % (decl, value),
+                         '    memcpy(&%s, &init, sizeof(init));' % field.member(),
+                         '}']
+
+        decoder = (['#ifndef PB_NO_SPECIALIZED_DECODE', decode_proto, '{'] +
+                   indent(init + ['return %s_decode_noinit(stream, msg);' % name]) + ['}'])
+
+        # Decoder without initialization
+        cases = []
+        required_count = 0
+        for field in self.all_fields():
+            if field.rules == 'REQUIRED':
+                statements = field.decode_statements(dependencies, required_count)
+                required_count += 1
+            else:
+                statements = field.decode_statements(dependencies)
+            cases += ['case %d:' % field.tag] + indent(statements + ['break;']) + ['']
+
+        variables = []
+        checks = []
+        if [f for f in self.all_fields() if f.rules == 'FIXARRAY']:
+            variables += ['uint32_t fixed_count_tag = 0;',
+                          'pb_size_t fixed_count_size = 0;',
+                          'pb_size_t fixed_count_total_size = 0;']
+            checks += ['if (fixed_count_tag != 0 && fixed_count_size != fixed_count_total_size)',
+                       '    PB_RETURN_ERROR(stream, "wrong size for fixed count field");']
+
+        if required_count > 0:
+            words = (required_count + 31) // 32
+            variables += ['uint32_t fields_seen[%d] = {0};' % words]
+            expected = []
+            for i in range(words):
+                bits = min(32, required_count - i * 32)
+                expected.append('fields_seen[%d] != 0x%xu' % (i, (1 << bits) - 1))
+            checks += ['if (%s)' % ' || '.join(expected),
+                       '    PB_RETURN_ERROR(stream, "missing required field");']
+
+        body = variables + ([''] if variables else []) + [
+            'while (stream->bytes_left)',
+            '{',
+            '    uint32_t tag;',
+            '    pb_wire_type_t wire_type;',
+            '    bool eof;',
+            '',
+            '    if (!pb_decode_tag(stream, &wire_type, &tag, &eof))',
+            '    {',
+            '        if (eof)',
+            '            break;',
+            '        else',
+            '            return false;',
+            '    }',
+            '',
+            '    switch (tag)',
+            '    {',
+            '        case 0:',
+            '            PB_RETURN_ERROR(stream, "zero tag");',
+            ''] + indent(cases, 2) + [
+            '        default:',
+            '            if (!pb_skip_field(stream, wire_type))',
+            '                return false;',
+            '            break;',
+            '    }',
+            '}',
+            ''] + checks + ([''] if checks else [])
+        body += unused_parameters(body, ['msg']) + ['return true;']
+
+        noinit = [noinit_proto, '{'] + indent(body) + ['}', '#endif']
+
+        return '\n'.join(encoder + [''] + decoder + [''] + noinit) + '\n'
+
+    def constant_size(self, dependencies):
+        '''Return the encoded size of this message if it is the same for
+        all message contents, otherwise None.'''
+        total = 0
+        for field in self.fields:
+            if isinstance(field, OneOf):
+                return None
+            size = field.constant_size(dependencies)
+            if size is None:
+                return None
+            total += size
+        return total
+
+    def size_declarations(self):
+        '''Return the prototype of the encoded size function.'''
+        if not self.size_functions:
+            return ''
+
+        return 'bool %s_get_encoded_size(size_t *size, const %s *msg);\n' % (self.name, self.name)
+
+    def size_definitions(self, dependencies):
+        '''Return the encoded size function that goes in .pb.c file. It gives
+        the same result as pb_get_encoded_size(), but computes the size from
+        the message contents instead of encoding to a sizing stream.'''
+        if not self.size_functions:
+            return ''
+
+        proto = 'bool %s_get_encoded_size(size_t *size, const %s *msg)' % (self.name, self.name)
+
+        generic = False
+        for field in self.all_fields():
+            if field.allocation != 'STATIC':
+                generic = True
+            elif field.rules == 'SINGULAR' and field.pbtype == 'MESSAGE':
+                # The presence of a proto3 submessage is found by comparing
+                # all of its fields to zero, like in pb_encode.c.
+                submsg = dependencies.get(str(field.submsgname))
+                if submsg is None or not submsg.is_plain(dependencies):
+                    generic = True
+
+        if generic:
+            return '\n'.join([
+                '/* %s has callback, pointer or extension fields,' % self.name,
+                ' * so it is handled by the generic function. */',
+                proto, '{',
+                '    return pb_get_encoded_size(size, %s_fields, msg);' % self.name,
+                '}']) + '\n'
+
+        # Sizes of fields that do not depend on the contents are added
+        # together at generator time.
+        constant = 0
+        body = []
+        for field in sorted(self.fields):
+            if isinstance(field, OneOf):
+                if field.fields:
+                    body += ['switch (msg->which_%s)' % field.name, '{']
+                    for member in field.fields:
+                        body += indent(['case %d:' % member.tag] +
+                                       indent(member.size_statements(dependencies) + ['break;']))
+                    body += ['}']
+            else:
+                size = field.constant_size(dependencies)
+                if size is not None:
+                    constant += size
+                else:
+                    body += field.size_statements(dependencies)
+
+        if not body:
+            return '\n'.join([proto, '{',
+                              '    PB_UNUSED(msg);',
+                              '    *size = %d;' % constant,
+                              '    return true;',
+                              '}']) + '\n'
+
+        variables = ['size_t total = %d;' % constant]
+        if [line for line in body if 'subsize' in line]:
+            variables.append('size_t subsize;')
+        if [line for line in body if line.strip().startswith('for (i = 0;')]:
+            variables.append('pb_size_t i;')
+
+        body = variables + [''] + body + ['', '*size = total;', 'return true;']
+        return '\n'.join([proto, '{'] + indent(body) + ['}']) + '\n'
+
     def count_required_fields(self):
         '''Returns number of required fields inside this message'''
         count = 0
@@ -1042,27 +2495,117 @@ class Message:
 
         return result
 
-    def fields_definition(self, dependencies):
+    def fields_definition(self, dependencies, sizes = None, abi = None):
         '''Return the field descriptor definition that goes in .pb.c file.'''
-        width = self.required_descriptor_width(dependencies)
+        width = self.required_descriptor_width(dependencies, sizes, abi)
         if width == 1:
           width = 'AUTO'
 
-        result = 'PB_BIND(%s, %s, %s)\n' % (self.name, self.name, width)
+        result = self.tag_index_definition(width)
+        if result:
+            result += 'PB_BIND_WITH_TAGINDEX(%s, %s, %s)\n' % (self.name, self.name, width)
+        else:
+            result += 'PB_BIND(%s, %s, %s)\n' % (self.name, self.name, width)
+        return result
+
+    def tag_index_entries(self):
+        '''Return the entries of the tag lookup table, sorted by tag, as
+        (tag, index, required_index, submsg_index) tuples. The indexes are
+        the iterator position of the field in the FIELDLIST. Returns an
+        empty list if the tag_index option is not enabled.'''
+        if not self.tag_index:
+            return []
+
+        entries = []
+        index = required_index = submsg_index = 0
+        for field in sorted(self.fields):
+            for f in (field.fields if isinstance(field, OneOf) else [field]):
+                if f.pbtype != 'EXTENSION':
+                    entries.append((f.tag, index, required_index, submsg_index))
+                index += 1
+                if f.rules == 'REQUIRED':
+                    required_index += 1
+                if f.pbtype == 'MESSAGE':
+                    submsg_index += 1
+        entries.sort()
+        return entries
+
+    def tag_index_definition(self, width):
+        '''Return the tag lookup table definition that goes in .pb.c file.
+        Dense tags are indexed directly, sparse tags use a sorted table.'''
+        entries = self.tag_index_entries()
+        if not entries:
+            return ''
+
+        first_tag = entries[0][0]
+        span = entries[-1][0] - first_tag + 1
+        if span <= 2 * len(entries):
+            by_tag = dict((e[0], e) for e in entries)
+            entries = [by_tag.get(first_tag + i) for i in range(span)]
+        else:
+            first_tag = 0
+
+        result = 'PB_FIELD_INFO_POSITIONS(%s, %s, %s)\n' % (self.name, self.name, width)
+        result += 'const pb_tagindex_entry_t %s_tagindex_entries[] =\n{\n' % self.name
+        for entry in entries:
+            if entry is None:
+                result += '    PB_TAGINDEX_UNUSED\n'
+            else:
+                result += '    PB_TAGINDEX_ENTRY(%s, %d, %d, %d, %d)\n' % ((self.name,) + entry)
+        result += '};\n'
+        result += 'const pb_tagindex_t %s_tagindex = {%d, %d, %s_tagindex_entries};\n' % (
+            self.name, len(entries), first_tag, self.name)
         return result
 
-    def required_descriptor_width(self, dependencies):
-        '''Estimate how many words are necessary for each field descriptor.'''
+    def required_descriptor_width(self, dependencies, sizes = None, abi = None):
+        '''Choose the smallest field descriptor width that fits all fields.
+        The values are computed from the struct layout on the target ABI.
+        Returns 1 for AUTO width, where pb.h uses width 2 for some fields.'''
         if self.descriptorsize != nanopb_pb2.DS_AUTO:
             return int(self.descriptorsize)
 
         if not self.fields:
           return 1
 
+        if abi is None:
+            abi = TargetABI()
+
+        values = self.descriptor_values(dependencies, abi)
+        if values is None:
+            return self.estimate_descriptor_width(dependencies, sizes)
+
+        # Values that do not fit in 16 bits require PB_FIELD_32BIT.
+        for field_32bit in (abi.field_32bit, True):
+            for width in (1, 2, 4, 8):
+                for field, data_offset, data_size, size_offset, array_size in values:
+                    if width == 1:
+                        field_width = field.descriptor_auto_width()
+                    else:
+                        field_width = width
+
+                    if not descriptor_fits(field_width, field.tag, data_offset, data_size,
+                                           size_offset, array_size, field_32bit):
+                        break
+                else:
+                    return width
+
+        return 8
+
+    def estimate_descriptor_width(self, dependencies, sizes = None):
+        '''Estimate how many words are necessary for each field descriptor,
+        when the submessage types are not available.'''
         max_tag = max(field.tag for field in self.all_fields())
-        max_offset = self.data_size(dependencies)
+        if sizes and str(self.name) in sizes:
+            max_offset = sizes[str(self.name)][1]
+        else:
+            max_offset = self.data_size(dependencies, sizes)
         max_arraysize = max((field.max_count or 0) for field in self.all_fields())
-        max_datasize = max(field.data_size(dependencies) for field in self.all_fields())
+        datasizes = [field.data_size(dependencies, sizes) for field in self.all_fields()]
+        if max_offset is None or None in datasizes:
+            raise Exception("Cannot choose descriptor width for %s, because the type "
+                            "of a submessage is not known. Set the descriptorsize "
+                            "option for the message." % self.name)
+        max_datasize = max(datasizes)
 
         if max_arraysize > 0xFFFF:
             return 8
@@ -1078,23 +2621,28 @@ class Message:
             # be checked.
             return 1
 
-    def data_size(self, dependencies):
-        '''Return approximate sizeof(struct) in the compiled code.'''
-        return sum(f.data_size(dependencies) for f in self.fields)
+    def data_size(self, dependencies, sizes = None):
+        '''Return approximate sizeof(struct) in the compiled code.
+        If the type of a submessage is not known, returns None.'''
+        fsizes = [f.data_size(dependencies, sizes) for f in self.fields]
+        if None in fsizes:
+            return None
+        return sum(fsizes)
 
-    def encoded_size(self, dependencies):
+    def encoded_size(self, dependencies, sizes = None):
         '''Return the maximum size that this message can take when encoded.
         If the size cannot be determined, returns None.
         '''
-        size = EncodedSize(0)
+        fsizes = []
         for field in self.fields:
-            fsize = field.encoded_size(dependencies)
+            fsize = field.encoded_size(dependencies, sizes)
             if fsize is None:
                 return None
-            size += fsize
+            fsizes.append(fsize)
 
-        return size
+        return EncodedSize.sum(fsizes)
 
+    @timed_function('default value encoding')
     def default_value(self, dependencies):
         '''Generate serialized protobuf message that contains the
         default values for optional fields.'''
@@ -1105,48 +2653,69 @@ class Message:
         if self.desc.options.map_entry:
             return b''
 
-        optional_only = copy.deepcopy(self.desc)
-        enums = []
+        parsed_fields = dict((f.tag, f) for f in self.all_fields())
+        encoded = {}
+        oneof_members = {}
 
-        # Remove fields without default values
-        # The iteration is done in reverse order to avoid remove() messing up iteration.
-        for field in reversed(list(optional_only.field)):
-            parsed_field = self.field_for_tag(field.number)
+        for field in self.desc.field:
+            parsed_field = parsed_fields.get(field.number)
             if parsed_field is None or parsed_field.allocation != 'STATIC':
-                optional_only.field.remove(field)
+                continue
             elif (field.label == FieldD.LABEL_REPEATED or
                   field.type == FieldD.TYPE_MESSAGE or
                   not field.HasField('default_value')):
-                optional_only.field.remove(field)
-            elif field.type == FieldD.TYPE_ENUM:
-                # The partial descriptor doesn't include the enum type
-                # so we fake it with int64.
-                enums.append(field.name)
-                field.type = FieldD.TYPE_INT64
-
-        desc = google.protobuf.descriptor.MakeDescriptor(optional_only)
-        msg = reflection.MakeClass(desc)()
-
-        for field in optional_only.field:
-            if field.type == FieldD.TYPE_STRING:
-                setattr(msg, field.name, field.default_value)
-            elif field.type == FieldD.TYPE_BYTES:
-                setattr(msg, field.name, codecs.escape_decode(field.default_value)[0])
-            elif field.type in [FieldD.TYPE_FLOAT, FieldD.TYPE_DOUBLE]:
-                setattr(msg, field.name, float(field.default_value))
-            elif field.type == FieldD.TYPE_BOOL:
-                setattr(msg, field.name, field.default_value == 'true')
-            elif field.name in enums:
-                # Lookup the enum default value
-                enumname = names_from_type_name(field.type_name)
-                enumtype = dependencies[str(enumname)]
-                defvals = [v for n,v in enumtype.values if n.parts[-1] == field.default_value]
-                if defvals:
-                    setattr(msg, field.name, defvals[0])
+                continue
+
+            value = field.default_value
+            if field.type in (FieldD.TYPE_STRING, FieldD.TYPE_BYTES):
+                if field.type == FieldD.TYPE_STRING:
+                    data = value.encode('utf-8')
+                else:
+                    data = codecs.escape_decode(value)[0]
+                wiretype = 2
+                data = encode_varint(len(data)) + data
+            elif field.type in (FieldD.TYPE_FLOAT, FieldD.TYPE_FIXED32, FieldD.TYPE_SFIXED32):
+                wiretype = 5
+                fmt = {FieldD.TYPE_FLOAT: '<f', FieldD.TYPE_FIXED32: '<I', FieldD.TYPE_SFIXED32: '<i'}
+                value = float(value) if field.type == FieldD.TYPE_FLOAT else int(value)
+                data = struct.pack(fmt[field.type], value)
+            elif field.type in (FieldD.TYPE_DOUBLE, FieldD.TYPE_FIXED64, FieldD.TYPE_SFIXED64):
+                wiretype = 1
+                fmt = {FieldD.TYPE_DOUBLE: '<d', FieldD.TYPE_FIXED64: '<Q', FieldD.TYPE_SFIXED64: '<q'}
+                value = float(value) if field.type == FieldD.TYPE_DOUBLE else int(value)
+                data = struct.pack(fmt[field.type], value)
             else:
-                setattr(msg, field.name, int(field.default_value))
+                wiretype = 0
+                if field.type == FieldD.TYPE_BOOL:
+                    value = int(value == 'true')
+                elif field.type == FieldD.TYPE_ENUM:
+                    # Lookup the enum default value
+                    enumname = names_from_type_name(field.type_name)
+                    enumtype = dependencies[str(enumname)]
+                    defvals = [v for n,v in enumtype.values if n.parts[-1] == value]
+                    if not defvals:
+                        continue
+                    value = defvals[0]
+                elif field.type in (FieldD.TYPE_SINT32, FieldD.TYPE_SINT64):
+                    # Zigzag encoding
+                    value = int(value)
+                    value = (value << 1) if value >= 0 else ~(value << 1)
+                else:
+                    value = int(value)
+                data = encode_varint(value)
+
+            encoded[field.number] = encode_varint((field.number << 3) | wiretype) + data
+
+            # Setting a member of a oneof clears the other members, so only
+            # the last one with a default value is kept.
+            if field.HasField('oneof_index'):
+                previous = oneof_members.get(field.oneof_index)
+                if previous is not None:
+                    del encoded[previous]
+                oneof_members[field.oneof_index] = field.number
 
-        return msg.SerializeToString()
+        # Fields are serialized in the order of field numbers
+        return b''.join(encoded[tag] for tag in sorted(encoded))
 
 
 # ---------------------------------------------------------------------------
@@ -1181,24 +2750,55 @@ def iterate_extensions(desc, flatten = False, names = Names()):
         for extension in subdesc.extension:
             yield subname, extension
 
-def toposort2(data):
-    '''Topological sort.
-    From http://code.activestate.com/recipes/577413-topological-sort/
-    This function is under the MIT license.
+def toposort(data):
+    '''Topological sort of a dict {item: set of items it depends on}.
+    Items are returned in levels: first all items without dependencies,
+    then the items that depend only on those, and so on. Each level is
+    sorted, so that the order is deterministic.
     '''
-    for k, v in list(data.items()):
-        v.discard(k) # Ignore self dependencies
-    extra_items_in_deps = reduce(set.union, list(data.values()), set()) - set(data.keys())
-    data.update(dict([(item, set()) for item in extra_items_in_deps]))
+    remaining = {}
+    dependents = {}
+    for item, deps in data.items():
+        deps = set(deps)
+        deps.discard(item) # Ignore self dependencies
+        remaining[item] = len(deps)
+        for dep in deps:
+            dependents.setdefault(dep, []).append(item)
+            remaining.setdefault(dep, 0)
+
+    result = []
+    level = sorted(item for item, count in remaining.items() if count == 0)
+    while level:
+        result += level
+        next_level = []
+        for item in level:
+            for dependent in dependents.get(item, []):
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    next_level.append(dependent)
+        level = sorted(next_level)
+
+    if len(result) != len(remaining):
+        done = set(result)
+        raise Exception("Cyclic dependency between messages: " +
+                        ' -> '.join(find_cycle(data, done)))
+
+    return result
+
+def find_cycle(data, exclude):
+    '''Find a dependency cycle among the items of data that are not in
+    exclude. Returns the items of the cycle as a list, with the first item
+    repeated at the end.'''
+    start = min(item for item in data if item not in exclude)
+    path = [start]
+    position = {start: 0}
     while True:
-        ordered = set(item for item,dep in list(data.items()) if not dep)
-        if not ordered:
-            break
-        for item in sorted(ordered):
-            yield item
-        data = dict([(item, (dep - ordered)) for item,dep in list(data.items())
-                if item not in ordered])
-    assert not data, "A cyclic dependency exists amongst %r" % data
+        item = min(dep for dep in data[path[-1]]
+                   if dep not in exclude and dep in data and dep != path[-1])
+        if item in position:
+            return path[position[item]:] + [item]
+        position[item] = len(path)
+        path.append(item)
 
 def sort_dependencies(messages):
     '''Sort a list of Messages based on dependencies.'''
@@ -1208,7 +2808,7 @@ def sort_dependencies(messages):
         dependencies[str(message.name)] = set(message.get_dependencies())
         message_by_name[str(message.name)] = message
 
-    for msgname in toposort2(dependencies):
+    for msgname in toposort(dependencies):
         if msgname in message_by_name:
             yield message_by_name[msgname]
 
@@ -1223,17 +2823,24 @@ def make_identifier(headername):
     return result
 
 class ProtoFile:
-    def __init__(self, fdesc, file_options):
-        '''Takes a FileDescriptorProto and parses it.'''
+    def __init__(self, fdesc, file_options, context = None):
+        '''Takes a FileDescriptorProto and parses it.
+        context is the OptionContext used for resolving the options.'''
         self.fdesc = fdesc
         self.file_options = file_options
+        self.context = context
         self.dependencies = {}
+        self.abi = TargetABI()
+        self.sizes = None
+        self.enum_fields = None
+        self.sorted_messages = None
         self.parse()
 
         # Some of types used in this file probably come from the file itself.
         # Thus it has implicit dependency on itself.
         self.add_dependency(self)
 
+    @timed_function('ProtoFile.parse')
     def parse(self):
         self.enums = []
         self.messages = []
@@ -1271,12 +2878,12 @@ class ProtoFile:
 
         for enum in self.fdesc.enum_type:
             name = create_name(enum.name)
-            enum_options = get_nanopb_suboptions(enum, self.file_options, name)
+            enum_options = get_nanopb_suboptions(enum, self.file_options, name, self.context)
             self.enums.append(Enum(name, enum, enum_options))
 
         for names, message in iterate_messages(self.fdesc, flatten):
             name = create_name(names)
-            message_options = get_nanopb_suboptions(message, self.file_options, name)
+            message_options = get_nanopb_suboptions(message, self.file_options, name, self.context)
 
             if message_options.skip_message:
                 continue
@@ -1286,19 +2893,24 @@ class ProtoFile:
                     field.type_name = mangle_field_typename(field.type_name)
 
 
-            self.messages.append(Message(name, message, message_options))
+            with timed_message(name):
+                self.messages.append(Message(name, message, message_options, self.context))
             for enum in message.enum_type:
                 name = create_name(names + enum.name)
-                enum_options = get_nanopb_suboptions(enum, message_options, name)
+                enum_options = get_nanopb_suboptions(enum, message_options, name, self.context)
                 self.enums.append(Enum(name, enum, enum_options))
 
         for names, extension in iterate_extensions(self.fdesc, flatten):
             name = create_name(names + extension.name)
-            field_options = get_nanopb_suboptions(extension, self.file_options, name)
+            field_options = get_nanopb_suboptions(extension, self.file_options, name, self.context)
             if field_options.type != nanopb_pb2.FT_IGNORE:
                 self.extensions.append(ExtensionField(name, extension, field_options))
 
+    @timed_function('add_dependency')
     def add_dependency(self, other):
+        # Any previously calculated sizes may change with new dependencies
+        self.sizes = None
+
         for enum in other.enums:
             self.dependencies[str(enum.names)] = enum
             enum.protofile = other
@@ -1307,27 +2919,77 @@ class ProtoFile:
             self.dependencies[str(msg.name)] = msg
             msg.protofile = other
 
-        # Fix field default values where enum short names are used.
+        if self.enum_fields is None:
+            # Index the enum fields of this file by the enum type name
+            self.enum_fields = {}
+            for message in self.messages:
+                for field in message.fields:
+                    if field.pbtype in ('ENUM', 'UENUM'):
+                        self.enum_fields.setdefault(field.ctype.parts, []).append(field)
+
         for enum in other.enums:
+            fields = self.enum_fields.get(enum.names.parts)
+            if not fields:
+                continue
+
+            # Fix field default values where enum short names are used.
             if not enum.options.long_names:
-                for message in self.messages:
-                    for field in message.fields:
-                        if field.default in enum.value_longnames:
-                            idx = enum.value_longnames.index(field.default)
-                            field.default = enum.values[idx][0]
+                for field in fields:
+                    if field.default is not None:
+                        name = enum.longname_values.get(field.default.parts)
+                        if name is not None:
+                            field.default = name
 
-        # Fix field data types where enums have negative values.
-        for enum in other.enums:
+            # Fix field data types where enums have negative values.
             if not enum.has_negative():
-                for message in self.messages:
-                    for field in message.fields:
-                        if field.pbtype == 'ENUM' and field.ctype == enum.names:
-                            field.pbtype = 'UENUM'
+                for field in fields:
+                    if field.pbtype == 'ENUM':
+                        field.pbtype = 'UENUM'
+
+    def get_sorted_messages(self):
+        '''Return the messages of this file sorted so that each message
+        comes after the messages it depends on.'''
+        if self.sorted_messages is None:
+            self.sorted_messages = list(sort_dependencies(self.messages))
+        return self.sorted_messages
+
+    @timed_function('size analysis')
+    def analyze_sizes(self):
+        '''Calculate the encoded size and struct size of every message
+        known to this file. Messages are processed in dependency order, so
+        that each size is computed only once and reused by the submessage
+        fields that refer to it. Result is stored in self.sizes as a dict:
+            {'message_name': (encoded_size, data_size), ...}
+        '''
+        if self.sizes is not None:
+            return self.sizes
+
+        # Only the messages used by this file are needed. The messages of
+        # the dependencies may refer to files that have not been loaded.
+        names = set()
+        stack = [str(m.name) for m in self.messages]
+        while stack:
+            name = stack.pop()
+            msg = self.dependencies.get(name)
+            if name not in names and isinstance(msg, Message):
+                names.add(name)
+                stack.extend(msg.get_dependencies())
+
+        messages = [self.dependencies[name] for name in names]
+        sizes = {}
+        for msg in sort_dependencies(messages):
+            with timed_message(msg.name):
+                sizes[str(msg.name)] = (msg.encoded_size(self.dependencies, sizes),
+                                        msg.data_size(self.dependencies, sizes))
+
+        self.sizes = sizes
+        return sizes
 
     def generate_header(self, includes, headername, options):
         '''Generate content for a header file.
         Generates strings, which should be concatenated and stored to file.
         '''
+        sizes = self.analyze_sizes()
 
         yield '/* Automatically generated nanopb header */\n'
         if options.notimestamp:
@@ -1371,7 +3033,11 @@ class ProtoFile:
 
         if self.messages:
             yield '/* Struct definitions */\n'
-            for msg in sort_dependencies(self.messages):
+            for msg in self.get_sorted_messages():
+                msg.order_members(self.dependencies, self.abi)
+                if msg.padding_saved and options.verbose:
+                    sys.stderr.write('Reordered struct members of %s, saved %d bytes on %s\n'
+                                     % (msg.name, msg.padding_saved, msg.padding_abi))
                 yield msg.types()
                 yield str(msg) + '\n\n'
 
@@ -1385,14 +3051,14 @@ class ProtoFile:
             yield '/* Initializer values for message structs */\n'
             for msg in self.messages:
                 identifier = '%s_init_default' % msg.name
-                yield '#define %-40s %s\n' % (identifier, msg.get_initializer(False))
+                yield '#define %-40s %s\n' % (identifier, msg.get_initializer(False, self.dependencies))
             for msg in self.messages:
                 identifier = '%s_init_zero' % msg.name
-                yield '#define %-40s %s\n' % (identifier, msg.get_initializer(True))
+                yield '#define %-40s %s\n' % (identifier, msg.get_initializer(True, self.dependencies))
             yield '\n'
 
             yield '/* Field tags (for use in manual encoding/decoding) */\n'
-            for msg in sort_dependencies(self.messages):
+            for msg in self.get_sorted_messages():
                 for field in msg.fields:
                     yield field.tags()
             for extension in self.extensions:
@@ -1401,7 +3067,9 @@ class ProtoFile:
 
             yield '/* Struct field encoding specification for nanopb */\n'
             for msg in self.messages:
-                yield msg.fields_declaration(self.dependencies) + '\n'
+                with timed_message(msg.name):
+                    declaration = msg.fields_declaration(self.dependencies)
+                yield declaration + '\n'
             for msg in self.messages:
                 yield 'extern const pb_msgdesc_t %s_msg;\n' % msg.name
             yield '\n'
@@ -1411,9 +3079,21 @@ class ProtoFile:
               yield '#define %s_fields &%s_msg\n' % (msg.name, msg.name)
             yield '\n'
 
+            if [msg for msg in self.messages if msg.specialized]:
+                yield '/* Specialized encoding and decoding functions */\n'
+                for msg in self.messages:
+                    yield msg.specialized_declarations()
+                yield '\n'
+
+            if [msg for msg in self.messages if msg.size_functions]:
+                yield '/* Encoded size of message contents */\n'
+                for msg in self.messages:
+                    yield msg.size_declarations()
+                yield '\n'
+
             yield '/* Maximum encoded size of messages (where known) */\n'
             for msg in self.messages:
-                msize = msg.encoded_size(self.dependencies)
+                msize = sizes[str(msg.name)][0]
                 identifier = '%s_size' % msg.name
                 if msize is not None:
                     yield '#define %-40s %s\n' % (identifier, msize)
@@ -1434,7 +3114,7 @@ class ProtoFile:
 
               for msg in self.messages:
                   m = "-1"
-                  msize = msg.encoded_size(self.dependencies)
+                  msize = sizes[str(msg.name)][0]
                   if msize is not None:
                       m = msize
                   if hasattr(msg,'msgid'):
@@ -1457,6 +3137,7 @@ class ProtoFile:
 
     def generate_source(self, headername, options):
         '''Generate content for a source file.'''
+        sizes = self.analyze_sizes()
 
         yield '/* Automatically generated nanopb constant definitions */\n'
         if options.notimestamp:
@@ -1464,6 +3145,16 @@ class ProtoFile:
         else:
             yield '/* Generated by %s at %s. */\n\n' % (nanopb_version, time.asctime())
         yield options.genformat % (headername)
+        libheaders = []
+        if [msg for msg in self.messages if msg.specialized or msg.size_functions]:
+            libheaders.append('pb_encode.h')
+        if [msg for msg in self.messages if msg.specialized]:
+            libheaders.append('pb_decode.h')
+        for libheader in libheaders:
+            try:
+                yield options.libformat % libheader
+            except TypeError:
+                yield '#include <%s>\n' % libheader
         yield '\n'
         yield '/* @@protoc_insertion_point(includes) */\n'
 
@@ -1473,10 +3164,35 @@ class ProtoFile:
         yield '\n'
 
         for msg in self.messages:
-            yield msg.fields_definition(self.dependencies) + '\n\n'
+            with timed_message(msg.name):
+                definition = msg.fields_definition(self.dependencies, sizes, self.abi)
+            yield definition + '\n\n'
+
+        if [msg for msg in self.messages if msg.specialized or msg.size_functions]:
+            # Integer types used by the generated functions, as in pb_encode.c
+            yield '#ifdef PB_WITHOUT_64BIT\n'
+            yield '#define pb_int64_t int32_t\n'
+            yield '#define pb_uint64_t uint32_t\n'
+            yield '#else\n'
+            yield '#define pb_int64_t int64_t\n'
+            yield '#define pb_uint64_t uint64_t\n'
+            yield '#endif\n'
+            yield '\n'
+
+        for msg in self.messages:
+            if msg.specialized:
+                with timed_message(msg.name):
+                    definition = msg.specialized_definitions(self.dependencies)
+                yield definition + '\n'
+
+        for msg in self.messages:
+            if msg.size_functions:
+                with timed_message(msg.name):
+                    definition = msg.size_definitions(self.dependencies)
+                yield definition + '\n'
 
         for ext in self.extensions:
-            yield ext.extension_def(self.dependencies) + '\n'
+            yield ext.extension_def(self.dependencies, self.abi) + '\n'
 
         for enum in self.enums:
             yield enum.enum_to_string_definition() + '\n'
@@ -1492,6 +3208,15 @@ class ProtoFile:
                 yield '       setting PB_MAX_REQUIRED_FIELDS to %d or more.\n' % largest_count
                 yield '#endif\n'
 
+        # Add check that the library will use the tag lookup tables
+        indexed = [msg for msg in self.messages if msg.tag_index_entries()]
+        if indexed:
+            yield '\n/* Check that the tag lookup tables will be used */\n'
+            yield '#ifndef PB_ENABLE_TAG_INDEX\n'
+            yield '#error The tag_index option in %s requires \\\n' % indexed[0].name
+            yield '       defining PB_ENABLE_TAG_INDEX.\n'
+            yield '#endif\n'
+
         # Add check for sizeof(double)
         has_double = False
         for msg in self.messages:
@@ -1515,12 +3240,14 @@ class ProtoFile:
 #                    Options parsing for the .proto files
 # ---------------------------------------------------------------------------
 
-from fnmatch import fnmatchcase
+import fnmatch
 
+@timed_function('options file read')
 def read_options_file(infile):
     '''Parse a separate options file to list:
         [(namemask, options), ...]
     '''
+    import google.protobuf.text_format as text_format
     results = []
     data = infile.read()
     data = re.sub('/\*.*?\*/', '', data, flags = re.MULTILINE)
@@ -1552,26 +3279,187 @@ def read_options_file(infile):
 
     return results
 
-class Globals:
-    '''Ugly global variables, should find a good way to pass these.'''
-    verbose_options = False
-    separate_options = []
-    matched_namemasks = set()
+class NameMaskIndex:
+    '''Index of the name masks in a separate options file, for quickly
+    finding all masks that match a given name. Masks without wildcards
+    are looked up from a dictionary, masks of the form 'prefix*' from a
+    prefix tree and all other masks are combined into a single regex.
+    '''
+    # Maximum number of masks per regex, to stay below the limit on
+    # number of groups in older Python versions.
+    regex_chunk = 90
+
+    def __init__(self, separate_options):
+        '''separate_options is list of (namemask, options) as returned
+        by read_options_file().'''
+        self.separate_options = separate_options
+        self.values = [option_values(options) for namemask, options in separate_options]
+        self.exact = {}
+        self.prefix_tree = {}
+        self.regexes = []
+
+        patterns = []
+        for index, (namemask, options) in enumerate(separate_options):
+            if not self.has_wildcards(namemask):
+                self.exact.setdefault(namemask, []).append(index)
+            elif namemask.endswith('*') and not self.has_wildcards(namemask[:-1]):
+                node = self.prefix_tree
+                for c in namemask[:-1]:
+                    node = node.setdefault(c, {})
+                node.setdefault(None, []).append(index)
+            else:
+                regex = fnmatch.translate(namemask)
+                if regex.endswith('(?ms)'):
+                    # Python versions before 3.6 append the flags to the end.
+                    regex = regex[:-len('(?ms)')]
+                patterns.append((index, regex))
+
+        # Each mask becomes an optional lookahead group, so that a single
+        # match() call reports all of the masks that match the name.
+        # The regexes from fnmatch may contain groups of their own, so the
+        # indexes of the masks are stored along with each regex.
+        for i in range(0, len(patterns), self.regex_chunk):
+            chunk = patterns[i:i + self.regex_chunk]
+            regex = ''.join('(?=(?P<m%d>%s))?' % p for p in chunk)
+            groups = [('m%d' % index, index) for index, regex in chunk]
+            self.regexes.append((re.compile(regex, re.S), groups))
+
+    @staticmethod
+    def has_wildcards(namemask):
+        return '*' in namemask or '?' in namemask or '[' in namemask
+
+    def match(self, dotname):
+        '''Return list of (namemask, values) that match dotname, in the
+        same order as they were in the options file. The values are
+        given as returned by option_values().'''
+        indexes = list(self.exact.get(dotname, []))
+
+        node = self.prefix_tree
+        for c in dotname:
+            indexes += node.get(None, [])
+            node = node.get(c)
+            if node is None:
+                break
+        else:
+            indexes += node.get(None, [])
+
+        for regex, groups in self.regexes:
+            m = regex.match(dotname)
+            for group, index in groups:
+                if m.group(group) is not None:
+                    indexes.append(index)
+
+        return [(self.separate_options[i][0], self.values[i]) for i in sorted(indexes)]
+
+def option_values(options):
+    '''Return the fields that have been set in a NanoPBOptions message,
+    as a tuple of (name, value) pairs.'''
+    return tuple((field.name, value) for field, value in options.ListFields())
+
+class ResolvedOptions:
+    '''Read-only view of the NanoPBOptions that apply to a file, message,
+    field or enum. Options of each scope are resolved by laying the values
+    set for it over the options of the parent scope, without copying any
+    protobuf messages. Identical option sets are interned in the
+    OptionContext of the file, so a member that has no options of its own
+    shares the object of its parent scope.
+
+    Attribute access and HasField() work as with NanoPBOptions.
+    '''
+    _fields = nanopb_pb2.NanoPBOptions.DESCRIPTOR.fields_by_name
+
+    def __init__(self, values):
+        '''values is a dict of the fields that have been set.'''
+        self._values = values
+
+    @classmethod
+    def from_message(cls, options, context):
+        '''Create from a NanoPBOptions message.'''
+        return context.resolved_options(dict(option_values(options)))
+
+    def overlay(self, layers, context):
+        '''Return options with each layer of (name, value) pairs applied
+        in order on top of these options.'''
+        layers = [layer for layer in layers if layer]
+        if not layers:
+            return self
+
+        values = dict(self._values)
+        for layer in layers:
+            values.update(layer)
+        return context.resolved_options(values)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+
+        try:
+            return self._fields[name].default_value
+        except KeyError:
+            raise AttributeError(name)
+
+    def HasField(self, name):
+        return name in self._values
+
+    def to_message(self):
+        '''Return the options as a NanoPBOptions message.'''
+        options = nanopb_pb2.NanoPBOptions()
+        for name, value in self._values.items():
+            setattr(options, name, value)
+        return options
+
+class OptionContext:
+    '''State used while resolving the options of one .proto file:
+    the name masks of its separate .options file, the masks that have
+    matched so far and the interned ResolvedOptions. Kept per file, so
+    that several files can be processed at the same time and the state is
+    released along with the file.
+    separate_options: List of (namemask, options) from read_options_file().
+    verbose: Print the resolved options of each member to stderr.
+    '''
+    def __init__(self, separate_options = [], verbose = False):
+        self.separate_options = separate_options
+        self.index = NameMaskIndex(separate_options)
+        self.matched_namemasks = set()
+        self.verbose = verbose
+        self.interned = {}
+
+    def resolved_options(self, values):
+        '''Return the shared ResolvedOptions for the given dict of values.'''
+        key = frozenset(values.items())
+        result = self.interned.get(key)
+        if result is None:
+            result = self.interned[key] = ResolvedOptions(values)
+        return result
+
+    def unmatched_namemasks(self):
+        '''Return the name masks that have not matched any member.'''
+        return [n for n, o in self.separate_options if n not in self.matched_namemasks]
 
-def get_nanopb_suboptions(subdesc, options, name):
-    '''Get copy of options, and merge information from subdesc.'''
-    new_options = nanopb_pb2.NanoPBOptions()
-    new_options.CopyFrom(options)
+@timed_function('get_nanopb_suboptions')
+def get_nanopb_suboptions(subdesc, options, name, context = None):
+    '''Get options for subdesc, resolved on top of the parent options.
+    Both options and the return value are ResolvedOptions instances.
+    context is the OptionContext of the file, or None if there are no
+    separate options.'''
+    if context is None:
+        context = OptionContext()
+
+    layers = []
 
     if hasattr(subdesc, 'syntax') and subdesc.syntax == "proto3":
-        new_options.proto3 = True
+        layers.append((('proto3', True),))
 
     # Handle options defined in a separate file
     dotname = '.'.join(name.parts)
-    for namemask, options in Globals.separate_options:
-        if fnmatchcase(dotname, namemask):
-            Globals.matched_namemasks.add(namemask)
-            new_options.MergeFrom(options)
+    for namemask, values in context.index.match(dotname):
+        context.matched_namemasks.add(namemask)
+        layers.append(values)
 
     # Handle options defined in .proto
     if isinstance(subdesc.options, descriptor.FieldOptions):
@@ -1587,11 +3475,14 @@ def get_nanopb_suboptions(subdesc, options, name):
 
     if subdesc.options.HasExtension(ext_type):
         ext = subdesc.options.Extensions[ext_type]
-        new_options.MergeFrom(ext)
+        layers.append(option_values(ext))
+
+    new_options = options.overlay(layers, context)
 
-    if Globals.verbose_options:
+    if context.verbose:
+        import google.protobuf.text_format as text_format
         sys.stderr.write("Options for " + dotname + ": ")
-        sys.stderr.write(text_format.MessageToString(new_options) + "\n")
+        sys.stderr.write(text_format.MessageToString(new_options.to_message()) + "\n")
 
     return new_options
 
@@ -1604,58 +3495,84 @@ import sys
 import os.path
 from optparse import OptionParser
 
-optparser = OptionParser(
-    usage = "Usage: nanopb_generator.py [options] file.pb ...",
-    epilog = "Compile file.pb from file.proto by: 'protoc -ofile.pb file.proto'. " +
-             "Output will be written to file.pb.h and file.pb.c.")
-optparser.add_option("-x", dest="exclude", metavar="FILE", action="append", default=[],
-    help="Exclude file from generated #include list.")
-optparser.add_option("-e", "--extension", dest="extension", metavar="EXTENSION", default=".pb",
-    help="Set extension to use instead of '.pb' for generated files. [default: %default]")
-optparser.add_option("-H", "--header-extension", dest="header_extension", metavar="EXTENSION", default=".h",
-    help="Set extension to use for generated header files. [default: %default]")
-optparser.add_option("-S", "--source-extension", dest="source_extension", metavar="EXTENSION", default=".c",
-    help="Set extension to use for generated source files. [default: %default]")
-optparser.add_option("-f", "--options-file", dest="options_file", metavar="FILE", default="%s.options",
-    help="Set name of a separate generator options file.")
-optparser.add_option("-I", "--options-path", dest="options_path", metavar="DIR",
-    action="append", default = [],
-    help="Search for .options files additionally in this path")
-optparser.add_option("-D", "--output-dir", dest="output_dir",
-                     metavar="OUTPUTDIR", default=None,
-                     help="Output directory of .pb.h and .pb.c files")
-optparser.add_option("-Q", "--generated-include-format", dest="genformat",
-    metavar="FORMAT", default='#include "%s"\n',
-    help="Set format string to use for including other .pb.h files. [default: %default]")
-optparser.add_option("-L", "--library-include-format", dest="libformat",
-    metavar="FORMAT", default='#include <%s>\n',
-    help="Set format string to use for including the nanopb pb.h header. [default: %default]")
-optparser.add_option("--strip-path", dest="strip_path", action="store_true", default=False,
-    help="Strip directory path from #included .pb.h file name")
-optparser.add_option("--no-strip-path", dest="strip_path", action="store_false",
-    help="Opposite of --strip-path (default since 0.4.0)")
-optparser.add_option("-T", "--no-timestamp", dest="notimestamp", action="store_true", default=True,
-    help="Don't add timestamp to .pb.h and .pb.c preambles (default since 0.4.0)")
-optparser.add_option("-t", "--timestamp", dest="notimestamp", action="store_false", default=True,
-    help="Add timestamp to .pb.h and .pb.c preambles")
-optparser.add_option("-q", "--quiet", dest="quiet", action="store_true", default=False,
-    help="Don't print anything except errors.")
-optparser.add_option("-v", "--verbose", dest="verbose", action="store_true", default=False,
-    help="Print more information.")
-optparser.add_option("-s", dest="settings", metavar="OPTION:VALUE", action="append", default=[],
-    help="Set generator option (max_size, max_count etc.).")
-
-def parse_file(filename, fdesc, options):
-    '''Parse a single file. Returns a ProtoFile instance.'''
-    toplevel_options = nanopb_pb2.NanoPBOptions()
-    for s in options.settings:
-        text_format.Merge(s, toplevel_options)
-
-    if not fdesc:
-        data = open(filename, 'rb').read()
-        fdesc = descriptor.FileDescriptorSet.FromString(data).file[0]
+def make_optparser():
+    '''Create the parser for the generator options. A new parser is made
+    for each use, as parse_args() appends to the default lists of the
+    parser and the usage text is changed for the protoc plugin.'''
+    optparser = OptionParser(
+        usage = "Usage: nanopb_generator.py [options] file.pb ...",
+        epilog = "Compile file.pb from file.proto by: 'protoc -ofile.pb file.proto'. " +
+                 "Output will be written to file.pb.h and file.pb.c.")
+    optparser.add_option("-x", dest="exclude", metavar="FILE", action="append", default=[],
+        help="Exclude file from generated #include list.")
+    optparser.add_option("-e", "--extension", dest="extension", metavar="EXTENSION", default=".pb",
+        help="Set extension to use instead of '.pb' for generated files. [default: %default]")
+    optparser.add_option("-H", "--header-extension", dest="header_extension", metavar="EXTENSION", default=".h",
+        help="Set extension to use for generated header files. [default: %default]")
+    optparser.add_option("-S", "--source-extension", dest="source_extension", metavar="EXTENSION", default=".c",
+        help="Set extension to use for generated source files. [default: %default]")
+    optparser.add_option("-f", "--options-file", dest="options_file", metavar="FILE", default="%s.options",
+        help="Set name of a separate generator options file.")
+    optparser.add_option("-I", "--options-path", dest="options_path", metavar="DIR",
+        action="append", default = [],
+        help="Search for .options files additionally in this path")
+    optparser.add_option("-D", "--output-dir", dest="output_dir",
+                         metavar="OUTPUTDIR", default=None,
+                         help="Output directory of .pb.h and .pb.c files")
+    optparser.add_option("-Q", "--generated-include-format", dest="genformat",
+        metavar="FORMAT", default='#include "%s"\n',
+        help="Set format string to use for including other .pb.h files. [default: %default]")
+    optparser.add_option("-L", "--library-include-format", dest="libformat",
+        metavar="FORMAT", default='#include <%s>\n',
+        help="Set format string to use for including the nanopb pb.h header. [default: %default]")
+    optparser.add_option("--strip-path", dest="strip_path", action="store_true", default=False,
+        help="Strip directory path from #included .pb.h file name")
+    optparser.add_option("--no-strip-path", dest="strip_path", action="store_false",
+        help="Opposite of --strip-path (default since 0.4.0)")
+    optparser.add_option("-T", "--no-timestamp", dest="notimestamp", action="store_true", default=True,
+        help="Don't add timestamp to .pb.h and .pb.c preambles (default since 0.4.0)")
+    optparser.add_option("-t", "--timestamp", dest="notimestamp", action="store_false", default=True,
+        help="Add timestamp to .pb.h and .pb.c preambles")
+    optparser.add_option("--target-abi", dest="target_abi", metavar="ABI[,TYPE=SIZE[:ALIGN]]", default="default",
+        help="Sizes of C types on the target, used for choosing the field descriptor width. "
+             "Presets: %s. [default: %%default]" % ', '.join(sorted(TargetABI.presets)))
+    optparser.add_option("-q", "--quiet", dest="quiet", action="store_true", default=False,
+        help="Don't print anything except errors.")
+    optparser.add_option("-v", "--verbose", dest="verbose", action="store_true", default=False,
+        help="Print more information.")
+    optparser.add_option("-s", dest="settings", metavar="OPTION:VALUE", action="append", default=[],
+        help="Set generator option (max_size, max_count etc.).")
+    optparser.add_option("--generate", dest="generate", metavar="NAME.proto", action="append", default=[],
+        help="Generate only the given file from a .pb file that contains several files. Can be given multiple times.")
+    optparser.add_option("-j", "--jobs", dest="jobs", metavar="N", type="int", default=1,
+        help="Number of files to generate in parallel. [default: %default]")
+    optparser.add_option("--always-write", dest="always_write", action="store_true", default=False,
+        help="Rewrite output files even when their contents have not changed.")
+    optparser.add_option("--cache-dir", dest="cache_dir", metavar="DIR", default=None,
+        help="Store generated files in a cache directory and reuse them when the inputs are unchanged.")
+    optparser.add_option("--cache-size", dest="cache_size", metavar="MB", type="int", default=256,
+        help="Maximum size of the cache directory in megabytes. [default: %default]")
+    optparser.add_option("--timings", dest="timings", action="store_true", default=False,
+        help="Print the time spent in each phase of the generator.")
+    optparser.add_option("--timings-json", dest="timings_json", metavar="FILE", default=None,
+        help="Write the phase and message timings to a JSON file.")
+    optparser.add_option("--profile", dest="profile", metavar="DIR", default=None,
+        help="Write cProfile statistics for each input file to DIR and print the slowest messages.")
+    optparser.add_option("--profile-top", dest="profile_top", metavar="N", type="int", default=10,
+        help="Number of slowest messages to print with --profile. [default: %default]")
+    return optparser
+
+def parse_options(args = []):
+    '''Parse generator options given as a list of command line arguments,
+    for example ['-s', 'max_size:16']. Returns tuple (options, other arguments).
+    '''
+    return make_optparser().parse_args(list(args))
 
-    # Check if there is a separate .options file
+def find_options_file(filename, options):
+    '''Locate the separate .options file for a .proto file.
+    Returns tuple (optfilename, found, had_abspath), where optfilename
+    includes the search path if the file was found.
+    '''
     had_abspath = False
     try:
         optfilename = options.options_file % os.path.splitext(filename)[0]
@@ -1667,33 +3584,199 @@ def parse_file(filename, fdesc, options):
     paths = ['.'] + options.options_path
     for p in paths:
         if os.path.isfile(os.path.join(p, optfilename)):
-            optfilename = os.path.join(p, optfilename)
-            if options.verbose:
-                sys.stderr.write('Reading options from ' + optfilename + '\n')
-            Globals.separate_options = read_options_file(open(optfilename, "rU"))
-            break
+            return os.path.join(p, optfilename), True, had_abspath
+
+    return optfilename, False, had_abspath
+
+def parse_file(filename, fdesc, options):
+    '''Parse a single file. Returns a ProtoFile instance.'''
+    toplevel_options = nanopb_pb2.NanoPBOptions()
+    if options.settings:
+        import google.protobuf.text_format as text_format
+    for s in options.settings:
+        text_format.Merge(s, toplevel_options)
+
+    if not fdesc:
+        with timed('descriptor load'):
+            data = open(filename, 'rb').read()
+            fdesc = descriptor.FileDescriptorSet.FromString(data).file[0]
+
+    # Check if there is a separate .options file
+    optfilename, found, had_abspath = find_options_file(filename, options)
+    separate_options = []
+    if found:
+        if options.verbose:
+            sys.stderr.write('Reading options from ' + optfilename + '\n')
+        separate_options = read_options_file(open(optfilename, "rU"))
     else:
         # If we are given a full filename and it does not exist, give an error.
         # However, don't give error when we automatically look for .options file
         # with the same name as .proto.
         if options.verbose or had_abspath:
             sys.stderr.write('Options file not found: ' + optfilename + '\n')
-        Globals.separate_options = []
 
-    Globals.matched_namemasks = set()
+    context = OptionContext(separate_options, options.verbose)
 
     # Parse the file
-    file_options = get_nanopb_suboptions(fdesc, toplevel_options, Names([filename]))
-    f = ProtoFile(fdesc, file_options)
+    toplevel_options = ResolvedOptions.from_message(toplevel_options, context)
+    file_options = get_nanopb_suboptions(fdesc, toplevel_options, Names([filename]), context)
+    f = ProtoFile(fdesc, file_options, context)
+    f.abi = TargetABI(options.target_abi)
     f.optfilename = optfilename
-
     return f
 
+class LazyProtoFiles:
+    '''Dictionary-like collection of the files known to protoc.
+    Each file is parsed only when it is first accessed, so that files
+    which are not referenced by the files being generated do not need
+    to be parsed at all.
+    '''
+    def __init__(self, fdescs, options):
+        self.fdescs = dict((fdesc.name, fdesc) for fdesc in fdescs)
+        self.options = options
+        self.parsed = {}
+
+        self.serialized = {}
+
+    def __contains__(self, filename):
+        return filename in self.fdescs
+
+    def __getitem__(self, filename):
+        if filename not in self.parsed:
+            self.serialized_fdesc(filename)
+            self.parsed[filename] = parse_file(filename, self.fdescs[filename], self.options)
+        return self.parsed[filename]
+
+    def serialized_fdesc(self, filename):
+        '''Return the FileDescriptorProto as serialized before parsing.'''
+        if filename not in self.serialized:
+            self.serialized[filename] = self.fdescs[filename].SerializeToString()
+        return self.serialized[filename]
+
+def transitive_dependencies(fdesc, other_files):
+    '''Return the names of the files that fdesc imports directly or
+    indirectly, in breadth-first order. Files not in other_files are
+    skipped, and so are their imports.
+    '''
+    result = []
+    seen = set([fdesc.name])
+    queue = list(fdesc.dependency)
+    while queue:
+        dep = queue.pop(0)
+        if dep in seen or dep not in other_files:
+            continue
+        seen.add(dep)
+        result.append(dep)
+        if isinstance(other_files, LazyProtoFiles):
+            # Avoid parsing the file just to find its imports
+            queue.extend(other_files.fdescs[dep].dependency)
+        else:
+            queue.extend(other_files[dep].fdesc.dependency)
+    return result
+
+# ---------------------------------------------------------------------------
+#                    Cache of generated files
+# ---------------------------------------------------------------------------
+
+def generator_cache_key(filename, fdesc, options, other_files):
+    '''Compute a hash of everything that affects the generated output:
+    the file descriptor, the .options file contents, the command line
+    options and the generator version. Dependencies are included in the
+    same way, as their contents affect e.g. message sizes.
+    '''
+    import hashlib
+
+    def add_file(h, name, data):
+        h.update(name.encode('utf-8') + b'\0')
+        h.update(str(len(data)).encode('ascii') + b'\0' + data)
+
+        optfilename, found, dummy = find_options_file(name, options)
+        if found:
+            add_file_data(h, open(optfilename, 'rb').read())
+        else:
+            add_file_data(h, b'')
+
+    def add_file_data(h, data):
+        h.update(str(len(data)).encode('ascii') + b'\0' + data)
+
+    # Options that only affect how the generator runs, not its output.
+    ignored = ('jobs', 'cache_dir', 'cache_size', 'quiet', 'verbose', 'output_dir',
+               'always_write', 'timings', 'timings_json', 'profile', 'profile_top',
+               'generate')
+    cmdline = sorted((k, v) for k, v in vars(options).items() if k not in ignored)
+
+    h = hashlib.sha256()
+    h.update(nanopb_version.encode('utf-8') + b'\0')
+    h.update(repr(cmdline).encode('utf-8') + b'\0')
+    add_file(h, filename, fdesc.SerializeToString())
+    for dep in transitive_dependencies(fdesc, other_files):
+        add_file(h, dep, other_files.serialized_fdesc(dep))
+    return h.hexdigest()
+
+def cache_lookup(cache_dir, key):
+    '''Return the cached entry for key, or None if it is not in cache.'''
+    import json
+    path = os.path.join(cache_dir, key + '.json')
+    try:
+        with open(path, 'rb') as f:
+            entry = json.loads(f.read().decode('utf-8'))
+        # Mark the entry as recently used
+        os.utime(path, None)
+    except (IOError, OSError, ValueError):
+        # Missing, evicted or partially written entry
+        return None
+    return entry
+
+def cache_store(cache_dir, key, entry, max_size):
+    '''Store entry in the cache, and evict the least recently used
+    entries if the cache grows larger than max_size bytes.
+    Writes are atomic, so that several generator processes can safely
+    share the same cache directory.
+    '''
+    import json, tempfile
+    if not os.path.isdir(cache_dir):
+        try:
+            os.makedirs(cache_dir)
+        except OSError:
+            if not os.path.isdir(cache_dir):
+                raise
+
+    fd, tmpname = tempfile.mkstemp(dir = cache_dir, suffix = '.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(json.dumps(entry).encode('utf-8'))
+    os.chmod(tmpname, 0o644)
+    try:
+        os.rename(tmpname, os.path.join(cache_dir, key + '.json'))
+    except OSError:
+        # Another process stored the same entry concurrently
+        os.remove(tmpname)
+
+    entries = []
+    total = 0
+    for name in os.listdir(cache_dir):
+        if name.endswith('.json'):
+            try:
+                st = os.stat(os.path.join(cache_dir, name))
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, name))
+            total += st.st_size
+
+    for mtime, size, name in sorted(entries):
+        if total <= max_size:
+            break
+        try:
+            os.remove(os.path.join(cache_dir, name))
+        except OSError:
+            pass # Already removed by someone else
+        total -= size
+
 def process_file(filename, fdesc, options, other_files = {}):
     '''Process a single file.
     filename: The full path to the .proto or .pb source file, as string.
     fdesc: The loaded FileDescriptorSet, or None to read from the input file.
     options: Command line options as they come from OptionsParser.
+    other_files: Already parsed dependencies, as dict or LazyProtoFiles.
 
     Returns a dict:
         {'headername': Name of header file,
@@ -1702,12 +3785,26 @@ def process_file(filename, fdesc, options, other_files = {}):
          'sourcedata': Data for the .c source code file
         }
     '''
+    if fdesc is None:
+        with timed('descriptor load'):
+            data = open(filename, 'rb').read()
+            fdesc = descriptor.FileDescriptorSet.FromString(data).file[0]
+
+    # Timestamps and verbose messages cannot be reproduced from cache
+    cache_key = None
+    if options.cache_dir and options.notimestamp and not options.verbose:
+        cache_key = generator_cache_key(filename, fdesc, options, other_files)
+        entry = cache_lookup(options.cache_dir, cache_key)
+        if entry is not None:
+            warn_unmatched_options(entry['optfilename'], entry['unmatched'], options)
+            return entry['results']
+
     f = parse_file(filename, fdesc, options)
 
-    # Provide dependencies if available
-    for dep in f.fdesc.dependency:
-        if dep in other_files:
-            f.add_dependency(other_files[dep])
+    # Provide dependencies if available. Indirect dependencies are needed
+    # for resolving the sizes of submessages defined in them.
+    for dep in transitive_dependencies(fdesc, other_files):
+        f.add_dependency(other_files[dep])
 
     # Decide the file names
     noext = os.path.splitext(filename)[0]
@@ -1724,23 +3821,202 @@ def process_file(filename, fdesc, options, other_files = {}):
     excludes = ['nanopb.proto', 'google/protobuf/descriptor.proto'] + options.exclude
     includes = [d for d in f.fdesc.dependency if d not in excludes]
 
-    headerdata = ''.join(f.generate_header(includes, headerbasename, options))
-    sourcedata = ''.join(f.generate_source(headerbasename, options))
+    f.analyze_sizes()
+    with timed('header emit'):
+        headerdata = ''.join(f.generate_header(includes, headerbasename, options))
+    with timed('source emit'):
+        sourcedata = ''.join(f.generate_source(headerbasename, options))
 
     # Check if there were any lines in .options that did not match a member
-    unmatched = [n for n,o in Globals.separate_options if n not in Globals.matched_namemasks]
+    unmatched = f.context.unmatched_namemasks()
+    warn_unmatched_options(f.optfilename, unmatched, options)
+
+    results = {'headername': headername, 'headerdata': headerdata,
+               'sourcename': sourcename, 'sourcedata': sourcedata}
+
+    if cache_key is not None:
+        entry = {'results': results, 'optfilename': f.optfilename, 'unmatched': unmatched}
+        cache_store(options.cache_dir, cache_key, entry, options.cache_size * 1024 * 1024)
+
+    return results
+
+def warn_unmatched_options(optfilename, unmatched, options):
+    '''Warn about lines in .options file that did not match any member.'''
     if unmatched and not options.quiet:
-        sys.stderr.write("Following patterns in " + f.optfilename + " did not match any fields: "
+        sys.stderr.write("Following patterns in " + optfilename + " did not match any fields: "
                          + ', '.join(unmatched) + "\n")
-        if not Globals.verbose_options:
+        if not options.verbose:
             sys.stderr.write("Use  protoc --nanopb-out=-v:.   to see a list of the field names.\n")
 
-    return {'headername': headername, 'headerdata': headerdata,
-            'sourcename': sourcename, 'sourcedata': sourcedata}
+def process_file_task(args):
+    '''Run process_file() for one task in a worker process.
+    args is a tuple (options, filename, fdesc, other_files).
+    '''
+    options, filename, fdesc, other_files = args
+    return process_file(filename, fdesc, options, other_files)
+
+def process_files(tasks, options):
+    '''Process multiple files, in parallel if options.jobs is above 1.
+    tasks: List of (filename, fdesc, other_files) tuples for process_file().
+
+    Returns list of process_file() results, in the same order as tasks.
+    '''
+    jobs = min(options.jobs, len(tasks))
+    if timing_state.timings is not None:
+        # Timings are collected only in this process
+        jobs = 1
+
+    if jobs <= 1:
+        if options.profile:
+            return [profile_file(filename, fdesc, options, other_files)
+                    for filename, fdesc, other_files in tasks]
+        return [process_file(filename, fdesc, options, other_files)
+                for filename, fdesc, other_files in tasks]
+
+    import multiprocessing
+    pool = multiprocessing.Pool(jobs)
+    try:
+        return pool.map(process_file_task, [(options,) + task for task in tasks])
+    finally:
+        pool.close()
+        pool.join()
+
+def generate(file_descriptors, options = None, files_to_generate = None):
+    '''Generate code in-process, for use from Python build tools.
+    file_descriptors: FileDescriptorSet, or a list of FileDescriptorProto.
+        Should include the dependencies of the files to generate, as with
+        'protoc --include_imports -o'.
+    options: List of generator options as on the command line, for example
+        ['-s', 'max_size:16'], or the options returned by parse_options().
+    files_to_generate: Names of the .proto files to generate code for, as
+        given in the descriptors. By default code is generated for all files.
+
+    Returns a dict {filename: content} of the generated .pb.h and .pb.c files.
+    All state is kept per call, so this is safe to call concurrently from
+    multiple threads. The options object is not modified.
+    '''
+    if options is None:
+        options = []
+    if isinstance(options, (list, tuple)):
+        options, dummy = parse_options(options)
+
+    fdescs = list(getattr(file_descriptors, 'file', file_descriptors))
+    if files_to_generate is None:
+        files_to_generate = [fdesc.name for fdesc in fdescs]
+
+    by_name = dict((fdesc.name, fdesc) for fdesc in fdescs)
+    other_files = LazyProtoFiles(fdescs, options)
+    tasks = []
+    for filename in files_to_generate:
+        if filename not in by_name:
+            raise Exception("File not found in the descriptors: " + filename)
+        tasks.append((filename, by_name[filename], other_files))
+
+    output = {}
+    for results in process_files(tasks, options):
+        output[results['headername']] = results['headerdata']
+        output[results['sourcename']] = results['sourcedata']
+    return output
+
+def profile_file(filename, fdesc, options, other_files):
+    '''Run process_file() under cProfile and write the statistics to the
+    directory given by options.profile, as <filename>.prof.
+    The file can be examined with the pstats module or e.g. snakeviz.
+    '''
+    import cProfile
+    if not os.path.isdir(options.profile):
+        os.makedirs(options.profile)
+
+    profiler = cProfile.Profile()
+    results = profiler.runcall(process_file, filename, fdesc, options, other_files)
+
+    statsname = re.sub(r'[/\\:]', '_', filename) + '.prof'
+    profiler.dump_stats(os.path.join(options.profile, statsname))
+    return results
+
+def start_timings(options):
+    '''Enable collection of timings if requested by options.'''
+    if options.timings or options.timings_json or options.profile:
+        timing_state.timings = Timings()
+    else:
+        timing_state.timings = None
+
+def report_timings(options):
+    '''Print or store the timings collected since start_timings().'''
+    timings = timing_state.timings
+    if timings is None:
+        return
+
+    if options.timings:
+        sys.stderr.write("Generator phase timings (self time excludes nested phases):\n")
+        sys.stderr.write(timings.format_phases())
+
+    if options.profile:
+        sys.stderr.write("Slowest messages:\n")
+        sys.stderr.write(timings.format_messages(options.profile_top))
+
+    if options.timings_json:
+        import json
+        with open(options.timings_json, 'w') as f:
+            json.dump(timings.to_dict(), f, indent = 2)
+
+def cli_tasks(filenames, options):
+    '''Load the descriptor sets given on the command line.
+    Returns list of (filename, fdesc, other_files) tasks for process_files().
+
+    A set with a single file is generated as before, with the output file
+    names based on the name of the .pb file. When a set has several files,
+    such as from 'protoc --include_imports -o', all of them are generated
+    and the output names are taken from the .proto names, relative to the
+    directory of the .pb file. The files share the parsed dependencies.
+    The --generate option selects which files to generate.
+    '''
+    selected = options.generate
+    excludes = ['nanopb.proto', 'google/protobuf/descriptor.proto'] + options.exclude
+    found = set()
+    tasks = []
+    for filename in filenames:
+        with timed('descriptor load'):
+            data = open(filename, 'rb').read()
+            fdescs = descriptor.FileDescriptorSet.FromString(data).file
+
+        if len(fdescs) == 1 and not selected:
+            tasks.append((filename, fdescs[0], {}))
+            continue
+
+        # Look for the .options files of the dependencies also next to the .pb
+        pbdir = os.path.dirname(filename)
+        if pbdir and pbdir not in options.options_path:
+            options.options_path.append(pbdir)
+
+        other_files = LazyProtoFiles(fdescs, options)
+        for fdesc in fdescs:
+            if selected:
+                if fdesc.name not in selected:
+                    continue
+            elif fdesc.name in excludes:
+                continue
+
+            found.add(fdesc.name)
+            if options.jobs > 1:
+                # Pass only the dependencies to worker processes
+                names = transitive_dependencies(fdesc, other_files)
+                deps = [d for d in fdescs if d.name in names]
+                tasks.append((os.path.join(pbdir, fdesc.name), fdesc, LazyProtoFiles(deps, options)))
+            else:
+                tasks.append((os.path.join(pbdir, fdesc.name), fdesc, other_files))
+
+    missing = [name for name in selected if name not in found]
+    if missing:
+        sys.stderr.write("Files not found in the descriptor sets: %s\n" % ', '.join(missing))
+        sys.exit(1)
+
+    return tasks
 
 def main_cli():
     '''Main function when invoked directly from the command line.'''
 
+    optparser = make_optparser()
     options, filenames = optparser.parse_args()
 
     if not filenames:
@@ -1756,26 +4032,54 @@ def main_cli():
         sys.exit(1)
 
     if options.verbose:
+        import google.protobuf
         sys.stderr.write('Google Python protobuf library imported from %s, version %s\n'
                          % (google.protobuf.__file__, google.protobuf.__version__))
 
-    Globals.verbose_options = options.verbose
-    for filename in filenames:
-        results = process_file(filename, None, options)
-
+    start_timings(options)
+    tasks = cli_tasks(filenames, options)
+    rewritten = 0
+    unchanged = 0
+    for results in process_files(tasks, options):
         base_dir = options.output_dir or ''
         to_write = [
             (os.path.join(base_dir, results['headername']), results['headerdata']),
             (os.path.join(base_dir, results['sourcename']), results['sourcedata']),
         ]
 
-        if not options.quiet:
+        if not options.always_write:
+            # Leave files with identical contents untouched, so that their
+            # modification time does not trigger needless recompilation.
+            count = len(to_write)
+            to_write = [(path, data) for path, data in to_write
+                        if not file_has_contents(path, data)]
+            unchanged += count - len(to_write)
+
+        if to_write and not options.quiet:
             paths = " and ".join([x[0] for x in to_write])
             sys.stderr.write("Writing to %s\n" % paths)
 
         for path, data in to_write:
+            dirname = os.path.dirname(path)
+            if dirname and not os.path.isdir(dirname):
+                os.makedirs(dirname)
             with open(path, 'w') as f:
                 f.write(data)
+            rewritten += 1
+
+    if (rewritten or unchanged) and not options.quiet:
+        sys.stderr.write("%d files rewritten, %d files unchanged\n"
+                         % (rewritten, unchanged))
+
+    report_timings(options)
+
+def file_has_contents(path, data):
+    '''Check if the file at path already contains exactly data.'''
+    try:
+        with open(path, 'r') as f:
+            return f.read() == data
+    except (IOError, OSError, UnicodeDecodeError):
+        return False
 
 def main_plugin():
     '''Main function when invoked as a protoc plugin.'''
@@ -1788,8 +4092,21 @@ def main_plugin():
         msvcrt.setmode(sys.stdout.fileno(), os.O_BINARY)
 
     data = io.open(sys.stdin.fileno(), "rb").read()
+    io.open(sys.stdout.fileno(), "wb").write(process_plugin_request(data))
 
+def process_plugin_request(data):
+    '''Process a serialized CodeGeneratorRequest from protoc.
+    Returns the serialized CodeGeneratorResponse.
+    '''
+    # Timings are enabled by the options inside the request, so the
+    # time to load it is measured separately.
+    start = timeit.default_timer()
+    blocks = allocated_blocks()
+    import google.protobuf.compiler.plugin_pb2 as plugin_pb2
     request = plugin_pb2.CodeGeneratorRequest.FromString(data)
+    load_time = timeit.default_timer() - start
+    if blocks is not None:
+        blocks = allocated_blocks() - blocks
 
     try:
         # Versions of Python prior to 2.7.3 do not support unicode
@@ -1809,6 +4126,7 @@ def main_plugin():
         lex.whitespace = ','
         args = list(lex)
 
+    optparser = make_optparser()
     optparser.usage = "Usage: protoc --nanopb_out=[options][,more_options]:outdir file.proto"
     optparser.epilog = "Output will be written to file.pb.h and file.pb.c."
 
@@ -1820,9 +4138,12 @@ def main_plugin():
 
     options, dummy = optparser.parse_args(args)
 
-    Globals.verbose_options = options.verbose
+    start_timings(options)
+    if timing_state.timings is not None:
+        timing_state.timings.add_phase('descriptor load', load_time, load_time, blocks)
 
     if options.verbose:
+        import google.protobuf
         sys.stderr.write('Google Python protobuf library imported from %s, version %s\n'
                          % (google.protobuf.__file__, google.protobuf.__version__))
 
@@ -1834,26 +4155,33 @@ def main_plugin():
     import os.path
     options.options_path.append(os.path.dirname(request.file_to_generate[0]))
 
-    # Process any include files first, in order to have them
-    # available as dependencies
-    other_files = {}
-    for fdesc in request.proto_file:
-        other_files[fdesc.name] = parse_file(fdesc.name, fdesc, options)
+    # Include files are parsed when they are first needed as dependencies
+    other_files = LazyProtoFiles(request.proto_file, options)
 
+    tasks = []
     for filename in request.file_to_generate:
         for fdesc in request.proto_file:
             if fdesc.name == filename:
-                results = process_file(filename, fdesc, options, other_files)
+                if options.jobs > 1:
+                    # Pass only the dependencies to worker processes,
+                    # instead of transferring the whole request for every file.
+                    names = transitive_dependencies(fdesc, other_files)
+                    deps = [d for d in request.proto_file if d.name in names]
+                    tasks.append((filename, fdesc, LazyProtoFiles(deps, options)))
+                else:
+                    tasks.append((filename, fdesc, other_files))
 
-                f = response.file.add()
-                f.name = results['headername']
-                f.content = results['headerdata']
+    for results in process_files(tasks, options):
+        f = response.file.add()
+        f.name = results['headername']
+        f.content = results['headerdata']
 
-                f = response.file.add()
-                f.name = results['sourcename']
-                f.content = results['sourcedata']
+        f = response.file.add()
+        f.name = results['sourcename']
+        f.content = results['sourcedata']
 
-    io.open(sys.stdout.fileno(), "wb").write(response.SerializeToString())
+    report_timings(options)
+    return response.SerializeToString()
 
 if __name__ == '__main__':
     # Check if we are running as a plugin under protoc
@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# kate: replace-tabs on; indent-width 4;
+
+from __future__ import unicode_literals
+
+'''Persistent server mode for the nanopb generator.
+
+Starting the protoc plugin involves starting Python, importing the protobuf
+library and loading the generator. For small .proto files this can take
+most of the time. This script allows keeping a generator process running
+in the background, listening on a Unix socket:
+
+    nanopb_server.py /tmp/nanopb.sock &
+    export NANOPB_SERVER=/tmp/nanopb.sock
+
+When NANOPB_SERVER is set, protoc-gen-nanopb runs this script as a thin
+client that forwards the CodeGeneratorRequest to the server and relays the
+response back to protoc. If the server cannot be reached, the request is
+processed in-process just like without the server.
+'''
+
+import sys
+import os
+import signal
+import socket
+import struct
+import traceback
+
+try:
+    import socketserver
+except ImportError:
+    import SocketServer as socketserver
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+# ---------------------------------------------------------------------------
+#                    Communication over the socket
+# ---------------------------------------------------------------------------
+# Each message is sent as a 4-byte big-endian length followed by the data.
+# The client sends its working directory and the serialized request.
+# The server replies with the exit status, the text written to stderr and
+# the serialized response.
+
+def send_message(sock, data):
+    '''Send one length-prefixed message.'''
+    sock.sendall(struct.pack('>I', len(data)) + data)
+
+def recv_exactly(sock, length):
+    '''Receive the given number of bytes, or raise IOError if the
+    connection is closed before that.'''
+    parts = []
+    while length > 0:
+        part = sock.recv(min(length, 65536))
+        if not part:
+            raise IOError("Connection closed unexpectedly")
+        parts.append(part)
+        length -= len(part)
+    return b''.join(parts)
+
+def recv_message(sock):
+    '''Receive one length-prefixed message.'''
+    length = struct.unpack('>I', recv_exactly(sock, 4))[0]
+    return recv_exactly(sock, length)
+
+# ---------------------------------------------------------------------------
+#                         Generator server
+# ---------------------------------------------------------------------------
+
+class RequestHandler(socketserver.BaseRequestHandler):
+    '''Process a single plugin request. Each request is handled in a
+    forked child process, so the state of the generator module is
+    always the same as it was after startup.'''
+    def handle(self):
+        cwd = recv_message(self.request).decode('utf-8')
+        data = recv_message(self.request)
+
+        old_stderr = sys.stderr
+        sys.stderr = StringIO()
+        status = 0
+        response = b''
+        try:
+            os.chdir(cwd)
+            response = nanopb_generator.process_plugin_request(data)
+        except SystemExit as e:
+            if e.code is None:
+                status = 0
+            elif isinstance(e.code, int):
+                # Same as the exit status of a process, e.g. -1 becomes 255
+                status = e.code & 0xFF
+            else:
+                # Python prints the message to stderr and exits with 1
+                sys.stderr.write('%s\n' % e.code)
+                status = 1
+        except Exception:
+            traceback.print_exc()
+            status = 1
+        finally:
+            errors = sys.stderr.getvalue()
+            sys.stderr = old_stderr
+
+        send_message(self.request, struct.pack('>I', status))
+        send_message(self.request, errors.encode('utf-8'))
+        send_message(self.request, response)
+
+class GeneratorServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    pass
+
+def serve(socket_path):
+    '''Run the generator server until interrupted.'''
+    global nanopb_generator
+    import nanopb_generator
+
+    if os.path.exists(socket_path):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(socket_path)
+        except socket.error:
+            # Left over from a previous server that did not exit cleanly
+            os.unlink(socket_path)
+        else:
+            sys.stderr.write("Server is already running at %s\n" % socket_path)
+            sys.exit(1)
+        finally:
+            sock.close()
+
+    server = GeneratorServer(socket_path, RequestHandler)
+    os.chmod(socket_path, 0o600)
+    sys.stderr.write("Nanopb generator server listening at %s\n" % socket_path)
+
+    # Remove the socket also when terminated by a signal
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(socket_path)
+
+# ---------------------------------------------------------------------------
+#                     Client used by protoc-gen-nanopb
+# ---------------------------------------------------------------------------
+
+def forward_request(socket_path, data):
+    '''Send a serialized CodeGeneratorRequest to the server.
+    Returns tuple (status, stderr text, serialized response), or None if
+    the server could not be reached.
+    '''
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+        send_message(sock, os.getcwd().encode('utf-8'))
+        send_message(sock, data)
+        status = struct.unpack('>I', recv_message(sock))[0]
+        errors = recv_message(sock).decode('utf-8')
+        response = recv_message(sock)
+    except (socket.error, IOError):
+        return None
+    finally:
+        sock.close()
+
+    return status, errors, response
+
+def main_client(socket_path):
+    '''Main function when invoked as a protoc plugin.'''
+    import io
+    data = io.open(sys.stdin.fileno(), "rb").read()
+
+    result = forward_request(socket_path, data)
+    if result is None:
+        # No server available, process the request ourselves.
+        import nanopb_generator
+        status, errors = 0, ''
+        response = nanopb_generator.process_plugin_request(data)
+    else:
+        status, errors, response = result
+
+    sys.stderr.write(errors)
+    io.open(sys.stdout.fileno(), "wb").write(response)
+    sys.exit(status)
+
+if __name__ == '__main__':
+    from optparse import OptionParser
+    optparser = OptionParser(
+        usage = "Usage: nanopb_server.py [--client] socket_path",
+        epilog = "Without --client, starts the generator server. " +
+                 "Set NANOPB_SERVER=socket_path to make protoc-gen-nanopb use it.")
+    optparser.add_option("--client", dest="client", action="store_true", default=False,
+        help="Act as a protoc plugin that forwards requests to the server.")
+    options, args = optparser.parse_args()
+
+    if len(args) != 1:
+        optparser.print_help(sys.stderr)
+        sys.exit(1)
+
+    if options.client:
+        main_client(args[0])
+    else:
+        serve(args[0])
@@ -1,19 +1,23 @@
-'''This file automatically rebuilds the proto definitions for Python.'''
+'''Proto definitions used by the generator.
+
+nanopb_pb2.py is built from nanopb.proto. Importing this package does not
+check whether it is up to date; nanopb_generator.py calls rebuild_if_needed()
+when it is imported.
+'''
 
-import os
 import os.path
-import sys
-import subprocess
 
 dirname = os.path.dirname(__file__)
 protosrc = os.path.join(dirname, "nanopb.proto")
 protodst = os.path.join(dirname, "nanopb_pb2.py")
 
-if os.path.isfile(protosrc):
-    src_date = os.path.getmtime(protosrc)
-    if not os.path.isfile(protodst) or os.path.getmtime(protodst) < src_date:
-        cmd = ["protoc", "--python_out=.", "nanopb.proto"]
-        status = subprocess.call(cmd, cwd = dirname)
-        if status != 0:
-            sys.stderr.write("Failed to build nanopb_pb2.py: " + ' '.join(cmd) + "\n")
-
+def rebuild_if_needed():
+    '''Rebuild nanopb_pb2.py if nanopb.proto is newer than it.'''
+    if os.path.isfile(protosrc):
+        src_date = os.path.getmtime(protosrc)
+        if not os.path.isfile(protodst) or os.path.getmtime(protodst) < src_date:
+            import subprocess, sys
+            cmd = ["protoc", "--python_out=.", "nanopb.proto"]
+            status = subprocess.call(cmd, cwd = dirname)
+            if status != 0:
+                sys.stderr.write("Failed to build nanopb_pb2.py: " + ' '.join(cmd) + "\n")
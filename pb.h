@@ -40,6 +40,16 @@
  * to do so through the descriptorsize option in .options file. */
 /* #define PB_FIELDINFO_WIDTH 4 */
 
+/* Leave out the encoder or decoder functions generated with the
+ * specialized_functions option, for programs that link only one of
+ * pb_encode.c and pb_decode.c. */
+/* #define PB_NO_SPECIALIZED_ENCODE 1 */
+/* #define PB_NO_SPECIALIZED_DECODE 1 */
+
+/* Enable support for the tag lookup tables generated with the tag_index
+ * option. Adds a pointer to the descriptor of every message. */
+/* #define PB_ENABLE_TAG_INDEX 1 */
+
 /******************************************************************
  * You usually don't need to change anything below this line.     *
  * Feel free to look around and use the defined macros, though.   *
@@ -238,6 +248,28 @@ typedef struct pb_istream_s pb_istream_t;
 typedef struct pb_ostream_s pb_ostream_t;
 typedef struct pb_field_iter_s pb_field_iter_t;
 
+/* Optional lookup table from tag number to field, generated with the
+ * tag_index option. Each entry stores the iterator position of the field,
+ * so that pb_field_iter_find() does not have to scan the descriptor.
+ *
+ * If first_tag is nonzero, the table is indexed directly by tag - first_tag,
+ * and unused tags have entries with tag 0. Otherwise the entries are sorted
+ * by tag number and searched with binary search.
+ */
+typedef struct pb_tagindex_entry_s {
+    pb_size_t tag;
+    pb_size_t index;
+    pb_size_t field_info_index;
+    pb_size_t required_field_index;
+    pb_size_t submessage_index;
+} pb_tagindex_entry_t;
+
+typedef struct pb_tagindex_s {
+    pb_size_t count;
+    pb_size_t first_tag;
+    const pb_tagindex_entry_t *entries;
+} pb_tagindex_t;
+
 /* This structure is used in auto-generated constants
  * to specify struct fields.
  */
@@ -250,6 +282,10 @@ struct pb_msgdesc_s {
     const pb_byte_t *default_value;
 
     bool (*field_callback)(pb_istream_t *istream, pb_ostream_t *ostream, const pb_field_iter_t *field);
+
+#ifdef PB_ENABLE_TAG_INDEX
+    const pb_tagindex_t *tag_index; /* NULL if not generated */
+#endif
 } pb_packed;
 PB_PACKED_STRUCT_END
 
@@ -426,6 +462,13 @@ struct pb_extension_s {
 
 /* Binding of a message field set into a specific structure */
 #define PB_BIND(msgname, structname, width) \
+    PB_BIND2(msgname, structname, width, NULL)
+
+/* Binding with a tag lookup table, see PB_FIELD_INFO_POSITIONS() */
+#define PB_BIND_WITH_TAGINDEX(msgname, structname, width) \
+    PB_BIND2(msgname, structname, width, &structname ## _tagindex)
+
+#define PB_BIND2(msgname, structname, width, tagindex) \
     const uint32_t structname ## _field_info[] = \
     { \
         msgname ## _FIELDLIST(PB_GEN_FIELD_INFO_ ## width, structname) \
@@ -443,9 +486,42 @@ struct pb_extension_s {
        structname ## _submsg_info, \
        msgname ## _DEFAULT, \
        msgname ## _CALLBACK, \
+       PB_TAGINDEX_INIT(tagindex) \
     }; \
     msgname ## _FIELDLIST(PB_GEN_FIELD_INFO_ASSERT_ ## width, structname)
 
+#ifdef PB_ENABLE_TAG_INDEX
+#define PB_TAGINDEX_INIT(tagindex) tagindex,
+#else
+#define PB_TAGINDEX_INIT(tagindex)
+#endif
+
+/* Tag lookup table for a message, see pb_tagindex_t. The generator emits
+ * PB_FIELD_INFO_POSITIONS() followed by the table entries, and binds the
+ * table to the message with PB_BIND_WITH_TAGINDEX(). The position of
+ * each field in the field_info array depends on the descriptor widths, so
+ * it is computed by the compiler as the offset of a member in a struct that
+ * has a char array of the descriptor width for each field. */
+#define PB_FIELD_INFO_POSITIONS(msgname, structname, width) \
+    typedef struct { \
+        msgname ## _FIELDLIST(PB_GEN_FIELD_INFO_POS_ ## width, structname) \
+        char end; \
+    } structname ## _field_info_pos_t;
+
+#define PB_TAGINDEX_ENTRY(structname, tag, index, required_index, submsg_index) \
+    {tag, index, (pb_size_t)offsetof(structname ## _field_info_pos_t, field ## tag), \
+     required_index, submsg_index},
+
+#define PB_TAGINDEX_UNUSED {0, 0, 0, 0, 0},
+
+#define PB_GEN_FIELD_INFO_POS_1(structname, atype, htype, ltype, fieldname, tag) char field ## tag[1];
+#define PB_GEN_FIELD_INFO_POS_2(structname, atype, htype, ltype, fieldname, tag) char field ## tag[2];
+#define PB_GEN_FIELD_INFO_POS_4(structname, atype, htype, ltype, fieldname, tag) char field ## tag[4];
+#define PB_GEN_FIELD_INFO_POS_8(structname, atype, htype, ltype, fieldname, tag) char field ## tag[8];
+#define PB_GEN_FIELD_INFO_POS_AUTO(structname, atype, htype, ltype, fieldname, tag) \
+    PB_GEN_FIELD_INFO_POS_AUTO2(PB_FIELDINFO_WIDTH_AUTO(atype, htype, ltype), tag)
+#define PB_GEN_FIELD_INFO_POS_AUTO2(width, tag) char field ## tag[width];
+
 #define PB_GEN_FIELD_COUNT(structname, atype, htype, ltype, fieldname, tag) +1
 
 #define PB_GEN_FIELD_INFO_1(structname, atype, htype, ltype, fieldname, tag) \
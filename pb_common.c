@@ -182,12 +182,69 @@ bool pb_field_iter_next(pb_field_iter_t *iter)
     return iter->index != 0;
 }
 
+#ifdef PB_ENABLE_TAG_INDEX
+/* Find the entry for tag in the generated tag lookup table.
+ * Returns NULL if the message does not have a field with that tag. */
+static const pb_tagindex_entry_t *find_tagindex_entry(const pb_tagindex_t *tagindex, uint32_t tag)
+{
+    if (tagindex->first_tag != 0)
+    {
+        /* Direct table */
+        if (tag >= tagindex->first_tag && tag - tagindex->first_tag < tagindex->count)
+        {
+            const pb_tagindex_entry_t *entry = &tagindex->entries[tag - tagindex->first_tag];
+            if (entry->tag == tag)
+                return entry;
+        }
+    }
+    else
+    {
+        /* Sorted table */
+        pb_size_t low = 0;
+        pb_size_t high = tagindex->count;
+
+        while (low < high)
+        {
+            pb_size_t mid = (pb_size_t)(low + (high - low) / 2);
+            const pb_tagindex_entry_t *entry = &tagindex->entries[mid];
+
+            if (entry->tag == tag)
+                return entry;
+            else if (entry->tag < tag)
+                low = (pb_size_t)(mid + 1);
+            else
+                high = mid;
+        }
+    }
+
+    return NULL;
+}
+#endif
+
 bool pb_field_iter_find(pb_field_iter_t *iter, uint32_t tag)
 {
     if (iter->tag == tag)
     {
         return true; /* Nothing to do, correct field already. */
     }
+#ifdef PB_ENABLE_TAG_INDEX
+    else if (iter->descriptor->tag_index != NULL)
+    {
+        const pb_tagindex_entry_t *entry = find_tagindex_entry(iter->descriptor->tag_index, tag);
+
+        if (entry == NULL)
+        {
+            /* The iterator position is left unchanged */
+            return false;
+        }
+
+        iter->index = entry->index;
+        iter->field_info_index = entry->field_info_index;
+        iter->required_field_index = entry->required_field_index;
+        iter->submessage_index = entry->submessage_index;
+        return load_descriptor_values(iter);
+    }
+#endif
     else
     {
         pb_size_t start = iter->index;
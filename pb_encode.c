@@ -586,6 +586,25 @@ bool checkreturn pb_encode_svarint(pb_ostream_t *stream, pb_int64_t value)
     return pb_encode_varint(stream, zigzagged);
 }
 
+size_t pb_varint_size(pb_uint64_t value)
+{
+    size_t size = 1;
+    while (value > 0x7F)
+    {
+        value >>= 7;
+        size++;
+    }
+    return size;
+}
+
+size_t pb_svarint_size(pb_int64_t value)
+{
+    if (value < 0)
+        return pb_varint_size(~((pb_uint64_t)value << 1));
+    else
+        return pb_varint_size((pb_uint64_t)value << 1);
+}
+
 bool checkreturn pb_encode_fixed32(pb_ostream_t *stream, const void *value)
 {
     uint32_t val = *(const uint32_t*)value;
@@ -152,6 +152,16 @@ bool pb_encode_svarint(pb_ostream_t *stream, int64_t value);
 bool pb_encode_svarint(pb_ostream_t *stream, int32_t value);
 #endif
 
+/* Return the number of bytes that pb_encode_varint() and pb_encode_svarint()
+ * would write for the value. */
+#ifndef PB_WITHOUT_64BIT
+size_t pb_varint_size(uint64_t value);
+size_t pb_svarint_size(int64_t value);
+#else
+size_t pb_varint_size(uint32_t value);
+size_t pb_svarint_size(int32_t value);
+#endif
+
 /* Encode a string or bytes type field. For strings, pass strlen(s) as size. */
 bool pb_encode_string(pb_ostream_t *stream, const pb_byte_t *buffer, size_t size);
 
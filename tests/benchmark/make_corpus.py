@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# kate: replace-tabs on; indent-width 4;
+
+'''Generate a synthetic corpus of .proto and .options files for
+benchmarking the nanopb generator.
+
+The size and shape of the schema are controlled by the parameters of
+make_corpus(). Messages are distributed evenly over the files, and each
+message only refers to messages defined before it, so that the schema
+never has cyclic dependencies and all sizes are statically known.
+Every other message is a leaf without submessage references to other
+messages, which keeps the maximum encoded sizes from growing exponentially.
+'''
+
+from __future__ import unicode_literals
+
+import io
+import os
+import sys
+from optparse import OptionParser
+
+# Scalar field types, used in rotation for the generated fields
+scalar_types = ['int32', 'uint64', 'sint32', 'fixed32', 'sfixed64',
+                'bool', 'float', 'double', 'string', 'bytes']
+
+defaults = {
+    'messages': 100,    # Total number of top-level messages
+    'files': 1,         # Number of .proto files
+    'depth': 1,         # Levels of nested message definitions in each message
+    'fields': 10,       # Scalar fields per message
+    'oneofs': 0,        # Oneof groups per message, each with 3 members
+    'enums': 5,         # Enum types per file
+    'enum_size': 20,    # Maximum number of values in an enum
+    'imports': 1,       # Number of previous files that each file imports
+    'max_count': 10,    # max_count of the repeated fields
+}
+
+def enum_size(index, maxsize):
+    '''Enums get varying sizes between 1 and maxsize.'''
+    return 1 + (index * 7) % maxsize
+
+class CorpusFile:
+    '''Contents of one generated .proto file and its .options file.'''
+    def __init__(self, index, params):
+        self.index = index
+        self.params = params
+        self.name = 'bench_%d' % index
+        self.prefix = 'F%d_' % index
+        self.messages = [] # Names of the top-level messages
+        self.enums = []
+        self.enum_uses = 0
+        self.imports = []
+        self.proto = []
+        self.options = []
+
+    def field_lines(self, msgname, indent, counter, refs):
+        '''Generate the fields of one message.
+        refs is a list of message type names that may be used as submessages.
+        '''
+        p = self.params
+        lines = []
+
+        def tag():
+            counter[0] += 1
+            return counter[0]
+
+        for i in range(p['fields']):
+            ftype = scalar_types[i % len(scalar_types)]
+            fname = 'field%d' % i
+            if i % 5 == 4:
+                lines.append('%srepeated %s %s = %d;' % (indent, ftype, fname, tag()))
+                self.options.append('bench.%s.%s max_count:%d' % (msgname, fname, p['max_count']))
+            else:
+                lines.append('%soptional %s %s = %d;' % (indent, ftype, fname, tag()))
+
+        if self.enums:
+            enum = self.enums[self.enum_uses % len(self.enums)]
+            self.enum_uses += 1
+            lines.append('%soptional %s enumfield = %d;' % (indent, enum, tag()))
+
+        for i, ref in enumerate(refs):
+            lines.append('%soptional %s sub%d = %d;' % (indent, ref, i, tag()))
+
+        for i in range(p['oneofs']):
+            lines.append('%soneof choice%d {' % (indent, i))
+            lines.append('%s    int32 choice%d_int = %d;' % (indent, i, tag()))
+            lines.append('%s    string choice%d_str = %d;' % (indent, i, tag()))
+            if refs:
+                lines.append('%s    %s choice%d_msg = %d;' % (indent, refs[0], i, tag()))
+            else:
+                lines.append('%s    double choice%d_dbl = %d;' % (indent, i, tag()))
+            lines.append('%s}' % indent)
+
+        return lines
+
+    def message_lines(self, name, fullname, depth, indent, refs):
+        '''Generate a message definition with depth levels of nested messages.'''
+        lines = ['%smessage %s {' % (indent, name)]
+        refs = list(refs)
+        if depth > 0:
+            lines += self.message_lines('Nested', fullname + '.Nested', depth - 1,
+                                        indent + '    ', [])
+            refs.insert(0, 'Nested')
+        lines += self.field_lines(fullname, indent + '    ', [0], refs)
+        lines.append('%s}' % indent)
+        return lines
+
+    def generate(self, count, imported):
+        '''Generate count messages, referring to the messages in the
+        imported files.'''
+        p = self.params
+
+        for i in range(p['enums']):
+            name = '%sEnum%d' % (self.prefix, i)
+            self.proto.append('enum %s {' % name)
+            for j in range(enum_size(self.index * p['enums'] + i, p['enum_size'])):
+                self.proto.append('    %s_V%d = %d;' % (name, j, j * 3))
+            self.proto.append('}')
+            self.proto.append('')
+            self.enums.append(name)
+
+        for i in range(count):
+            name = '%sMsg%d' % (self.prefix, i)
+            refs = []
+            if i % 2 == 1:
+                refs.append(self.messages[-1])
+                if imported:
+                    other = imported[(i // 2) % len(imported)]
+                    if other.messages:
+                        refs.append(other.messages[(i - 1) % len(other.messages) // 2 * 2])
+            self.proto += self.message_lines(name, name, p['depth'], '', refs)
+            self.proto.append('')
+            self.messages.append(name)
+
+        # Wildcard options, to exercise the name mask matching
+        if p['fields'] > 8:
+            self.options.append('bench.%s*.field8 max_size:32' % self.prefix)
+        if p['fields'] > 9:
+            self.options.append('bench.%s*.field9 max_size:64' % self.prefix)
+        if p['oneofs'] > 0:
+            self.options.append('bench.%s*.choice*_str max_size:16' % self.prefix)
+
+        self.imports = [f.name + '.proto' for f in imported]
+
+    def write(self, outdir):
+        header = ['syntax = "proto2";', '', 'package bench;', '']
+        header += ['import "%s";' % name for name in self.imports]
+        if self.imports:
+            header.append('')
+
+        with io.open(os.path.join(outdir, self.name + '.proto'), 'w') as f:
+            f.write('\n'.join(header + self.proto) + '\n')
+
+        with io.open(os.path.join(outdir, self.name + '.options'), 'w') as f:
+            f.write('\n'.join(self.options) + '\n')
+
+def make_corpus(outdir, **params):
+    '''Write the corpus to outdir. Parameters are as in defaults.
+    Returns the list of .proto file names, in dependency order.
+    '''
+    p = dict(defaults)
+    for key, value in params.items():
+        if key not in p:
+            raise ValueError("Unknown corpus parameter: " + key)
+        p[key] = value
+
+    if not os.path.isdir(outdir):
+        os.makedirs(outdir)
+
+    files = []
+    for i in range(p['files']):
+        count = p['messages'] // p['files']
+        if i < p['messages'] % p['files']:
+            count += 1
+
+        f = CorpusFile(i, p)
+        f.generate(count, files[max(0, i - p['imports']):i])
+        f.write(outdir)
+        files.append(f)
+
+    return [f.name + '.proto' for f in files]
+
+if __name__ == '__main__':
+    optparser = OptionParser(
+        usage = "Usage: make_corpus.py [options] outdir")
+    for key, value in sorted(defaults.items()):
+        optparser.add_option("--" + key.replace('_', '-'), dest=key, type="int", default=value,
+            help="[default: %default]")
+    options, args = optparser.parse_args()
+
+    if len(args) != 1:
+        optparser.print_help()
+        sys.exit(1)
+
+    names = make_corpus(args[0], **vars(options))
+    sys.stderr.write("Wrote %d files to %s\n" % (len(names), args[0]))
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+# kate: replace-tabs on; indent-width 4;
+
+'''Benchmark the nanopb generator on synthetic schemas.
+
+For each benchmark case, a corpus is generated with make_corpus.py and
+compiled with protoc. The generator is then run on it in two ways:
+
+    process_file: process_file() for every file of the corpus
+    plugin:       process_plugin_request(), the body of main_plugin()
+
+The special case 'import' measures the time to import nanopb_generator,
+and checks that the modules that should be loaded only when needed are
+not imported at startup.
+
+Each measurement runs in a separate Python process, so that the peak
+memory usage of one case does not affect the others. The wall time is
+the best of the repeated runs, excluding the interpreter startup.
+
+Usage:
+    run_benchmark.py --output results.json
+    run_benchmark.py --baseline results.json --threshold 10
+
+With --baseline, the results are compared to a previously saved file and
+the exit status is 1 if any case became slower (or used more memory) by
+more than the threshold percentage.
+'''
+
+from __future__ import unicode_literals
+
+import sys
+import os
+import json
+import timeit
+from optparse import OptionParser
+
+from make_corpus import make_corpus
+
+cases = {
+    'small':            dict(messages = 100),
+    'many_messages':    dict(messages = 1000),
+    'deep_nesting':     dict(messages = 50, depth = 6),
+    'wide_messages':    dict(messages = 50, fields = 200),
+    'oneofs':           dict(messages = 200, oneofs = 5),
+    'large_enums':      dict(messages = 100, enums = 50, enum_size = 1000),
+    'many_files':       dict(messages = 500, files = 50, imports = 3),
+    'large_arrays':     dict(messages = 200, max_count = 10000),
+    'large_schema':     dict(messages = 2000, files = 20, imports = 2, fields = 30),
+}
+
+modes = ['process_file', 'plugin']
+
+import_case = 'import'
+
+# Modules that should not be loaded just by importing the generator
+lazy_modules = ['distutils', 'pkg_resources', 'subprocess',
+                'google.protobuf.compiler.plugin_pb2']
+
+mydir = os.path.dirname(os.path.abspath(__file__))
+default_generator = os.path.join(mydir, '..', '..', 'generator')
+
+# ---------------------------------------------------------------------------
+#                  Measurement, run in a child process
+# ---------------------------------------------------------------------------
+
+def peak_rss_kb():
+    '''Peak resident set size of this process in kilobytes, or None
+    if not available on this platform.'''
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        rss //= 1024 # Reported in bytes instead of kilobytes
+    return rss
+
+def measure(mode, casedir, generator_dir):
+    '''Run the generator once on the corpus in casedir.
+    Returns a dict with the wall time and peak memory usage.
+    '''
+    sys.path.insert(0, generator_dir)
+    already_loaded = set(sys.modules)
+    start = timeit.default_timer()
+    import nanopb_generator
+    elapsed = timeit.default_timer() - start
+
+    if mode == 'import':
+        loaded = [m for m in lazy_modules
+                  if m in sys.modules and m not in already_loaded]
+        return {'wall_seconds': elapsed, 'peak_rss_kb': peak_rss_kb(),
+                'loaded_lazy_modules': loaded}
+
+    from google.protobuf.compiler import plugin_pb2
+
+    os.chdir(casedir)
+    data = open('corpus.pb', 'rb').read()
+    filenames = open('files.txt').read().split()
+    startup_rss = peak_rss_kb()
+
+    start = timeit.default_timer()
+    if mode == 'process_file':
+        fdescs = nanopb_generator.descriptor.FileDescriptorSet.FromString(data).file
+        options, dummy = nanopb_generator.parse_options(['-q'])
+        other_files = nanopb_generator.LazyProtoFiles(fdescs, options)
+        for fdesc in fdescs:
+            if fdesc.name in filenames:
+                nanopb_generator.process_file(fdesc.name, fdesc, options, other_files)
+    elif mode == 'plugin':
+        request = plugin_pb2.CodeGeneratorRequest()
+        request.file_to_generate.extend(filenames)
+        request.parameter = '-q'
+        request.proto_file.extend(
+            nanopb_generator.descriptor.FileDescriptorSet.FromString(data).file)
+        nanopb_generator.process_plugin_request(request.SerializeToString())
+    else:
+        raise ValueError("Unknown mode: " + mode)
+    elapsed = timeit.default_timer() - start
+
+    return {'wall_seconds': elapsed, 'peak_rss_kb': peak_rss_kb(),
+            'startup_rss_kb': startup_rss}
+
+# ---------------------------------------------------------------------------
+#                     Running the benchmark cases
+# ---------------------------------------------------------------------------
+
+def prepare_case(name, workdir, protoc):
+    '''Generate the corpus for a case and compile it with protoc.'''
+    import subprocess
+    casedir = os.path.join(workdir, name)
+    filenames = make_corpus(casedir, **cases[name])
+    subprocess.check_call([protoc, '-I.', '--include_imports', '-ocorpus.pb'] + filenames,
+                          cwd = casedir)
+    with open(os.path.join(casedir, 'files.txt'), 'w') as f:
+        f.write('\n'.join(filenames) + '\n')
+    return casedir
+
+def run_case(casedir, mode, options):
+    '''Run the measurement in child processes and combine the results.'''
+    import subprocess
+    best = None
+    for i in range(options.repeat):
+        output = subprocess.check_output([sys.executable, os.path.abspath(__file__),
+                                          '--measure', mode, '--generator', options.generator,
+                                          casedir or '.'])
+        result = json.loads(output.decode('utf-8'))
+        if best is None:
+            best = result
+        else:
+            best['wall_seconds'] = min(best['wall_seconds'], result['wall_seconds'])
+            if result['peak_rss_kb'] is not None:
+                best['peak_rss_kb'] = max(best['peak_rss_kb'], result['peak_rss_kb'])
+    return best
+
+def compare(results, baseline, threshold):
+    '''Compare results to baseline. Prints a report and returns the list
+    of (case, mode, quantity) that regressed by more than threshold percent.'''
+    regressions = []
+    sys.stdout.write('%-16s %-14s %10s %10s %8s %10s %10s %8s\n' % (
+        'Case', 'Mode', 'Base s', 'Now s', 'Change', 'Base kB', 'Now kB', 'Change'))
+
+    for case in sorted(results):
+        for mode in sorted(results[case]):
+            old = baseline.get(case, {}).get(mode)
+            if old is None:
+                continue
+            new = results[case][mode]
+            line = '%-16s %-14s' % (case, mode)
+            for quantity in ('wall_seconds', 'peak_rss_kb'):
+                if not old.get(quantity) or new.get(quantity) is None:
+                    line += ' %10s %10s %8s' % ('-', '-', '-')
+                    continue
+                change = 100.0 * (new[quantity] - old[quantity]) / old[quantity]
+                fmt = ' %10.3f %10.3f %+7.1f%%' if quantity == 'wall_seconds' else ' %10d %10d %+7.1f%%'
+                line += fmt % (old[quantity], new[quantity], change)
+                if change > threshold:
+                    regressions.append((case, mode, quantity))
+            sys.stdout.write(line + '\n')
+
+    return regressions
+
+def main():
+    optparser = OptionParser(
+        usage = "Usage: run_benchmark.py [options] [case ...]",
+        epilog = "Available cases: " + ', '.join(sorted(cases) + [import_case]))
+    optparser.add_option("-o", "--output", dest="output", metavar="FILE", default=None,
+        help="Write the results to a JSON file.")
+    optparser.add_option("-b", "--baseline", dest="baseline", metavar="FILE", default=None,
+        help="Compare the results to a previously saved JSON file.")
+    optparser.add_option("-t", "--threshold", dest="threshold", metavar="PERCENT", type="float", default=10.0,
+        help="Slowdown that is reported as a regression. [default: %default]")
+    optparser.add_option("-r", "--repeat", dest="repeat", metavar="N", type="int", default=3,
+        help="Number of runs for each case, the best time is used. [default: %default]")
+    optparser.add_option("-m", "--mode", dest="modes", metavar="MODE", action="append", default=[],
+        help="Run only the given mode: " + ', '.join(modes))
+    optparser.add_option("--protoc", dest="protoc", metavar="PATH", default="protoc",
+        help="The protoc binary to use. [default: %default]")
+    optparser.add_option("--generator", dest="generator", metavar="DIR", default=default_generator,
+        help="Directory of the nanopb_generator.py to benchmark.")
+    optparser.add_option("--keep", dest="keep", metavar="DIR", default=None,
+        help="Generate the corpus in DIR and keep it after the run.")
+    optparser.add_option("--measure", dest="measure", metavar="MODE", default=None,
+        help="Internal: measure a single run in this process.")
+    options, args = optparser.parse_args()
+    options.generator = os.path.abspath(options.generator)
+
+    if options.measure:
+        result = measure(options.measure, args[0], options.generator)
+        sys.stdout.write(json.dumps(result) + '\n')
+        return 0
+
+    for name in args:
+        if name not in cases and name != import_case:
+            optparser.error("Unknown case: " + name)
+
+    import shutil, tempfile
+    if options.keep:
+        workdir = options.keep
+    else:
+        workdir = tempfile.mkdtemp(prefix = 'nanopb_benchmark_')
+
+    results = {}
+    try:
+        for name in args or [import_case] + sorted(cases):
+            results[name] = {}
+            if name == import_case:
+                casedir, case_modes = None, ['import']
+            else:
+                casedir, case_modes = prepare_case(name, workdir, options.protoc), options.modes or modes
+
+            for mode in case_modes:
+                result = run_case(casedir, mode, options)
+                results[name][mode] = result
+                sys.stderr.write('%-16s %-14s %8.3f s %10s kB\n' % (
+                    name, mode, result['wall_seconds'], result['peak_rss_kb']))
+                if result.get('loaded_lazy_modules'):
+                    sys.stderr.write('Modules loaded at import: %s\n'
+                                     % ', '.join(result['loaded_lazy_modules']))
+    finally:
+        if not options.keep:
+            shutil.rmtree(workdir)
+
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump({'python': sys.version.split()[0], 'results': results},
+                      f, indent = 2, sort_keys = True)
+
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, options.threshold)
+        if regressions:
+            sys.stdout.write('\nRegressions over %.1f%%:\n' % options.threshold)
+            for case, mode, quantity in regressions:
+                sys.stdout.write('    %s %s %s\n' % (case, mode, quantity))
+            return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
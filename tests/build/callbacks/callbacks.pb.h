@@ -0,0 +1,93 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_CALLBACKS_PB_H_INCLUDED
+#define PB_CALLBACKS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _SubMessage {
+    pb_callback_t stringvalue;
+    pb_callback_t int32value;
+    pb_callback_t fixed32value;
+    pb_callback_t fixed64value;
+/* @@protoc_insertion_point(struct:SubMessage) */
+} SubMessage;
+
+
+typedef struct _TestMessage {
+    pb_callback_t stringvalue;
+    pb_callback_t int32value;
+    pb_callback_t fixed32value;
+    pb_callback_t fixed64value;
+    bool has_submsg;
+    SubMessage submsg;
+    pb_callback_t repeatedstring;
+/* @@protoc_insertion_point(struct:TestMessage) */
+} TestMessage;
+
+
+/* Initializer values for message structs */
+#define SubMessage_init_default                  {{{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}}
+#define TestMessage_init_default                 {{{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, false, SubMessage_init_default, {{NULL}, NULL}}
+#define SubMessage_init_zero                     {{{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}}
+#define TestMessage_init_zero                    {{{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, false, SubMessage_init_zero, {{NULL}, NULL}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define SubMessage_stringvalue_tag               1
+#define SubMessage_int32value_tag                2
+#define SubMessage_fixed32value_tag              3
+#define SubMessage_fixed64value_tag              4
+#define TestMessage_stringvalue_tag              1
+#define TestMessage_int32value_tag               2
+#define TestMessage_fixed32value_tag             3
+#define TestMessage_fixed64value_tag             4
+#define TestMessage_submsg_tag                   5
+#define TestMessage_repeatedstring_tag           6
+
+/* Struct field encoding specification for nanopb */
+#define SubMessage_FIELDLIST(X, a) \
+X(a, CALLBACK, OPTIONAL, STRING, stringvalue, 1) \
+X(a, CALLBACK, REPEATED, INT32, int32value, 2) \
+X(a, CALLBACK, REPEATED, FIXED32, fixed32value, 3) \
+X(a, CALLBACK, REPEATED, FIXED64, fixed64value, 4)
+#define SubMessage_CALLBACK pb_default_field_callback
+#define SubMessage_DEFAULT NULL
+
+#define TestMessage_FIELDLIST(X, a) \
+X(a, CALLBACK, OPTIONAL, STRING, stringvalue, 1) \
+X(a, CALLBACK, REPEATED, INT32, int32value, 2) \
+X(a, CALLBACK, REPEATED, FIXED32, fixed32value, 3) \
+X(a, CALLBACK, REPEATED, FIXED64, fixed64value, 4) \
+X(a, STATIC, OPTIONAL, MESSAGE, submsg, 5) \
+X(a, CALLBACK, REPEATED, STRING, repeatedstring, 6)
+#define TestMessage_CALLBACK pb_default_field_callback
+#define TestMessage_DEFAULT NULL
+#define TestMessage_submsg_MSGTYPE SubMessage
+
+extern const pb_msgdesc_t SubMessage_msg;
+extern const pb_msgdesc_t TestMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define SubMessage_fields &SubMessage_msg
+#define TestMessage_fields &TestMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+/* SubMessage_size depends on runtime parameters */
+/* TestMessage_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
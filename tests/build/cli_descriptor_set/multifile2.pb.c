@@ -0,0 +1,24 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "multifile2.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Callback2Message, Callback2Message, AUTO)
+
+
+PB_BIND(OneofMessage, OneofMessage, AUTO)
+
+
+PB_BIND(Enums, Enums, AUTO)
+
+
+PB_BIND(TwoSubMessages, TwoSubMessages, AUTO)
+
+
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,128 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_MULTIFILE1_PB_H_INCLUDED
+#define PB_MULTIFILE1_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _SignedEnum {
+    SignedEnum_SE_MIN = -128,
+    SignedEnum_SE_MAX = 127
+} SignedEnum;
+#define _SignedEnum_MIN SignedEnum_SE_MIN
+#define _SignedEnum_MAX SignedEnum_SE_MAX
+#define _SignedEnum_ARRAYSIZE ((SignedEnum)(SignedEnum_SE_MAX+1))
+
+typedef enum _UnsignedEnum {
+    UnsignedEnum_UE_MIN = 0,
+    UnsignedEnum_UE_MAX = 255
+} UnsignedEnum;
+#define _UnsignedEnum_MIN UnsignedEnum_UE_MIN
+#define _UnsignedEnum_MAX UnsignedEnum_UE_MAX
+#define _UnsignedEnum_ARRAYSIZE ((UnsignedEnum)(UnsignedEnum_UE_MAX+1))
+
+/* Struct definitions */
+typedef struct _SubMessage {
+    pb_callback_t stringvalue;
+    pb_callback_t int32value;
+    pb_callback_t fixed32value;
+    pb_callback_t fixed64value;
+/* @@protoc_insertion_point(struct:SubMessage) */
+} SubMessage;
+
+
+typedef struct _StaticMessage {
+    pb_size_t repint32_count;
+    uint32_t repint32[5];
+/* @@protoc_insertion_point(struct:StaticMessage) */
+} StaticMessage;
+
+
+typedef struct _TestMessage {
+    pb_callback_t stringvalue;
+    pb_callback_t int32value;
+    pb_callback_t fixed32value;
+    pb_callback_t fixed64value;
+    bool has_submsg;
+    SubMessage submsg;
+    pb_callback_t repeatedstring;
+/* @@protoc_insertion_point(struct:TestMessage) */
+} TestMessage;
+
+
+/* Initializer values for message structs */
+#define SubMessage_init_default                  {{{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}}
+#define TestMessage_init_default                 {{{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, false, SubMessage_init_default, {{NULL}, NULL}}
+#define StaticMessage_init_default               {0, {0, 0, 0, 0, 0}}
+#define SubMessage_init_zero                     {{{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}}
+#define TestMessage_init_zero                    {{{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, {{NULL}, NULL}, false, SubMessage_init_zero, {{NULL}, NULL}}
+#define StaticMessage_init_zero                  {0, {0, 0, 0, 0, 0}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define SubMessage_stringvalue_tag               1
+#define SubMessage_int32value_tag                2
+#define SubMessage_fixed32value_tag              3
+#define SubMessage_fixed64value_tag              4
+#define StaticMessage_repint32_tag               1
+#define TestMessage_stringvalue_tag              1
+#define TestMessage_int32value_tag               2
+#define TestMessage_fixed32value_tag             3
+#define TestMessage_fixed64value_tag             4
+#define TestMessage_submsg_tag                   5
+#define TestMessage_repeatedstring_tag           6
+
+/* Struct field encoding specification for nanopb */
+#define SubMessage_FIELDLIST(X, a) \
+X(a, CALLBACK, OPTIONAL, STRING, stringvalue, 1) \
+X(a, CALLBACK, REPEATED, INT32, int32value, 2) \
+X(a, CALLBACK, REPEATED, FIXED32, fixed32value, 3) \
+X(a, CALLBACK, REPEATED, FIXED64, fixed64value, 4)
+#define SubMessage_CALLBACK pb_default_field_callback
+#define SubMessage_DEFAULT NULL
+
+#define TestMessage_FIELDLIST(X, a) \
+X(a, CALLBACK, OPTIONAL, STRING, stringvalue, 1) \
+X(a, CALLBACK, REPEATED, INT32, int32value, 2) \
+X(a, CALLBACK, REPEATED, FIXED32, fixed32value, 3) \
+X(a, CALLBACK, REPEATED, FIXED64, fixed64value, 4) \
+X(a, STATIC, OPTIONAL, MESSAGE, submsg, 5) \
+X(a, CALLBACK, REPEATED, STRING, repeatedstring, 6)
+#define TestMessage_CALLBACK pb_default_field_callback
+#define TestMessage_DEFAULT NULL
+#define TestMessage_submsg_MSGTYPE SubMessage
+
+#define StaticMessage_FIELDLIST(X, a) \
+X(a, STATIC, REPEATED, FIXED32, repint32, 1)
+#define StaticMessage_CALLBACK NULL
+#define StaticMessage_DEFAULT NULL
+
+extern const pb_msgdesc_t SubMessage_msg;
+extern const pb_msgdesc_t TestMessage_msg;
+extern const pb_msgdesc_t StaticMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define SubMessage_fields &SubMessage_msg
+#define TestMessage_fields &TestMessage_msg
+#define StaticMessage_fields &StaticMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+/* SubMessage_size depends on runtime parameters */
+/* TestMessage_size depends on runtime parameters */
+#define StaticMessage_size                       25
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
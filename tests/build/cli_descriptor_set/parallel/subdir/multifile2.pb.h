@@ -0,0 +1,136 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_SUBDIR_SUBDIR_MULTIFILE2_PB_H_INCLUDED
+#define PB_SUBDIR_SUBDIR_MULTIFILE2_PB_H_INCLUDED
+#include <pb.h>
+
+#include "multifile1.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _subdir_Callback2Message {
+    TestMessage tstmsg;
+    SubMessage submsg;
+/* @@protoc_insertion_point(struct:subdir_Callback2Message) */
+} subdir_Callback2Message;
+
+
+typedef struct _subdir_Enums {
+    SignedEnum senum;
+    UnsignedEnum uenum;
+/* @@protoc_insertion_point(struct:subdir_Enums) */
+} subdir_Enums;
+
+
+typedef struct _subdir_SmallMessage {
+    bool dummy;
+/* @@protoc_insertion_point(struct:subdir_SmallMessage) */
+} subdir_SmallMessage;
+
+
+typedef struct _subdir_SubdirMessage {
+    int32_t foo;
+/* @@protoc_insertion_point(struct:subdir_SubdirMessage) */
+} subdir_SubdirMessage;
+
+
+typedef struct _subdir_OneofMessage {
+    pb_size_t which_msgs;
+    union {
+        StaticMessage tstmsg;
+        subdir_SmallMessage msg2;
+    } msgs;
+/* @@protoc_insertion_point(struct:subdir_OneofMessage) */
+} subdir_OneofMessage;
+
+
+/* Initializer values for message structs */
+#define subdir_Callback2Message_init_default     {TestMessage_init_default, SubMessage_init_default}
+#define subdir_SmallMessage_init_default         {0}
+#define subdir_OneofMessage_init_default         {0, {StaticMessage_init_default}}
+#define subdir_Enums_init_default                {_SignedEnum_MIN, _UnsignedEnum_MIN}
+#define subdir_SubdirMessage_init_default        {15}
+#define subdir_Callback2Message_init_zero        {TestMessage_init_zero, SubMessage_init_zero}
+#define subdir_SmallMessage_init_zero            {0}
+#define subdir_OneofMessage_init_zero            {0, {StaticMessage_init_zero}}
+#define subdir_Enums_init_zero                   {_SignedEnum_MIN, _UnsignedEnum_MIN}
+#define subdir_SubdirMessage_init_zero           {0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define subdir_Callback2Message_tstmsg_tag       1
+#define subdir_Callback2Message_submsg_tag       2
+#define subdir_Enums_senum_tag                   1
+#define subdir_Enums_uenum_tag                   2
+#define subdir_SmallMessage_dummy_tag            1
+#define subdir_SubdirMessage_foo_tag             1
+#define subdir_OneofMessage_tstmsg_tag           1
+#define subdir_OneofMessage_msg2_tag             2
+
+/* Struct field encoding specification for nanopb */
+#define subdir_Callback2Message_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, tstmsg, 1) \
+X(a, STATIC, REQUIRED, MESSAGE, submsg, 2)
+#define subdir_Callback2Message_CALLBACK NULL
+#define subdir_Callback2Message_DEFAULT NULL
+#define subdir_Callback2Message_tstmsg_MSGTYPE TestMessage
+#define subdir_Callback2Message_submsg_MSGTYPE SubMessage
+
+#define subdir_SmallMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, BOOL, dummy, 1)
+#define subdir_SmallMessage_CALLBACK NULL
+#define subdir_SmallMessage_DEFAULT NULL
+
+#define subdir_OneofMessage_FIELDLIST(X, a) \
+X(a, STATIC, ONEOF, MESSAGE, (msgs,tstmsg,msgs.tstmsg), 1) \
+X(a, STATIC, ONEOF, MESSAGE, (msgs,msg2,msgs.msg2), 2)
+#define subdir_OneofMessage_CALLBACK NULL
+#define subdir_OneofMessage_DEFAULT NULL
+#define subdir_OneofMessage_msgs_tstmsg_MSGTYPE StaticMessage
+#define subdir_OneofMessage_msgs_msg2_MSGTYPE subdir_SmallMessage
+
+#define subdir_Enums_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, ENUM, senum, 1) \
+X(a, STATIC, REQUIRED, UENUM, uenum, 2)
+#define subdir_Enums_CALLBACK NULL
+#define subdir_Enums_DEFAULT NULL
+
+#define subdir_SubdirMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, foo, 1)
+#define subdir_SubdirMessage_CALLBACK NULL
+#define subdir_SubdirMessage_DEFAULT (const uint8_t*)"\x08\x0f\x00"
+
+extern const pb_msgdesc_t subdir_Callback2Message_msg;
+extern const pb_msgdesc_t subdir_SmallMessage_msg;
+extern const pb_msgdesc_t subdir_OneofMessage_msg;
+extern const pb_msgdesc_t subdir_Enums_msg;
+extern const pb_msgdesc_t subdir_SubdirMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define subdir_Callback2Message_fields &subdir_Callback2Message_msg
+#define subdir_SmallMessage_fields &subdir_SmallMessage_msg
+#define subdir_OneofMessage_fields &subdir_OneofMessage_msg
+#define subdir_Enums_fields &subdir_Enums_msg
+#define subdir_SubdirMessage_fields &subdir_SubdirMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define subdir_Callback2Message_size             (12 + SubMessage_size + TestMessage_size)
+#define subdir_SmallMessage_size                 2
+#define subdir_OneofMessage_size                 27
+#define subdir_Enums_size                        14
+#define subdir_SubdirMessage_size                11
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,39 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "unittestproto.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(IntegerArray, IntegerArray, AUTO)
+
+
+PB_BIND(FloatArray, FloatArray, AUTO)
+
+
+PB_BIND(StringMessage, StringMessage, AUTO)
+
+
+PB_BIND(BytesMessage, BytesMessage, AUTO)
+
+
+PB_BIND(CallbackArray, CallbackArray, AUTO)
+
+
+PB_BIND(IntegerContainer, IntegerContainer, AUTO)
+
+
+PB_BIND(CallbackContainer, CallbackContainer, AUTO)
+
+
+PB_BIND(CallbackContainerContainer, CallbackContainerContainer, AUTO)
+
+
+PB_BIND(StringPointerContainer, StringPointerContainer, AUTO)
+
+
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,193 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_UNITTESTPROTO_PB_H_INCLUDED
+#define PB_UNITTESTPROTO_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _CallbackArray {
+    pb_callback_t data;
+/* @@protoc_insertion_point(struct:CallbackArray) */
+} CallbackArray;
+
+
+typedef struct _StringPointerContainer {
+    pb_size_t rep_str_count;
+    char **rep_str;
+/* @@protoc_insertion_point(struct:StringPointerContainer) */
+} StringPointerContainer;
+
+
+typedef PB_BYTES_ARRAY_T(16) BytesMessage_data_t;
+typedef struct _BytesMessage {
+    BytesMessage_data_t data;
+/* @@protoc_insertion_point(struct:BytesMessage) */
+} BytesMessage;
+
+
+typedef struct _CallbackContainer {
+    CallbackArray submsg;
+/* @@protoc_insertion_point(struct:CallbackContainer) */
+} CallbackContainer;
+
+
+typedef struct _FloatArray {
+    pb_size_t data_count;
+    float data[10];
+/* @@protoc_insertion_point(struct:FloatArray) */
+} FloatArray;
+
+
+typedef struct _IntegerArray {
+    pb_size_t data_count;
+    int32_t data[10];
+/* @@protoc_insertion_point(struct:IntegerArray) */
+} IntegerArray;
+
+
+typedef struct _StringMessage {
+    char data[11];
+/* @@protoc_insertion_point(struct:StringMessage) */
+} StringMessage;
+
+
+typedef struct _CallbackContainerContainer {
+    CallbackContainer submsg;
+/* @@protoc_insertion_point(struct:CallbackContainerContainer) */
+} CallbackContainerContainer;
+
+
+typedef struct _IntegerContainer {
+    IntegerArray submsg;
+/* @@protoc_insertion_point(struct:IntegerContainer) */
+} IntegerContainer;
+
+
+/* Initializer values for message structs */
+#define IntegerArray_init_default                {0, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}
+#define FloatArray_init_default                  {0, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}
+#define StringMessage_init_default               {""}
+#define BytesMessage_init_default                {{0, {0}}}
+#define CallbackArray_init_default               {{{NULL}, NULL}}
+#define IntegerContainer_init_default            {IntegerArray_init_default}
+#define CallbackContainer_init_default           {CallbackArray_init_default}
+#define CallbackContainerContainer_init_default  {CallbackContainer_init_default}
+#define StringPointerContainer_init_default      {0, NULL}
+#define IntegerArray_init_zero                   {0, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}
+#define FloatArray_init_zero                     {0, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}
+#define StringMessage_init_zero                  {""}
+#define BytesMessage_init_zero                   {{0, {0}}}
+#define CallbackArray_init_zero                  {{{NULL}, NULL}}
+#define IntegerContainer_init_zero               {IntegerArray_init_zero}
+#define CallbackContainer_init_zero              {CallbackArray_init_zero}
+#define CallbackContainerContainer_init_zero     {CallbackContainer_init_zero}
+#define StringPointerContainer_init_zero         {0, NULL}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define CallbackArray_data_tag                   1
+#define StringPointerContainer_rep_str_tag       1
+#define BytesMessage_data_tag                    1
+#define CallbackContainer_submsg_tag             1
+#define FloatArray_data_tag                      1
+#define IntegerArray_data_tag                    1
+#define StringMessage_data_tag                   1
+#define CallbackContainerContainer_submsg_tag    1
+#define IntegerContainer_submsg_tag              1
+
+/* Struct field encoding specification for nanopb */
+#define IntegerArray_FIELDLIST(X, a) \
+X(a, STATIC, REPEATED, INT32, data, 1)
+#define IntegerArray_CALLBACK NULL
+#define IntegerArray_DEFAULT NULL
+
+#define FloatArray_FIELDLIST(X, a) \
+X(a, STATIC, REPEATED, FLOAT, data, 1)
+#define FloatArray_CALLBACK NULL
+#define FloatArray_DEFAULT NULL
+
+#define StringMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, STRING, data, 1)
+#define StringMessage_CALLBACK NULL
+#define StringMessage_DEFAULT NULL
+
+#define BytesMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, BYTES, data, 1)
+#define BytesMessage_CALLBACK NULL
+#define BytesMessage_DEFAULT NULL
+
+#define CallbackArray_FIELDLIST(X, a) \
+X(a, CALLBACK, REPEATED, INT32, data, 1)
+#define CallbackArray_CALLBACK pb_default_field_callback
+#define CallbackArray_DEFAULT NULL
+
+#define IntegerContainer_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, submsg, 1)
+#define IntegerContainer_CALLBACK NULL
+#define IntegerContainer_DEFAULT NULL
+#define IntegerContainer_submsg_MSGTYPE IntegerArray
+
+#define CallbackContainer_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, submsg, 1)
+#define CallbackContainer_CALLBACK NULL
+#define CallbackContainer_DEFAULT NULL
+#define CallbackContainer_submsg_MSGTYPE CallbackArray
+
+#define CallbackContainerContainer_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, submsg, 1)
+#define CallbackContainerContainer_CALLBACK NULL
+#define CallbackContainerContainer_DEFAULT NULL
+#define CallbackContainerContainer_submsg_MSGTYPE CallbackContainer
+
+#define StringPointerContainer_FIELDLIST(X, a) \
+X(a, POINTER, REPEATED, STRING, rep_str, 1)
+#define StringPointerContainer_CALLBACK NULL
+#define StringPointerContainer_DEFAULT NULL
+
+extern const pb_msgdesc_t IntegerArray_msg;
+extern const pb_msgdesc_t FloatArray_msg;
+extern const pb_msgdesc_t StringMessage_msg;
+extern const pb_msgdesc_t BytesMessage_msg;
+extern const pb_msgdesc_t CallbackArray_msg;
+extern const pb_msgdesc_t IntegerContainer_msg;
+extern const pb_msgdesc_t CallbackContainer_msg;
+extern const pb_msgdesc_t CallbackContainerContainer_msg;
+extern const pb_msgdesc_t StringPointerContainer_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define IntegerArray_fields &IntegerArray_msg
+#define FloatArray_fields &FloatArray_msg
+#define StringMessage_fields &StringMessage_msg
+#define BytesMessage_fields &BytesMessage_msg
+#define CallbackArray_fields &CallbackArray_msg
+#define IntegerContainer_fields &IntegerContainer_msg
+#define CallbackContainer_fields &CallbackContainer_msg
+#define CallbackContainerContainer_fields &CallbackContainerContainer_msg
+#define StringPointerContainer_fields &StringPointerContainer_msg
+
+/* Maximum encoded size of messages (where known) */
+#define IntegerArray_size                        110
+#define FloatArray_size                          50
+#define StringMessage_size                       12
+#define BytesMessage_size                        18
+/* CallbackArray_size depends on runtime parameters */
+#define IntegerContainer_size                    112
+/* CallbackContainer_size depends on runtime parameters */
+/* CallbackContainerContainer_size depends on runtime parameters */
+/* StringPointerContainer_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
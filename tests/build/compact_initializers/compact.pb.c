@@ -0,0 +1,23 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "compact.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(ZeroSub, ZeroSub, AUTO)
+
+
+PB_BIND(DefaultSub, DefaultSub, AUTO)
+
+
+PB_BIND(Arrays, Arrays, AUTO)
+
+
+
+
+
+/* @@protoc_insertion_point(eof) */
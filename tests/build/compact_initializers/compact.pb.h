@@ -0,0 +1,146 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_COMPACT_PB_H_INCLUDED
+#define PB_COMPACT_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _ZeroEnum {
+    ZeroEnum_ZERO_FIRST = 0,
+    ZeroEnum_ZERO_SECOND = 1
+} ZeroEnum;
+#define _ZeroEnum_MIN ZeroEnum_ZERO_FIRST
+#define _ZeroEnum_MAX ZeroEnum_ZERO_SECOND
+#define _ZeroEnum_ARRAYSIZE ((ZeroEnum)(ZeroEnum_ZERO_SECOND+1))
+
+typedef enum _NonZeroEnum {
+    NonZeroEnum_NONZERO_FIRST = 5,
+    NonZeroEnum_NONZERO_SECOND = 6
+} NonZeroEnum;
+#define _NonZeroEnum_MIN NonZeroEnum_NONZERO_FIRST
+#define _NonZeroEnum_MAX NonZeroEnum_NONZERO_SECOND
+#define _NonZeroEnum_ARRAYSIZE ((NonZeroEnum)(NonZeroEnum_NONZERO_SECOND+1))
+
+/* Struct definitions */
+typedef struct _DefaultSub {
+    bool has_value;
+    int32_t value;
+/* @@protoc_insertion_point(struct:DefaultSub) */
+} DefaultSub;
+
+
+typedef struct _ZeroSub {
+    bool has_value;
+    int32_t value;
+    bool has_text;
+    char text[8];
+    bool has_kind;
+    ZeroEnum kind;
+/* @@protoc_insertion_point(struct:ZeroSub) */
+} ZeroSub;
+
+
+typedef PB_BYTES_ARRAY_T(8) Arrays_data_t;
+typedef struct _Arrays {
+    pb_size_t ints_count;
+    int32_t ints[100];
+    pb_size_t strs_count;
+    char strs[10][16];
+    pb_size_t data_count;
+    Arrays_data_t data[5];
+    pb_size_t subs_count;
+    ZeroSub subs[10];
+    pb_size_t defsubs_count;
+    DefaultSub defsubs[3];
+    pb_size_t zeroenums_count;
+    ZeroEnum zeroenums[20];
+    pb_size_t nonzeroenums_count;
+    NonZeroEnum nonzeroenums[3];
+    uint32_t fixed[50];
+    pb_size_t listed_count;
+    int32_t listed[3];
+/* @@protoc_insertion_point(struct:Arrays) */
+} Arrays;
+
+
+/* Initializer values for message structs */
+#define ZeroSub_init_default                     {false, 0, false, "", false, _ZeroEnum_MIN}
+#define DefaultSub_init_default                  {false, 7}
+#define Arrays_init_default                      {0, {0}, 0, {""}, 0, {{0, {0}}}, 0, {ZeroSub_init_default}, 0, {DefaultSub_init_default, DefaultSub_init_default, DefaultSub_init_default}, 0, {_ZeroEnum_MIN}, 0, {_NonZeroEnum_MIN, _NonZeroEnum_MIN, _NonZeroEnum_MIN}, {0}, 0, {0, 0, 0}}
+#define ZeroSub_init_zero                        {false, 0, false, "", false, _ZeroEnum_MIN}
+#define DefaultSub_init_zero                     {false, 0}
+#define Arrays_init_zero                         {0, {0}, 0, {""}, 0, {{0, {0}}}, 0, {ZeroSub_init_zero}, 0, {DefaultSub_init_zero}, 0, {_ZeroEnum_MIN}, 0, {_NonZeroEnum_MIN, _NonZeroEnum_MIN, _NonZeroEnum_MIN}, {0}, 0, {0, 0, 0}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define DefaultSub_value_tag                     1
+#define ZeroSub_value_tag                        1
+#define ZeroSub_text_tag                         2
+#define ZeroSub_kind_tag                         3
+#define Arrays_ints_tag                          1
+#define Arrays_strs_tag                          2
+#define Arrays_data_tag                          3
+#define Arrays_subs_tag                          4
+#define Arrays_defsubs_tag                       5
+#define Arrays_zeroenums_tag                     6
+#define Arrays_nonzeroenums_tag                  7
+#define Arrays_fixed_tag                         8
+#define Arrays_listed_tag                        9
+
+/* Struct field encoding specification for nanopb */
+#define ZeroSub_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, INT32, value, 1) \
+X(a, STATIC, OPTIONAL, STRING, text, 2) \
+X(a, STATIC, OPTIONAL, UENUM, kind, 3)
+#define ZeroSub_CALLBACK NULL
+#define ZeroSub_DEFAULT NULL
+
+#define DefaultSub_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, INT32, value, 1)
+#define DefaultSub_CALLBACK NULL
+#define DefaultSub_DEFAULT (const uint8_t*)"\x08\x07\x00"
+
+#define Arrays_FIELDLIST(X, a) \
+X(a, STATIC, REPEATED, INT32, ints, 1) \
+X(a, STATIC, REPEATED, STRING, strs, 2) \
+X(a, STATIC, REPEATED, BYTES, data, 3) \
+X(a, STATIC, REPEATED, MESSAGE, subs, 4) \
+X(a, STATIC, REPEATED, MESSAGE, defsubs, 5) \
+X(a, STATIC, REPEATED, UENUM, zeroenums, 6) \
+X(a, STATIC, REPEATED, UENUM, nonzeroenums, 7) \
+X(a, STATIC, FIXARRAY, FIXED32, fixed, 8) \
+X(a, STATIC, REPEATED, INT32, listed, 9)
+#define Arrays_CALLBACK NULL
+#define Arrays_DEFAULT NULL
+#define Arrays_subs_MSGTYPE ZeroSub
+#define Arrays_defsubs_MSGTYPE DefaultSub
+
+extern const pb_msgdesc_t ZeroSub_msg;
+extern const pb_msgdesc_t DefaultSub_msg;
+extern const pb_msgdesc_t Arrays_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define ZeroSub_fields &ZeroSub_msg
+#define DefaultSub_fields &DefaultSub_msg
+#define Arrays_fields &Arrays_msg
+
+/* Maximum encoded size of messages (where known) */
+#define ZeroSub_size                             22
+#define DefaultSub_size                          11
+#define Arrays_size                              1928
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
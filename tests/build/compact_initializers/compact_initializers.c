@@ -0,0 +1,46 @@
+/* Check that compact initializers give the same values as listing
+ * every array element. */
+
+#include <stdio.h>
+#include "compact.pb.h"
+#include "unittests.h"
+
+int main()
+{
+    int status = 0;
+    int i;
+
+    {
+        Arrays msg = Arrays_init_default;
+        for (i = 0; i < 100; i++)
+            TEST(msg.ints[i] == 0);
+        for (i = 0; i < 10; i++)
+        {
+            TEST(msg.strs[i][0] == '\0');
+            TEST(!msg.subs[i].has_value && msg.subs[i].value == 0);
+            TEST(msg.subs[i].kind == ZeroEnum_ZERO_FIRST);
+        }
+        for (i = 0; i < 5; i++)
+            TEST(msg.data[i].size == 0);
+        for (i = 0; i < 3; i++)
+        {
+            TEST(msg.defsubs[i].value == 7);
+            TEST(msg.nonzeroenums[i] == NonZeroEnum_NONZERO_FIRST);
+        }
+        for (i = 0; i < 20; i++)
+            TEST(msg.zeroenums[i] == ZeroEnum_ZERO_FIRST);
+        for (i = 0; i < 50; i++)
+            TEST(msg.fixed[i] == 0);
+    }
+
+    {
+        Arrays msg = Arrays_init_zero;
+        for (i = 0; i < 3; i++)
+        {
+            TEST(msg.defsubs[i].value == 0);
+            TEST(msg.nonzeroenums[i] == NonZeroEnum_NONZERO_FIRST);
+        }
+    }
+
+    return status;
+}
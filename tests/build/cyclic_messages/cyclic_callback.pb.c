@@ -0,0 +1,21 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "cyclic_callback.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(TreeNode, TreeNode, AUTO)
+
+
+PB_BIND(Dictionary, Dictionary, AUTO)
+
+
+PB_BIND(KeyValuePair, KeyValuePair, AUTO)
+
+
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,111 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_CYCLIC_CALLBACK_PB_H_INCLUDED
+#define PB_CYCLIC_CALLBACK_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Dictionary {
+    pb_callback_t dictItem;
+/* @@protoc_insertion_point(struct:Dictionary) */
+} Dictionary;
+
+
+typedef struct _KeyValuePair {
+    char key[8];
+    bool has_stringValue;
+    char stringValue[8];
+    bool has_intValue;
+    int32_t intValue;
+    bool has_dictValue;
+    Dictionary dictValue;
+    pb_callback_t treeValue;
+/* @@protoc_insertion_point(struct:KeyValuePair) */
+} KeyValuePair;
+
+
+typedef struct _TreeNode {
+    bool has_leaf;
+    int32_t leaf;
+    pb_callback_t left;
+    pb_callback_t right;
+/* @@protoc_insertion_point(struct:TreeNode) */
+} TreeNode;
+
+
+/* Initializer values for message structs */
+#define TreeNode_init_default                    {false, 0, {{NULL}, NULL}, {{NULL}, NULL}}
+#define Dictionary_init_default                  {{{NULL}, NULL}}
+#define KeyValuePair_init_default                {"", false, "", false, 0, false, Dictionary_init_default, {{NULL}, NULL}}
+#define TreeNode_init_zero                       {false, 0, {{NULL}, NULL}, {{NULL}, NULL}}
+#define Dictionary_init_zero                     {{{NULL}, NULL}}
+#define KeyValuePair_init_zero                   {"", false, "", false, 0, false, Dictionary_init_zero, {{NULL}, NULL}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Dictionary_dictItem_tag                  1
+#define KeyValuePair_key_tag                     1
+#define KeyValuePair_stringValue_tag             2
+#define KeyValuePair_intValue_tag                3
+#define KeyValuePair_dictValue_tag               4
+#define KeyValuePair_treeValue_tag               5
+#define TreeNode_leaf_tag                        1
+#define TreeNode_left_tag                        2
+#define TreeNode_right_tag                       3
+
+/* Struct field encoding specification for nanopb */
+#define TreeNode_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, INT32, leaf, 1) \
+X(a, CALLBACK, OPTIONAL, MESSAGE, left, 2) \
+X(a, CALLBACK, OPTIONAL, MESSAGE, right, 3)
+#define TreeNode_CALLBACK pb_default_field_callback
+#define TreeNode_DEFAULT NULL
+#define TreeNode_left_MSGTYPE TreeNode
+#define TreeNode_right_MSGTYPE TreeNode
+
+#define Dictionary_FIELDLIST(X, a) \
+X(a, CALLBACK, REPEATED, MESSAGE, dictItem, 1)
+#define Dictionary_CALLBACK pb_default_field_callback
+#define Dictionary_DEFAULT NULL
+#define Dictionary_dictItem_MSGTYPE KeyValuePair
+
+#define KeyValuePair_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, STRING, key, 1) \
+X(a, STATIC, OPTIONAL, STRING, stringValue, 2) \
+X(a, STATIC, OPTIONAL, INT32, intValue, 3) \
+X(a, STATIC, OPTIONAL, MESSAGE, dictValue, 4) \
+X(a, CALLBACK, OPTIONAL, MESSAGE, treeValue, 5)
+#define KeyValuePair_CALLBACK pb_default_field_callback
+#define KeyValuePair_DEFAULT NULL
+#define KeyValuePair_dictValue_MSGTYPE Dictionary
+#define KeyValuePair_treeValue_MSGTYPE TreeNode
+
+extern const pb_msgdesc_t TreeNode_msg;
+extern const pb_msgdesc_t Dictionary_msg;
+extern const pb_msgdesc_t KeyValuePair_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define TreeNode_fields &TreeNode_msg
+#define Dictionary_fields &Dictionary_msg
+#define KeyValuePair_fields &KeyValuePair_msg
+
+/* Maximum encoded size of messages (where known) */
+/* TreeNode_size depends on runtime parameters */
+/* Dictionary_size depends on runtime parameters */
+/* KeyValuePair_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
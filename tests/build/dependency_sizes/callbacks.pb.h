@@ -0,0 +1,67 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_CALLBACKS_PB_H_INCLUDED
+#define PB_CALLBACKS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _First {
+    pb_callback_t text;
+/* @@protoc_insertion_point(struct:First) */
+} First;
+
+
+typedef struct _Second {
+    pb_callback_t values;
+/* @@protoc_insertion_point(struct:Second) */
+} Second;
+
+
+/* Initializer values for message structs */
+#define First_init_default                       {{{NULL}, NULL}}
+#define Second_init_default                      {{{NULL}, NULL}}
+#define First_init_zero                          {{{NULL}, NULL}}
+#define Second_init_zero                         {{{NULL}, NULL}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define First_text_tag                           1
+#define Second_values_tag                        1
+
+/* Struct field encoding specification for nanopb */
+#define First_FIELDLIST(X, a) \
+X(a, CALLBACK, OPTIONAL, STRING, text, 1)
+#define First_CALLBACK pb_default_field_callback
+#define First_DEFAULT NULL
+
+#define Second_FIELDLIST(X, a) \
+X(a, CALLBACK, REPEATED, INT32, values, 1)
+#define Second_CALLBACK pb_default_field_callback
+#define Second_DEFAULT NULL
+
+extern const pb_msgdesc_t First_msg;
+extern const pb_msgdesc_t Second_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define First_fields &First_msg
+#define Second_fields &Second_msg
+
+/* Maximum encoded size of messages (where known) */
+/* First_size depends on runtime parameters */
+/* Second_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
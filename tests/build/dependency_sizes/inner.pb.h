@@ -0,0 +1,50 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_INNER_PB_H_INCLUDED
+#define PB_INNER_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Inner {
+    int32_t value;
+/* @@protoc_insertion_point(struct:Inner) */
+} Inner;
+
+
+/* Initializer values for message structs */
+#define Inner_init_default                       {0}
+#define Inner_init_zero                          {0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Inner_value_tag                          1
+
+/* Struct field encoding specification for nanopb */
+#define Inner_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, value, 1)
+#define Inner_CALLBACK NULL
+#define Inner_DEFAULT NULL
+
+extern const pb_msgdesc_t Inner_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Inner_fields &Inner_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Inner_size                               11
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,70 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_MIDDLE_PB_H_INCLUDED
+#define PB_MIDDLE_PB_H_INCLUDED
+#include <pb.h>
+
+#include "inner.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Middle {
+    Inner inner;
+/* @@protoc_insertion_point(struct:Middle) */
+} Middle;
+
+
+typedef struct _Unrelated {
+    int32_t value;
+/* @@protoc_insertion_point(struct:Unrelated) */
+} Unrelated;
+
+
+/* Initializer values for message structs */
+#define Middle_init_default                      {Inner_init_default}
+#define Unrelated_init_default                   {0}
+#define Middle_init_zero                         {Inner_init_zero}
+#define Unrelated_init_zero                      {0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Middle_inner_tag                         1
+#define Unrelated_value_tag                      1
+
+/* Struct field encoding specification for nanopb */
+#define Middle_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, inner, 1)
+#define Middle_CALLBACK NULL
+#define Middle_DEFAULT NULL
+#define Middle_inner_MSGTYPE Inner
+
+#define Unrelated_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, value, 1)
+#define Unrelated_CALLBACK NULL
+#define Unrelated_DEFAULT NULL
+
+extern const pb_msgdesc_t Middle_msg;
+extern const pb_msgdesc_t Unrelated_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Middle_fields &Middle_msg
+#define Unrelated_fields &Unrelated_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Middle_size                              13
+#define Unrelated_size                           11
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
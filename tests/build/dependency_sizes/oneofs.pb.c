@@ -0,0 +1,24 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "oneofs.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Both, Both, AUTO)
+
+
+PB_BIND(WithOneof, WithOneof, AUTO)
+
+
+PB_BIND(OnlyOneof, OnlyOneof, AUTO)
+
+
+PB_BIND(Repeated, Repeated, AUTO)
+
+
+
+/* @@protoc_insertion_point(eof) */
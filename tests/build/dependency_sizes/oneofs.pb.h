@@ -0,0 +1,126 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_ONEOFS_PB_H_INCLUDED
+#define PB_ONEOFS_PB_H_INCLUDED
+#include <pb.h>
+
+#include "callbacks.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Both {
+    First first;
+    Second second;
+/* @@protoc_insertion_point(struct:Both) */
+} Both;
+
+
+typedef struct _OnlyOneof {
+    pb_size_t which_choice;
+    union {
+        Both both;
+    } choice;
+/* @@protoc_insertion_point(struct:OnlyOneof) */
+} OnlyOneof;
+
+
+typedef struct _WithOneof {
+    pb_size_t which_choice;
+    union {
+        Both both;
+        int32_t value;
+    } choice;
+/* @@protoc_insertion_point(struct:WithOneof) */
+} WithOneof;
+
+
+typedef struct _Repeated {
+    pb_size_t items_count;
+    WithOneof items[3];
+    pb_size_t others_count;
+    OnlyOneof others[3];
+/* @@protoc_insertion_point(struct:Repeated) */
+} Repeated;
+
+
+/* Initializer values for message structs */
+#define Both_init_default                        {First_init_default, Second_init_default}
+#define WithOneof_init_default                   {0, {Both_init_default}}
+#define OnlyOneof_init_default                   {0, {Both_init_default}}
+#define Repeated_init_default                    {0, {WithOneof_init_default, WithOneof_init_default, WithOneof_init_default}, 0, {OnlyOneof_init_default, OnlyOneof_init_default, OnlyOneof_init_default}}
+#define Both_init_zero                           {First_init_zero, Second_init_zero}
+#define WithOneof_init_zero                      {0, {Both_init_zero}}
+#define OnlyOneof_init_zero                      {0, {Both_init_zero}}
+#define Repeated_init_zero                       {0, {WithOneof_init_zero, WithOneof_init_zero, WithOneof_init_zero}, 0, {OnlyOneof_init_zero, OnlyOneof_init_zero, OnlyOneof_init_zero}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Both_first_tag                           1
+#define Both_second_tag                          2
+#define OnlyOneof_both_tag                       1
+#define WithOneof_both_tag                       1
+#define WithOneof_value_tag                      2
+#define Repeated_items_tag                       1
+#define Repeated_others_tag                      2
+
+/* Struct field encoding specification for nanopb */
+#define Both_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, first, 1) \
+X(a, STATIC, REQUIRED, MESSAGE, second, 2)
+#define Both_CALLBACK NULL
+#define Both_DEFAULT NULL
+#define Both_first_MSGTYPE First
+#define Both_second_MSGTYPE Second
+
+#define WithOneof_FIELDLIST(X, a) \
+X(a, STATIC, ONEOF, MESSAGE, (choice,both,choice.both), 1) \
+X(a, STATIC, ONEOF, INT32, (choice,value,choice.value), 2)
+#define WithOneof_CALLBACK NULL
+#define WithOneof_DEFAULT NULL
+#define WithOneof_choice_both_MSGTYPE Both
+
+#define OnlyOneof_FIELDLIST(X, a) \
+X(a, STATIC, ONEOF, MESSAGE, (choice,both,choice.both), 1)
+#define OnlyOneof_CALLBACK NULL
+#define OnlyOneof_DEFAULT NULL
+#define OnlyOneof_choice_both_MSGTYPE Both
+
+#define Repeated_FIELDLIST(X, a) \
+X(a, STATIC, REPEATED, MESSAGE, items, 1) \
+X(a, STATIC, REPEATED, MESSAGE, others, 2)
+#define Repeated_CALLBACK NULL
+#define Repeated_DEFAULT NULL
+#define Repeated_items_MSGTYPE WithOneof
+#define Repeated_others_MSGTYPE OnlyOneof
+
+extern const pb_msgdesc_t Both_msg;
+extern const pb_msgdesc_t WithOneof_msg;
+extern const pb_msgdesc_t OnlyOneof_msg;
+extern const pb_msgdesc_t Repeated_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Both_fields &Both_msg
+#define WithOneof_fields &WithOneof_msg
+#define OnlyOneof_fields &OnlyOneof_msg
+#define Repeated_fields &Repeated_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Both_size                                (12 + First_size + Second_size)
+#define WithOneof_size                           (0 + sizeof(union{char f0[11]; char f1[(18 + First_size + Second_size)];}))
+#define OnlyOneof_size                           (18 + First_size + Second_size)
+#define Repeated_size                            (90 + 3*First_size + 3*Second_size + 3*sizeof(union{char f0[11]; char f1[(18 + First_size + Second_size)];}))
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
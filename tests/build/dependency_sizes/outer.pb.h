@@ -0,0 +1,53 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_OUTER_PB_H_INCLUDED
+#define PB_OUTER_PB_H_INCLUDED
+#include <pb.h>
+
+#include "middle.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Outer {
+    Unrelated unrelated;
+/* @@protoc_insertion_point(struct:Outer) */
+} Outer;
+
+
+/* Initializer values for message structs */
+#define Outer_init_default                       {Unrelated_init_default}
+#define Outer_init_zero                          {Unrelated_init_zero}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Outer_unrelated_tag                      1
+
+/* Struct field encoding specification for nanopb */
+#define Outer_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, unrelated, 1)
+#define Outer_CALLBACK NULL
+#define Outer_DEFAULT NULL
+#define Outer_unrelated_MSGTYPE Unrelated
+
+extern const pb_msgdesc_t Outer_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Outer_fields &Outer_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Outer_size                               13
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,11 @@
+
+f
+middle.protoinner.proto"&
+Middle
+inner (2.InnerRinner"!
+	Unrelated
+value (Rvalue
+I
+partial.protomiddle.proto"*
+Partial
+middle (2.MiddleRmiddle
\ No newline at end of file
@@ -0,0 +1,53 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_PARTIAL_PB_H_INCLUDED
+#define PB_PARTIAL_PB_H_INCLUDED
+#include <pb.h>
+
+#include "middle.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Partial {
+    Middle middle;
+/* @@protoc_insertion_point(struct:Partial) */
+} Partial;
+
+
+/* Initializer values for message structs */
+#define Partial_init_default                     {Middle_init_default}
+#define Partial_init_zero                        {Middle_init_zero}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Partial_middle_tag                       1
+
+/* Struct field encoding specification for nanopb */
+#define Partial_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, middle, 1)
+#define Partial_CALLBACK NULL
+#define Partial_DEFAULT NULL
+#define Partial_middle_MSGTYPE Middle
+
+extern const pb_msgdesc_t Partial_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Partial_fields &Partial_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Partial_size                             (12 + Inner_size)
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,57 @@
+/* Encode and decode messages that use the smaller descriptor widths. */
+
+#include <stdio.h>
+#include <pb_encode.h>
+#include <pb_decode.h>
+#include "widths.pb.h"
+#include "unittests.h"
+
+int main()
+{
+    int status = 0;
+    int i;
+
+    {
+        static LargeArray msg1, msg2;
+        static pb_byte_t buffer[LargeArray_size];
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        pb_istream_t istream;
+
+        COMMENT("Test LargeArray");
+        msg1.values_count = 2000;
+        for (i = 0; i < 2000; i++)
+            msg1.values[i] = i * 1000;
+
+        TEST(pb_encode(&ostream, LargeArray_fields, &msg1));
+        istream = pb_istream_from_buffer(buffer, ostream.bytes_written);
+        TEST(pb_decode(&istream, LargeArray_fields, &msg2));
+        TEST(msg2.values_count == 2000);
+        TEST(msg2.values[0] == 0 && msg2.values[1999] == 1999000);
+    }
+
+    {
+        ManyBools msg1 = ManyBools_init_zero;
+        ManyBools msg2 = ManyBools_init_zero;
+        pb_byte_t buffer[ManyBools_size];
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        pb_istream_t istream;
+
+        COMMENT("Test ManyBools");
+        msg1.has_flag1 = true;
+        msg1.flag1 = true;
+        msg1.has_flag40 = true;
+        msg1.flag40 = true;
+
+        TEST(pb_encode(&ostream, ManyBools_fields, &msg1));
+        istream = pb_istream_from_buffer(buffer, ostream.bytes_written);
+        TEST(pb_decode(&istream, ManyBools_fields, &msg2));
+        TEST(msg2.has_flag1 && msg2.flag1);
+        TEST(msg2.has_flag40 && msg2.flag40);
+        TEST(!msg2.has_flag20);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
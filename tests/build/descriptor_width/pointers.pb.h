@@ -0,0 +1,167 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_POINTERS_PB_H_INCLUDED
+#define PB_POINTERS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Pointers {
+    int32_t *value1;
+    int32_t *value2;
+    int32_t *value3;
+    int32_t *value4;
+    int32_t *value5;
+    int32_t *value6;
+    int32_t *value7;
+    int32_t *value8;
+    int32_t *value9;
+    int32_t *value10;
+    int32_t *value11;
+    int32_t *value12;
+    int32_t *value13;
+    int32_t *value14;
+    int32_t *value15;
+    int32_t *value16;
+    int32_t *value17;
+    int32_t *value18;
+    int32_t *value19;
+    int32_t *value20;
+    int32_t *value21;
+    int32_t *value22;
+    int32_t *value23;
+    int32_t *value24;
+    int32_t *value25;
+    int32_t *value26;
+    int32_t *value27;
+    int32_t *value28;
+    int32_t *value29;
+    int32_t *value30;
+    int32_t *value31;
+    int32_t *value32;
+    int32_t *value33;
+    int32_t *value34;
+    int32_t *value35;
+    int32_t *value36;
+    int32_t *value37;
+    int32_t *value38;
+    int32_t *value39;
+    int32_t *value40;
+/* @@protoc_insertion_point(struct:Pointers) */
+} Pointers;
+
+
+/* Initializer values for message structs */
+#define Pointers_init_default                    {NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL}
+#define Pointers_init_zero                       {NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Pointers_value1_tag                      1
+#define Pointers_value2_tag                      2
+#define Pointers_value3_tag                      3
+#define Pointers_value4_tag                      4
+#define Pointers_value5_tag                      5
+#define Pointers_value6_tag                      6
+#define Pointers_value7_tag                      7
+#define Pointers_value8_tag                      8
+#define Pointers_value9_tag                      9
+#define Pointers_value10_tag                     10
+#define Pointers_value11_tag                     11
+#define Pointers_value12_tag                     12
+#define Pointers_value13_tag                     13
+#define Pointers_value14_tag                     14
+#define Pointers_value15_tag                     15
+#define Pointers_value16_tag                     16
+#define Pointers_value17_tag                     17
+#define Pointers_value18_tag                     18
+#define Pointers_value19_tag                     19
+#define Pointers_value20_tag                     20
+#define Pointers_value21_tag                     21
+#define Pointers_value22_tag                     22
+#define Pointers_value23_tag                     23
+#define Pointers_value24_tag                     24
+#define Pointers_value25_tag                     25
+#define Pointers_value26_tag                     26
+#define Pointers_value27_tag                     27
+#define Pointers_value28_tag                     28
+#define Pointers_value29_tag                     29
+#define Pointers_value30_tag                     30
+#define Pointers_value31_tag                     31
+#define Pointers_value32_tag                     32
+#define Pointers_value33_tag                     33
+#define Pointers_value34_tag                     34
+#define Pointers_value35_tag                     35
+#define Pointers_value36_tag                     36
+#define Pointers_value37_tag                     37
+#define Pointers_value38_tag                     38
+#define Pointers_value39_tag                     39
+#define Pointers_value40_tag                     40
+
+/* Struct field encoding specification for nanopb */
+#define Pointers_FIELDLIST(X, a) \
+X(a, POINTER, OPTIONAL, INT32, value1, 1) \
+X(a, POINTER, OPTIONAL, INT32, value2, 2) \
+X(a, POINTER, OPTIONAL, INT32, value3, 3) \
+X(a, POINTER, OPTIONAL, INT32, value4, 4) \
+X(a, POINTER, OPTIONAL, INT32, value5, 5) \
+X(a, POINTER, OPTIONAL, INT32, value6, 6) \
+X(a, POINTER, OPTIONAL, INT32, value7, 7) \
+X(a, POINTER, OPTIONAL, INT32, value8, 8) \
+X(a, POINTER, OPTIONAL, INT32, value9, 9) \
+X(a, POINTER, OPTIONAL, INT32, value10, 10) \
+X(a, POINTER, OPTIONAL, INT32, value11, 11) \
+X(a, POINTER, OPTIONAL, INT32, value12, 12) \
+X(a, POINTER, OPTIONAL, INT32, value13, 13) \
+X(a, POINTER, OPTIONAL, INT32, value14, 14) \
+X(a, POINTER, OPTIONAL, INT32, value15, 15) \
+X(a, POINTER, OPTIONAL, INT32, value16, 16) \
+X(a, POINTER, OPTIONAL, INT32, value17, 17) \
+X(a, POINTER, OPTIONAL, INT32, value18, 18) \
+X(a, POINTER, OPTIONAL, INT32, value19, 19) \
+X(a, POINTER, OPTIONAL, INT32, value20, 20) \
+X(a, POINTER, OPTIONAL, INT32, value21, 21) \
+X(a, POINTER, OPTIONAL, INT32, value22, 22) \
+X(a, POINTER, OPTIONAL, INT32, value23, 23) \
+X(a, POINTER, OPTIONAL, INT32, value24, 24) \
+X(a, POINTER, OPTIONAL, INT32, value25, 25) \
+X(a, POINTER, OPTIONAL, INT32, value26, 26) \
+X(a, POINTER, OPTIONAL, INT32, value27, 27) \
+X(a, POINTER, OPTIONAL, INT32, value28, 28) \
+X(a, POINTER, OPTIONAL, INT32, value29, 29) \
+X(a, POINTER, OPTIONAL, INT32, value30, 30) \
+X(a, POINTER, OPTIONAL, INT32, value31, 31) \
+X(a, POINTER, OPTIONAL, INT32, value32, 32) \
+X(a, POINTER, OPTIONAL, INT32, value33, 33) \
+X(a, POINTER, OPTIONAL, INT32, value34, 34) \
+X(a, POINTER, OPTIONAL, INT32, value35, 35) \
+X(a, POINTER, OPTIONAL, INT32, value36, 36) \
+X(a, POINTER, OPTIONAL, INT32, value37, 37) \
+X(a, POINTER, OPTIONAL, INT32, value38, 38) \
+X(a, POINTER, OPTIONAL, INT32, value39, 39) \
+X(a, POINTER, OPTIONAL, INT32, value40, 40)
+#define Pointers_CALLBACK NULL
+#define Pointers_DEFAULT NULL
+
+extern const pb_msgdesc_t Pointers_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Pointers_fields &Pointers_msg
+
+/* Maximum encoded size of messages (where known) */
+/* Pointers_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,333 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "alltypes.pb.h"
+#include <pb_encode.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(SubMessage, SubMessage, AUTO)
+
+
+PB_BIND(EmptyMessage, EmptyMessage, AUTO)
+
+
+PB_BIND(Limits, Limits, AUTO)
+
+
+PB_BIND(AllTypes, AllTypes, 2)
+
+
+#ifdef PB_WITHOUT_64BIT
+#define pb_int64_t int32_t
+#define pb_uint64_t uint32_t
+#else
+#define pb_int64_t int64_t
+#define pb_uint64_t uint64_t
+#endif
+
+bool SubMessage_get_encoded_size(size_t *size, const SubMessage *msg)
+{
+    size_t total = 0;
+
+    {
+        size_t length = 0;
+        while (length < 15 && msg->substuff1[length] != '\0')
+            length++;
+        if (msg->substuff1[length] != '\0')
+            return false;
+        total += 1 + pb_varint_size(length) + length;
+    }
+    total += 1 + ((pb_int64_t)msg->substuff2 < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->substuff2));
+    if (msg->has_substuff3)
+        total += 5;
+
+    *size = total;
+    return true;
+}
+
+bool EmptyMessage_get_encoded_size(size_t *size, const EmptyMessage *msg)
+{
+    PB_UNUSED(msg);
+    *size = 0;
+    return true;
+}
+
+bool Limits_get_encoded_size(size_t *size, const Limits *msg)
+{
+    size_t total = 0;
+
+    total += 1 + ((pb_int64_t)msg->int32_min < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->int32_min));
+    total += 1 + ((pb_int64_t)msg->int32_max < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->int32_max));
+    total += 1 + pb_varint_size((pb_uint64_t)msg->uint32_min);
+    total += 1 + pb_varint_size((pb_uint64_t)msg->uint32_max);
+    total += 1 + ((pb_int64_t)msg->int64_min < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->int64_min));
+    total += 1 + ((pb_int64_t)msg->int64_max < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->int64_max));
+    total += 1 + pb_varint_size((pb_uint64_t)msg->uint64_min);
+    total += 1 + pb_varint_size((pb_uint64_t)msg->uint64_max);
+    total += 1 + ((pb_int64_t)msg->enum_min < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->enum_min));
+    total += 1 + ((pb_int64_t)msg->enum_max < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->enum_max));
+
+    *size = total;
+    return true;
+}
+
+bool AllTypes_get_encoded_size(size_t *size, const AllTypes *msg)
+{
+    size_t total = 54;
+    size_t subsize;
+    pb_size_t i;
+
+    total += 1 + ((pb_int64_t)msg->req_int32 < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->req_int32));
+    total += 1 + ((pb_int64_t)msg->req_int64 < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->req_int64));
+    total += 1 + pb_varint_size((pb_uint64_t)msg->req_uint32);
+    total += 1 + pb_varint_size((pb_uint64_t)msg->req_uint64);
+    total += 1 + pb_svarint_size((pb_int64_t)msg->req_sint32);
+    total += 1 + pb_svarint_size((pb_int64_t)msg->req_sint64);
+    {
+        size_t length = 0;
+        while (length < 15 && msg->req_string[length] != '\0')
+            length++;
+        if (msg->req_string[length] != '\0')
+            return false;
+        total += 1 + pb_varint_size(length) + length;
+    }
+    if (PB_BYTES_ARRAY_T_ALLOCSIZE(msg->req_bytes.size) > sizeof(msg->req_bytes))
+        return false;
+    total += 1 + pb_varint_size(msg->req_bytes.size) + msg->req_bytes.size;
+    if (!SubMessage_get_encoded_size(&subsize, &msg->req_submsg))
+        return false;
+    total += 2 + pb_varint_size(subsize) + subsize;
+    total += 2 + pb_varint_size((pb_uint64_t)msg->req_enum);
+    if (msg->rep_int32_count > 5)
+        return false;
+    if (msg->rep_int32_count > 0)
+    {
+        size_t datasize = 0;
+        for (i = 0; i < msg->rep_int32_count; i++)
+            datasize += ((pb_int64_t)msg->rep_int32[i] < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->rep_int32[i]));
+        total += 2 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->rep_int64_count > 5)
+        return false;
+    if (msg->rep_int64_count > 0)
+    {
+        size_t datasize = 0;
+        for (i = 0; i < msg->rep_int64_count; i++)
+            datasize += ((pb_int64_t)msg->rep_int64[i] < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->rep_int64[i]));
+        total += 2 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->rep_uint32_count > 5)
+        return false;
+    if (msg->rep_uint32_count > 0)
+    {
+        size_t datasize = 0;
+        for (i = 0; i < msg->rep_uint32_count; i++)
+            datasize += pb_varint_size((pb_uint64_t)msg->rep_uint32[i]);
+        total += 2 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->rep_uint64_count > 5)
+        return false;
+    if (msg->rep_uint64_count > 0)
+    {
+        size_t datasize = 0;
+        for (i = 0; i < msg->rep_uint64_count; i++)
+            datasize += pb_varint_size((pb_uint64_t)msg->rep_uint64[i]);
+        total += 2 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->rep_sint32_count > 5)
+        return false;
+    if (msg->rep_sint32_count > 0)
+    {
+        size_t datasize = 0;
+        for (i = 0; i < msg->rep_sint32_count; i++)
+            datasize += pb_svarint_size((pb_int64_t)msg->rep_sint32[i]);
+        total += 2 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->rep_sint64_count > 5)
+        return false;
+    if (msg->rep_sint64_count > 0)
+    {
+        size_t datasize = 0;
+        for (i = 0; i < msg->rep_sint64_count; i++)
+            datasize += pb_svarint_size((pb_int64_t)msg->rep_sint64[i]);
+        total += 2 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->rep_bool_count > 5)
+        return false;
+    if (msg->rep_bool_count > 0)
+    {
+        size_t datasize = (size_t)msg->rep_bool_count;
+        total += 2 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->rep_fixed32_count > 5)
+        return false;
+    if (msg->rep_fixed32_count > 0)
+    {
+        size_t datasize = 4 * (size_t)msg->rep_fixed32_count;
+        total += 2 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->rep_sfixed32_count > 5)
+        return false;
+    if (msg->rep_sfixed32_count > 0)
+    {
+        size_t datasize = 4 * (size_t)msg->rep_sfixed32_count;
+        total += 2 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->rep_float_count > 5)
+        return false;
+    if (msg->rep_float_count > 0)
+    {
+        size_t datasize = 4 * (size_t)msg->rep_float_count;
+        total += 2 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->rep_fixed64_count > 5)
+        return false;
+    if (msg->rep_fixed64_count > 0)
+    {
+        size_t datasize = 8 * (size_t)msg->rep_fixed64_count;
+        total += 2 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->rep_sfixed64_count > 5)
+        return false;
+    if (msg->rep_sfixed64_count > 0)
+    {
+        size_t datasize = 8 * (size_t)msg->rep_sfixed64_count;
+        total += 2 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->rep_double_count > 5)
+        return false;
+    if (msg->rep_double_count > 0)
+    {
+        size_t datasize = 8 * (size_t)msg->rep_double_count;
+        total += 2 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->rep_string_count > 5)
+        return false;
+    for (i = 0; i < msg->rep_string_count; i++)
+    {
+        size_t length = 0;
+        while (length < 15 && msg->rep_string[i][length] != '\0')
+            length++;
+        if (msg->rep_string[i][length] != '\0')
+            return false;
+        total += 2 + pb_varint_size(length) + length;
+    }
+    if (msg->rep_bytes_count > 5)
+        return false;
+    for (i = 0; i < msg->rep_bytes_count; i++)
+    {
+        if (PB_BYTES_ARRAY_T_ALLOCSIZE(msg->rep_bytes[i].size) > sizeof(msg->rep_bytes[i]))
+            return false;
+        total += 2 + pb_varint_size(msg->rep_bytes[i].size) + msg->rep_bytes[i].size;
+    }
+    if (msg->rep_submsg_count > 5)
+        return false;
+    for (i = 0; i < msg->rep_submsg_count; i++)
+    {
+        if (!SubMessage_get_encoded_size(&subsize, &msg->rep_submsg[i]))
+            return false;
+        total += 2 + pb_varint_size(subsize) + subsize;
+    }
+    if (msg->rep_enum_count > 5)
+        return false;
+    if (msg->rep_enum_count > 0)
+    {
+        size_t datasize = 0;
+        for (i = 0; i < msg->rep_enum_count; i++)
+            datasize += pb_varint_size((pb_uint64_t)msg->rep_enum[i]);
+        total += 2 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->rep_emptymsg_count > 5)
+        return false;
+    total += 3 * (size_t)msg->rep_emptymsg_count;
+    if (msg->rep_fbytes_count > 5)
+        return false;
+    total += 7 * (size_t)msg->rep_fbytes_count;
+    if (msg->has_opt_int32)
+        total += 2 + ((pb_int64_t)msg->opt_int32 < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->opt_int32));
+    if (msg->has_opt_int64)
+        total += 2 + ((pb_int64_t)msg->opt_int64 < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->opt_int64));
+    if (msg->has_opt_uint32)
+        total += 2 + pb_varint_size((pb_uint64_t)msg->opt_uint32);
+    if (msg->has_opt_uint64)
+        total += 2 + pb_varint_size((pb_uint64_t)msg->opt_uint64);
+    if (msg->has_opt_sint32)
+        total += 2 + pb_svarint_size((pb_int64_t)msg->opt_sint32);
+    if (msg->has_opt_sint64)
+        total += 2 + pb_svarint_size((pb_int64_t)msg->opt_sint64);
+    if (msg->has_opt_bool)
+        total += 3;
+    if (msg->has_opt_fixed32)
+        total += 6;
+    if (msg->has_opt_sfixed32)
+        total += 6;
+    if (msg->has_opt_float)
+        total += 6;
+    if (msg->has_opt_fixed64)
+        total += 10;
+    if (msg->has_opt_sfixed64)
+        total += 10;
+    if (msg->has_opt_double)
+        total += 10;
+    if (msg->has_opt_string)
+    {
+        size_t length = 0;
+        while (length < 15 && msg->opt_string[length] != '\0')
+            length++;
+        if (msg->opt_string[length] != '\0')
+            return false;
+        total += 2 + pb_varint_size(length) + length;
+    }
+    if (msg->has_opt_bytes)
+    {
+        if (PB_BYTES_ARRAY_T_ALLOCSIZE(msg->opt_bytes.size) > sizeof(msg->opt_bytes))
+            return false;
+        total += 2 + pb_varint_size(msg->opt_bytes.size) + msg->opt_bytes.size;
+    }
+    if (msg->has_opt_submsg)
+    {
+        if (!SubMessage_get_encoded_size(&subsize, &msg->opt_submsg))
+            return false;
+        total += 2 + pb_varint_size(subsize) + subsize;
+    }
+    if (msg->has_opt_enum)
+        total += 2 + pb_varint_size((pb_uint64_t)msg->opt_enum);
+    if (msg->has_opt_emptymsg)
+        total += 3;
+    if (msg->has_opt_fbytes)
+        total += 7;
+    switch (msg->which_oneof)
+    {
+        case 60:
+            if (!SubMessage_get_encoded_size(&subsize, &msg->oneof.oneof_msg1))
+                return false;
+            total += 2 + pb_varint_size(subsize) + subsize;
+            break;
+        case 61:
+            total += 3;
+            break;
+    }
+    if (!Limits_get_encoded_size(&subsize, &msg->req_limits))
+        return false;
+    total += 2 + pb_varint_size(subsize) + subsize;
+    total += 2 + ((pb_int64_t)msg->end < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->end));
+
+    *size = total;
+    return true;
+}
+
+
+
+
+/* On some platforms (such as AVR), double is really float.
+ * Using double on these platforms is not directly supported
+ * by nanopb, but see example_avr_double.
+ * To get rid of this error, remove any double fields from your .proto.
+ */
+PB_STATIC_ASSERT(sizeof(double) == 8, DOUBLE_MUST_BE_8_BYTES)
+
+/* @@protoc_insertion_point(eof) */
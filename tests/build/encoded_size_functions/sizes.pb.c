@@ -0,0 +1,249 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "sizes.pb.h"
+#include <pb_encode.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Fixed, Fixed, AUTO)
+
+
+PB_BIND(Inner, Inner, AUTO)
+
+
+PB_BIND(Sizes, Sizes, 4)
+
+
+PB_BIND(FixedCount, FixedCount, AUTO)
+
+
+PB_BIND(WithCallback, WithCallback, AUTO)
+
+
+PB_BIND(Outer, Outer, AUTO)
+
+
+PB_BIND(Fallback, Fallback, AUTO)
+
+
+#ifdef PB_WITHOUT_64BIT
+#define pb_int64_t int32_t
+#define pb_uint64_t uint32_t
+#else
+#define pb_int64_t int64_t
+#define pb_uint64_t uint64_t
+#endif
+
+bool Fixed_get_encoded_size(size_t *size, const Fixed *msg)
+{
+    PB_UNUSED(msg);
+    *size = 32;
+    return true;
+}
+
+bool Inner_get_encoded_size(size_t *size, const Inner *msg)
+{
+    size_t total = 0;
+
+    if (msg->value != 0)
+        total += 1 + pb_svarint_size((pb_int64_t)msg->value);
+    if (msg->text[0] != '\0')
+    {
+        size_t length = 0;
+        while (length < 7 && msg->text[length] != '\0')
+            length++;
+        if (msg->text[length] != '\0')
+            return false;
+        total += 1 + pb_varint_size(length) + length;
+    }
+
+    *size = total;
+    return true;
+}
+
+bool Sizes_get_encoded_size(size_t *size, const Sizes *msg)
+{
+    size_t total = 34;
+    size_t subsize;
+    pb_size_t i;
+
+    if (msg->small != 0)
+        total += 1 + ((pb_int64_t)msg->small < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->small));
+    if (msg->large != 0)
+        total += 1 + ((pb_int64_t)msg->large < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->large));
+    if (msg->unsigned_value != 0)
+        total += 1 + pb_varint_size((pb_uint64_t)msg->unsigned_value);
+    if (msg->zigzag != 0)
+        total += 1 + pb_svarint_size((pb_int64_t)msg->zigzag);
+    if (msg->color != 0)
+        total += 1 + ((pb_int64_t)msg->color < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->color));
+    if (msg->flag != 0)
+        total += 2;
+    if (memcmp(&msg->ratio, "\0\0\0\0\0\0\0", sizeof(msg->ratio)) != 0)
+        total += 5;
+    if (msg->name[0] != '\0')
+    {
+        size_t length = 0;
+        while (length < 15 && msg->name[length] != '\0')
+            length++;
+        if (msg->name[length] != '\0')
+            return false;
+        total += 1 + pb_varint_size(length) + length;
+    }
+    if (msg->data.size != 0)
+    {
+        if (PB_BYTES_ARRAY_T_ALLOCSIZE(msg->data.size) > sizeof(msg->data))
+            return false;
+        total += 1 + pb_varint_size(msg->data.size) + msg->data.size;
+    }
+    if ((msg->inner.value != 0 || msg->inner.text[0] != '\0'))
+    {
+        if (!Inner_get_encoded_size(&subsize, &msg->inner))
+            return false;
+        total += 1 + pb_varint_size(subsize) + subsize;
+    }
+    if (msg->values_count > 4)
+        return false;
+    if (msg->values_count > 0)
+    {
+        size_t datasize = 0;
+        for (i = 0; i < msg->values_count; i++)
+            datasize += ((pb_int64_t)msg->values[i] < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->values[i]));
+        total += 1 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->stamps_count > 4)
+        return false;
+    if (msg->stamps_count > 0)
+    {
+        size_t datasize = 8 * (size_t)msg->stamps_count;
+        total += 1 + pb_varint_size(datasize) + datasize;
+    }
+    if (msg->names_count > 3)
+        return false;
+    for (i = 0; i < msg->names_count; i++)
+    {
+        size_t length = 0;
+        while (length < 7 && msg->names[i][length] != '\0')
+            length++;
+        if (msg->names[i][length] != '\0')
+            return false;
+        total += 1 + pb_varint_size(length) + length;
+    }
+    if (msg->inners_count > 2)
+        return false;
+    for (i = 0; i < msg->inners_count; i++)
+    {
+        if (!Inner_get_encoded_size(&subsize, &msg->inners[i]))
+            return false;
+        total += 1 + pb_varint_size(subsize) + subsize;
+    }
+    if (msg->bits_count > 4)
+        return false;
+    if (msg->bits_count > 0)
+    {
+        size_t datasize = (size_t)msg->bits_count;
+        total += 2 + pb_varint_size(datasize) + datasize;
+    }
+    switch (msg->which_choice)
+    {
+        case 17:
+            total += 2 + pb_varint_size((pb_uint64_t)msg->choice.number);
+            break;
+        case 18:
+            if (!Inner_get_encoded_size(&subsize, &msg->choice.nested))
+                return false;
+            total += 2 + pb_varint_size(subsize) + subsize;
+            break;
+        case 19:
+            total += 35;
+            break;
+    }
+    if (msg->last != 0)
+        total += 2 + pb_varint_size((pb_uint64_t)msg->last);
+
+    *size = total;
+    return true;
+}
+
+bool FixedCount_get_encoded_size(size_t *size, const FixedCount *msg)
+{
+    size_t total = 0;
+    size_t subsize;
+    pb_size_t i;
+
+    {
+        size_t datasize = 0;
+        for (i = 0; i < 3; i++)
+            datasize += ((pb_int64_t)msg->vals[i] < 0 ? 10 : pb_varint_size((pb_uint64_t)msg->vals[i]));
+        total += 1 + pb_varint_size(datasize) + datasize;
+    }
+    for (i = 0; i < 2; i++)
+    {
+        size_t length = 0;
+        while (length < 7 && msg->words[i][length] != '\0')
+            length++;
+        if (msg->words[i][length] != '\0')
+            return false;
+        total += 1 + pb_varint_size(length) + length;
+    }
+    for (i = 0; i < 2; i++)
+    {
+        if (!Inner_get_encoded_size(&subsize, &msg->inners[i]))
+            return false;
+        total += 1 + pb_varint_size(subsize) + subsize;
+    }
+
+    *size = total;
+    return true;
+}
+
+/* WithCallback has callback, pointer or extension fields,
+ * so it is handled by the generic function. */
+bool WithCallback_get_encoded_size(size_t *size, const WithCallback *msg)
+{
+    return pb_get_encoded_size(size, WithCallback_fields, msg);
+}
+
+bool Outer_get_encoded_size(size_t *size, const Outer *msg)
+{
+    size_t total = 0;
+    size_t subsize;
+    pb_size_t i;
+
+    if (!Sizes_get_encoded_size(&subsize, &msg->sizes))
+        return false;
+    total += 1 + pb_varint_size(subsize) + subsize;
+    if (msg->others_count > 2)
+        return false;
+    for (i = 0; i < msg->others_count; i++)
+    {
+        if (!WithCallback_get_encoded_size(&subsize, &msg->others[i]))
+            return false;
+        total += 1 + pb_varint_size(subsize) + subsize;
+    }
+
+    *size = total;
+    return true;
+}
+
+/* Fallback has callback, pointer or extension fields,
+ * so it is handled by the generic function. */
+bool Fallback_get_encoded_size(size_t *size, const Fallback *msg)
+{
+    return pb_get_encoded_size(size, Fallback_fields, msg);
+}
+
+
+
+/* On some platforms (such as AVR), double is really float.
+ * Using double on these platforms is not directly supported
+ * by nanopb, but see example_avr_double.
+ * To get rid of this error, remove any double fields from your .proto.
+ */
+PB_STATIC_ASSERT(sizeof(double) == 8, DOUBLE_MUST_BE_8_BYTES)
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,265 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_SIZES_PB_H_INCLUDED
+#define PB_SIZES_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _Color {
+    Color_RED = 0,
+    Color_GREEN = 1,
+    Color_BLUE = -1
+} Color;
+#define _Color_MIN Color_RED
+#define _Color_MAX Color_BLUE
+#define _Color_ARRAYSIZE ((Color)(Color_BLUE+1))
+
+/* Struct definitions */
+typedef struct _Fixed {
+    double values[3];
+    pb_byte_t id[4];
+/* @@protoc_insertion_point(struct:Fixed) */
+} Fixed;
+
+
+typedef struct _Inner {
+    int32_t value;
+    char text[8];
+/* @@protoc_insertion_point(struct:Inner) */
+} Inner;
+
+
+typedef struct _WithCallback {
+    uint32_t id;
+    pb_callback_t name;
+/* @@protoc_insertion_point(struct:WithCallback) */
+} WithCallback;
+
+
+typedef struct _Fallback {
+    WithCallback other;
+/* @@protoc_insertion_point(struct:Fallback) */
+} Fallback;
+
+
+typedef struct _FixedCount {
+    int32_t vals[3];
+    char words[2][8];
+    Inner inners[2];
+/* @@protoc_insertion_point(struct:FixedCount) */
+} FixedCount;
+
+
+typedef PB_BYTES_ARRAY_T(16) Sizes_data_t;
+typedef struct _Sizes {
+    int32_t small;
+    int64_t large;
+    uint32_t unsigned_value;
+    int64_t zigzag;
+    Color color;
+    bool flag;
+    float ratio;
+    char name[16];
+    Sizes_data_t data;
+    Inner inner;
+    Fixed fixed;
+    pb_size_t values_count;
+    int32_t values[4];
+    pb_size_t stamps_count;
+    uint64_t stamps[4];
+    pb_size_t names_count;
+    char names[3][8];
+    pb_size_t inners_count;
+    Inner inners[2];
+    pb_size_t bits_count;
+    bool bits[4];
+    pb_size_t which_choice;
+    union {
+        uint32_t number;
+        Inner nested;
+        Fixed constant;
+    } choice;
+    uint32_t last;
+/* @@protoc_insertion_point(struct:Sizes) */
+} Sizes;
+
+
+typedef struct _Outer {
+    Sizes sizes;
+    pb_size_t others_count;
+    WithCallback others[2];
+/* @@protoc_insertion_point(struct:Outer) */
+} Outer;
+
+
+/* Initializer values for message structs */
+#define Fixed_init_default                       {{0, 0, 0}, {0}}
+#define Inner_init_default                       {0, ""}
+#define Sizes_init_default                       {0, 0, 0, 0, _Color_MIN, 0, 0, "", {0, {0}}, Inner_init_default, Fixed_init_default, 0, {0, 0, 0, 0}, 0, {0, 0, 0, 0}, 0, {"", "", ""}, 0, {Inner_init_default, Inner_init_default}, 0, {0, 0, 0, 0}, 0, {0}, 0}
+#define FixedCount_init_default                  {{0, 0, 0}, {"", ""}, {Inner_init_default, Inner_init_default}}
+#define WithCallback_init_default                {0, {{NULL}, NULL}}
+#define Outer_init_default                       {Sizes_init_default, 0, {WithCallback_init_default, WithCallback_init_default}}
+#define Fallback_init_default                    {WithCallback_init_default}
+#define Fixed_init_zero                          {{0, 0, 0}, {0}}
+#define Inner_init_zero                          {0, ""}
+#define Sizes_init_zero                          {0, 0, 0, 0, _Color_MIN, 0, 0, "", {0, {0}}, Inner_init_zero, Fixed_init_zero, 0, {0, 0, 0, 0}, 0, {0, 0, 0, 0}, 0, {"", "", ""}, 0, {Inner_init_zero, Inner_init_zero}, 0, {0, 0, 0, 0}, 0, {0}, 0}
+#define FixedCount_init_zero                     {{0, 0, 0}, {"", ""}, {Inner_init_zero, Inner_init_zero}}
+#define WithCallback_init_zero                   {0, {{NULL}, NULL}}
+#define Outer_init_zero                          {Sizes_init_zero, 0, {WithCallback_init_zero, WithCallback_init_zero}}
+#define Fallback_init_zero                       {WithCallback_init_zero}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Fixed_values_tag                         1
+#define Fixed_id_tag                             2
+#define Inner_value_tag                          1
+#define Inner_text_tag                           2
+#define WithCallback_id_tag                      1
+#define WithCallback_name_tag                    2
+#define Fallback_other_tag                       1
+#define FixedCount_vals_tag                      1
+#define FixedCount_words_tag                     2
+#define FixedCount_inners_tag                    3
+#define Sizes_number_tag                         17
+#define Sizes_nested_tag                         18
+#define Sizes_constant_tag                       19
+#define Sizes_small_tag                          1
+#define Sizes_large_tag                          2
+#define Sizes_unsigned_value_tag                 3
+#define Sizes_zigzag_tag                         4
+#define Sizes_color_tag                          5
+#define Sizes_flag_tag                           6
+#define Sizes_ratio_tag                          7
+#define Sizes_name_tag                           8
+#define Sizes_data_tag                           9
+#define Sizes_inner_tag                          10
+#define Sizes_fixed_tag                          11
+#define Sizes_values_tag                         12
+#define Sizes_stamps_tag                         13
+#define Sizes_names_tag                          14
+#define Sizes_inners_tag                         15
+#define Sizes_bits_tag                           16
+#define Sizes_last_tag                           2000
+#define Outer_sizes_tag                          1
+#define Outer_others_tag                         2
+
+/* Struct field encoding specification for nanopb */
+#define Fixed_FIELDLIST(X, a) \
+X(a, STATIC, FIXARRAY, DOUBLE, values, 1) \
+X(a, STATIC, SINGULAR, FIXED_LENGTH_BYTES, id, 2)
+#define Fixed_CALLBACK NULL
+#define Fixed_DEFAULT NULL
+
+#define Inner_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, SINT32, value, 1) \
+X(a, STATIC, SINGULAR, STRING, text, 2)
+#define Inner_CALLBACK NULL
+#define Inner_DEFAULT NULL
+
+#define Sizes_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, INT32, small, 1) \
+X(a, STATIC, SINGULAR, INT64, large, 2) \
+X(a, STATIC, SINGULAR, UINT32, unsigned_value, 3) \
+X(a, STATIC, SINGULAR, SINT64, zigzag, 4) \
+X(a, STATIC, SINGULAR, ENUM, color, 5) \
+X(a, STATIC, SINGULAR, BOOL, flag, 6) \
+X(a, STATIC, SINGULAR, FLOAT, ratio, 7) \
+X(a, STATIC, SINGULAR, STRING, name, 8) \
+X(a, STATIC, SINGULAR, BYTES, data, 9) \
+X(a, STATIC, SINGULAR, MESSAGE, inner, 10) \
+X(a, STATIC, SINGULAR, MESSAGE, fixed, 11) \
+X(a, STATIC, REPEATED, INT32, values, 12) \
+X(a, STATIC, REPEATED, FIXED64, stamps, 13) \
+X(a, STATIC, REPEATED, STRING, names, 14) \
+X(a, STATIC, REPEATED, MESSAGE, inners, 15) \
+X(a, STATIC, REPEATED, BOOL, bits, 16) \
+X(a, STATIC, ONEOF, UINT32, (choice,number,choice.number), 17) \
+X(a, STATIC, ONEOF, MESSAGE, (choice,nested,choice.nested), 18) \
+X(a, STATIC, ONEOF, MESSAGE, (choice,constant,choice.constant), 19) \
+X(a, STATIC, SINGULAR, UINT32, last, 2000)
+#define Sizes_CALLBACK NULL
+#define Sizes_DEFAULT NULL
+#define Sizes_inner_MSGTYPE Inner
+#define Sizes_fixed_MSGTYPE Fixed
+#define Sizes_inners_MSGTYPE Inner
+#define Sizes_choice_nested_MSGTYPE Inner
+#define Sizes_choice_constant_MSGTYPE Fixed
+
+#define FixedCount_FIELDLIST(X, a) \
+X(a, STATIC, FIXARRAY, INT32, vals, 1) \
+X(a, STATIC, FIXARRAY, STRING, words, 2) \
+X(a, STATIC, FIXARRAY, MESSAGE, inners, 3)
+#define FixedCount_CALLBACK NULL
+#define FixedCount_DEFAULT NULL
+#define FixedCount_inners_MSGTYPE Inner
+
+#define WithCallback_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, UINT32, id, 1) \
+X(a, CALLBACK, SINGULAR, STRING, name, 2)
+#define WithCallback_CALLBACK pb_default_field_callback
+#define WithCallback_DEFAULT NULL
+
+#define Outer_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, MESSAGE, sizes, 1) \
+X(a, STATIC, REPEATED, MESSAGE, others, 2)
+#define Outer_CALLBACK NULL
+#define Outer_DEFAULT NULL
+#define Outer_sizes_MSGTYPE Sizes
+#define Outer_others_MSGTYPE WithCallback
+
+#define Fallback_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, MESSAGE, other, 1)
+#define Fallback_CALLBACK NULL
+#define Fallback_DEFAULT NULL
+#define Fallback_other_MSGTYPE WithCallback
+
+extern const pb_msgdesc_t Fixed_msg;
+extern const pb_msgdesc_t Inner_msg;
+extern const pb_msgdesc_t Sizes_msg;
+extern const pb_msgdesc_t FixedCount_msg;
+extern const pb_msgdesc_t WithCallback_msg;
+extern const pb_msgdesc_t Outer_msg;
+extern const pb_msgdesc_t Fallback_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Fixed_fields &Fixed_msg
+#define Inner_fields &Inner_msg
+#define Sizes_fields &Sizes_msg
+#define FixedCount_fields &FixedCount_msg
+#define WithCallback_fields &WithCallback_msg
+#define Outer_fields &Outer_msg
+#define Fallback_fields &Fallback_msg
+
+/* Encoded size of message contents */
+bool Fixed_get_encoded_size(size_t *size, const Fixed *msg);
+bool Inner_get_encoded_size(size_t *size, const Inner *msg);
+bool Sizes_get_encoded_size(size_t *size, const Sizes *msg);
+bool FixedCount_get_encoded_size(size_t *size, const FixedCount *msg);
+bool WithCallback_get_encoded_size(size_t *size, const WithCallback *msg);
+bool Outer_get_encoded_size(size_t *size, const Outer *msg);
+bool Fallback_get_encoded_size(size_t *size, const Fallback *msg);
+
+/* Maximum encoded size of messages (where known) */
+#define Fixed_size                               33
+#define Inner_size                               15
+#define Sizes_size                               340
+#define FixedCount_size                          85
+/* WithCallback_size depends on runtime parameters */
+/* Outer_size depends on runtime parameters */
+/* Fallback_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,28 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "enum.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+const char *MyEnum_name(MyEnum v) {
+    switch (v) {
+        case MyEnum_VALUE1: return "VALUE1";
+        case MyEnum_VALUE2: return "VALUE2";
+        case MyEnum_VALUE15: return "VALUE15";
+    }
+    return "unknown";
+}
+
+const char *MyShortNameEnum_name(MyShortNameEnum v) {
+    switch (v) {
+        case MSNE_VALUE256: return "MSNE_VALUE256";
+    }
+    return "unknown";
+}
+
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,64 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_EXTENSIONS_PB_H_INCLUDED
+#define PB_EXTENSIONS_PB_H_INCLUDED
+#include <pb.h>
+
+#include "alltypes.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _ExtensionMessage {
+    char test1[16];
+    int32_t test2;
+/* @@protoc_insertion_point(struct:ExtensionMessage) */
+} ExtensionMessage;
+
+
+/* Extensions */
+extern const pb_extension_type_t AllTypes_extensionfield1; /* field type: int32_t AllTypes_extensionfield1; */
+extern const pb_extension_type_t ExtensionMessage_AllTypes_extensionfield2; /* field type: ExtensionMessage AllTypes_extensionfield2; */
+/* Extension field ExtensionMessage_AllTypes_extensionfield4 was skipped because only "optional"
+   type of extension fields is currently supported. */
+
+/* Initializer values for message structs */
+#define ExtensionMessage_init_default            {"", 0}
+#define ExtensionMessage_init_zero               {"", 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define ExtensionMessage_test1_tag               1
+#define ExtensionMessage_test2_tag               2
+#define AllTypes_extensionfield1_tag             255
+#define ExtensionMessage_AllTypes_extensionfield2_tag 254
+#define ExtensionMessage_AllTypes_extensionfield4_tag 252
+
+/* Struct field encoding specification for nanopb */
+#define ExtensionMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, STRING, test1, 1) \
+X(a, STATIC, REQUIRED, INT32, test2, 2)
+#define ExtensionMessage_CALLBACK NULL
+#define ExtensionMessage_DEFAULT NULL
+
+extern const pb_msgdesc_t ExtensionMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define ExtensionMessage_fields &ExtensionMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define ExtensionMessage_size                    28
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
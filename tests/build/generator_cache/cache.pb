@@ -0,0 +1,11 @@
+
+3
+cache_dep.proto" 
+
+Dependency
+text (	Rtext
+`
+cache_main.protocache_dep.proto";
+Main
+dep (2.DependencyRdep
+value (Rvalue
\ No newline at end of file
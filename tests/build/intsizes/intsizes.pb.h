@@ -0,0 +1,133 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_INTSIZES_PB_H_INCLUDED
+#define PB_INTSIZES_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _DefaultSizes {
+    int32_t req_int8;
+    uint32_t req_uint8;
+    int32_t req_sint8;
+    int32_t req_int16;
+    uint32_t req_uint16;
+    int32_t req_sint16;
+    int32_t req_int32;
+    uint32_t req_uint32;
+    int32_t req_sint32;
+    int64_t req_int64;
+    uint64_t req_uint64;
+    int64_t req_sint64;
+/* @@protoc_insertion_point(struct:DefaultSizes) */
+} DefaultSizes;
+
+
+typedef struct _IntSizes {
+    int8_t req_int8;
+    uint8_t req_uint8;
+    int8_t req_sint8;
+    int16_t req_int16;
+    uint16_t req_uint16;
+    int16_t req_sint16;
+    int32_t req_int32;
+    uint32_t req_uint32;
+    int32_t req_sint32;
+    int64_t req_int64;
+    uint64_t req_uint64;
+    int64_t req_sint64;
+/* @@protoc_insertion_point(struct:IntSizes) */
+} IntSizes;
+
+
+/* Initializer values for message structs */
+#define IntSizes_init_default                    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0}
+#define DefaultSizes_init_default                {0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0}
+#define IntSizes_init_zero                       {0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0}
+#define DefaultSizes_init_zero                   {0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define DefaultSizes_req_int8_tag                1
+#define DefaultSizes_req_uint8_tag               2
+#define DefaultSizes_req_sint8_tag               3
+#define DefaultSizes_req_int16_tag               4
+#define DefaultSizes_req_uint16_tag              5
+#define DefaultSizes_req_sint16_tag              6
+#define DefaultSizes_req_int32_tag               7
+#define DefaultSizes_req_uint32_tag              8
+#define DefaultSizes_req_sint32_tag              9
+#define DefaultSizes_req_int64_tag               10
+#define DefaultSizes_req_uint64_tag              11
+#define DefaultSizes_req_sint64_tag              12
+#define IntSizes_req_int8_tag                    1
+#define IntSizes_req_uint8_tag                   2
+#define IntSizes_req_sint8_tag                   3
+#define IntSizes_req_int16_tag                   4
+#define IntSizes_req_uint16_tag                  5
+#define IntSizes_req_sint16_tag                  6
+#define IntSizes_req_int32_tag                   7
+#define IntSizes_req_uint32_tag                  8
+#define IntSizes_req_sint32_tag                  9
+#define IntSizes_req_int64_tag                   10
+#define IntSizes_req_uint64_tag                  11
+#define IntSizes_req_sint64_tag                  12
+
+/* Struct field encoding specification for nanopb */
+#define IntSizes_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, req_int8, 1) \
+X(a, STATIC, REQUIRED, UINT32, req_uint8, 2) \
+X(a, STATIC, REQUIRED, SINT32, req_sint8, 3) \
+X(a, STATIC, REQUIRED, INT32, req_int16, 4) \
+X(a, STATIC, REQUIRED, UINT32, req_uint16, 5) \
+X(a, STATIC, REQUIRED, SINT32, req_sint16, 6) \
+X(a, STATIC, REQUIRED, INT32, req_int32, 7) \
+X(a, STATIC, REQUIRED, UINT32, req_uint32, 8) \
+X(a, STATIC, REQUIRED, SINT32, req_sint32, 9) \
+X(a, STATIC, REQUIRED, INT32, req_int64, 10) \
+X(a, STATIC, REQUIRED, UINT32, req_uint64, 11) \
+X(a, STATIC, REQUIRED, SINT32, req_sint64, 12)
+#define IntSizes_CALLBACK NULL
+#define IntSizes_DEFAULT NULL
+
+#define DefaultSizes_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, req_int8, 1) \
+X(a, STATIC, REQUIRED, UINT32, req_uint8, 2) \
+X(a, STATIC, REQUIRED, SINT32, req_sint8, 3) \
+X(a, STATIC, REQUIRED, INT32, req_int16, 4) \
+X(a, STATIC, REQUIRED, UINT32, req_uint16, 5) \
+X(a, STATIC, REQUIRED, SINT32, req_sint16, 6) \
+X(a, STATIC, REQUIRED, INT32, req_int32, 7) \
+X(a, STATIC, REQUIRED, UINT32, req_uint32, 8) \
+X(a, STATIC, REQUIRED, SINT32, req_sint32, 9) \
+X(a, STATIC, REQUIRED, INT64, req_int64, 10) \
+X(a, STATIC, REQUIRED, UINT64, req_uint64, 11) \
+X(a, STATIC, REQUIRED, SINT64, req_sint64, 12)
+#define DefaultSizes_CALLBACK NULL
+#define DefaultSizes_DEFAULT NULL
+
+extern const pb_msgdesc_t IntSizes_msg;
+extern const pb_msgdesc_t DefaultSizes_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define IntSizes_fields &IntSizes_msg
+#define DefaultSizes_fields &DefaultSizes_msg
+
+/* Maximum encoded size of messages (where known) */
+#define IntSizes_size                            92
+#define DefaultSizes_size                        102
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
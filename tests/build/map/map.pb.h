@@ -0,0 +1,72 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_MAP_PB_H_INCLUDED
+#define PB_MAP_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _MyMessage_NumbersEntry {
+    char key[16];
+    uint32_t value;
+/* @@protoc_insertion_point(struct:MyMessage_NumbersEntry) */
+} MyMessage_NumbersEntry;
+
+
+typedef struct _MyMessage {
+    pb_size_t numbers_count;
+    MyMessage_NumbersEntry numbers[10];
+/* @@protoc_insertion_point(struct:MyMessage) */
+} MyMessage;
+
+
+/* Initializer values for message structs */
+#define MyMessage_init_default                   {0, {MyMessage_NumbersEntry_init_default, MyMessage_NumbersEntry_init_default, MyMessage_NumbersEntry_init_default, MyMessage_NumbersEntry_init_default, MyMessage_NumbersEntry_init_default, MyMessage_NumbersEntry_init_default, MyMessage_NumbersEntry_init_default, MyMessage_NumbersEntry_init_default, MyMessage_NumbersEntry_init_default, MyMessage_NumbersEntry_init_default}}
+#define MyMessage_NumbersEntry_init_default      {"", 0}
+#define MyMessage_init_zero                      {0, {MyMessage_NumbersEntry_init_zero, MyMessage_NumbersEntry_init_zero, MyMessage_NumbersEntry_init_zero, MyMessage_NumbersEntry_init_zero, MyMessage_NumbersEntry_init_zero, MyMessage_NumbersEntry_init_zero, MyMessage_NumbersEntry_init_zero, MyMessage_NumbersEntry_init_zero, MyMessage_NumbersEntry_init_zero, MyMessage_NumbersEntry_init_zero}}
+#define MyMessage_NumbersEntry_init_zero         {"", 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define MyMessage_NumbersEntry_key_tag           1
+#define MyMessage_NumbersEntry_value_tag         2
+#define MyMessage_numbers_tag                    1
+
+/* Struct field encoding specification for nanopb */
+#define MyMessage_FIELDLIST(X, a) \
+X(a, STATIC, REPEATED, MESSAGE, numbers, 1)
+#define MyMessage_CALLBACK NULL
+#define MyMessage_DEFAULT NULL
+#define MyMessage_numbers_MSGTYPE MyMessage_NumbersEntry
+
+#define MyMessage_NumbersEntry_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, STRING, key, 1) \
+X(a, STATIC, SINGULAR, UINT32, value, 2)
+#define MyMessage_NumbersEntry_CALLBACK NULL
+#define MyMessage_NumbersEntry_DEFAULT NULL
+
+extern const pb_msgdesc_t MyMessage_msg;
+extern const pb_msgdesc_t MyMessage_NumbersEntry_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define MyMessage_fields &MyMessage_msg
+#define MyMessage_NumbersEntry_fields &MyMessage_NumbersEntry_msg
+
+/* Maximum encoded size of messages (where known) */
+#define MyMessage_size                           250
+#define MyMessage_NumbersEntry_size              23
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
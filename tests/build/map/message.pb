@@ -0,0 +1,7 @@
+
+
+one
+
+two
+	
+seven
\ No newline at end of file
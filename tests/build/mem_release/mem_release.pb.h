@@ -0,0 +1,151 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_MEM_RELEASE_PB_H_INCLUDED
+#define PB_MEM_RELEASE_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _SubMessage {
+    char *dynamic_str;
+    pb_size_t dynamic_str_arr_count;
+    char **dynamic_str_arr;
+    pb_size_t dynamic_submsg_count;
+    struct _SubMessage *dynamic_submsg;
+/* @@protoc_insertion_point(struct:SubMessage) */
+} SubMessage;
+
+
+typedef struct _RepeatedMessage {
+    int32_t first;
+    pb_callback_t subs;
+/* @@protoc_insertion_point(struct:RepeatedMessage) */
+} RepeatedMessage;
+
+
+typedef struct _TestMessage {
+    SubMessage static_req_submsg;
+    struct _SubMessage *dynamic_submsg;
+    bool has_static_opt_submsg;
+    SubMessage static_opt_submsg;
+    pb_size_t static_rep_submsg_count;
+    SubMessage static_rep_submsg[2];
+    pb_extension_t *extensions;
+/* @@protoc_insertion_point(struct:TestMessage) */
+} TestMessage;
+
+
+typedef struct _OneofMessage {
+    int32_t first;
+    pb_size_t which_msgs;
+    union {
+        TestMessage msg1;
+        SubMessage msg2;
+    } msgs;
+    int32_t last;
+/* @@protoc_insertion_point(struct:OneofMessage) */
+} OneofMessage;
+
+
+/* Extensions */
+extern const pb_extension_type_t dynamic_ext; /* field type: struct _SubMessage *dynamic_ext; */
+extern const pb_extension_type_t static_ext; /* field type: SubMessage static_ext; */
+
+/* Initializer values for message structs */
+#define SubMessage_init_default                  {NULL, 0, NULL, 0, NULL}
+#define TestMessage_init_default                 {SubMessage_init_default, NULL, false, SubMessage_init_default, 0, {SubMessage_init_default, SubMessage_init_default}, NULL}
+#define OneofMessage_init_default                {0, 0, {TestMessage_init_default}, 0}
+#define RepeatedMessage_init_default             {0, {{NULL}, NULL}}
+#define SubMessage_init_zero                     {NULL, 0, NULL, 0, NULL}
+#define TestMessage_init_zero                    {SubMessage_init_zero, NULL, false, SubMessage_init_zero, 0, {SubMessage_init_zero, SubMessage_init_zero}, NULL}
+#define OneofMessage_init_zero                   {0, 0, {TestMessage_init_zero}, 0}
+#define RepeatedMessage_init_zero                {0, {{NULL}, NULL}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define SubMessage_dynamic_str_tag               1
+#define SubMessage_dynamic_str_arr_tag           2
+#define SubMessage_dynamic_submsg_tag            3
+#define RepeatedMessage_first_tag                1
+#define RepeatedMessage_subs_tag                 2
+#define TestMessage_static_req_submsg_tag        1
+#define TestMessage_dynamic_submsg_tag           2
+#define TestMessage_static_opt_submsg_tag        3
+#define TestMessage_static_rep_submsg_tag        4
+#define OneofMessage_msg1_tag                    2
+#define OneofMessage_msg2_tag                    3
+#define OneofMessage_first_tag                   1
+#define OneofMessage_last_tag                    4
+#define dynamic_ext_tag                          100
+#define static_ext_tag                           101
+
+/* Struct field encoding specification for nanopb */
+#define SubMessage_FIELDLIST(X, a) \
+X(a, POINTER, OPTIONAL, STRING, dynamic_str, 1) \
+X(a, POINTER, REPEATED, STRING, dynamic_str_arr, 2) \
+X(a, POINTER, REPEATED, MESSAGE, dynamic_submsg, 3)
+#define SubMessage_CALLBACK NULL
+#define SubMessage_DEFAULT NULL
+#define SubMessage_dynamic_submsg_MSGTYPE SubMessage
+
+#define TestMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, static_req_submsg, 1) \
+X(a, POINTER, OPTIONAL, MESSAGE, dynamic_submsg, 2) \
+X(a, STATIC, OPTIONAL, MESSAGE, static_opt_submsg, 3) \
+X(a, STATIC, REPEATED, MESSAGE, static_rep_submsg, 4) \
+X(a, CALLBACK, OPTIONAL, EXTENSION, extensions, 100)
+#define TestMessage_CALLBACK pb_default_field_callback
+#define TestMessage_DEFAULT NULL
+#define TestMessage_static_req_submsg_MSGTYPE SubMessage
+#define TestMessage_dynamic_submsg_MSGTYPE SubMessage
+#define TestMessage_static_opt_submsg_MSGTYPE SubMessage
+#define TestMessage_static_rep_submsg_MSGTYPE SubMessage
+
+#define OneofMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, first, 1) \
+X(a, STATIC, ONEOF, MESSAGE, (msgs,msg1,msgs.msg1), 2) \
+X(a, STATIC, ONEOF, MESSAGE, (msgs,msg2,msgs.msg2), 3) \
+X(a, STATIC, REQUIRED, INT32, last, 4)
+#define OneofMessage_CALLBACK NULL
+#define OneofMessage_DEFAULT NULL
+#define OneofMessage_msgs_msg1_MSGTYPE TestMessage
+#define OneofMessage_msgs_msg2_MSGTYPE SubMessage
+
+#define RepeatedMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, first, 1) \
+X(a, CALLBACK, REPEATED, MESSAGE, subs, 2)
+#define RepeatedMessage_CALLBACK pb_default_field_callback
+#define RepeatedMessage_DEFAULT NULL
+#define RepeatedMessage_subs_MSGTYPE SubMessage
+
+extern const pb_msgdesc_t SubMessage_msg;
+extern const pb_msgdesc_t TestMessage_msg;
+extern const pb_msgdesc_t OneofMessage_msg;
+extern const pb_msgdesc_t RepeatedMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define SubMessage_fields &SubMessage_msg
+#define TestMessage_fields &TestMessage_msg
+#define OneofMessage_fields &OneofMessage_msg
+#define RepeatedMessage_fields &RepeatedMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+/* SubMessage_size depends on runtime parameters */
+/* TestMessage_size depends on runtime parameters */
+/* OneofMessage_size depends on runtime parameters */
+/* RepeatedMessage_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
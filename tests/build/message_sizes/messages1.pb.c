@@ -0,0 +1,25 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "messages1.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(MessageInfo, MessageInfo, AUTO)
+
+
+PB_BIND(MessageResponseInfo, MessageResponseInfo, AUTO)
+
+
+PB_BIND(MessageHeader, MessageHeader, AUTO)
+
+
+PB_BIND(MessageResponse, MessageResponse, AUTO)
+
+
+
+
+/* @@protoc_insertion_point(eof) */
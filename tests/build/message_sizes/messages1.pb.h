@@ -0,0 +1,134 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_MESSAGES1_PB_H_INCLUDED
+#define PB_MESSAGES1_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _MessageStatus {
+    MessageStatus_FAIL = 0,
+    MessageStatus_OK = 1
+} MessageStatus;
+#define _MessageStatus_MIN MessageStatus_FAIL
+#define _MessageStatus_MAX MessageStatus_OK
+#define _MessageStatus_ARRAYSIZE ((MessageStatus)(MessageStatus_OK+1))
+
+/* Struct definitions */
+typedef struct _MessageInfo {
+    uint32_t msg_id;
+    bool has_interface_id;
+    uint32_t interface_id;
+/* @@protoc_insertion_point(struct:MessageInfo) */
+} MessageInfo;
+
+
+typedef struct _MessageResponse {
+    MessageStatus status;
+    uint32_t seq;
+/* @@protoc_insertion_point(struct:MessageResponse) */
+} MessageResponse;
+
+
+typedef struct _MessageResponseInfo {
+    uint64_t interface_id;
+    uint32_t seq;
+    uint32_t msg_id;
+/* @@protoc_insertion_point(struct:MessageResponseInfo) */
+} MessageResponseInfo;
+
+
+typedef struct _MessageHeader {
+    MessageInfo info;
+    bool has_response_info;
+    MessageResponseInfo response_info;
+    bool has_response;
+    MessageResponse response;
+/* @@protoc_insertion_point(struct:MessageHeader) */
+} MessageHeader;
+
+
+/* Initializer values for message structs */
+#define MessageInfo_init_default                 {0, false, 0}
+#define MessageResponseInfo_init_default         {0, 0, 0}
+#define MessageHeader_init_default               {MessageInfo_init_default, false, MessageResponseInfo_init_default, false, MessageResponse_init_default}
+#define MessageResponse_init_default             {_MessageStatus_MIN, 0}
+#define MessageInfo_init_zero                    {0, false, 0}
+#define MessageResponseInfo_init_zero            {0, 0, 0}
+#define MessageHeader_init_zero                  {MessageInfo_init_zero, false, MessageResponseInfo_init_zero, false, MessageResponse_init_zero}
+#define MessageResponse_init_zero                {_MessageStatus_MIN, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define MessageInfo_msg_id_tag                   1
+#define MessageInfo_interface_id_tag             2
+#define MessageResponse_status_tag               1
+#define MessageResponse_seq_tag                  2
+#define MessageResponseInfo_interface_id_tag     1
+#define MessageResponseInfo_seq_tag              2
+#define MessageResponseInfo_msg_id_tag           3
+#define MessageHeader_info_tag                   1
+#define MessageHeader_response_info_tag          2
+#define MessageHeader_response_tag               3
+
+/* Struct field encoding specification for nanopb */
+#define MessageInfo_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, FIXED32, msg_id, 1) \
+X(a, STATIC, OPTIONAL, FIXED32, interface_id, 2)
+#define MessageInfo_CALLBACK NULL
+#define MessageInfo_DEFAULT NULL
+
+#define MessageResponseInfo_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, FIXED64, interface_id, 1) \
+X(a, STATIC, REQUIRED, FIXED32, seq, 2) \
+X(a, STATIC, REQUIRED, FIXED32, msg_id, 3)
+#define MessageResponseInfo_CALLBACK NULL
+#define MessageResponseInfo_DEFAULT NULL
+
+#define MessageHeader_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, info, 1) \
+X(a, STATIC, OPTIONAL, MESSAGE, response_info, 2) \
+X(a, STATIC, OPTIONAL, MESSAGE, response, 3)
+#define MessageHeader_CALLBACK NULL
+#define MessageHeader_DEFAULT NULL
+#define MessageHeader_info_MSGTYPE MessageInfo
+#define MessageHeader_response_info_MSGTYPE MessageResponseInfo
+#define MessageHeader_response_MSGTYPE MessageResponse
+
+#define MessageResponse_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UENUM, status, 1) \
+X(a, STATIC, REQUIRED, FIXED32, seq, 2)
+#define MessageResponse_CALLBACK NULL
+#define MessageResponse_DEFAULT NULL
+
+extern const pb_msgdesc_t MessageInfo_msg;
+extern const pb_msgdesc_t MessageResponseInfo_msg;
+extern const pb_msgdesc_t MessageHeader_msg;
+extern const pb_msgdesc_t MessageResponse_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define MessageInfo_fields &MessageInfo_msg
+#define MessageResponseInfo_fields &MessageResponseInfo_msg
+#define MessageHeader_fields &MessageHeader_msg
+#define MessageResponse_fields &MessageResponse_msg
+
+/* Maximum encoded size of messages (where known) */
+#define MessageInfo_size                         10
+#define MessageResponseInfo_size                 19
+#define MessageHeader_size                       42
+#define MessageResponse_size                     7
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,108 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_PADDING_PB_H_INCLUDED
+#define PB_PADDING_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+/* Struct members are ordered by alignment, which saves 8 bytes of padding on lp64 */
+typedef struct _Mixed {
+    double ratio;
+    int64_t big;
+    pb_size_t values_count;
+    int32_t values[2];
+    bool has_count;
+    uint32_t count;
+    bool flag;
+    uint8_t small;
+    char name[4];
+/* @@protoc_insertion_point(struct:Mixed) */
+} Mixed;
+
+
+typedef struct _Reference {
+    bool flag;
+    double ratio;
+    uint8_t small;
+    int64_t big;
+    char name[4];
+    pb_size_t values_count;
+    int32_t values[2];
+    bool has_count;
+    uint32_t count;
+/* @@protoc_insertion_point(struct:Reference) */
+} Reference;
+
+
+/* Initializer values for message structs */
+#define Mixed_init_default                       {0, 0, 0, {0, 0}, false, 0, 0, 0, ""}
+#define Reference_init_default                   {0, 0, 0, 0, "", 0, {0, 0}, false, 0}
+#define Mixed_init_zero                          {0, 0, 0, {0, 0}, false, 0, 0, 0, ""}
+#define Reference_init_zero                      {0, 0, 0, 0, "", 0, {0, 0}, false, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Mixed_flag_tag                           1
+#define Mixed_ratio_tag                          2
+#define Mixed_small_tag                          3
+#define Mixed_big_tag                            4
+#define Mixed_name_tag                           5
+#define Mixed_values_tag                         6
+#define Mixed_count_tag                          7
+#define Reference_flag_tag                       1
+#define Reference_ratio_tag                      2
+#define Reference_small_tag                      3
+#define Reference_big_tag                        4
+#define Reference_name_tag                       5
+#define Reference_values_tag                     6
+#define Reference_count_tag                      7
+
+/* Struct field encoding specification for nanopb */
+#define Mixed_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, BOOL, flag, 1) \
+X(a, STATIC, REQUIRED, DOUBLE, ratio, 2) \
+X(a, STATIC, REQUIRED, UINT32, small, 3) \
+X(a, STATIC, REQUIRED, INT64, big, 4) \
+X(a, STATIC, REQUIRED, STRING, name, 5) \
+X(a, STATIC, REPEATED, INT32, values, 6) \
+X(a, STATIC, OPTIONAL, FIXED32, count, 7)
+#define Mixed_CALLBACK NULL
+#define Mixed_DEFAULT NULL
+
+#define Reference_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, BOOL, flag, 1) \
+X(a, STATIC, REQUIRED, DOUBLE, ratio, 2) \
+X(a, STATIC, REQUIRED, UINT32, small, 3) \
+X(a, STATIC, REQUIRED, INT64, big, 4) \
+X(a, STATIC, REQUIRED, STRING, name, 5) \
+X(a, STATIC, REPEATED, INT32, values, 6) \
+X(a, STATIC, OPTIONAL, FIXED32, count, 7)
+#define Reference_CALLBACK NULL
+#define Reference_DEFAULT NULL
+
+extern const pb_msgdesc_t Mixed_msg;
+extern const pb_msgdesc_t Reference_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Mixed_fields &Mixed_msg
+#define Reference_fields &Reference_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Mixed_size                               57
+#define Reference_size                           57
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,111 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_ONEOF_PB_H_INCLUDED
+#define PB_ONEOF_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _SubMessage {
+    pb_size_t array_count;
+    int32_t array[8];
+/* @@protoc_insertion_point(struct:SubMessage) */
+} SubMessage;
+
+
+typedef struct _OneOfMessage {
+    int32_t prefix;
+    pb_size_t which_values;
+    union {
+        int32_t first;
+        char second[8];
+        SubMessage third;
+    } values;
+    int32_t suffix;
+/* @@protoc_insertion_point(struct:OneOfMessage) */
+} OneOfMessage;
+
+
+typedef struct _PlainOneOfMessage {
+    pb_size_t which_values;
+    union {
+        int32_t first;
+        char second[8];
+        SubMessage third;
+    } values;
+/* @@protoc_insertion_point(struct:PlainOneOfMessage) */
+} PlainOneOfMessage;
+
+
+/* Initializer values for message structs */
+#define SubMessage_init_default                  {0, {0, 0, 0, 0, 0, 0, 0, 0}}
+#define OneOfMessage_init_default                {0, 0, {0}, 0}
+#define PlainOneOfMessage_init_default           {0, {0}}
+#define SubMessage_init_zero                     {0, {0, 0, 0, 0, 0, 0, 0, 0}}
+#define OneOfMessage_init_zero                   {0, 0, {0}, 0}
+#define PlainOneOfMessage_init_zero              {0, {0}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define SubMessage_array_tag                     1
+#define OneOfMessage_first_tag                   5
+#define OneOfMessage_second_tag                  6
+#define OneOfMessage_third_tag                   7
+#define OneOfMessage_prefix_tag                  1
+#define OneOfMessage_suffix_tag                  99
+#define PlainOneOfMessage_first_tag              5
+#define PlainOneOfMessage_second_tag             6
+#define PlainOneOfMessage_third_tag              7
+
+/* Struct field encoding specification for nanopb */
+#define SubMessage_FIELDLIST(X, a) \
+X(a, STATIC, REPEATED, INT32, array, 1)
+#define SubMessage_CALLBACK NULL
+#define SubMessage_DEFAULT NULL
+
+#define OneOfMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, prefix, 1) \
+X(a, STATIC, ONEOF, INT32, (values,first,values.first), 5) \
+X(a, STATIC, ONEOF, STRING, (values,second,values.second), 6) \
+X(a, STATIC, ONEOF, MESSAGE, (values,third,values.third), 7) \
+X(a, STATIC, REQUIRED, INT32, suffix, 99)
+#define OneOfMessage_CALLBACK NULL
+#define OneOfMessage_DEFAULT NULL
+#define OneOfMessage_values_third_MSGTYPE SubMessage
+
+#define PlainOneOfMessage_FIELDLIST(X, a) \
+X(a, STATIC, ONEOF, INT32, (values,first,values.first), 5) \
+X(a, STATIC, ONEOF, STRING, (values,second,values.second), 6) \
+X(a, STATIC, ONEOF, MESSAGE, (values,third,values.third), 7)
+#define PlainOneOfMessage_CALLBACK NULL
+#define PlainOneOfMessage_DEFAULT NULL
+#define PlainOneOfMessage_values_third_MSGTYPE SubMessage
+
+extern const pb_msgdesc_t SubMessage_msg;
+extern const pb_msgdesc_t OneOfMessage_msg;
+extern const pb_msgdesc_t PlainOneOfMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define SubMessage_fields &SubMessage_msg
+#define OneOfMessage_fields &OneOfMessage_msg
+#define PlainOneOfMessage_fields &PlainOneOfMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define SubMessage_size                          88
+#define OneOfMessage_size                        113
+#define PlainOneOfMessage_size                   90
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,73 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_ONEOF_DEFAULTS_PB_H_INCLUDED
+#define PB_ONEOF_DEFAULTS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _OneofDefaults {
+    bool has_before;
+    int32_t before;
+    pb_size_t which_choice;
+    union {
+        int32_t x;
+        int32_t y;
+    } choice;
+    pb_size_t which_other;
+    union {
+        char s[8];
+        int32_t z;
+    } other;
+    bool has_after;
+    int32_t after;
+/* @@protoc_insertion_point(struct:OneofDefaults) */
+} OneofDefaults;
+
+
+/* Initializer values for message structs */
+#define OneofDefaults_init_default               {false, 5, 0, {7}, 0, {"abc"}, false, 11}
+#define OneofDefaults_init_zero                  {false, 0, 0, {0}, 0, {""}, false, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define OneofDefaults_x_tag                      2
+#define OneofDefaults_y_tag                      3
+#define OneofDefaults_s_tag                      4
+#define OneofDefaults_z_tag                      5
+#define OneofDefaults_before_tag                 1
+#define OneofDefaults_after_tag                  6
+
+/* Struct field encoding specification for nanopb */
+#define OneofDefaults_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, INT32, before, 1) \
+X(a, STATIC, ONEOF, INT32, (choice,x,choice.x), 2) \
+X(a, STATIC, ONEOF, INT32, (choice,y,choice.y), 3) \
+X(a, STATIC, ONEOF, STRING, (other,s,other.s), 4) \
+X(a, STATIC, ONEOF, INT32, (other,z,other.z), 5) \
+X(a, STATIC, OPTIONAL, INT32, after, 6)
+#define OneofDefaults_CALLBACK NULL
+#define OneofDefaults_DEFAULT (const uint8_t*)"\x08\x05\x18\x09\x22\x03\x61\x62\x63\x30\x0b\x00"
+
+extern const pb_msgdesc_t OneofDefaults_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define OneofDefaults_fields &OneofDefaults_msg
+
+/* Maximum encoded size of messages (where known) */
+#define OneofDefaults_size                       44
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,56 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_MASKS_PB_H_INCLUDED
+#define PB_MASKS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Masks {
+    char p_q_r_s_a[10];
+    char x_y_b[20];
+    char plain_c[30];
+/* @@protoc_insertion_point(struct:Masks) */
+} Masks;
+
+
+/* Initializer values for message structs */
+#define Masks_init_default                       {"", "", ""}
+#define Masks_init_zero                          {"", "", ""}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Masks_p_q_r_s_a_tag                      1
+#define Masks_x_y_b_tag                          2
+#define Masks_plain_c_tag                        3
+
+/* Struct field encoding specification for nanopb */
+#define Masks_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, STRING, p_q_r_s_a, 1) \
+X(a, STATIC, REQUIRED, STRING, x_y_b, 2) \
+X(a, STATIC, REQUIRED, STRING, plain_c, 3)
+#define Masks_CALLBACK NULL
+#define Masks_DEFAULT NULL
+
+extern const pb_msgdesc_t Masks_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Masks_fields &Masks_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Masks_size                               63
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
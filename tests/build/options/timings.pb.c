@@ -0,0 +1,47 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "timings.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Message1, Message1, AUTO)
+
+
+PB_BIND(Message2, Message2, AUTO)
+
+
+PB_BIND(Message3, Message3, AUTO)
+
+
+PB_BIND(Message4, Message4, AUTO)
+
+
+PB_BIND(EnumTest, EnumTest, AUTO)
+
+
+PB_BIND(Message5, Message5, AUTO)
+
+
+PB_BIND(my_packed_struct, my_packed_struct, AUTO)
+
+
+PB_BIND(Message6, Message6, AUTO)
+
+
+PB_BIND(OneofMessage, OneofMessage, AUTO)
+
+
+PB_BIND(Proto3Field, Proto3Field, AUTO)
+
+
+PB_BIND(WideMessage, WideMessage, 4)
+
+
+
+
+
+/* @@protoc_insertion_point(eof) */
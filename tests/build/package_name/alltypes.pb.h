@@ -0,0 +1,388 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_TEST_PACKAGE_ALLTYPES_PB_H_INCLUDED
+#define PB_TEST_PACKAGE_ALLTYPES_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _test_package_HugeEnum {
+    test_package_HugeEnum_Negative = -2147483647,
+    test_package_HugeEnum_Positive = 2147483647
+} test_package_HugeEnum;
+#define _test_package_HugeEnum_MIN test_package_HugeEnum_Negative
+#define _test_package_HugeEnum_MAX test_package_HugeEnum_Positive
+#define _test_package_HugeEnum_ARRAYSIZE ((test_package_HugeEnum)(test_package_HugeEnum_Positive+1))
+
+typedef enum _test_package_MyEnum {
+    test_package_MyEnum_Zero = 0,
+    test_package_MyEnum_First = 1,
+    test_package_MyEnum_Second = 2,
+    test_package_MyEnum_Truth = 42
+} test_package_MyEnum;
+#define _test_package_MyEnum_MIN test_package_MyEnum_Zero
+#define _test_package_MyEnum_MAX test_package_MyEnum_Truth
+#define _test_package_MyEnum_ARRAYSIZE ((test_package_MyEnum)(test_package_MyEnum_Truth+1))
+
+/* Struct definitions */
+typedef struct _test_package_EmptyMessage {
+    char dummy_field;
+/* @@protoc_insertion_point(struct:test_package_EmptyMessage) */
+} test_package_EmptyMessage;
+
+
+typedef struct _test_package_Limits {
+    int32_t int32_min;
+    int32_t int32_max;
+    uint32_t uint32_min;
+    uint32_t uint32_max;
+    int64_t int64_min;
+    int64_t int64_max;
+    uint64_t uint64_min;
+    uint64_t uint64_max;
+    test_package_HugeEnum enum_min;
+    test_package_HugeEnum enum_max;
+/* @@protoc_insertion_point(struct:test_package_Limits) */
+} test_package_Limits;
+
+
+typedef struct _test_package_SubMessage {
+    char substuff1[16];
+    int32_t substuff2;
+    bool has_substuff3;
+    uint32_t substuff3;
+/* @@protoc_insertion_point(struct:test_package_SubMessage) */
+} test_package_SubMessage;
+
+
+typedef PB_BYTES_ARRAY_T(16) test_package_AllTypes_req_bytes_t;
+typedef PB_BYTES_ARRAY_T(16) test_package_AllTypes_rep_bytes_t;
+typedef PB_BYTES_ARRAY_T(16) test_package_AllTypes_opt_bytes_t;
+typedef struct _test_package_AllTypes {
+    int32_t req_int32;
+    int64_t req_int64;
+    uint32_t req_uint32;
+    uint64_t req_uint64;
+    int32_t req_sint32;
+    int64_t req_sint64;
+    bool req_bool;
+    uint32_t req_fixed32;
+    int32_t req_sfixed32;
+    float req_float;
+    uint64_t req_fixed64;
+    int64_t req_sfixed64;
+    double req_double;
+    char req_string[16];
+    test_package_AllTypes_req_bytes_t req_bytes;
+    test_package_SubMessage req_submsg;
+    test_package_MyEnum req_enum;
+    test_package_EmptyMessage req_emptymsg;
+    pb_byte_t req_fbytes[4];
+    pb_size_t rep_int32_count;
+    int32_t rep_int32[5];
+    pb_size_t rep_int64_count;
+    int64_t rep_int64[5];
+    pb_size_t rep_uint32_count;
+    uint32_t rep_uint32[5];
+    pb_size_t rep_uint64_count;
+    uint64_t rep_uint64[5];
+    pb_size_t rep_sint32_count;
+    int32_t rep_sint32[5];
+    pb_size_t rep_sint64_count;
+    int64_t rep_sint64[5];
+    pb_size_t rep_bool_count;
+    bool rep_bool[5];
+    pb_size_t rep_fixed32_count;
+    uint32_t rep_fixed32[5];
+    pb_size_t rep_sfixed32_count;
+    int32_t rep_sfixed32[5];
+    pb_size_t rep_float_count;
+    float rep_float[5];
+    pb_size_t rep_fixed64_count;
+    uint64_t rep_fixed64[5];
+    pb_size_t rep_sfixed64_count;
+    int64_t rep_sfixed64[5];
+    pb_size_t rep_double_count;
+    double rep_double[5];
+    pb_size_t rep_string_count;
+    char rep_string[5][16];
+    pb_size_t rep_bytes_count;
+    test_package_AllTypes_rep_bytes_t rep_bytes[5];
+    pb_size_t rep_submsg_count;
+    test_package_SubMessage rep_submsg[5];
+    pb_size_t rep_enum_count;
+    test_package_MyEnum rep_enum[5];
+    pb_size_t rep_emptymsg_count;
+    test_package_EmptyMessage rep_emptymsg[5];
+    pb_size_t rep_fbytes_count;
+    pb_byte_t rep_fbytes[5][4];
+    bool has_opt_int32;
+    int32_t opt_int32;
+    bool has_opt_int64;
+    int64_t opt_int64;
+    bool has_opt_uint32;
+    uint32_t opt_uint32;
+    bool has_opt_uint64;
+    uint64_t opt_uint64;
+    bool has_opt_sint32;
+    int32_t opt_sint32;
+    bool has_opt_sint64;
+    int64_t opt_sint64;
+    bool has_opt_bool;
+    bool opt_bool;
+    bool has_opt_fixed32;
+    uint32_t opt_fixed32;
+    bool has_opt_sfixed32;
+    int32_t opt_sfixed32;
+    bool has_opt_float;
+    float opt_float;
+    bool has_opt_fixed64;
+    uint64_t opt_fixed64;
+    bool has_opt_sfixed64;
+    int64_t opt_sfixed64;
+    bool has_opt_double;
+    double opt_double;
+    bool has_opt_string;
+    char opt_string[16];
+    bool has_opt_bytes;
+    test_package_AllTypes_opt_bytes_t opt_bytes;
+    bool has_opt_submsg;
+    test_package_SubMessage opt_submsg;
+    bool has_opt_enum;
+    test_package_MyEnum opt_enum;
+    bool has_opt_emptymsg;
+    test_package_EmptyMessage opt_emptymsg;
+    bool has_opt_fbytes;
+    pb_byte_t opt_fbytes[4];
+    pb_size_t which_oneof;
+    union {
+        test_package_SubMessage oneof_msg1;
+        test_package_EmptyMessage oneof_msg2;
+    } oneof;
+    test_package_Limits req_limits;
+    int32_t end;
+    pb_extension_t *extensions;
+/* @@protoc_insertion_point(struct:test_package_AllTypes) */
+} test_package_AllTypes;
+
+
+/* Initializer values for message structs */
+#define test_package_SubMessage_init_default     {"1", 2, false, 3u}
+#define test_package_EmptyMessage_init_default   {0}
+#define test_package_Limits_init_default         {2147483647, -2147483647, 4294967295u, 0u, 9223372036854775807ll, -9223372036854775807ll, 18446744073709551615ull, 0ull, test_package_HugeEnum_Positive, test_package_HugeEnum_Negative}
+#define test_package_AllTypes_init_default       {0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, "", {0, {0}}, test_package_SubMessage_init_default, _test_package_MyEnum_MIN, test_package_EmptyMessage_init_default, {0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {"", "", "", "", ""}, 0, {{0, {0}}, {0, {0}}, {0, {0}}, {0, {0}}, {0, {0}}}, 0, {test_package_SubMessage_init_default, test_package_SubMessage_init_default, test_package_SubMessage_init_default, test_package_SubMessage_init_default, test_package_SubMessage_init_default}, 0, {_test_package_MyEnum_MIN, _test_package_MyEnum_MIN, _test_package_MyEnum_MIN, _test_package_MyEnum_MIN, _test_package_MyEnum_MIN}, 0, {test_package_EmptyMessage_init_default, test_package_EmptyMessage_init_default, test_package_EmptyMessage_init_default, test_package_EmptyMessage_init_default, test_package_EmptyMessage_init_default}, 0, {{0}, {0}, {0}, {0}, {0}}, false, 4041, false, 4042ll, false, 4043u, false, 4044ull, false, 4045, false, 4046, false, false, false, 4048u, false, 4049, false, 4050, false, 4051ull, false, 4052ll, false, 4053, false, "4054", false, {4, {0x34,0x5c,0x00,0xff}}, false, test_package_SubMessage_init_default, false, test_package_MyEnum_Second, false, test_package_EmptyMessage_init_default, false, {0x34,0x30,0x35,0x39}, 0, {test_package_SubMessage_init_default}, test_package_Limits_init_default, 0, NULL}
+#define test_package_SubMessage_init_zero        {"", 0, false, 0}
+#define test_package_EmptyMessage_init_zero      {0}
+#define test_package_Limits_init_zero            {0, 0, 0, 0, 0, 0, 0, 0, _test_package_HugeEnum_MIN, _test_package_HugeEnum_MIN}
+#define test_package_AllTypes_init_zero          {0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, "", {0, {0}}, test_package_SubMessage_init_zero, _test_package_MyEnum_MIN, test_package_EmptyMessage_init_zero, {0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {0, 0, 0, 0, 0}, 0, {"", "", "", "", ""}, 0, {{0, {0}}, {0, {0}}, {0, {0}}, {0, {0}}, {0, {0}}}, 0, {test_package_SubMessage_init_zero, test_package_SubMessage_init_zero, test_package_SubMessage_init_zero, test_package_SubMessage_init_zero, test_package_SubMessage_init_zero}, 0, {_test_package_MyEnum_MIN, _test_package_MyEnum_MIN, _test_package_MyEnum_MIN, _test_package_MyEnum_MIN, _test_package_MyEnum_MIN}, 0, {test_package_EmptyMessage_init_zero, test_package_EmptyMessage_init_zero, test_package_EmptyMessage_init_zero, test_package_EmptyMessage_init_zero, test_package_EmptyMessage_init_zero}, 0, {{0}, {0}, {0}, {0}, {0}}, false, 0, false, 0, false, 0, false, 0, false, 0, false, 0, false, 0, false, 0, false, 0, false, 0, false, 0, false, 0, false, 0, false, "", false, {0, {0}}, false, test_package_SubMessage_init_zero, false, _test_package_MyEnum_MIN, false, test_package_EmptyMessage_init_zero, false, {0}, 0, {test_package_SubMessage_init_zero}, test_package_Limits_init_zero, 0, NULL}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define test_package_Limits_int32_min_tag        1
+#define test_package_Limits_int32_max_tag        2
+#define test_package_Limits_uint32_min_tag       3
+#define test_package_Limits_uint32_max_tag       4
+#define test_package_Limits_int64_min_tag        5
+#define test_package_Limits_int64_max_tag        6
+#define test_package_Limits_uint64_min_tag       7
+#define test_package_Limits_uint64_max_tag       8
+#define test_package_Limits_enum_min_tag         9
+#define test_package_Limits_enum_max_tag         10
+#define test_package_SubMessage_substuff1_tag    1
+#define test_package_SubMessage_substuff2_tag    2
+#define test_package_SubMessage_substuff3_tag    3
+#define test_package_AllTypes_oneof_msg1_tag     60
+#define test_package_AllTypes_oneof_msg2_tag     61
+#define test_package_AllTypes_req_int32_tag      1
+#define test_package_AllTypes_req_int64_tag      2
+#define test_package_AllTypes_req_uint32_tag     3
+#define test_package_AllTypes_req_uint64_tag     4
+#define test_package_AllTypes_req_sint32_tag     5
+#define test_package_AllTypes_req_sint64_tag     6
+#define test_package_AllTypes_req_bool_tag       7
+#define test_package_AllTypes_req_fixed32_tag    8
+#define test_package_AllTypes_req_sfixed32_tag   9
+#define test_package_AllTypes_req_float_tag      10
+#define test_package_AllTypes_req_fixed64_tag    11
+#define test_package_AllTypes_req_sfixed64_tag   12
+#define test_package_AllTypes_req_double_tag     13
+#define test_package_AllTypes_req_string_tag     14
+#define test_package_AllTypes_req_bytes_tag      15
+#define test_package_AllTypes_req_submsg_tag     16
+#define test_package_AllTypes_req_enum_tag       17
+#define test_package_AllTypes_req_emptymsg_tag   18
+#define test_package_AllTypes_req_fbytes_tag     19
+#define test_package_AllTypes_rep_int32_tag      21
+#define test_package_AllTypes_rep_int64_tag      22
+#define test_package_AllTypes_rep_uint32_tag     23
+#define test_package_AllTypes_rep_uint64_tag     24
+#define test_package_AllTypes_rep_sint32_tag     25
+#define test_package_AllTypes_rep_sint64_tag     26
+#define test_package_AllTypes_rep_bool_tag       27
+#define test_package_AllTypes_rep_fixed32_tag    28
+#define test_package_AllTypes_rep_sfixed32_tag   29
+#define test_package_AllTypes_rep_float_tag      30
+#define test_package_AllTypes_rep_fixed64_tag    31
+#define test_package_AllTypes_rep_sfixed64_tag   32
+#define test_package_AllTypes_rep_double_tag     33
+#define test_package_AllTypes_rep_string_tag     34
+#define test_package_AllTypes_rep_bytes_tag      35
+#define test_package_AllTypes_rep_submsg_tag     36
+#define test_package_AllTypes_rep_enum_tag       37
+#define test_package_AllTypes_rep_emptymsg_tag   38
+#define test_package_AllTypes_rep_fbytes_tag     39
+#define test_package_AllTypes_opt_int32_tag      41
+#define test_package_AllTypes_opt_int64_tag      42
+#define test_package_AllTypes_opt_uint32_tag     43
+#define test_package_AllTypes_opt_uint64_tag     44
+#define test_package_AllTypes_opt_sint32_tag     45
+#define test_package_AllTypes_opt_sint64_tag     46
+#define test_package_AllTypes_opt_bool_tag       47
+#define test_package_AllTypes_opt_fixed32_tag    48
+#define test_package_AllTypes_opt_sfixed32_tag   49
+#define test_package_AllTypes_opt_float_tag      50
+#define test_package_AllTypes_opt_fixed64_tag    51
+#define test_package_AllTypes_opt_sfixed64_tag   52
+#define test_package_AllTypes_opt_double_tag     53
+#define test_package_AllTypes_opt_string_tag     54
+#define test_package_AllTypes_opt_bytes_tag      55
+#define test_package_AllTypes_opt_submsg_tag     56
+#define test_package_AllTypes_opt_enum_tag       57
+#define test_package_AllTypes_opt_emptymsg_tag   58
+#define test_package_AllTypes_opt_fbytes_tag     59
+#define test_package_AllTypes_req_limits_tag     98
+#define test_package_AllTypes_end_tag            99
+
+/* Struct field encoding specification for nanopb */
+#define test_package_SubMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, STRING, substuff1, 1) \
+X(a, STATIC, REQUIRED, INT32, substuff2, 2) \
+X(a, STATIC, OPTIONAL, FIXED32, substuff3, 3)
+#define test_package_SubMessage_CALLBACK NULL
+#define test_package_SubMessage_DEFAULT (const uint8_t*)"\x0a\x01\x31\x10\x02\x1d\x03\x00\x00\x00\x00"
+
+#define test_package_EmptyMessage_FIELDLIST(X, a) \
+
+#define test_package_EmptyMessage_CALLBACK NULL
+#define test_package_EmptyMessage_DEFAULT NULL
+
+#define test_package_Limits_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, int32_min, 1) \
+X(a, STATIC, REQUIRED, INT32, int32_max, 2) \
+X(a, STATIC, REQUIRED, UINT32, uint32_min, 3) \
+X(a, STATIC, REQUIRED, UINT32, uint32_max, 4) \
+X(a, STATIC, REQUIRED, INT64, int64_min, 5) \
+X(a, STATIC, REQUIRED, INT64, int64_max, 6) \
+X(a, STATIC, REQUIRED, UINT64, uint64_min, 7) \
+X(a, STATIC, REQUIRED, UINT64, uint64_max, 8) \
+X(a, STATIC, REQUIRED, ENUM, enum_min, 9) \
+X(a, STATIC, REQUIRED, ENUM, enum_max, 10)
+#define test_package_Limits_CALLBACK NULL
+#define test_package_Limits_DEFAULT (const uint8_t*)"\x08\xff\xff\xff\xff\x07\x10\x81\x80\x80\x80\xf8\xff\xff\xff\xff\x01\x18\xff\xff\xff\xff\x0f\x20\x00\x28\xff\xff\xff\xff\xff\xff\xff\xff\x7f\x30\x81\x80\x80\x80\x80\x80\x80\x80\x80\x01\x38\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x40\x00\x48\xff\xff\xff\xff\x07\x50\x81\x80\x80\x80\xf8\xff\xff\xff\xff\x01\x00"
+
+#define test_package_AllTypes_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, req_int32, 1) \
+X(a, STATIC, REQUIRED, INT64, req_int64, 2) \
+X(a, STATIC, REQUIRED, UINT32, req_uint32, 3) \
+X(a, STATIC, REQUIRED, UINT64, req_uint64, 4) \
+X(a, STATIC, REQUIRED, SINT32, req_sint32, 5) \
+X(a, STATIC, REQUIRED, SINT64, req_sint64, 6) \
+X(a, STATIC, REQUIRED, BOOL, req_bool, 7) \
+X(a, STATIC, REQUIRED, FIXED32, req_fixed32, 8) \
+X(a, STATIC, REQUIRED, SFIXED32, req_sfixed32, 9) \
+X(a, STATIC, REQUIRED, FLOAT, req_float, 10) \
+X(a, STATIC, REQUIRED, FIXED64, req_fixed64, 11) \
+X(a, STATIC, REQUIRED, SFIXED64, req_sfixed64, 12) \
+X(a, STATIC, REQUIRED, DOUBLE, req_double, 13) \
+X(a, STATIC, REQUIRED, STRING, req_string, 14) \
+X(a, STATIC, REQUIRED, BYTES, req_bytes, 15) \
+X(a, STATIC, REQUIRED, MESSAGE, req_submsg, 16) \
+X(a, STATIC, REQUIRED, UENUM, req_enum, 17) \
+X(a, STATIC, REQUIRED, MESSAGE, req_emptymsg, 18) \
+X(a, STATIC, REQUIRED, FIXED_LENGTH_BYTES, req_fbytes, 19) \
+X(a, STATIC, REPEATED, INT32, rep_int32, 21) \
+X(a, STATIC, REPEATED, INT64, rep_int64, 22) \
+X(a, STATIC, REPEATED, UINT32, rep_uint32, 23) \
+X(a, STATIC, REPEATED, UINT64, rep_uint64, 24) \
+X(a, STATIC, REPEATED, SINT32, rep_sint32, 25) \
+X(a, STATIC, REPEATED, SINT64, rep_sint64, 26) \
+X(a, STATIC, REPEATED, BOOL, rep_bool, 27) \
+X(a, STATIC, REPEATED, FIXED32, rep_fixed32, 28) \
+X(a, STATIC, REPEATED, SFIXED32, rep_sfixed32, 29) \
+X(a, STATIC, REPEATED, FLOAT, rep_float, 30) \
+X(a, STATIC, REPEATED, FIXED64, rep_fixed64, 31) \
+X(a, STATIC, REPEATED, SFIXED64, rep_sfixed64, 32) \
+X(a, STATIC, REPEATED, DOUBLE, rep_double, 33) \
+X(a, STATIC, REPEATED, STRING, rep_string, 34) \
+X(a, STATIC, REPEATED, BYTES, rep_bytes, 35) \
+X(a, STATIC, REPEATED, MESSAGE, rep_submsg, 36) \
+X(a, STATIC, REPEATED, UENUM, rep_enum, 37) \
+X(a, STATIC, REPEATED, MESSAGE, rep_emptymsg, 38) \
+X(a, STATIC, REPEATED, FIXED_LENGTH_BYTES, rep_fbytes, 39) \
+X(a, STATIC, OPTIONAL, INT32, opt_int32, 41) \
+X(a, STATIC, OPTIONAL, INT64, opt_int64, 42) \
+X(a, STATIC, OPTIONAL, UINT32, opt_uint32, 43) \
+X(a, STATIC, OPTIONAL, UINT64, opt_uint64, 44) \
+X(a, STATIC, OPTIONAL, SINT32, opt_sint32, 45) \
+X(a, STATIC, OPTIONAL, SINT64, opt_sint64, 46) \
+X(a, STATIC, OPTIONAL, BOOL, opt_bool, 47) \
+X(a, STATIC, OPTIONAL, FIXED32, opt_fixed32, 48) \
+X(a, STATIC, OPTIONAL, SFIXED32, opt_sfixed32, 49) \
+X(a, STATIC, OPTIONAL, FLOAT, opt_float, 50) \
+X(a, STATIC, OPTIONAL, FIXED64, opt_fixed64, 51) \
+X(a, STATIC, OPTIONAL, SFIXED64, opt_sfixed64, 52) \
+X(a, STATIC, OPTIONAL, DOUBLE, opt_double, 53) \
+X(a, STATIC, OPTIONAL, STRING, opt_string, 54) \
+X(a, STATIC, OPTIONAL, BYTES, opt_bytes, 55) \
+X(a, STATIC, OPTIONAL, MESSAGE, opt_submsg, 56) \
+X(a, STATIC, OPTIONAL, UENUM, opt_enum, 57) \
+X(a, STATIC, OPTIONAL, MESSAGE, opt_emptymsg, 58) \
+X(a, STATIC, OPTIONAL, FIXED_LENGTH_BYTES, opt_fbytes, 59) \
+X(a, STATIC, ONEOF, MESSAGE, (oneof,oneof_msg1,oneof.oneof_msg1), 60) \
+X(a, STATIC, ONEOF, MESSAGE, (oneof,oneof_msg2,oneof.oneof_msg2), 61) \
+X(a, STATIC, REQUIRED, MESSAGE, req_limits, 98) \
+X(a, STATIC, REQUIRED, INT32, end, 99) \
+X(a, CALLBACK, OPTIONAL, EXTENSION, extensions, 200)
+#define test_package_AllTypes_CALLBACK pb_default_field_callback
+#define test_package_AllTypes_DEFAULT (const uint8_t*)"\xc8\x02\xc9\x1f\xd0\x02\xca\x1f\xd8\x02\xcb\x1f\xe0\x02\xcc\x1f\xe8\x02\x9a\x3f\xf0\x02\x9c\x3f\xf8\x02\x00\x85\x03\xd0\x0f\x00\x00\x8d\x03\xd1\x0f\x00\x00\x95\x03\x00\x20\x7d\x45\x99\x03\xd3\x0f\x00\x00\x00\x00\x00\x00\xa1\x03\xd4\x0f\x00\x00\x00\x00\x00\x00\xa9\x03\x00\x00\x00\x00\x00\xaa\xaf\x40\xb2\x03\x04\x34\x30\x35\x34\xba\x03\x04\x34\x5c\x00\xff\xc8\x03\x02\xda\x03\x04\x34\x30\x35\x39\x00"
+#define test_package_AllTypes_req_submsg_MSGTYPE test_package_SubMessage
+#define test_package_AllTypes_req_emptymsg_MSGTYPE test_package_EmptyMessage
+#define test_package_AllTypes_rep_submsg_MSGTYPE test_package_SubMessage
+#define test_package_AllTypes_rep_emptymsg_MSGTYPE test_package_EmptyMessage
+#define test_package_AllTypes_opt_submsg_MSGTYPE test_package_SubMessage
+#define test_package_AllTypes_opt_emptymsg_MSGTYPE test_package_EmptyMessage
+#define test_package_AllTypes_oneof_oneof_msg1_MSGTYPE test_package_SubMessage
+#define test_package_AllTypes_oneof_oneof_msg2_MSGTYPE test_package_EmptyMessage
+#define test_package_AllTypes_req_limits_MSGTYPE test_package_Limits
+
+extern const pb_msgdesc_t test_package_SubMessage_msg;
+extern const pb_msgdesc_t test_package_EmptyMessage_msg;
+extern const pb_msgdesc_t test_package_Limits_msg;
+extern const pb_msgdesc_t test_package_AllTypes_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define test_package_SubMessage_fields &test_package_SubMessage_msg
+#define test_package_EmptyMessage_fields &test_package_EmptyMessage_msg
+#define test_package_Limits_fields &test_package_Limits_msg
+#define test_package_AllTypes_fields &test_package_AllTypes_msg
+
+/* Maximum encoded size of messages (where known) */
+#define test_package_SubMessage_size             33
+#define test_package_EmptyMessage_size           0
+#define test_package_Limits_size                 100
+#define test_package_AllTypes_size               1529
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,31 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_ENUMDEF_PB_H_INCLUDED
+#define PB_ENUMDEF_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _MyEnum {
+    FOOBAR = 1
+} MyEnum;
+#define _MyEnum_MIN FOOBAR
+#define _MyEnum_MAX FOOBAR
+#define _MyEnum_ARRAYSIZE ((MyEnum)(FOOBAR+1))
+#define MyEnum_FOOBAR FOOBAR
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,36 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "extensionbug.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Message1, Message1, AUTO)
+
+
+PB_BIND(Message2, Message2, AUTO)
+
+
+/* Definition for extension field Message2_extras */
+typedef struct _Message2_extras_extmsg {
+    Message2 extras;
+/* @@protoc_insertion_point(struct:Message2_extras_extmsg) */
+} Message2_extras_extmsg;
+#define Message2_extras_extmsg_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, extras, 30)
+#define Message2_extras_extmsg_CALLBACK NULL
+#define Message2_extras_extmsg_DEFAULT NULL
+#define Message2_extras_extmsg_extras_MSGTYPE Message2
+pb_byte_t Message2_extras_extmsg_default[] = {0x00};
+PB_BIND(Message2_extras_extmsg, Message2_extras_extmsg, AUTO)
+const pb_extension_type_t Message2_extras = {
+    NULL,
+    NULL,
+    &Message2_extras_extmsg_msg
+};
+
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,204 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_TESTPROTO_PB_H_INCLUDED
+#define PB_TESTPROTO_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _MyMessage1 {
+    uint32_t n1;
+    uint32_t n2;
+    char s[33];
+/* @@protoc_insertion_point(struct:MyMessage1) */
+} MyMessage1;
+
+
+typedef struct _MyMessage2 {
+    uint32_t num;
+    bool b;
+/* @@protoc_insertion_point(struct:MyMessage2) */
+} MyMessage2;
+
+
+typedef struct _MyMessage3 {
+    bool bbb;
+    char ss[2];
+/* @@protoc_insertion_point(struct:MyMessage3) */
+} MyMessage3;
+
+
+typedef struct _MyMessage4 {
+    bool bbbb;
+    char sss[3];
+    uint32_t num;
+    uint32_t num2;
+/* @@protoc_insertion_point(struct:MyMessage4) */
+} MyMessage4;
+
+
+typedef struct _SubMessage {
+    pb_size_t array_count;
+    int32_t array[8];
+/* @@protoc_insertion_point(struct:SubMessage) */
+} SubMessage;
+
+
+typedef struct _OneOfMessage {
+    int32_t prefix;
+    pb_size_t which_values;
+    union {
+        int32_t first;
+        char second[9];
+        SubMessage third;
+    } values;
+    int32_t suffix;
+/* @@protoc_insertion_point(struct:OneOfMessage) */
+} OneOfMessage;
+
+
+typedef struct _topMessage {
+    int32_t start;
+    pb_size_t which_msg;
+    union {
+        MyMessage1 msg1;
+        MyMessage2 msg2;
+    } msg;
+    int32_t end;
+/* @@protoc_insertion_point(struct:topMessage) */
+} topMessage;
+
+
+/* Initializer values for message structs */
+#define SubMessage_init_default                  {0, {0, 0, 0, 0, 0, 0, 0, 0}}
+#define OneOfMessage_init_default                {0, 0, {0}, 0}
+#define topMessage_init_default                  {0, 0, {MyMessage1_init_default}, 0}
+#define MyMessage1_init_default                  {0, 0, ""}
+#define MyMessage2_init_default                  {0, 0}
+#define MyMessage3_init_default                  {0, ""}
+#define MyMessage4_init_default                  {0, "", 0, 0}
+#define SubMessage_init_zero                     {0, {0, 0, 0, 0, 0, 0, 0, 0}}
+#define OneOfMessage_init_zero                   {0, 0, {0}, 0}
+#define topMessage_init_zero                     {0, 0, {MyMessage1_init_zero}, 0}
+#define MyMessage1_init_zero                     {0, 0, ""}
+#define MyMessage2_init_zero                     {0, 0}
+#define MyMessage3_init_zero                     {0, ""}
+#define MyMessage4_init_zero                     {0, "", 0, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define MyMessage1_n1_tag                        1
+#define MyMessage1_n2_tag                        2
+#define MyMessage1_s_tag                         3
+#define MyMessage2_num_tag                       1
+#define MyMessage2_b_tag                         2
+#define MyMessage3_bbb_tag                       1
+#define MyMessage3_ss_tag                        2
+#define MyMessage4_bbbb_tag                      1
+#define MyMessage4_sss_tag                       2
+#define MyMessage4_num_tag                       3
+#define MyMessage4_num2_tag                      4
+#define SubMessage_array_tag                     1
+#define OneOfMessage_first_tag                   5
+#define OneOfMessage_second_tag                  6
+#define OneOfMessage_third_tag                   7
+#define OneOfMessage_prefix_tag                  1
+#define OneOfMessage_suffix_tag                  99
+#define topMessage_msg1_tag                      2
+#define topMessage_msg2_tag                      3
+#define topMessage_start_tag                     1
+#define topMessage_end_tag                       4
+
+/* Struct field encoding specification for nanopb */
+#define SubMessage_FIELDLIST(X, a) \
+X(a, STATIC, REPEATED, INT32, array, 1)
+#define SubMessage_CALLBACK NULL
+#define SubMessage_DEFAULT NULL
+
+#define OneOfMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, prefix, 1) \
+X(a, STATIC, ONEOF, INT32, (values,first,values.first), 5) \
+X(a, STATIC, ONEOF, STRING, (values,second,values.second), 6) \
+X(a, STATIC, ONEOF, MESSAGE, (values,third,values.third), 7) \
+X(a, STATIC, REQUIRED, INT32, suffix, 99)
+#define OneOfMessage_CALLBACK NULL
+#define OneOfMessage_DEFAULT NULL
+#define OneOfMessage_values_third_MSGTYPE SubMessage
+
+#define topMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, start, 1) \
+X(a, STATIC, ONEOF, MESSAGE, (msg,msg1,msg.msg1), 2) \
+X(a, STATIC, ONEOF, MESSAGE, (msg,msg2,msg.msg2), 3) \
+X(a, STATIC, REQUIRED, INT32, end, 4)
+#define topMessage_CALLBACK NULL
+#define topMessage_DEFAULT NULL
+#define topMessage_msg_msg1_MSGTYPE MyMessage1
+#define topMessage_msg_msg2_MSGTYPE MyMessage2
+
+#define MyMessage1_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, n1, 1) \
+X(a, STATIC, REQUIRED, UINT32, n2, 2) \
+X(a, STATIC, REQUIRED, STRING, s, 3)
+#define MyMessage1_CALLBACK NULL
+#define MyMessage1_DEFAULT NULL
+
+#define MyMessage2_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UINT32, num, 1) \
+X(a, STATIC, REQUIRED, BOOL, b, 2)
+#define MyMessage2_CALLBACK NULL
+#define MyMessage2_DEFAULT NULL
+
+#define MyMessage3_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, BOOL, bbb, 1) \
+X(a, STATIC, REQUIRED, STRING, ss, 2)
+#define MyMessage3_CALLBACK NULL
+#define MyMessage3_DEFAULT NULL
+
+#define MyMessage4_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, BOOL, bbbb, 1) \
+X(a, STATIC, REQUIRED, STRING, sss, 2) \
+X(a, STATIC, REQUIRED, UINT32, num, 3) \
+X(a, STATIC, REQUIRED, UINT32, num2, 4)
+#define MyMessage4_CALLBACK NULL
+#define MyMessage4_DEFAULT NULL
+
+extern const pb_msgdesc_t SubMessage_msg;
+extern const pb_msgdesc_t OneOfMessage_msg;
+extern const pb_msgdesc_t topMessage_msg;
+extern const pb_msgdesc_t MyMessage1_msg;
+extern const pb_msgdesc_t MyMessage2_msg;
+extern const pb_msgdesc_t MyMessage3_msg;
+extern const pb_msgdesc_t MyMessage4_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define SubMessage_fields &SubMessage_msg
+#define OneOfMessage_fields &OneOfMessage_msg
+#define topMessage_fields &topMessage_msg
+#define MyMessage1_fields &MyMessage1_msg
+#define MyMessage2_fields &MyMessage2_msg
+#define MyMessage3_fields &MyMessage3_msg
+#define MyMessage4_fields &MyMessage4_msg
+
+/* Maximum encoded size of messages (where known) */
+#define SubMessage_size                          88
+#define OneOfMessage_size                        113
+#define topMessage_size                          70
+#define MyMessage1_size                          46
+#define MyMessage2_size                          8
+#define MyMessage3_size                          5
+#define MyMessage4_size                          18
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,53 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_COMMENTS_PB_H_INCLUDED
+#define PB_COMMENTS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _DummyMessage {
+    char foo[5];
+    char bar[16];
+/* @@protoc_insertion_point(struct:DummyMessage) */
+} DummyMessage;
+
+
+/* Initializer values for message structs */
+#define DummyMessage_init_default                {"", ""}
+#define DummyMessage_init_zero                   {"", ""}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define DummyMessage_foo_tag                     1
+#define DummyMessage_bar_tag                     2
+
+/* Struct field encoding specification for nanopb */
+#define DummyMessage_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, STRING, foo, 1) \
+X(a, STATIC, REQUIRED, STRING, bar, 2)
+#define DummyMessage_CALLBACK NULL
+#define DummyMessage_DEFAULT NULL
+
+extern const pb_msgdesc_t DummyMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define DummyMessage_fields &DummyMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define DummyMessage_size                        23
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
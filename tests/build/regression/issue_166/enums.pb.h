@@ -0,0 +1,83 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_ENUMS_PB_H_INCLUDED
+#define PB_ENUMS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _SignedEnum {
+    SignedEnum_SE_MIN = -1,
+    SignedEnum_SE_MAX = 255
+} SignedEnum;
+#define _SignedEnum_MIN SignedEnum_SE_MIN
+#define _SignedEnum_MAX SignedEnum_SE_MAX
+#define _SignedEnum_ARRAYSIZE ((SignedEnum)(SignedEnum_SE_MAX+1))
+
+typedef enum _UnsignedEnum {
+    UnsignedEnum_UE_MAX = 65536
+} UnsignedEnum;
+#define _UnsignedEnum_MIN UnsignedEnum_UE_MAX
+#define _UnsignedEnum_MAX UnsignedEnum_UE_MAX
+#define _UnsignedEnum_ARRAYSIZE ((UnsignedEnum)(UnsignedEnum_UE_MAX+1))
+
+/* Struct definitions */
+typedef struct _SignedMsg {
+    SignedEnum value;
+/* @@protoc_insertion_point(struct:SignedMsg) */
+} SignedMsg;
+
+
+typedef struct _UnsignedMsg {
+    UnsignedEnum value;
+/* @@protoc_insertion_point(struct:UnsignedMsg) */
+} UnsignedMsg;
+
+
+/* Initializer values for message structs */
+#define SignedMsg_init_default                   {_SignedEnum_MIN}
+#define UnsignedMsg_init_default                 {_UnsignedEnum_MIN}
+#define SignedMsg_init_zero                      {_SignedEnum_MIN}
+#define UnsignedMsg_init_zero                    {_UnsignedEnum_MIN}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define SignedMsg_value_tag                      1
+#define UnsignedMsg_value_tag                    1
+
+/* Struct field encoding specification for nanopb */
+#define SignedMsg_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, ENUM, value, 1)
+#define SignedMsg_CALLBACK NULL
+#define SignedMsg_DEFAULT NULL
+
+#define UnsignedMsg_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, UENUM, value, 1)
+#define UnsignedMsg_CALLBACK NULL
+#define UnsignedMsg_DEFAULT NULL
+
+extern const pb_msgdesc_t SignedMsg_msg;
+extern const pb_msgdesc_t UnsignedMsg_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define SignedMsg_fields &SignedMsg_msg
+#define UnsignedMsg_fields &UnsignedMsg_msg
+
+/* Maximum encoded size of messages (where known) */
+#define SignedMsg_size                           11
+#define UnsignedMsg_size                         4
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
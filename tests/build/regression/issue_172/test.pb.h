@@ -0,0 +1,54 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_TEST_PB_H_INCLUDED
+#define PB_TEST_PB_H_INCLUDED
+#include <pb.h>
+
+#include "submessage.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _testmessage {
+    bool has_sub;
+    submessage sub;
+/* @@protoc_insertion_point(struct:testmessage) */
+} testmessage;
+
+
+/* Initializer values for message structs */
+#define testmessage_init_default                 {false, submessage_init_default}
+#define testmessage_init_zero                    {false, submessage_init_zero}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define testmessage_sub_tag                      1
+
+/* Struct field encoding specification for nanopb */
+#define testmessage_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, MESSAGE, sub, 1)
+#define testmessage_CALLBACK NULL
+#define testmessage_DEFAULT NULL
+#define testmessage_sub_MSGTYPE submessage
+
+extern const pb_msgdesc_t testmessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define testmessage_fields &testmessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define testmessage_size                         (6 + submessage_size)
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
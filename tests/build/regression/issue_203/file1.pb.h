@@ -0,0 +1,68 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_FILE1_PB_H_INCLUDED
+#define PB_FILE1_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _SubMessage1 {
+    int32_t foo;
+/* @@protoc_insertion_point(struct:SubMessage1) */
+} SubMessage1;
+
+
+typedef struct _Message1 {
+    SubMessage1 bar;
+/* @@protoc_insertion_point(struct:Message1) */
+} Message1;
+
+
+/* Initializer values for message structs */
+#define SubMessage1_init_default                 {0}
+#define Message1_init_default                    {SubMessage1_init_default}
+#define SubMessage1_init_zero                    {0}
+#define Message1_init_zero                       {SubMessage1_init_zero}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define SubMessage1_foo_tag                      1
+#define Message1_bar_tag                         1
+
+/* Struct field encoding specification for nanopb */
+#define SubMessage1_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, foo, 1)
+#define SubMessage1_CALLBACK NULL
+#define SubMessage1_DEFAULT NULL
+
+#define Message1_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, bar, 1)
+#define Message1_CALLBACK NULL
+#define Message1_DEFAULT NULL
+#define Message1_bar_MSGTYPE SubMessage1
+
+extern const pb_msgdesc_t SubMessage1_msg;
+extern const pb_msgdesc_t Message1_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define SubMessage1_fields &SubMessage1_msg
+#define Message1_fields &Message1_msg
+
+/* Maximum encoded size of messages (where known) */
+#define SubMessage1_size                         11
+#define Message1_size                            13
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,68 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_FILE2_PB_H_INCLUDED
+#define PB_FILE2_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _SubMessage2 {
+    int32_t foo;
+/* @@protoc_insertion_point(struct:SubMessage2) */
+} SubMessage2;
+
+
+typedef struct _Message2 {
+    SubMessage2 bar;
+/* @@protoc_insertion_point(struct:Message2) */
+} Message2;
+
+
+/* Initializer values for message structs */
+#define SubMessage2_init_default                 {0}
+#define Message2_init_default                    {SubMessage2_init_default}
+#define SubMessage2_init_zero                    {0}
+#define Message2_init_zero                       {SubMessage2_init_zero}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define SubMessage2_foo_tag                      1
+#define Message2_bar_tag                         1
+
+/* Struct field encoding specification for nanopb */
+#define SubMessage2_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, foo, 1)
+#define SubMessage2_CALLBACK NULL
+#define SubMessage2_DEFAULT NULL
+
+#define Message2_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, bar, 1)
+#define Message2_CALLBACK NULL
+#define Message2_DEFAULT NULL
+#define Message2_bar_MSGTYPE SubMessage2
+
+extern const pb_msgdesc_t SubMessage2_msg;
+extern const pb_msgdesc_t Message2_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define SubMessage2_fields &SubMessage2_msg
+#define Message2_fields &Message2_msg
+
+/* Maximum encoded size of messages (where known) */
+#define SubMessage2_size                         11
+#define Message2_size                            13
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
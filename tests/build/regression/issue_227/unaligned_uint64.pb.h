@@ -0,0 +1,53 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_UNALIGNED_UINT64_PB_H_INCLUDED
+#define PB_UNALIGNED_UINT64_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _MainMessage {
+    char foo[3];
+    char bar[8];
+/* @@protoc_insertion_point(struct:MainMessage) */
+} MainMessage;
+
+
+/* Initializer values for message structs */
+#define MainMessage_init_default                 {"", ""}
+#define MainMessage_init_zero                    {"", ""}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define MainMessage_foo_tag                      1
+#define MainMessage_bar_tag                      2
+
+/* Struct field encoding specification for nanopb */
+#define MainMessage_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, STRING, foo, 1) \
+X(a, STATIC, SINGULAR, STRING, bar, 2)
+#define MainMessage_CALLBACK NULL
+#define MainMessage_DEFAULT NULL
+
+extern const pb_msgdesc_t MainMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define MainMessage_fields &MainMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define MainMessage_size                         13
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,70 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_ZERO_VALUE_PB_H_INCLUDED
+#define PB_ZERO_VALUE_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Extendable {
+    pb_extension_t *extensions;
+/* @@protoc_insertion_point(struct:Extendable) */
+} Extendable;
+
+
+typedef struct _PointerMessage {
+    int32_t *opt_int32;
+/* @@protoc_insertion_point(struct:PointerMessage) */
+} PointerMessage;
+
+
+/* Extensions */
+extern const pb_extension_type_t opt_int32; /* field type: int32_t opt_int32; */
+
+/* Initializer values for message structs */
+#define Extendable_init_default                  {NULL}
+#define PointerMessage_init_default              {NULL}
+#define Extendable_init_zero                     {NULL}
+#define PointerMessage_init_zero                 {NULL}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define PointerMessage_opt_int32_tag             11
+#define opt_int32_tag                            11
+
+/* Struct field encoding specification for nanopb */
+#define Extendable_FIELDLIST(X, a) \
+X(a, CALLBACK, OPTIONAL, EXTENSION, extensions, 10)
+#define Extendable_CALLBACK pb_default_field_callback
+#define Extendable_DEFAULT NULL
+
+#define PointerMessage_FIELDLIST(X, a) \
+X(a, POINTER, OPTIONAL, INT32, opt_int32, 11)
+#define PointerMessage_CALLBACK NULL
+#define PointerMessage_DEFAULT NULL
+
+extern const pb_msgdesc_t Extendable_msg;
+extern const pb_msgdesc_t PointerMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Extendable_fields &Extendable_msg
+#define PointerMessage_fields &PointerMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Extendable_size                          0
+/* PointerMessage_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
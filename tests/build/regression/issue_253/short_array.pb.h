@@ -0,0 +1,51 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_SHORT_ARRAY_PB_H_INCLUDED
+#define PB_SHORT_ARRAY_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _TestMessage {
+    pb_size_t rep_uint32_count;
+    uint32_t rep_uint32[1];
+/* @@protoc_insertion_point(struct:TestMessage) */
+} TestMessage;
+
+
+/* Initializer values for message structs */
+#define TestMessage_init_default                 {0, {0}}
+#define TestMessage_init_zero                    {0, {0}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define TestMessage_rep_uint32_tag               1
+
+/* Struct field encoding specification for nanopb */
+#define TestMessage_FIELDLIST(X, a) \
+X(a, STATIC, REPEATED, UINT32, rep_uint32, 1)
+#define TestMessage_CALLBACK NULL
+#define TestMessage_DEFAULT NULL
+
+extern const pb_msgdesc_t TestMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define TestMessage_fields &TestMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define TestMessage_size                         7
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,68 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_CALLBACK_POINTER_PB_H_INCLUDED
+#define PB_CALLBACK_POINTER_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _MainMessage {
+    struct _SubMessage *bar;
+/* @@protoc_insertion_point(struct:MainMessage) */
+} MainMessage;
+
+
+typedef struct _SubMessage {
+    pb_callback_t foo;
+/* @@protoc_insertion_point(struct:SubMessage) */
+} SubMessage;
+
+
+/* Initializer values for message structs */
+#define SubMessage_init_default                  {{{NULL}, NULL}}
+#define MainMessage_init_default                 {NULL}
+#define SubMessage_init_zero                     {{{NULL}, NULL}}
+#define MainMessage_init_zero                    {NULL}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define MainMessage_bar_tag                      1
+#define SubMessage_foo_tag                       1
+
+/* Struct field encoding specification for nanopb */
+#define SubMessage_FIELDLIST(X, a) \
+X(a, CALLBACK, OPTIONAL, INT32, foo, 1)
+#define SubMessage_CALLBACK pb_default_field_callback
+#define SubMessage_DEFAULT NULL
+
+#define MainMessage_FIELDLIST(X, a) \
+X(a, POINTER, OPTIONAL, MESSAGE, bar, 1)
+#define MainMessage_CALLBACK NULL
+#define MainMessage_DEFAULT NULL
+#define MainMessage_bar_MSGTYPE SubMessage
+
+extern const pb_msgdesc_t SubMessage_msg;
+extern const pb_msgdesc_t MainMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define SubMessage_fields &SubMessage_msg
+#define MainMessage_fields &MainMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+/* SubMessage_size depends on runtime parameters */
+/* MainMessage_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,32 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "large_extension.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Foo, Foo, AUTO)
+
+
+/* Definition for extension field foo_ext */
+typedef struct _foo_ext_extmsg {
+    int32_t foo_ext;
+/* @@protoc_insertion_point(struct:foo_ext_extmsg) */
+} foo_ext_extmsg;
+#define foo_ext_extmsg_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, foo_ext, 99999)
+#define foo_ext_extmsg_CALLBACK NULL
+#define foo_ext_extmsg_DEFAULT NULL
+pb_byte_t foo_ext_extmsg_default[] = {0x00};
+PB_BIND(foo_ext_extmsg, foo_ext_extmsg, 4)
+const pb_extension_type_t foo_ext = {
+    NULL,
+    NULL,
+    &foo_ext_extmsg_msg
+};
+
+
+/* @@protoc_insertion_point(eof) */
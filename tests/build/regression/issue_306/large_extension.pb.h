@@ -0,0 +1,53 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_LARGE_EXTENSION_PB_H_INCLUDED
+#define PB_LARGE_EXTENSION_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Foo {
+    pb_extension_t *extensions;
+/* @@protoc_insertion_point(struct:Foo) */
+} Foo;
+
+
+/* Extensions */
+extern const pb_extension_type_t foo_ext; /* field type: int32_t foo_ext; */
+
+/* Initializer values for message structs */
+#define Foo_init_default                         {NULL}
+#define Foo_init_zero                            {NULL}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define foo_ext_tag                              99999
+
+/* Struct field encoding specification for nanopb */
+#define Foo_FIELDLIST(X, a) \
+X(a, CALLBACK, OPTIONAL, EXTENSION, extensions, 1)
+#define Foo_CALLBACK pb_default_field_callback
+#define Foo_DEFAULT NULL
+
+extern const pb_msgdesc_t Foo_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Foo_fields &Foo_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Foo_size                                 0
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
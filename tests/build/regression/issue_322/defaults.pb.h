@@ -0,0 +1,65 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_DEFAULTS_PB_H_INCLUDED
+#define PB_DEFAULTS_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef PB_BYTES_ARRAY_T(5) DefaultsMsg_b2_t;
+typedef PB_BYTES_ARRAY_T(15) DefaultsMsg_b3_t;
+typedef struct _DefaultsMsg {
+    bool has_b1;
+    pb_byte_t b1[5];
+    bool has_b2;
+    DefaultsMsg_b2_t b2;
+    bool has_b3;
+    DefaultsMsg_b3_t b3;
+    bool has_s1;
+    char s1[8];
+/* @@protoc_insertion_point(struct:DefaultsMsg) */
+} DefaultsMsg;
+
+
+/* Initializer values for message structs */
+#define DefaultsMsg_init_default                 {false, {0xde,0xad,0x00,0xbe,0xef}, false, {5, {0xde,0xad,0x00,0xbe,0xef}}, false, {5, {0xde,0xad,0x00,0xbe,0xef}}, false, "\xc3\xa4\xc3\xb6"}
+#define DefaultsMsg_init_zero                    {false, {0}, false, {0, {0}}, false, {0, {0}}, false, ""}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define DefaultsMsg_b1_tag                       1
+#define DefaultsMsg_b2_tag                       2
+#define DefaultsMsg_b3_tag                       3
+#define DefaultsMsg_s1_tag                       4
+
+/* Struct field encoding specification for nanopb */
+#define DefaultsMsg_FIELDLIST(X, a) \
+X(a, STATIC, OPTIONAL, FIXED_LENGTH_BYTES, b1, 1) \
+X(a, STATIC, OPTIONAL, BYTES, b2, 2) \
+X(a, STATIC, OPTIONAL, BYTES, b3, 3) \
+X(a, STATIC, OPTIONAL, STRING, s1, 4)
+#define DefaultsMsg_CALLBACK NULL
+#define DefaultsMsg_DEFAULT (const uint8_t*)"\x0a\x05\xde\xad\x00\xbe\xef\x12\x05\xde\xad\x00\xbe\xef\x1a\x05\xde\xad\x00\xbe\xef\x22\x04\xc3\xa4\xc3\xb6\x00"
+
+extern const pb_msgdesc_t DefaultsMsg_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define DefaultsMsg_fields &DefaultsMsg_msg
+
+/* Maximum encoded size of messages (where known) */
+#define DefaultsMsg_size                         40
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,32 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "extensions.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(BaseMessage, BaseMessage, AUTO)
+
+
+/* Definition for extension field string_extension */
+typedef struct _string_extension_extmsg {
+    pb_callback_t string_extension;
+/* @@protoc_insertion_point(struct:string_extension_extmsg) */
+} string_extension_extmsg;
+#define string_extension_extmsg_FIELDLIST(X, a) \
+X(a, CALLBACK, REQUIRED, STRING, string_extension, 100)
+#define string_extension_extmsg_CALLBACK pb_default_field_callback
+#define string_extension_extmsg_DEFAULT NULL
+pb_byte_t string_extension_extmsg_default[] = {0x00};
+PB_BIND(string_extension_extmsg, string_extension_extmsg, AUTO)
+const pb_extension_type_t string_extension = {
+    NULL,
+    NULL,
+    &string_extension_extmsg_msg
+};
+
+
+/* @@protoc_insertion_point(eof) */
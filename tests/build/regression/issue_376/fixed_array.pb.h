@@ -0,0 +1,68 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_FIXED_ARRAY_PB_H_INCLUDED
+#define PB_FIXED_ARRAY_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _SubMessage {
+    int32_t data[8];
+/* @@protoc_insertion_point(struct:SubMessage) */
+} SubMessage;
+
+
+typedef struct _MainMessage {
+    SubMessage submsg;
+/* @@protoc_insertion_point(struct:MainMessage) */
+} MainMessage;
+
+
+/* Initializer values for message structs */
+#define MainMessage_init_default                 {SubMessage_init_default}
+#define SubMessage_init_default                  {{0, 0, 0, 0, 0, 0, 0, 0}}
+#define MainMessage_init_zero                    {SubMessage_init_zero}
+#define SubMessage_init_zero                     {{0, 0, 0, 0, 0, 0, 0, 0}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define SubMessage_data_tag                      1
+#define MainMessage_submsg_tag                   1
+
+/* Struct field encoding specification for nanopb */
+#define MainMessage_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, MESSAGE, submsg, 1)
+#define MainMessage_CALLBACK NULL
+#define MainMessage_DEFAULT NULL
+#define MainMessage_submsg_MSGTYPE SubMessage
+
+#define SubMessage_FIELDLIST(X, a) \
+X(a, STATIC, FIXARRAY, INT32, data, 1)
+#define SubMessage_CALLBACK NULL
+#define SubMessage_DEFAULT NULL
+
+extern const pb_msgdesc_t MainMessage_msg;
+extern const pb_msgdesc_t SubMessage_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define MainMessage_fields &MainMessage_msg
+#define SubMessage_fields &SubMessage_msg
+
+/* Maximum encoded size of messages (where known) */
+#define MainMessage_size                         90
+#define SubMessage_size                          88
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,2382 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "alltypes.pb.h"
+#include <pb_encode.h>
+#include <pb_decode.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(SubMessage, SubMessage, AUTO)
+
+
+PB_BIND(EmptyMessage, EmptyMessage, AUTO)
+
+
+PB_BIND(Limits, Limits, AUTO)
+
+
+PB_BIND(AllTypes, AllTypes, 2)
+
+
+#ifdef PB_WITHOUT_64BIT
+#define pb_int64_t int32_t
+#define pb_uint64_t uint32_t
+#else
+#define pb_int64_t int64_t
+#define pb_uint64_t uint64_t
+#endif
+
+#ifndef PB_NO_SPECIALIZED_ENCODE
+bool SubMessage_encode(pb_ostream_t *stream, const SubMessage *msg)
+{
+#ifdef PB_WITHOUT_64BIT
+    return pb_encode(stream, SubMessage_fields, msg);
+#else
+    if (!pb_encode_tag(stream, PB_WT_STRING, 1))
+        return false;
+    {
+        size_t size = 0;
+        while (size < 15 && msg->substuff1[size] != '\0')
+            size++;
+        if (msg->substuff1[size] != '\0')
+            PB_RETURN_ERROR(stream, "unterminated string");
+        if (!pb_encode_string(stream, (const pb_byte_t*)msg->substuff1, size))
+            return false;
+    }
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 2))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->substuff2))
+        return false;
+    if (msg->has_substuff3)
+    {
+        if (!pb_encode_tag(stream, PB_WT_32BIT, 3))
+            return false;
+        if (!pb_encode_fixed32(stream, &msg->substuff3))
+            return false;
+    }
+    return true;
+#endif
+}
+#endif
+
+#ifndef PB_NO_SPECIALIZED_DECODE
+bool SubMessage_decode(pb_istream_t *stream, SubMessage *msg)
+{
+    memset(msg, 0, sizeof(SubMessage));
+    {
+        static const char init[16] = "1";
+        memcpy(&msg->substuff1, &init, sizeof(init));
+    }
+    msg->substuff2 = 2;
+    msg->substuff3 = 3u;
+    return SubMessage_decode_noinit(stream, msg);
+}
+
+bool SubMessage_decode_noinit(pb_istream_t *stream, SubMessage *msg)
+{
+    uint32_t fields_seen[1] = {0};
+
+    while (stream->bytes_left)
+    {
+        uint32_t tag;
+        pb_wire_type_t wire_type;
+        bool eof;
+
+        if (!pb_decode_tag(stream, &wire_type, &tag, &eof))
+        {
+            if (eof)
+                break;
+            else
+                return false;
+        }
+
+        switch (tag)
+        {
+            case 0:
+                PB_RETURN_ERROR(stream, "zero tag");
+
+            case 1:
+                fields_seen[0] |= (uint32_t)1 << 0;
+                {
+                    uint32_t size;
+                    if (!pb_decode_varint32(stream, &size))
+                        return false;
+                    if (size >= 16)
+                        PB_RETURN_ERROR(stream, "string overflow");
+                    msg->substuff1[size] = '\0';
+                    if (!pb_read(stream, (pb_byte_t*)msg->substuff1, size))
+                        return false;
+                }
+                break;
+
+            case 2:
+                fields_seen[0] |= (uint32_t)1 << 1;
+                {
+                    pb_uint64_t value;
+                    pb_int64_t svalue;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    svalue = (int32_t)value;
+                    msg->substuff2 = (int32_t)svalue;
+                    if ((pb_int64_t)msg->substuff2 != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 3:
+                msg->has_substuff3 = true;
+                if (!pb_decode_fixed32(stream, &msg->substuff3))
+                    return false;
+                break;
+
+            default:
+                if (!pb_skip_field(stream, wire_type))
+                    return false;
+                break;
+        }
+    }
+
+    if (fields_seen[0] != 0x3u)
+        PB_RETURN_ERROR(stream, "missing required field");
+
+    return true;
+}
+#endif
+
+#ifndef PB_NO_SPECIALIZED_ENCODE
+bool EmptyMessage_encode(pb_ostream_t *stream, const EmptyMessage *msg)
+{
+    PB_UNUSED(stream);
+    PB_UNUSED(msg);
+    return true;
+}
+#endif
+
+#ifndef PB_NO_SPECIALIZED_DECODE
+bool EmptyMessage_decode(pb_istream_t *stream, EmptyMessage *msg)
+{
+    memset(msg, 0, sizeof(EmptyMessage));
+    return EmptyMessage_decode_noinit(stream, msg);
+}
+
+bool EmptyMessage_decode_noinit(pb_istream_t *stream, EmptyMessage *msg)
+{
+    while (stream->bytes_left)
+    {
+        uint32_t tag;
+        pb_wire_type_t wire_type;
+        bool eof;
+
+        if (!pb_decode_tag(stream, &wire_type, &tag, &eof))
+        {
+            if (eof)
+                break;
+            else
+                return false;
+        }
+
+        switch (tag)
+        {
+            case 0:
+                PB_RETURN_ERROR(stream, "zero tag");
+
+            default:
+                if (!pb_skip_field(stream, wire_type))
+                    return false;
+                break;
+        }
+    }
+
+    PB_UNUSED(msg);
+    return true;
+}
+#endif
+
+#ifndef PB_NO_SPECIALIZED_ENCODE
+bool Limits_encode(pb_ostream_t *stream, const Limits *msg)
+{
+#ifdef PB_WITHOUT_64BIT
+    return pb_encode(stream, Limits_fields, msg);
+#else
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 1))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->int32_min))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 2))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->int32_max))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 3))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)msg->uint32_min))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 4))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)msg->uint32_max))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 5))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->int64_min))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 6))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->int64_max))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 7))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)msg->uint64_min))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 8))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)msg->uint64_max))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 9))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->enum_min))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 10))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->enum_max))
+        return false;
+    return true;
+#endif
+}
+#endif
+
+#ifndef PB_NO_SPECIALIZED_DECODE
+bool Limits_decode(pb_istream_t *stream, Limits *msg)
+{
+    memset(msg, 0, sizeof(Limits));
+    msg->int32_min = 2147483647;
+    msg->int32_max = -2147483647;
+    msg->uint32_min = 4294967295u;
+    msg->int64_min = 9223372036854775807ll;
+    msg->int64_max = -9223372036854775807ll;
+    msg->uint64_min = 18446744073709551615ull;
+    msg->enum_min = HugeEnum_Positive;
+    msg->enum_max = HugeEnum_Negative;
+    return Limits_decode_noinit(stream, msg);
+}
+
+bool Limits_decode_noinit(pb_istream_t *stream, Limits *msg)
+{
+    uint32_t fields_seen[1] = {0};
+
+    while (stream->bytes_left)
+    {
+        uint32_t tag;
+        pb_wire_type_t wire_type;
+        bool eof;
+
+        if (!pb_decode_tag(stream, &wire_type, &tag, &eof))
+        {
+            if (eof)
+                break;
+            else
+                return false;
+        }
+
+        switch (tag)
+        {
+            case 0:
+                PB_RETURN_ERROR(stream, "zero tag");
+
+            case 1:
+                fields_seen[0] |= (uint32_t)1 << 0;
+                {
+                    pb_uint64_t value;
+                    pb_int64_t svalue;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    svalue = (int32_t)value;
+                    msg->int32_min = (int32_t)svalue;
+                    if ((pb_int64_t)msg->int32_min != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 2:
+                fields_seen[0] |= (uint32_t)1 << 1;
+                {
+                    pb_uint64_t value;
+                    pb_int64_t svalue;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    svalue = (int32_t)value;
+                    msg->int32_max = (int32_t)svalue;
+                    if ((pb_int64_t)msg->int32_max != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 3:
+                fields_seen[0] |= (uint32_t)1 << 2;
+                {
+                    pb_uint64_t value;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    msg->uint32_min = (uint32_t)value;
+                    if ((pb_uint64_t)msg->uint32_min != value)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 4:
+                fields_seen[0] |= (uint32_t)1 << 3;
+                {
+                    pb_uint64_t value;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    msg->uint32_max = (uint32_t)value;
+                    if ((pb_uint64_t)msg->uint32_max != value)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 5:
+                fields_seen[0] |= (uint32_t)1 << 4;
+                {
+                    pb_uint64_t value;
+                    pb_int64_t svalue;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    svalue = (pb_int64_t)value;
+                    msg->int64_min = (int64_t)svalue;
+                    if ((pb_int64_t)msg->int64_min != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 6:
+                fields_seen[0] |= (uint32_t)1 << 5;
+                {
+                    pb_uint64_t value;
+                    pb_int64_t svalue;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    svalue = (pb_int64_t)value;
+                    msg->int64_max = (int64_t)svalue;
+                    if ((pb_int64_t)msg->int64_max != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 7:
+                fields_seen[0] |= (uint32_t)1 << 6;
+                {
+                    pb_uint64_t value;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    msg->uint64_min = (uint64_t)value;
+                    if ((pb_uint64_t)msg->uint64_min != value)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 8:
+                fields_seen[0] |= (uint32_t)1 << 7;
+                {
+                    pb_uint64_t value;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    msg->uint64_max = (uint64_t)value;
+                    if ((pb_uint64_t)msg->uint64_max != value)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 9:
+                fields_seen[0] |= (uint32_t)1 << 8;
+                {
+                    pb_uint64_t value;
+                    pb_int64_t svalue;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    svalue = (int32_t)value;
+                    msg->enum_min = (HugeEnum)svalue;
+                    if ((pb_int64_t)msg->enum_min != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 10:
+                fields_seen[0] |= (uint32_t)1 << 9;
+                {
+                    pb_uint64_t value;
+                    pb_int64_t svalue;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    svalue = (int32_t)value;
+                    msg->enum_max = (HugeEnum)svalue;
+                    if ((pb_int64_t)msg->enum_max != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            default:
+                if (!pb_skip_field(stream, wire_type))
+                    return false;
+                break;
+        }
+    }
+
+    if (fields_seen[0] != 0x3ffu)
+        PB_RETURN_ERROR(stream, "missing required field");
+
+    return true;
+}
+#endif
+
+#ifndef PB_NO_SPECIALIZED_ENCODE
+bool AllTypes_encode(pb_ostream_t *stream, const AllTypes *msg)
+{
+#ifdef PB_WITHOUT_64BIT
+    return pb_encode(stream, AllTypes_fields, msg);
+#else
+    pb_size_t i;
+
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 1))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->req_int32))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 2))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->req_int64))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 3))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)msg->req_uint32))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 4))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)msg->req_uint64))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 5))
+        return false;
+    if (!pb_encode_svarint(stream, (pb_int64_t)msg->req_sint32))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 6))
+        return false;
+    if (!pb_encode_svarint(stream, (pb_int64_t)msg->req_sint64))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 7))
+        return false;
+    if (!pb_encode_varint(stream, msg->req_bool ? 1 : 0))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_32BIT, 8))
+        return false;
+    if (!pb_encode_fixed32(stream, &msg->req_fixed32))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_32BIT, 9))
+        return false;
+    if (!pb_encode_fixed32(stream, &msg->req_sfixed32))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_32BIT, 10))
+        return false;
+    if (!pb_encode_fixed32(stream, &msg->req_float))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_64BIT, 11))
+        return false;
+    if (!pb_encode_fixed64(stream, &msg->req_fixed64))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_64BIT, 12))
+        return false;
+    if (!pb_encode_fixed64(stream, &msg->req_sfixed64))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_64BIT, 13))
+        return false;
+    if (!pb_encode_fixed64(stream, &msg->req_double))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_STRING, 14))
+        return false;
+    {
+        size_t size = 0;
+        while (size < 15 && msg->req_string[size] != '\0')
+            size++;
+        if (msg->req_string[size] != '\0')
+            PB_RETURN_ERROR(stream, "unterminated string");
+        if (!pb_encode_string(stream, (const pb_byte_t*)msg->req_string, size))
+            return false;
+    }
+    if (!pb_encode_tag(stream, PB_WT_STRING, 15))
+        return false;
+    if (PB_BYTES_ARRAY_T_ALLOCSIZE(msg->req_bytes.size) > sizeof(msg->req_bytes))
+        PB_RETURN_ERROR(stream, "bytes size exceeded");
+    if (!pb_encode_string(stream, msg->req_bytes.bytes, msg->req_bytes.size))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_STRING, 16))
+        return false;
+    {
+        pb_ostream_t substream = PB_OSTREAM_SIZING;
+        if (!SubMessage_encode(&substream, &msg->req_submsg))
+            PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+        if (!pb_encode_varint(stream, (pb_uint64_t)substream.bytes_written))
+            return false;
+        if (stream->callback == NULL)
+        {
+            /* Just sizing */
+            if (!pb_write(stream, NULL, substream.bytes_written))
+                return false;
+        }
+        else if (!SubMessage_encode(stream, &msg->req_submsg))
+        {
+            return false;
+        }
+    }
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 17))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)msg->req_enum))
+        return false;
+    if (!pb_encode_tag(stream, PB_WT_STRING, 18))
+        return false;
+    {
+        pb_ostream_t substream = PB_OSTREAM_SIZING;
+        if (!EmptyMessage_encode(&substream, &msg->req_emptymsg))
+            PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+        if (!pb_encode_varint(stream, (pb_uint64_t)substream.bytes_written))
+            return false;
+        if (stream->callback == NULL)
+        {
+            /* Just sizing */
+            if (!pb_write(stream, NULL, substream.bytes_written))
+                return false;
+        }
+        else if (!EmptyMessage_encode(stream, &msg->req_emptymsg))
+        {
+            return false;
+        }
+    }
+    if (!pb_encode_tag(stream, PB_WT_STRING, 19))
+        return false;
+    if (!pb_encode_string(stream, msg->req_fbytes, 4))
+        return false;
+    if (msg->rep_int32_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    if (msg->rep_int32_count > 0)
+    {
+        pb_ostream_t sizestream = PB_OSTREAM_SIZING;
+        if (!pb_encode_tag(stream, PB_WT_STRING, 21))
+            return false;
+        for (i = 0; i < msg->rep_int32_count; i++)
+        {
+            if (!pb_encode_varint(&sizestream, (pb_uint64_t)(pb_int64_t)msg->rep_int32[i]))
+                return false;
+        }
+        if (!pb_encode_varint(stream, (pb_uint64_t)(sizestream.bytes_written)))
+            return false;
+        for (i = 0; i < msg->rep_int32_count; i++)
+        {
+            if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->rep_int32[i]))
+                return false;
+        }
+    }
+    if (msg->rep_int64_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    if (msg->rep_int64_count > 0)
+    {
+        pb_ostream_t sizestream = PB_OSTREAM_SIZING;
+        if (!pb_encode_tag(stream, PB_WT_STRING, 22))
+            return false;
+        for (i = 0; i < msg->rep_int64_count; i++)
+        {
+            if (!pb_encode_varint(&sizestream, (pb_uint64_t)(pb_int64_t)msg->rep_int64[i]))
+                return false;
+        }
+        if (!pb_encode_varint(stream, (pb_uint64_t)(sizestream.bytes_written)))
+            return false;
+        for (i = 0; i < msg->rep_int64_count; i++)
+        {
+            if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->rep_int64[i]))
+                return false;
+        }
+    }
+    if (msg->rep_uint32_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    if (msg->rep_uint32_count > 0)
+    {
+        pb_ostream_t sizestream = PB_OSTREAM_SIZING;
+        if (!pb_encode_tag(stream, PB_WT_STRING, 23))
+            return false;
+        for (i = 0; i < msg->rep_uint32_count; i++)
+        {
+            if (!pb_encode_varint(&sizestream, (pb_uint64_t)msg->rep_uint32[i]))
+                return false;
+        }
+        if (!pb_encode_varint(stream, (pb_uint64_t)(sizestream.bytes_written)))
+            return false;
+        for (i = 0; i < msg->rep_uint32_count; i++)
+        {
+            if (!pb_encode_varint(stream, (pb_uint64_t)msg->rep_uint32[i]))
+                return false;
+        }
+    }
+    if (msg->rep_uint64_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    if (msg->rep_uint64_count > 0)
+    {
+        pb_ostream_t sizestream = PB_OSTREAM_SIZING;
+        if (!pb_encode_tag(stream, PB_WT_STRING, 24))
+            return false;
+        for (i = 0; i < msg->rep_uint64_count; i++)
+        {
+            if (!pb_encode_varint(&sizestream, (pb_uint64_t)msg->rep_uint64[i]))
+                return false;
+        }
+        if (!pb_encode_varint(stream, (pb_uint64_t)(sizestream.bytes_written)))
+            return false;
+        for (i = 0; i < msg->rep_uint64_count; i++)
+        {
+            if (!pb_encode_varint(stream, (pb_uint64_t)msg->rep_uint64[i]))
+                return false;
+        }
+    }
+    if (msg->rep_sint32_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    if (msg->rep_sint32_count > 0)
+    {
+        pb_ostream_t sizestream = PB_OSTREAM_SIZING;
+        if (!pb_encode_tag(stream, PB_WT_STRING, 25))
+            return false;
+        for (i = 0; i < msg->rep_sint32_count; i++)
+        {
+            if (!pb_encode_svarint(&sizestream, (pb_int64_t)msg->rep_sint32[i]))
+                return false;
+        }
+        if (!pb_encode_varint(stream, (pb_uint64_t)(sizestream.bytes_written)))
+            return false;
+        for (i = 0; i < msg->rep_sint32_count; i++)
+        {
+            if (!pb_encode_svarint(stream, (pb_int64_t)msg->rep_sint32[i]))
+                return false;
+        }
+    }
+    if (msg->rep_sint64_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    if (msg->rep_sint64_count > 0)
+    {
+        pb_ostream_t sizestream = PB_OSTREAM_SIZING;
+        if (!pb_encode_tag(stream, PB_WT_STRING, 26))
+            return false;
+        for (i = 0; i < msg->rep_sint64_count; i++)
+        {
+            if (!pb_encode_svarint(&sizestream, (pb_int64_t)msg->rep_sint64[i]))
+                return false;
+        }
+        if (!pb_encode_varint(stream, (pb_uint64_t)(sizestream.bytes_written)))
+            return false;
+        for (i = 0; i < msg->rep_sint64_count; i++)
+        {
+            if (!pb_encode_svarint(stream, (pb_int64_t)msg->rep_sint64[i]))
+                return false;
+        }
+    }
+    if (msg->rep_bool_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    if (msg->rep_bool_count > 0)
+    {
+        pb_ostream_t sizestream = PB_OSTREAM_SIZING;
+        if (!pb_encode_tag(stream, PB_WT_STRING, 27))
+            return false;
+        for (i = 0; i < msg->rep_bool_count; i++)
+        {
+            if (!pb_encode_varint(&sizestream, msg->rep_bool[i] ? 1 : 0))
+                return false;
+        }
+        if (!pb_encode_varint(stream, (pb_uint64_t)(sizestream.bytes_written)))
+            return false;
+        for (i = 0; i < msg->rep_bool_count; i++)
+        {
+            if (!pb_encode_varint(stream, msg->rep_bool[i] ? 1 : 0))
+                return false;
+        }
+    }
+    if (msg->rep_fixed32_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    if (msg->rep_fixed32_count > 0)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 28))
+            return false;
+        if (!pb_encode_varint(stream, (pb_uint64_t)(4 * (size_t)msg->rep_fixed32_count)))
+            return false;
+        for (i = 0; i < msg->rep_fixed32_count; i++)
+        {
+            if (!pb_encode_fixed32(stream, &msg->rep_fixed32[i]))
+                return false;
+        }
+    }
+    if (msg->rep_sfixed32_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    if (msg->rep_sfixed32_count > 0)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 29))
+            return false;
+        if (!pb_encode_varint(stream, (pb_uint64_t)(4 * (size_t)msg->rep_sfixed32_count)))
+            return false;
+        for (i = 0; i < msg->rep_sfixed32_count; i++)
+        {
+            if (!pb_encode_fixed32(stream, &msg->rep_sfixed32[i]))
+                return false;
+        }
+    }
+    if (msg->rep_float_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    if (msg->rep_float_count > 0)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 30))
+            return false;
+        if (!pb_encode_varint(stream, (pb_uint64_t)(4 * (size_t)msg->rep_float_count)))
+            return false;
+        for (i = 0; i < msg->rep_float_count; i++)
+        {
+            if (!pb_encode_fixed32(stream, &msg->rep_float[i]))
+                return false;
+        }
+    }
+    if (msg->rep_fixed64_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    if (msg->rep_fixed64_count > 0)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 31))
+            return false;
+        if (!pb_encode_varint(stream, (pb_uint64_t)(8 * (size_t)msg->rep_fixed64_count)))
+            return false;
+        for (i = 0; i < msg->rep_fixed64_count; i++)
+        {
+            if (!pb_encode_fixed64(stream, &msg->rep_fixed64[i]))
+                return false;
+        }
+    }
+    if (msg->rep_sfixed64_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    if (msg->rep_sfixed64_count > 0)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 32))
+            return false;
+        if (!pb_encode_varint(stream, (pb_uint64_t)(8 * (size_t)msg->rep_sfixed64_count)))
+            return false;
+        for (i = 0; i < msg->rep_sfixed64_count; i++)
+        {
+            if (!pb_encode_fixed64(stream, &msg->rep_sfixed64[i]))
+                return false;
+        }
+    }
+    if (msg->rep_double_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    if (msg->rep_double_count > 0)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 33))
+            return false;
+        if (!pb_encode_varint(stream, (pb_uint64_t)(8 * (size_t)msg->rep_double_count)))
+            return false;
+        for (i = 0; i < msg->rep_double_count; i++)
+        {
+            if (!pb_encode_fixed64(stream, &msg->rep_double[i]))
+                return false;
+        }
+    }
+    if (msg->rep_string_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    for (i = 0; i < msg->rep_string_count; i++)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 34))
+            return false;
+        {
+            size_t size = 0;
+            while (size < 15 && msg->rep_string[i][size] != '\0')
+                size++;
+            if (msg->rep_string[i][size] != '\0')
+                PB_RETURN_ERROR(stream, "unterminated string");
+            if (!pb_encode_string(stream, (const pb_byte_t*)msg->rep_string[i], size))
+                return false;
+        }
+    }
+    if (msg->rep_bytes_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    for (i = 0; i < msg->rep_bytes_count; i++)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 35))
+            return false;
+        if (PB_BYTES_ARRAY_T_ALLOCSIZE(msg->rep_bytes[i].size) > sizeof(msg->rep_bytes[i]))
+            PB_RETURN_ERROR(stream, "bytes size exceeded");
+        if (!pb_encode_string(stream, msg->rep_bytes[i].bytes, msg->rep_bytes[i].size))
+            return false;
+    }
+    if (msg->rep_submsg_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    for (i = 0; i < msg->rep_submsg_count; i++)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 36))
+            return false;
+        {
+            pb_ostream_t substream = PB_OSTREAM_SIZING;
+            if (!SubMessage_encode(&substream, &msg->rep_submsg[i]))
+                PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+            if (!pb_encode_varint(stream, (pb_uint64_t)substream.bytes_written))
+                return false;
+            if (stream->callback == NULL)
+            {
+                /* Just sizing */
+                if (!pb_write(stream, NULL, substream.bytes_written))
+                    return false;
+            }
+            else if (!SubMessage_encode(stream, &msg->rep_submsg[i]))
+            {
+                return false;
+            }
+        }
+    }
+    if (msg->rep_enum_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    if (msg->rep_enum_count > 0)
+    {
+        pb_ostream_t sizestream = PB_OSTREAM_SIZING;
+        if (!pb_encode_tag(stream, PB_WT_STRING, 37))
+            return false;
+        for (i = 0; i < msg->rep_enum_count; i++)
+        {
+            if (!pb_encode_varint(&sizestream, (pb_uint64_t)msg->rep_enum[i]))
+                return false;
+        }
+        if (!pb_encode_varint(stream, (pb_uint64_t)(sizestream.bytes_written)))
+            return false;
+        for (i = 0; i < msg->rep_enum_count; i++)
+        {
+            if (!pb_encode_varint(stream, (pb_uint64_t)msg->rep_enum[i]))
+                return false;
+        }
+    }
+    if (msg->rep_emptymsg_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    for (i = 0; i < msg->rep_emptymsg_count; i++)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 38))
+            return false;
+        {
+            pb_ostream_t substream = PB_OSTREAM_SIZING;
+            if (!EmptyMessage_encode(&substream, &msg->rep_emptymsg[i]))
+                PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+            if (!pb_encode_varint(stream, (pb_uint64_t)substream.bytes_written))
+                return false;
+            if (stream->callback == NULL)
+            {
+                /* Just sizing */
+                if (!pb_write(stream, NULL, substream.bytes_written))
+                    return false;
+            }
+            else if (!EmptyMessage_encode(stream, &msg->rep_emptymsg[i]))
+            {
+                return false;
+            }
+        }
+    }
+    if (msg->rep_fbytes_count > 5)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    for (i = 0; i < msg->rep_fbytes_count; i++)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 39))
+            return false;
+        if (!pb_encode_string(stream, msg->rep_fbytes[i], 4))
+            return false;
+    }
+    if (msg->has_opt_int32)
+    {
+        if (!pb_encode_tag(stream, PB_WT_VARINT, 41))
+            return false;
+        if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->opt_int32))
+            return false;
+    }
+    if (msg->has_opt_int64)
+    {
+        if (!pb_encode_tag(stream, PB_WT_VARINT, 42))
+            return false;
+        if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->opt_int64))
+            return false;
+    }
+    if (msg->has_opt_uint32)
+    {
+        if (!pb_encode_tag(stream, PB_WT_VARINT, 43))
+            return false;
+        if (!pb_encode_varint(stream, (pb_uint64_t)msg->opt_uint32))
+            return false;
+    }
+    if (msg->has_opt_uint64)
+    {
+        if (!pb_encode_tag(stream, PB_WT_VARINT, 44))
+            return false;
+        if (!pb_encode_varint(stream, (pb_uint64_t)msg->opt_uint64))
+            return false;
+    }
+    if (msg->has_opt_sint32)
+    {
+        if (!pb_encode_tag(stream, PB_WT_VARINT, 45))
+            return false;
+        if (!pb_encode_svarint(stream, (pb_int64_t)msg->opt_sint32))
+            return false;
+    }
+    if (msg->has_opt_sint64)
+    {
+        if (!pb_encode_tag(stream, PB_WT_VARINT, 46))
+            return false;
+        if (!pb_encode_svarint(stream, (pb_int64_t)msg->opt_sint64))
+            return false;
+    }
+    if (msg->has_opt_bool)
+    {
+        if (!pb_encode_tag(stream, PB_WT_VARINT, 47))
+            return false;
+        if (!pb_encode_varint(stream, msg->opt_bool ? 1 : 0))
+            return false;
+    }
+    if (msg->has_opt_fixed32)
+    {
+        if (!pb_encode_tag(stream, PB_WT_32BIT, 48))
+            return false;
+        if (!pb_encode_fixed32(stream, &msg->opt_fixed32))
+            return false;
+    }
+    if (msg->has_opt_sfixed32)
+    {
+        if (!pb_encode_tag(stream, PB_WT_32BIT, 49))
+            return false;
+        if (!pb_encode_fixed32(stream, &msg->opt_sfixed32))
+            return false;
+    }
+    if (msg->has_opt_float)
+    {
+        if (!pb_encode_tag(stream, PB_WT_32BIT, 50))
+            return false;
+        if (!pb_encode_fixed32(stream, &msg->opt_float))
+            return false;
+    }
+    if (msg->has_opt_fixed64)
+    {
+        if (!pb_encode_tag(stream, PB_WT_64BIT, 51))
+            return false;
+        if (!pb_encode_fixed64(stream, &msg->opt_fixed64))
+            return false;
+    }
+    if (msg->has_opt_sfixed64)
+    {
+        if (!pb_encode_tag(stream, PB_WT_64BIT, 52))
+            return false;
+        if (!pb_encode_fixed64(stream, &msg->opt_sfixed64))
+            return false;
+    }
+    if (msg->has_opt_double)
+    {
+        if (!pb_encode_tag(stream, PB_WT_64BIT, 53))
+            return false;
+        if (!pb_encode_fixed64(stream, &msg->opt_double))
+            return false;
+    }
+    if (msg->has_opt_string)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 54))
+            return false;
+        {
+            size_t size = 0;
+            while (size < 15 && msg->opt_string[size] != '\0')
+                size++;
+            if (msg->opt_string[size] != '\0')
+                PB_RETURN_ERROR(stream, "unterminated string");
+            if (!pb_encode_string(stream, (const pb_byte_t*)msg->opt_string, size))
+                return false;
+        }
+    }
+    if (msg->has_opt_bytes)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 55))
+            return false;
+        if (PB_BYTES_ARRAY_T_ALLOCSIZE(msg->opt_bytes.size) > sizeof(msg->opt_bytes))
+            PB_RETURN_ERROR(stream, "bytes size exceeded");
+        if (!pb_encode_string(stream, msg->opt_bytes.bytes, msg->opt_bytes.size))
+            return false;
+    }
+    if (msg->has_opt_submsg)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 56))
+            return false;
+        {
+            pb_ostream_t substream = PB_OSTREAM_SIZING;
+            if (!SubMessage_encode(&substream, &msg->opt_submsg))
+                PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+            if (!pb_encode_varint(stream, (pb_uint64_t)substream.bytes_written))
+                return false;
+            if (stream->callback == NULL)
+            {
+                /* Just sizing */
+                if (!pb_write(stream, NULL, substream.bytes_written))
+                    return false;
+            }
+            else if (!SubMessage_encode(stream, &msg->opt_submsg))
+            {
+                return false;
+            }
+        }
+    }
+    if (msg->has_opt_enum)
+    {
+        if (!pb_encode_tag(stream, PB_WT_VARINT, 57))
+            return false;
+        if (!pb_encode_varint(stream, (pb_uint64_t)msg->opt_enum))
+            return false;
+    }
+    if (msg->has_opt_emptymsg)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 58))
+            return false;
+        {
+            pb_ostream_t substream = PB_OSTREAM_SIZING;
+            if (!EmptyMessage_encode(&substream, &msg->opt_emptymsg))
+                PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+            if (!pb_encode_varint(stream, (pb_uint64_t)substream.bytes_written))
+                return false;
+            if (stream->callback == NULL)
+            {
+                /* Just sizing */
+                if (!pb_write(stream, NULL, substream.bytes_written))
+                    return false;
+            }
+            else if (!EmptyMessage_encode(stream, &msg->opt_emptymsg))
+            {
+                return false;
+            }
+        }
+    }
+    if (msg->has_opt_fbytes)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 59))
+            return false;
+        if (!pb_encode_string(stream, msg->opt_fbytes, 4))
+            return false;
+    }
+    switch (msg->which_oneof)
+    {
+        case 60:
+            if (!pb_encode_tag(stream, PB_WT_STRING, 60))
+                return false;
+            {
+                pb_ostream_t substream = PB_OSTREAM_SIZING;
+                if (!SubMessage_encode(&substream, &msg->oneof.oneof_msg1))
+                    PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                if (!pb_encode_varint(stream, (pb_uint64_t)substream.bytes_written))
+                    return false;
+                if (stream->callback == NULL)
+                {
+                    /* Just sizing */
+                    if (!pb_write(stream, NULL, substream.bytes_written))
+                        return false;
+                }
+                else if (!SubMessage_encode(stream, &msg->oneof.oneof_msg1))
+                {
+                    return false;
+                }
+            }
+            break;
+        case 61:
+            if (!pb_encode_tag(stream, PB_WT_STRING, 61))
+                return false;
+            {
+                pb_ostream_t substream = PB_OSTREAM_SIZING;
+                if (!EmptyMessage_encode(&substream, &msg->oneof.oneof_msg2))
+                    PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                if (!pb_encode_varint(stream, (pb_uint64_t)substream.bytes_written))
+                    return false;
+                if (stream->callback == NULL)
+                {
+                    /* Just sizing */
+                    if (!pb_write(stream, NULL, substream.bytes_written))
+                        return false;
+                }
+                else if (!EmptyMessage_encode(stream, &msg->oneof.oneof_msg2))
+                {
+                    return false;
+                }
+            }
+            break;
+    }
+    if (!pb_encode_tag(stream, PB_WT_STRING, 98))
+        return false;
+    {
+        pb_ostream_t substream = PB_OSTREAM_SIZING;
+        if (!Limits_encode(&substream, &msg->req_limits))
+            PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+        if (!pb_encode_varint(stream, (pb_uint64_t)substream.bytes_written))
+            return false;
+        if (stream->callback == NULL)
+        {
+            /* Just sizing */
+            if (!pb_write(stream, NULL, substream.bytes_written))
+                return false;
+        }
+        else if (!Limits_encode(stream, &msg->req_limits))
+        {
+            return false;
+        }
+    }
+    if (!pb_encode_tag(stream, PB_WT_VARINT, 99))
+        return false;
+    if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->end))
+        return false;
+    return true;
+#endif
+}
+#endif
+
+#ifndef PB_NO_SPECIALIZED_DECODE
+bool AllTypes_decode(pb_istream_t *stream, AllTypes *msg)
+{
+    memset(msg, 0, sizeof(AllTypes));
+    {
+        static const SubMessage init = SubMessage_init_default;
+        memcpy(&msg->req_submsg, &init, sizeof(init));
+    }
+    msg->opt_int32 = 4041;
+    msg->opt_int64 = 4042ll;
+    msg->opt_uint32 = 4043u;
+    msg->opt_uint64 = 4044ull;
+    msg->opt_sint32 = 4045;
+    msg->opt_sint64 = 4046;
+    msg->opt_fixed32 = 4048u;
+    msg->opt_sfixed32 = 4049;
+    msg->opt_float = 4050;
+    msg->opt_fixed64 = 4051ull;
+    msg->opt_sfixed64 = 4052ll;
+    msg->opt_double = 4053;
+    {
+        static const char init[16] = "4054";
+        memcpy(&msg->opt_string, &init, sizeof(init));
+    }
+    {
+        static const AllTypes_opt_bytes_t init = {4, {0x34,0x5c,0x00,0xff}};
+        memcpy(&msg->opt_bytes, &init, sizeof(init));
+    }
+    {
+        static const SubMessage init = SubMessage_init_default;
+        memcpy(&msg->opt_submsg, &init, sizeof(init));
+    }
+    msg->opt_enum = MyEnum_Second;
+    {
+        static const pb_byte_t init[4] = {0x34,0x30,0x35,0x39};
+        memcpy(&msg->opt_fbytes, &init, sizeof(init));
+    }
+    {
+        static const Limits init = Limits_init_default;
+        memcpy(&msg->req_limits, &init, sizeof(init));
+    }
+    return AllTypes_decode_noinit(stream, msg);
+}
+
+bool AllTypes_decode_noinit(pb_istream_t *stream, AllTypes *msg)
+{
+    uint32_t fields_seen[1] = {0};
+
+    while (stream->bytes_left)
+    {
+        uint32_t tag;
+        pb_wire_type_t wire_type;
+        bool eof;
+
+        if (!pb_decode_tag(stream, &wire_type, &tag, &eof))
+        {
+            if (eof)
+                break;
+            else
+                return false;
+        }
+
+        switch (tag)
+        {
+            case 0:
+                PB_RETURN_ERROR(stream, "zero tag");
+
+            case 60:
+                msg->which_oneof = 60;
+                {
+                    pb_istream_t substream;
+                    bool status;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    status = SubMessage_decode(&substream, &msg->oneof.oneof_msg1);
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                    if (!status)
+                        return false;
+                }
+                break;
+
+            case 61:
+                msg->which_oneof = 61;
+                {
+                    pb_istream_t substream;
+                    bool status;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    status = EmptyMessage_decode(&substream, &msg->oneof.oneof_msg2);
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                    if (!status)
+                        return false;
+                }
+                break;
+
+            case 1:
+                fields_seen[0] |= (uint32_t)1 << 0;
+                {
+                    pb_uint64_t value;
+                    pb_int64_t svalue;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    svalue = (int32_t)value;
+                    msg->req_int32 = (int32_t)svalue;
+                    if ((pb_int64_t)msg->req_int32 != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 2:
+                fields_seen[0] |= (uint32_t)1 << 1;
+                {
+                    pb_uint64_t value;
+                    pb_int64_t svalue;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    svalue = (pb_int64_t)value;
+                    msg->req_int64 = (int64_t)svalue;
+                    if ((pb_int64_t)msg->req_int64 != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 3:
+                fields_seen[0] |= (uint32_t)1 << 2;
+                {
+                    pb_uint64_t value;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    msg->req_uint32 = (uint32_t)value;
+                    if ((pb_uint64_t)msg->req_uint32 != value)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 4:
+                fields_seen[0] |= (uint32_t)1 << 3;
+                {
+                    pb_uint64_t value;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    msg->req_uint64 = (uint64_t)value;
+                    if ((pb_uint64_t)msg->req_uint64 != value)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 5:
+                fields_seen[0] |= (uint32_t)1 << 4;
+                {
+                    pb_int64_t svalue;
+                    if (!pb_decode_svarint(stream, &svalue))
+                        return false;
+                    msg->req_sint32 = (int32_t)svalue;
+                    if ((pb_int64_t)msg->req_sint32 != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 6:
+                fields_seen[0] |= (uint32_t)1 << 5;
+                {
+                    pb_int64_t svalue;
+                    if (!pb_decode_svarint(stream, &svalue))
+                        return false;
+                    msg->req_sint64 = (int64_t)svalue;
+                    if ((pb_int64_t)msg->req_sint64 != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 7:
+                fields_seen[0] |= (uint32_t)1 << 6;
+                {
+                    pb_uint64_t value;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    msg->req_bool = (value != 0);
+                }
+                break;
+
+            case 8:
+                fields_seen[0] |= (uint32_t)1 << 7;
+                if (!pb_decode_fixed32(stream, &msg->req_fixed32))
+                    return false;
+                break;
+
+            case 9:
+                fields_seen[0] |= (uint32_t)1 << 8;
+                if (!pb_decode_fixed32(stream, &msg->req_sfixed32))
+                    return false;
+                break;
+
+            case 10:
+                fields_seen[0] |= (uint32_t)1 << 9;
+                if (!pb_decode_fixed32(stream, &msg->req_float))
+                    return false;
+                break;
+
+            case 11:
+                fields_seen[0] |= (uint32_t)1 << 10;
+                if (!pb_decode_fixed64(stream, &msg->req_fixed64))
+                    return false;
+                break;
+
+            case 12:
+                fields_seen[0] |= (uint32_t)1 << 11;
+                if (!pb_decode_fixed64(stream, &msg->req_sfixed64))
+                    return false;
+                break;
+
+            case 13:
+                fields_seen[0] |= (uint32_t)1 << 12;
+                if (!pb_decode_fixed64(stream, &msg->req_double))
+                    return false;
+                break;
+
+            case 14:
+                fields_seen[0] |= (uint32_t)1 << 13;
+                {
+                    uint32_t size;
+                    if (!pb_decode_varint32(stream, &size))
+                        return false;
+                    if (size >= 16)
+                        PB_RETURN_ERROR(stream, "string overflow");
+                    msg->req_string[size] = '\0';
+                    if (!pb_read(stream, (pb_byte_t*)msg->req_string, size))
+                        return false;
+                }
+                break;
+
+            case 15:
+                fields_seen[0] |= (uint32_t)1 << 14;
+                {
+                    uint32_t size;
+                    if (!pb_decode_varint32(stream, &size))
+                        return false;
+                    if (size > PB_SIZE_MAX || PB_BYTES_ARRAY_T_ALLOCSIZE(size) > sizeof(msg->req_bytes))
+                        PB_RETURN_ERROR(stream, "bytes overflow");
+                    msg->req_bytes.size = (pb_size_t)size;
+                    if (!pb_read(stream, msg->req_bytes.bytes, size))
+                        return false;
+                }
+                break;
+
+            case 16:
+                fields_seen[0] |= (uint32_t)1 << 15;
+                {
+                    pb_istream_t substream;
+                    bool status;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    status = SubMessage_decode_noinit(&substream, &msg->req_submsg);
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                    if (!status)
+                        return false;
+                }
+                break;
+
+            case 17:
+                fields_seen[0] |= (uint32_t)1 << 16;
+                {
+                    pb_uint64_t value;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    msg->req_enum = (MyEnum)value;
+                    if ((pb_uint64_t)msg->req_enum != value)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 18:
+                fields_seen[0] |= (uint32_t)1 << 17;
+                {
+                    pb_istream_t substream;
+                    bool status;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    status = EmptyMessage_decode_noinit(&substream, &msg->req_emptymsg);
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                    if (!status)
+                        return false;
+                }
+                break;
+
+            case 19:
+                fields_seen[0] |= (uint32_t)1 << 18;
+                {
+                    uint32_t size;
+                    if (!pb_decode_varint32(stream, &size))
+                        return false;
+                    if (size == 0)
+                    {
+                        memset(msg->req_fbytes, 0, 4);
+                    }
+                    else
+                    {
+                        if (size != 4)
+                            PB_RETURN_ERROR(stream, "incorrect fixed length bytes size");
+                        if (!pb_read(stream, msg->req_fbytes, 4))
+                            return false;
+                    }
+                }
+                break;
+
+            case 21:
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && msg->rep_int32_count < 5)
+                    {
+                        {
+                            pb_uint64_t value;
+                            pb_int64_t svalue;
+                            if (!pb_decode_varint(&substream, &value))
+                            {
+                                status = false;
+                                break;
+                            }
+                            svalue = (int32_t)value;
+                            msg->rep_int32[msg->rep_int32_count] = (int32_t)svalue;
+                            if ((pb_int64_t)msg->rep_int32[msg->rep_int32_count] != svalue)
+                            {
+                                PB_SET_ERROR(stream, "integer too large");
+                                status = false;
+                                break;
+                            }
+                        }
+                        msg->rep_int32_count++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (msg->rep_int32_count >= 5)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    {
+                        pb_uint64_t value;
+                        pb_int64_t svalue;
+                        if (!pb_decode_varint(stream, &value))
+                            return false;
+                        svalue = (int32_t)value;
+                        msg->rep_int32[msg->rep_int32_count] = (int32_t)svalue;
+                        if ((pb_int64_t)msg->rep_int32[msg->rep_int32_count] != svalue)
+                            PB_RETURN_ERROR(stream, "integer too large");
+                    }
+                    msg->rep_int32_count++;
+                }
+                break;
+
+            case 22:
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && msg->rep_int64_count < 5)
+                    {
+                        {
+                            pb_uint64_t value;
+                            pb_int64_t svalue;
+                            if (!pb_decode_varint(&substream, &value))
+                            {
+                                status = false;
+                                break;
+                            }
+                            svalue = (pb_int64_t)value;
+                            msg->rep_int64[msg->rep_int64_count] = (int64_t)svalue;
+                            if ((pb_int64_t)msg->rep_int64[msg->rep_int64_count] != svalue)
+                            {
+                                PB_SET_ERROR(stream, "integer too large");
+                                status = false;
+                                break;
+                            }
+                        }
+                        msg->rep_int64_count++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (msg->rep_int64_count >= 5)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    {
+                        pb_uint64_t value;
+                        pb_int64_t svalue;
+                        if (!pb_decode_varint(stream, &value))
+                            return false;
+                        svalue = (pb_int64_t)value;
+                        msg->rep_int64[msg->rep_int64_count] = (int64_t)svalue;
+                        if ((pb_int64_t)msg->rep_int64[msg->rep_int64_count] != svalue)
+                            PB_RETURN_ERROR(stream, "integer too large");
+                    }
+                    msg->rep_int64_count++;
+                }
+                break;
+
+            case 23:
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && msg->rep_uint32_count < 5)
+                    {
+                        {
+                            pb_uint64_t value;
+                            if (!pb_decode_varint(&substream, &value))
+                            {
+                                status = false;
+                                break;
+                            }
+                            msg->rep_uint32[msg->rep_uint32_count] = (uint32_t)value;
+                            if ((pb_uint64_t)msg->rep_uint32[msg->rep_uint32_count] != value)
+                            {
+                                PB_SET_ERROR(stream, "integer too large");
+                                status = false;
+                                break;
+                            }
+                        }
+                        msg->rep_uint32_count++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (msg->rep_uint32_count >= 5)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    {
+                        pb_uint64_t value;
+                        if (!pb_decode_varint(stream, &value))
+                            return false;
+                        msg->rep_uint32[msg->rep_uint32_count] = (uint32_t)value;
+                        if ((pb_uint64_t)msg->rep_uint32[msg->rep_uint32_count] != value)
+                            PB_RETURN_ERROR(stream, "integer too large");
+                    }
+                    msg->rep_uint32_count++;
+                }
+                break;
+
+            case 24:
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && msg->rep_uint64_count < 5)
+                    {
+                        {
+                            pb_uint64_t value;
+                            if (!pb_decode_varint(&substream, &value))
+                            {
+                                status = false;
+                                break;
+                            }
+                            msg->rep_uint64[msg->rep_uint64_count] = (uint64_t)value;
+                            if ((pb_uint64_t)msg->rep_uint64[msg->rep_uint64_count] != value)
+                            {
+                                PB_SET_ERROR(stream, "integer too large");
+                                status = false;
+                                break;
+                            }
+                        }
+                        msg->rep_uint64_count++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (msg->rep_uint64_count >= 5)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    {
+                        pb_uint64_t value;
+                        if (!pb_decode_varint(stream, &value))
+                            return false;
+                        msg->rep_uint64[msg->rep_uint64_count] = (uint64_t)value;
+                        if ((pb_uint64_t)msg->rep_uint64[msg->rep_uint64_count] != value)
+                            PB_RETURN_ERROR(stream, "integer too large");
+                    }
+                    msg->rep_uint64_count++;
+                }
+                break;
+
+            case 25:
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && msg->rep_sint32_count < 5)
+                    {
+                        {
+                            pb_int64_t svalue;
+                            if (!pb_decode_svarint(&substream, &svalue))
+                            {
+                                status = false;
+                                break;
+                            }
+                            msg->rep_sint32[msg->rep_sint32_count] = (int32_t)svalue;
+                            if ((pb_int64_t)msg->rep_sint32[msg->rep_sint32_count] != svalue)
+                            {
+                                PB_SET_ERROR(stream, "integer too large");
+                                status = false;
+                                break;
+                            }
+                        }
+                        msg->rep_sint32_count++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (msg->rep_sint32_count >= 5)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    {
+                        pb_int64_t svalue;
+                        if (!pb_decode_svarint(stream, &svalue))
+                            return false;
+                        msg->rep_sint32[msg->rep_sint32_count] = (int32_t)svalue;
+                        if ((pb_int64_t)msg->rep_sint32[msg->rep_sint32_count] != svalue)
+                            PB_RETURN_ERROR(stream, "integer too large");
+                    }
+                    msg->rep_sint32_count++;
+                }
+                break;
+
+            case 26:
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && msg->rep_sint64_count < 5)
+                    {
+                        {
+                            pb_int64_t svalue;
+                            if (!pb_decode_svarint(&substream, &svalue))
+                            {
+                                status = false;
+                                break;
+                            }
+                            msg->rep_sint64[msg->rep_sint64_count] = (int64_t)svalue;
+                            if ((pb_int64_t)msg->rep_sint64[msg->rep_sint64_count] != svalue)
+                            {
+                                PB_SET_ERROR(stream, "integer too large");
+                                status = false;
+                                break;
+                            }
+                        }
+                        msg->rep_sint64_count++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (msg->rep_sint64_count >= 5)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    {
+                        pb_int64_t svalue;
+                        if (!pb_decode_svarint(stream, &svalue))
+                            return false;
+                        msg->rep_sint64[msg->rep_sint64_count] = (int64_t)svalue;
+                        if ((pb_int64_t)msg->rep_sint64[msg->rep_sint64_count] != svalue)
+                            PB_RETURN_ERROR(stream, "integer too large");
+                    }
+                    msg->rep_sint64_count++;
+                }
+                break;
+
+            case 27:
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && msg->rep_bool_count < 5)
+                    {
+                        {
+                            pb_uint64_t value;
+                            if (!pb_decode_varint(&substream, &value))
+                            {
+                                status = false;
+                                break;
+                            }
+                            msg->rep_bool[msg->rep_bool_count] = (value != 0);
+                        }
+                        msg->rep_bool_count++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (msg->rep_bool_count >= 5)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    {
+                        pb_uint64_t value;
+                        if (!pb_decode_varint(stream, &value))
+                            return false;
+                        msg->rep_bool[msg->rep_bool_count] = (value != 0);
+                    }
+                    msg->rep_bool_count++;
+                }
+                break;
+
+            case 28:
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && msg->rep_fixed32_count < 5)
+                    {
+                        if (!pb_decode_fixed32(&substream, &msg->rep_fixed32[msg->rep_fixed32_count]))
+                        {
+                            status = false;
+                            break;
+                        }
+                        msg->rep_fixed32_count++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (msg->rep_fixed32_count >= 5)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_decode_fixed32(stream, &msg->rep_fixed32[msg->rep_fixed32_count]))
+                        return false;
+                    msg->rep_fixed32_count++;
+                }
+                break;
+
+            case 29:
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && msg->rep_sfixed32_count < 5)
+                    {
+                        if (!pb_decode_fixed32(&substream, &msg->rep_sfixed32[msg->rep_sfixed32_count]))
+                        {
+                            status = false;
+                            break;
+                        }
+                        msg->rep_sfixed32_count++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (msg->rep_sfixed32_count >= 5)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_decode_fixed32(stream, &msg->rep_sfixed32[msg->rep_sfixed32_count]))
+                        return false;
+                    msg->rep_sfixed32_count++;
+                }
+                break;
+
+            case 30:
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && msg->rep_float_count < 5)
+                    {
+                        if (!pb_decode_fixed32(&substream, &msg->rep_float[msg->rep_float_count]))
+                        {
+                            status = false;
+                            break;
+                        }
+                        msg->rep_float_count++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (msg->rep_float_count >= 5)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_decode_fixed32(stream, &msg->rep_float[msg->rep_float_count]))
+                        return false;
+                    msg->rep_float_count++;
+                }
+                break;
+
+            case 31:
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && msg->rep_fixed64_count < 5)
+                    {
+                        if (!pb_decode_fixed64(&substream, &msg->rep_fixed64[msg->rep_fixed64_count]))
+                        {
+                            status = false;
+                            break;
+                        }
+                        msg->rep_fixed64_count++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (msg->rep_fixed64_count >= 5)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_decode_fixed64(stream, &msg->rep_fixed64[msg->rep_fixed64_count]))
+                        return false;
+                    msg->rep_fixed64_count++;
+                }
+                break;
+
+            case 32:
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && msg->rep_sfixed64_count < 5)
+                    {
+                        if (!pb_decode_fixed64(&substream, &msg->rep_sfixed64[msg->rep_sfixed64_count]))
+                        {
+                            status = false;
+                            break;
+                        }
+                        msg->rep_sfixed64_count++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (msg->rep_sfixed64_count >= 5)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_decode_fixed64(stream, &msg->rep_sfixed64[msg->rep_sfixed64_count]))
+                        return false;
+                    msg->rep_sfixed64_count++;
+                }
+                break;
+
+            case 33:
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && msg->rep_double_count < 5)
+                    {
+                        if (!pb_decode_fixed64(&substream, &msg->rep_double[msg->rep_double_count]))
+                        {
+                            status = false;
+                            break;
+                        }
+                        msg->rep_double_count++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (msg->rep_double_count >= 5)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_decode_fixed64(stream, &msg->rep_double[msg->rep_double_count]))
+                        return false;
+                    msg->rep_double_count++;
+                }
+                break;
+
+            case 34:
+                if (msg->rep_string_count >= 5)
+                    PB_RETURN_ERROR(stream, "array overflow");
+                {
+                    uint32_t size;
+                    if (!pb_decode_varint32(stream, &size))
+                        return false;
+                    if (size >= 16)
+                        PB_RETURN_ERROR(stream, "string overflow");
+                    msg->rep_string[msg->rep_string_count][size] = '\0';
+                    if (!pb_read(stream, (pb_byte_t*)msg->rep_string[msg->rep_string_count], size))
+                        return false;
+                }
+                msg->rep_string_count++;
+                break;
+
+            case 35:
+                if (msg->rep_bytes_count >= 5)
+                    PB_RETURN_ERROR(stream, "array overflow");
+                {
+                    uint32_t size;
+                    if (!pb_decode_varint32(stream, &size))
+                        return false;
+                    if (size > PB_SIZE_MAX || PB_BYTES_ARRAY_T_ALLOCSIZE(size) > sizeof(msg->rep_bytes[msg->rep_bytes_count]))
+                        PB_RETURN_ERROR(stream, "bytes overflow");
+                    msg->rep_bytes[msg->rep_bytes_count].size = (pb_size_t)size;
+                    if (!pb_read(stream, msg->rep_bytes[msg->rep_bytes_count].bytes, size))
+                        return false;
+                }
+                msg->rep_bytes_count++;
+                break;
+
+            case 36:
+                if (msg->rep_submsg_count >= 5)
+                    PB_RETURN_ERROR(stream, "array overflow");
+                {
+                    pb_istream_t substream;
+                    bool status;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    status = SubMessage_decode(&substream, &msg->rep_submsg[msg->rep_submsg_count]);
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                    if (!status)
+                        return false;
+                }
+                msg->rep_submsg_count++;
+                break;
+
+            case 37:
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && msg->rep_enum_count < 5)
+                    {
+                        {
+                            pb_uint64_t value;
+                            if (!pb_decode_varint(&substream, &value))
+                            {
+                                status = false;
+                                break;
+                            }
+                            msg->rep_enum[msg->rep_enum_count] = (MyEnum)value;
+                            if ((pb_uint64_t)msg->rep_enum[msg->rep_enum_count] != value)
+                            {
+                                PB_SET_ERROR(stream, "integer too large");
+                                status = false;
+                                break;
+                            }
+                        }
+                        msg->rep_enum_count++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (msg->rep_enum_count >= 5)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    {
+                        pb_uint64_t value;
+                        if (!pb_decode_varint(stream, &value))
+                            return false;
+                        msg->rep_enum[msg->rep_enum_count] = (MyEnum)value;
+                        if ((pb_uint64_t)msg->rep_enum[msg->rep_enum_count] != value)
+                            PB_RETURN_ERROR(stream, "integer too large");
+                    }
+                    msg->rep_enum_count++;
+                }
+                break;
+
+            case 38:
+                if (msg->rep_emptymsg_count >= 5)
+                    PB_RETURN_ERROR(stream, "array overflow");
+                {
+                    pb_istream_t substream;
+                    bool status;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    status = EmptyMessage_decode(&substream, &msg->rep_emptymsg[msg->rep_emptymsg_count]);
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                    if (!status)
+                        return false;
+                }
+                msg->rep_emptymsg_count++;
+                break;
+
+            case 39:
+                if (msg->rep_fbytes_count >= 5)
+                    PB_RETURN_ERROR(stream, "array overflow");
+                {
+                    uint32_t size;
+                    if (!pb_decode_varint32(stream, &size))
+                        return false;
+                    if (size == 0)
+                    {
+                        memset(msg->rep_fbytes[msg->rep_fbytes_count], 0, 4);
+                    }
+                    else
+                    {
+                        if (size != 4)
+                            PB_RETURN_ERROR(stream, "incorrect fixed length bytes size");
+                        if (!pb_read(stream, msg->rep_fbytes[msg->rep_fbytes_count], 4))
+                            return false;
+                    }
+                }
+                msg->rep_fbytes_count++;
+                break;
+
+            case 41:
+                msg->has_opt_int32 = true;
+                {
+                    pb_uint64_t value;
+                    pb_int64_t svalue;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    svalue = (int32_t)value;
+                    msg->opt_int32 = (int32_t)svalue;
+                    if ((pb_int64_t)msg->opt_int32 != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 42:
+                msg->has_opt_int64 = true;
+                {
+                    pb_uint64_t value;
+                    pb_int64_t svalue;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    svalue = (pb_int64_t)value;
+                    msg->opt_int64 = (int64_t)svalue;
+                    if ((pb_int64_t)msg->opt_int64 != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 43:
+                msg->has_opt_uint32 = true;
+                {
+                    pb_uint64_t value;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    msg->opt_uint32 = (uint32_t)value;
+                    if ((pb_uint64_t)msg->opt_uint32 != value)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 44:
+                msg->has_opt_uint64 = true;
+                {
+                    pb_uint64_t value;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    msg->opt_uint64 = (uint64_t)value;
+                    if ((pb_uint64_t)msg->opt_uint64 != value)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 45:
+                msg->has_opt_sint32 = true;
+                {
+                    pb_int64_t svalue;
+                    if (!pb_decode_svarint(stream, &svalue))
+                        return false;
+                    msg->opt_sint32 = (int32_t)svalue;
+                    if ((pb_int64_t)msg->opt_sint32 != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 46:
+                msg->has_opt_sint64 = true;
+                {
+                    pb_int64_t svalue;
+                    if (!pb_decode_svarint(stream, &svalue))
+                        return false;
+                    msg->opt_sint64 = (int64_t)svalue;
+                    if ((pb_int64_t)msg->opt_sint64 != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 47:
+                msg->has_opt_bool = true;
+                {
+                    pb_uint64_t value;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    msg->opt_bool = (value != 0);
+                }
+                break;
+
+            case 48:
+                msg->has_opt_fixed32 = true;
+                if (!pb_decode_fixed32(stream, &msg->opt_fixed32))
+                    return false;
+                break;
+
+            case 49:
+                msg->has_opt_sfixed32 = true;
+                if (!pb_decode_fixed32(stream, &msg->opt_sfixed32))
+                    return false;
+                break;
+
+            case 50:
+                msg->has_opt_float = true;
+                if (!pb_decode_fixed32(stream, &msg->opt_float))
+                    return false;
+                break;
+
+            case 51:
+                msg->has_opt_fixed64 = true;
+                if (!pb_decode_fixed64(stream, &msg->opt_fixed64))
+                    return false;
+                break;
+
+            case 52:
+                msg->has_opt_sfixed64 = true;
+                if (!pb_decode_fixed64(stream, &msg->opt_sfixed64))
+                    return false;
+                break;
+
+            case 53:
+                msg->has_opt_double = true;
+                if (!pb_decode_fixed64(stream, &msg->opt_double))
+                    return false;
+                break;
+
+            case 54:
+                msg->has_opt_string = true;
+                {
+                    uint32_t size;
+                    if (!pb_decode_varint32(stream, &size))
+                        return false;
+                    if (size >= 16)
+                        PB_RETURN_ERROR(stream, "string overflow");
+                    msg->opt_string[size] = '\0';
+                    if (!pb_read(stream, (pb_byte_t*)msg->opt_string, size))
+                        return false;
+                }
+                break;
+
+            case 55:
+                msg->has_opt_bytes = true;
+                {
+                    uint32_t size;
+                    if (!pb_decode_varint32(stream, &size))
+                        return false;
+                    if (size > PB_SIZE_MAX || PB_BYTES_ARRAY_T_ALLOCSIZE(size) > sizeof(msg->opt_bytes))
+                        PB_RETURN_ERROR(stream, "bytes overflow");
+                    msg->opt_bytes.size = (pb_size_t)size;
+                    if (!pb_read(stream, msg->opt_bytes.bytes, size))
+                        return false;
+                }
+                break;
+
+            case 56:
+                msg->has_opt_submsg = true;
+                {
+                    pb_istream_t substream;
+                    bool status;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    status = SubMessage_decode_noinit(&substream, &msg->opt_submsg);
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                    if (!status)
+                        return false;
+                }
+                break;
+
+            case 57:
+                msg->has_opt_enum = true;
+                {
+                    pb_uint64_t value;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    msg->opt_enum = (MyEnum)value;
+                    if ((pb_uint64_t)msg->opt_enum != value)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 58:
+                msg->has_opt_emptymsg = true;
+                {
+                    pb_istream_t substream;
+                    bool status;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    status = EmptyMessage_decode_noinit(&substream, &msg->opt_emptymsg);
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                    if (!status)
+                        return false;
+                }
+                break;
+
+            case 59:
+                msg->has_opt_fbytes = true;
+                {
+                    uint32_t size;
+                    if (!pb_decode_varint32(stream, &size))
+                        return false;
+                    if (size == 0)
+                    {
+                        memset(msg->opt_fbytes, 0, 4);
+                    }
+                    else
+                    {
+                        if (size != 4)
+                            PB_RETURN_ERROR(stream, "incorrect fixed length bytes size");
+                        if (!pb_read(stream, msg->opt_fbytes, 4))
+                            return false;
+                    }
+                }
+                break;
+
+            case 98:
+                fields_seen[0] |= (uint32_t)1 << 19;
+                {
+                    pb_istream_t substream;
+                    bool status;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    status = Limits_decode_noinit(&substream, &msg->req_limits);
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                    if (!status)
+                        return false;
+                }
+                break;
+
+            case 99:
+                fields_seen[0] |= (uint32_t)1 << 20;
+                {
+                    pb_uint64_t value;
+                    pb_int64_t svalue;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    svalue = (int32_t)value;
+                    msg->end = (int32_t)svalue;
+                    if ((pb_int64_t)msg->end != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            default:
+                if (!pb_skip_field(stream, wire_type))
+                    return false;
+                break;
+        }
+    }
+
+    if (fields_seen[0] != 0x1fffffu)
+        PB_RETURN_ERROR(stream, "missing required field");
+
+    return true;
+}
+#endif
+
+
+
+
+/* On some platforms (such as AVR), double is really float.
+ * Using double on these platforms is not directly supported
+ * by nanopb, but see example_avr_double.
+ * To get rid of this error, remove any double fields from your .proto.
+ */
+PB_STATIC_ASSERT(sizeof(double) == 8, DOUBLE_MUST_BE_8_BYTES)
+
+/* @@protoc_insertion_point(eof) */
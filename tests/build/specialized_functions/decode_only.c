@@ -0,0 +1,31 @@
+/* Decode the output of encode_alltypes with the specialized decoder, in a
+ * program that is not linked with pb_encode.c. */
+
+#include <stdio.h>
+#include <pb_decode.h>
+#include "alltypes.pb.h"
+#include "test_helpers.h"
+#include "unittests.h"
+
+int main()
+{
+    int status = 0;
+    uint8_t input[1024];
+    size_t input_len;
+    AllTypes msg;
+    pb_istream_t stream;
+
+    SET_BINARY_MODE(stdin);
+    input_len = fread(input, 1, sizeof(input), stdin);
+
+    stream = pb_istream_from_buffer(input, input_len);
+    TEST(AllTypes_decode(&stream, &msg));
+    TEST(msg.req_int32 == -1001);
+    TEST(msg.rep_int32_count == 5 && msg.rep_int32[4] == -2001);
+    TEST(msg.end == 1099);
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,618 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "specialized.pb.h"
+#include <pb_encode.h>
+#include <pb_decode.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Point, Point, AUTO)
+
+
+PB_BIND(Sample, Sample, AUTO)
+
+
+PB_BIND(WithCallback, WithCallback, AUTO)
+
+
+PB_BIND(Container, Container, AUTO)
+
+
+#ifdef PB_WITHOUT_64BIT
+#define pb_int64_t int32_t
+#define pb_uint64_t uint32_t
+#else
+#define pb_int64_t int64_t
+#define pb_uint64_t uint64_t
+#endif
+
+#ifndef PB_NO_SPECIALIZED_ENCODE
+bool Point_encode(pb_ostream_t *stream, const Point *msg)
+{
+    if (memcmp(&msg->x, "\0\0\0\0\0\0\0", sizeof(msg->x)) != 0)
+    {
+        if (!pb_encode_tag(stream, PB_WT_32BIT, 1))
+            return false;
+        if (!pb_encode_fixed32(stream, &msg->x))
+            return false;
+    }
+    if (memcmp(&msg->y, "\0\0\0\0\0\0\0", sizeof(msg->y)) != 0)
+    {
+        if (!pb_encode_tag(stream, PB_WT_64BIT, 2))
+            return false;
+        if (!pb_encode_fixed64(stream, &msg->y))
+            return false;
+    }
+    if (msg->z != 0)
+    {
+        if (!pb_encode_tag(stream, PB_WT_VARINT, 3))
+            return false;
+        if (!pb_encode_svarint(stream, (pb_int64_t)msg->z))
+            return false;
+    }
+    return true;
+}
+#endif
+
+#ifndef PB_NO_SPECIALIZED_DECODE
+bool Point_decode(pb_istream_t *stream, Point *msg)
+{
+    memset(msg, 0, sizeof(Point));
+    return Point_decode_noinit(stream, msg);
+}
+
+bool Point_decode_noinit(pb_istream_t *stream, Point *msg)
+{
+    while (stream->bytes_left)
+    {
+        uint32_t tag;
+        pb_wire_type_t wire_type;
+        bool eof;
+
+        if (!pb_decode_tag(stream, &wire_type, &tag, &eof))
+        {
+            if (eof)
+                break;
+            else
+                return false;
+        }
+
+        switch (tag)
+        {
+            case 0:
+                PB_RETURN_ERROR(stream, "zero tag");
+
+            case 1:
+                if (!pb_decode_fixed32(stream, &msg->x))
+                    return false;
+                break;
+
+            case 2:
+                if (!pb_decode_fixed64(stream, &msg->y))
+                    return false;
+                break;
+
+            case 3:
+                {
+                    pb_int64_t svalue;
+                    if (!pb_decode_svarint(stream, &svalue))
+                        return false;
+                    msg->z = (int32_t)svalue;
+                    if ((pb_int64_t)msg->z != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            default:
+                if (!pb_skip_field(stream, wire_type))
+                    return false;
+                break;
+        }
+    }
+
+    return true;
+}
+#endif
+
+#ifndef PB_NO_SPECIALIZED_ENCODE
+bool Sample_encode(pb_ostream_t *stream, const Sample *msg)
+{
+#ifdef PB_WITHOUT_64BIT
+    return pb_encode(stream, Sample_fields, msg);
+#else
+    pb_size_t i;
+
+    if (msg->id != 0)
+    {
+        if (!pb_encode_tag(stream, PB_WT_VARINT, 1))
+            return false;
+        if (!pb_encode_varint(stream, (pb_uint64_t)msg->id))
+            return false;
+    }
+    if ((memcmp(&msg->position.x, "\0\0\0\0\0\0\0", sizeof(msg->position.x)) != 0 || memcmp(&msg->position.y, "\0\0\0\0\0\0\0", sizeof(msg->position.y)) != 0 || msg->position.z != 0))
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 2))
+            return false;
+        {
+            pb_ostream_t substream = PB_OSTREAM_SIZING;
+            if (!Point_encode(&substream, &msg->position))
+                PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+            if (!pb_encode_varint(stream, (pb_uint64_t)substream.bytes_written))
+                return false;
+            if (stream->callback == NULL)
+            {
+                /* Just sizing */
+                if (!pb_write(stream, NULL, substream.bytes_written))
+                    return false;
+            }
+            else if (!Point_encode(stream, &msg->position))
+            {
+                return false;
+            }
+        }
+    }
+    if (msg->name[0] != '\0')
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 3))
+            return false;
+        {
+            size_t size = 0;
+            while (size < 7 && msg->name[size] != '\0')
+                size++;
+            if (msg->name[size] != '\0')
+                PB_RETURN_ERROR(stream, "unterminated string");
+            if (!pb_encode_string(stream, (const pb_byte_t*)msg->name, size))
+                return false;
+        }
+    }
+    if (msg->data.size != 0)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 4))
+            return false;
+        if (PB_BYTES_ARRAY_T_ALLOCSIZE(msg->data.size) > sizeof(msg->data))
+            PB_RETURN_ERROR(stream, "bytes size exceeded");
+        if (!pb_encode_string(stream, msg->data.bytes, msg->data.size))
+            return false;
+    }
+    if (msg->mode != 0)
+    {
+        if (!pb_encode_tag(stream, PB_WT_VARINT, 5))
+            return false;
+        if (!pb_encode_varint(stream, (pb_uint64_t)msg->mode))
+            return false;
+    }
+    if (msg->values_count > 4)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    if (msg->values_count > 0)
+    {
+        pb_ostream_t sizestream = PB_OSTREAM_SIZING;
+        if (!pb_encode_tag(stream, PB_WT_STRING, 6))
+            return false;
+        for (i = 0; i < msg->values_count; i++)
+        {
+            if (!pb_encode_varint(&sizestream, (pb_uint64_t)(pb_int64_t)msg->values[i]))
+                return false;
+        }
+        if (!pb_encode_varint(stream, (pb_uint64_t)(sizestream.bytes_written)))
+            return false;
+        for (i = 0; i < msg->values_count; i++)
+        {
+            if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->values[i]))
+                return false;
+        }
+    }
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 7))
+            return false;
+        if (!pb_encode_varint(stream, (pb_uint64_t)(4 * (size_t)3)))
+            return false;
+        for (i = 0; i < 3; i++)
+        {
+            if (!pb_encode_fixed32(stream, &msg->fixed[i]))
+                return false;
+        }
+    }
+    if (msg->points_count > 2)
+        PB_RETURN_ERROR(stream, "array max size exceeded");
+    for (i = 0; i < msg->points_count; i++)
+    {
+        if (!pb_encode_tag(stream, PB_WT_STRING, 8))
+            return false;
+        {
+            pb_ostream_t substream = PB_OSTREAM_SIZING;
+            if (!Point_encode(&substream, &msg->points[i]))
+                PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+            if (!pb_encode_varint(stream, (pb_uint64_t)substream.bytes_written))
+                return false;
+            if (stream->callback == NULL)
+            {
+                /* Just sizing */
+                if (!pb_write(stream, NULL, substream.bytes_written))
+                    return false;
+            }
+            else if (!Point_encode(stream, &msg->points[i]))
+            {
+                return false;
+            }
+        }
+    }
+    switch (msg->which_payload)
+    {
+        case 9:
+            if (!pb_encode_tag(stream, PB_WT_VARINT, 9))
+                return false;
+            if (!pb_encode_varint(stream, (pb_uint64_t)(pb_int64_t)msg->payload.counter))
+                return false;
+            break;
+        case 10:
+            if (!pb_encode_tag(stream, PB_WT_STRING, 10))
+                return false;
+            {
+                pb_ostream_t substream = PB_OSTREAM_SIZING;
+                if (!Point_encode(&substream, &msg->payload.origin))
+                    PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                if (!pb_encode_varint(stream, (pb_uint64_t)substream.bytes_written))
+                    return false;
+                if (stream->callback == NULL)
+                {
+                    /* Just sizing */
+                    if (!pb_write(stream, NULL, substream.bytes_written))
+                        return false;
+                }
+                else if (!Point_encode(stream, &msg->payload.origin))
+                {
+                    return false;
+                }
+            }
+            break;
+        case 11:
+            if (!pb_encode_tag(stream, PB_WT_STRING, 11))
+                return false;
+            {
+                size_t size = 0;
+                while (size < 7 && msg->payload.label[size] != '\0')
+                    size++;
+                if (msg->payload.label[size] != '\0')
+                    PB_RETURN_ERROR(stream, "unterminated string");
+                if (!pb_encode_string(stream, (const pb_byte_t*)msg->payload.label, size))
+                    return false;
+            }
+            break;
+    }
+    if (msg->flag != 0)
+    {
+        if (!pb_encode_tag(stream, PB_WT_VARINT, 12))
+            return false;
+        if (!pb_encode_varint(stream, msg->flag ? 1 : 0))
+            return false;
+    }
+    return true;
+#endif
+}
+#endif
+
+#ifndef PB_NO_SPECIALIZED_DECODE
+bool Sample_decode(pb_istream_t *stream, Sample *msg)
+{
+    memset(msg, 0, sizeof(Sample));
+    return Sample_decode_noinit(stream, msg);
+}
+
+bool Sample_decode_noinit(pb_istream_t *stream, Sample *msg)
+{
+    uint32_t fixed_count_tag = 0;
+    pb_size_t fixed_count_size = 0;
+    pb_size_t fixed_count_total_size = 0;
+
+    while (stream->bytes_left)
+    {
+        uint32_t tag;
+        pb_wire_type_t wire_type;
+        bool eof;
+
+        if (!pb_decode_tag(stream, &wire_type, &tag, &eof))
+        {
+            if (eof)
+                break;
+            else
+                return false;
+        }
+
+        switch (tag)
+        {
+            case 0:
+                PB_RETURN_ERROR(stream, "zero tag");
+
+            case 9:
+                msg->which_payload = 9;
+                {
+                    pb_uint64_t value;
+                    pb_int64_t svalue;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    svalue = (pb_int64_t)value;
+                    msg->payload.counter = (int64_t)svalue;
+                    if ((pb_int64_t)msg->payload.counter != svalue)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 10:
+                msg->which_payload = 10;
+                {
+                    pb_istream_t substream;
+                    bool status;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    status = Point_decode(&substream, &msg->payload.origin);
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                    if (!status)
+                        return false;
+                }
+                break;
+
+            case 11:
+                msg->which_payload = 11;
+                {
+                    uint32_t size;
+                    if (!pb_decode_varint32(stream, &size))
+                        return false;
+                    if (size >= 8)
+                        PB_RETURN_ERROR(stream, "string overflow");
+                    msg->payload.label[size] = '\0';
+                    if (!pb_read(stream, (pb_byte_t*)msg->payload.label, size))
+                        return false;
+                }
+                break;
+
+            case 1:
+                {
+                    pb_uint64_t value;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    msg->id = (uint32_t)value;
+                    if ((pb_uint64_t)msg->id != value)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 2:
+                {
+                    pb_istream_t substream;
+                    bool status;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    status = Point_decode_noinit(&substream, &msg->position);
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                    if (!status)
+                        return false;
+                }
+                break;
+
+            case 3:
+                {
+                    uint32_t size;
+                    if (!pb_decode_varint32(stream, &size))
+                        return false;
+                    if (size >= 8)
+                        PB_RETURN_ERROR(stream, "string overflow");
+                    msg->name[size] = '\0';
+                    if (!pb_read(stream, (pb_byte_t*)msg->name, size))
+                        return false;
+                }
+                break;
+
+            case 4:
+                {
+                    uint32_t size;
+                    if (!pb_decode_varint32(stream, &size))
+                        return false;
+                    if (size > PB_SIZE_MAX || PB_BYTES_ARRAY_T_ALLOCSIZE(size) > sizeof(msg->data))
+                        PB_RETURN_ERROR(stream, "bytes overflow");
+                    msg->data.size = (pb_size_t)size;
+                    if (!pb_read(stream, msg->data.bytes, size))
+                        return false;
+                }
+                break;
+
+            case 5:
+                {
+                    pb_uint64_t value;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    msg->mode = (Mode)value;
+                    if ((pb_uint64_t)msg->mode != value)
+                        PB_RETURN_ERROR(stream, "integer too large");
+                }
+                break;
+
+            case 6:
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && msg->values_count < 4)
+                    {
+                        {
+                            pb_uint64_t value;
+                            pb_int64_t svalue;
+                            if (!pb_decode_varint(&substream, &value))
+                            {
+                                status = false;
+                                break;
+                            }
+                            svalue = (int32_t)value;
+                            msg->values[msg->values_count] = (int32_t)svalue;
+                            if ((pb_int64_t)msg->values[msg->values_count] != svalue)
+                            {
+                                PB_SET_ERROR(stream, "integer too large");
+                                status = false;
+                                break;
+                            }
+                        }
+                        msg->values_count++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (msg->values_count >= 4)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    {
+                        pb_uint64_t value;
+                        pb_int64_t svalue;
+                        if (!pb_decode_varint(stream, &value))
+                            return false;
+                        svalue = (int32_t)value;
+                        msg->values[msg->values_count] = (int32_t)svalue;
+                        if ((pb_int64_t)msg->values[msg->values_count] != svalue)
+                            PB_RETURN_ERROR(stream, "integer too large");
+                    }
+                    msg->values_count++;
+                }
+                break;
+
+            case 7:
+                if (fixed_count_tag != 7)
+                {
+                    if (fixed_count_tag != 0 && fixed_count_size != fixed_count_total_size)
+                        PB_RETURN_ERROR(stream, "wrong size for fixed count field");
+                    fixed_count_tag = 7;
+                    fixed_count_size = 0;
+                    fixed_count_total_size = 3;
+                }
+                if (wire_type == PB_WT_STRING)
+                {
+                    pb_istream_t substream;
+                    bool status = true;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    while (substream.bytes_left > 0 && fixed_count_size < 3)
+                    {
+                        if (!pb_decode_fixed32(&substream, &msg->fixed[fixed_count_size]))
+                        {
+                            status = false;
+                            break;
+                        }
+                        fixed_count_size++;
+                    }
+                    if (!status)
+                        PB_RETURN_ERROR(stream, PB_GET_ERROR(&substream));
+                    if (substream.bytes_left != 0)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                }
+                else
+                {
+                    if (fixed_count_size >= 3)
+                        PB_RETURN_ERROR(stream, "array overflow");
+                    if (!pb_decode_fixed32(stream, &msg->fixed[fixed_count_size]))
+                        return false;
+                    fixed_count_size++;
+                }
+                break;
+
+            case 8:
+                if (msg->points_count >= 2)
+                    PB_RETURN_ERROR(stream, "array overflow");
+                {
+                    pb_istream_t substream;
+                    bool status;
+                    if (!pb_make_string_substream(stream, &substream))
+                        return false;
+                    status = Point_decode(&substream, &msg->points[msg->points_count]);
+                    if (!pb_close_string_substream(stream, &substream))
+                        return false;
+                    if (!status)
+                        return false;
+                }
+                msg->points_count++;
+                break;
+
+            case 12:
+                {
+                    pb_uint64_t value;
+                    if (!pb_decode_varint(stream, &value))
+                        return false;
+                    msg->flag = (value != 0);
+                }
+                break;
+
+            default:
+                if (!pb_skip_field(stream, wire_type))
+                    return false;
+                break;
+        }
+    }
+
+    if (fixed_count_tag != 0 && fixed_count_size != fixed_count_total_size)
+        PB_RETURN_ERROR(stream, "wrong size for fixed count field");
+
+    return true;
+}
+#endif
+
+/* WithCallback has callback, pointer or extension fields,
+ * so it is handled by the generic functions. */
+#ifndef PB_NO_SPECIALIZED_ENCODE
+bool WithCallback_encode(pb_ostream_t *stream, const WithCallback *msg)
+{
+    return pb_encode(stream, WithCallback_fields, msg);
+}
+#endif
+#ifndef PB_NO_SPECIALIZED_DECODE
+bool WithCallback_decode(pb_istream_t *stream, WithCallback *msg)
+{
+    return pb_decode(stream, WithCallback_fields, msg);
+}
+
+bool WithCallback_decode_noinit(pb_istream_t *stream, WithCallback *msg)
+{
+    return pb_decode_noinit(stream, WithCallback_fields, msg);
+}
+#endif
+
+/* Container has callback, pointer or extension fields,
+ * so it is handled by the generic functions. */
+#ifndef PB_NO_SPECIALIZED_ENCODE
+bool Container_encode(pb_ostream_t *stream, const Container *msg)
+{
+    return pb_encode(stream, Container_fields, msg);
+}
+#endif
+#ifndef PB_NO_SPECIALIZED_DECODE
+bool Container_decode(pb_istream_t *stream, Container *msg)
+{
+    return pb_decode(stream, Container_fields, msg);
+}
+
+bool Container_decode_noinit(pb_istream_t *stream, Container *msg)
+{
+    return pb_decode_noinit(stream, Container_fields, msg);
+}
+#endif
+
+
+
+/* On some platforms (such as AVR), double is really float.
+ * Using double on these platforms is not directly supported
+ * by nanopb, but see example_avr_double.
+ * To get rid of this error, remove any double fields from your .proto.
+ */
+PB_STATIC_ASSERT(sizeof(double) == 8, DOUBLE_MUST_BE_8_BYTES)
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,196 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_SPECIALIZED_PB_H_INCLUDED
+#define PB_SPECIALIZED_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Enum definitions */
+typedef enum _Mode {
+    Mode_MODE_NONE = 0,
+    Mode_MODE_FAST = 1
+} Mode;
+#define _Mode_MIN Mode_MODE_NONE
+#define _Mode_MAX Mode_MODE_FAST
+#define _Mode_ARRAYSIZE ((Mode)(Mode_MODE_FAST+1))
+
+/* Struct definitions */
+typedef struct _Point {
+    float x;
+    double y;
+    int32_t z;
+/* @@protoc_insertion_point(struct:Point) */
+} Point;
+
+
+typedef struct _WithCallback {
+    uint32_t id;
+    pb_callback_t name;
+/* @@protoc_insertion_point(struct:WithCallback) */
+} WithCallback;
+
+
+typedef PB_BYTES_ARRAY_T(8) Sample_data_t;
+typedef struct _Sample {
+    uint32_t id;
+    Point position;
+    char name[8];
+    Sample_data_t data;
+    Mode mode;
+    pb_size_t values_count;
+    int32_t values[4];
+    uint32_t fixed[3];
+    pb_size_t points_count;
+    Point points[2];
+    pb_size_t which_payload;
+    union {
+        int64_t counter;
+        Point origin;
+        char label[8];
+    } payload;
+    bool flag;
+/* @@protoc_insertion_point(struct:Sample) */
+} Sample;
+
+
+typedef struct _Container {
+    Sample sample;
+    WithCallback other;
+/* @@protoc_insertion_point(struct:Container) */
+} Container;
+
+
+/* Initializer values for message structs */
+#define Point_init_default                       {0, 0, 0}
+#define Sample_init_default                      {0, Point_init_default, "", {0, {0}}, _Mode_MIN, 0, {0, 0, 0, 0}, {0, 0, 0}, 0, {Point_init_default, Point_init_default}, 0, {0}, 0}
+#define WithCallback_init_default                {0, {{NULL}, NULL}}
+#define Container_init_default                   {Sample_init_default, WithCallback_init_default}
+#define Point_init_zero                          {0, 0, 0}
+#define Sample_init_zero                         {0, Point_init_zero, "", {0, {0}}, _Mode_MIN, 0, {0, 0, 0, 0}, {0, 0, 0}, 0, {Point_init_zero, Point_init_zero}, 0, {0}, 0}
+#define WithCallback_init_zero                   {0, {{NULL}, NULL}}
+#define Container_init_zero                      {Sample_init_zero, WithCallback_init_zero}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Point_x_tag                              1
+#define Point_y_tag                              2
+#define Point_z_tag                              3
+#define WithCallback_id_tag                      1
+#define WithCallback_name_tag                    2
+#define Sample_counter_tag                       9
+#define Sample_origin_tag                        10
+#define Sample_label_tag                         11
+#define Sample_id_tag                            1
+#define Sample_position_tag                      2
+#define Sample_name_tag                          3
+#define Sample_data_tag                          4
+#define Sample_mode_tag                          5
+#define Sample_values_tag                        6
+#define Sample_fixed_tag                         7
+#define Sample_points_tag                        8
+#define Sample_flag_tag                          12
+#define Container_sample_tag                     1
+#define Container_other_tag                      2
+
+/* Struct field encoding specification for nanopb */
+#define Point_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, FLOAT, x, 1) \
+X(a, STATIC, SINGULAR, DOUBLE, y, 2) \
+X(a, STATIC, SINGULAR, SINT32, z, 3)
+#define Point_CALLBACK NULL
+#define Point_DEFAULT NULL
+
+#define Sample_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, UINT32, id, 1) \
+X(a, STATIC, SINGULAR, MESSAGE, position, 2) \
+X(a, STATIC, SINGULAR, STRING, name, 3) \
+X(a, STATIC, SINGULAR, BYTES, data, 4) \
+X(a, STATIC, SINGULAR, UENUM, mode, 5) \
+X(a, STATIC, REPEATED, INT32, values, 6) \
+X(a, STATIC, FIXARRAY, FIXED32, fixed, 7) \
+X(a, STATIC, REPEATED, MESSAGE, points, 8) \
+X(a, STATIC, ONEOF, INT64, (payload,counter,payload.counter), 9) \
+X(a, STATIC, ONEOF, MESSAGE, (payload,origin,payload.origin), 10) \
+X(a, STATIC, ONEOF, STRING, (payload,label,payload.label), 11) \
+X(a, STATIC, SINGULAR, BOOL, flag, 12)
+#define Sample_CALLBACK NULL
+#define Sample_DEFAULT NULL
+#define Sample_position_MSGTYPE Point
+#define Sample_points_MSGTYPE Point
+#define Sample_payload_origin_MSGTYPE Point
+
+#define WithCallback_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, UINT32, id, 1) \
+X(a, CALLBACK, SINGULAR, STRING, name, 2)
+#define WithCallback_CALLBACK pb_default_field_callback
+#define WithCallback_DEFAULT NULL
+
+#define Container_FIELDLIST(X, a) \
+X(a, STATIC, SINGULAR, MESSAGE, sample, 1) \
+X(a, STATIC, SINGULAR, MESSAGE, other, 2)
+#define Container_CALLBACK NULL
+#define Container_DEFAULT NULL
+#define Container_sample_MSGTYPE Sample
+#define Container_other_MSGTYPE WithCallback
+
+extern const pb_msgdesc_t Point_msg;
+extern const pb_msgdesc_t Sample_msg;
+extern const pb_msgdesc_t WithCallback_msg;
+extern const pb_msgdesc_t Container_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Point_fields &Point_msg
+#define Sample_fields &Sample_msg
+#define WithCallback_fields &WithCallback_msg
+#define Container_fields &Container_msg
+
+/* Specialized encoding and decoding functions */
+#ifndef PB_NO_SPECIALIZED_ENCODE
+bool Point_encode(pb_ostream_t *stream, const Point *msg);
+#endif
+#ifndef PB_NO_SPECIALIZED_DECODE
+bool Point_decode(pb_istream_t *stream, Point *msg);
+bool Point_decode_noinit(pb_istream_t *stream, Point *msg);
+#endif
+#ifndef PB_NO_SPECIALIZED_ENCODE
+bool Sample_encode(pb_ostream_t *stream, const Sample *msg);
+#endif
+#ifndef PB_NO_SPECIALIZED_DECODE
+bool Sample_decode(pb_istream_t *stream, Sample *msg);
+bool Sample_decode_noinit(pb_istream_t *stream, Sample *msg);
+#endif
+#ifndef PB_NO_SPECIALIZED_ENCODE
+bool WithCallback_encode(pb_ostream_t *stream, const WithCallback *msg);
+#endif
+#ifndef PB_NO_SPECIALIZED_DECODE
+bool WithCallback_decode(pb_istream_t *stream, WithCallback *msg);
+bool WithCallback_decode_noinit(pb_istream_t *stream, WithCallback *msg);
+#endif
+#ifndef PB_NO_SPECIALIZED_ENCODE
+bool Container_encode(pb_ostream_t *stream, const Container *msg);
+#endif
+#ifndef PB_NO_SPECIALIZED_DECODE
+bool Container_decode(pb_istream_t *stream, Container *msg);
+bool Container_decode_noinit(pb_istream_t *stream, Container *msg);
+#endif
+
+/* Maximum encoded size of messages (where known) */
+#define Point_size                               20
+#define Sample_size                              176
+/* WithCallback_size depends on runtime parameters */
+/* Container_size depends on runtime parameters */
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
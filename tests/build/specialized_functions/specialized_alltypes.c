@@ -0,0 +1,74 @@
+/* Decode the output of encode_alltypes with the specialized and generic
+ * decoders, and check that both encoders reproduce the original data. */
+
+#include <stdio.h>
+#include <string.h>
+#include <pb_encode.h>
+#include <pb_decode.h>
+#include "alltypes.pb.h"
+#include "test_helpers.h"
+#include "unittests.h"
+
+int main()
+{
+    int status = 0;
+    uint8_t input[1024];
+    size_t input_len;
+    AllTypes specialized, generic;
+
+    SET_BINARY_MODE(stdin);
+    input_len = fread(input, 1, sizeof(input), stdin);
+
+    COMMENT("Test decoding");
+    {
+        pb_istream_t stream = pb_istream_from_buffer(input, input_len);
+        TEST(AllTypes_decode(&stream, &specialized));
+        stream = pb_istream_from_buffer(input, input_len);
+        TEST(pb_decode(&stream, AllTypes_fields, &generic));
+
+        TEST(specialized.req_submsg.substuff2 == generic.req_submsg.substuff2);
+        TEST(specialized.has_opt_int32 == generic.has_opt_int32);
+        TEST(specialized.opt_int32 == generic.opt_int32);
+        TEST(strcmp(specialized.opt_string, generic.opt_string) == 0);
+        TEST(specialized.opt_submsg.substuff3 == generic.opt_submsg.substuff3);
+        TEST(specialized.which_oneof == generic.which_oneof);
+    }
+
+    COMMENT("Test encoding");
+    {
+        uint8_t buffer1[1024], buffer2[1024];
+        pb_ostream_t stream1 = pb_ostream_from_buffer(buffer1, sizeof(buffer1));
+        pb_ostream_t stream2 = pb_ostream_from_buffer(buffer2, sizeof(buffer2));
+        pb_ostream_t sizing = PB_OSTREAM_SIZING;
+
+        TEST(AllTypes_encode(&stream1, &specialized));
+        TEST(pb_encode(&stream2, AllTypes_fields, &generic));
+        TEST(stream1.bytes_written == input_len);
+        TEST(stream2.bytes_written == input_len);
+        TEST(memcmp(buffer1, input, input_len) == 0);
+        TEST(memcmp(buffer2, input, input_len) == 0);
+
+        TEST(AllTypes_encode(&sizing, &specialized));
+        TEST(sizing.bytes_written == input_len);
+    }
+
+    COMMENT("Test errors");
+    {
+        uint8_t buffer[1024];
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer, input_len - 1);
+        pb_istream_t istream = pb_istream_from_buffer(input, input_len - 1);
+
+        TEST(!AllTypes_encode(&ostream, &specialized));
+        TEST(!AllTypes_decode(&istream, &specialized));
+
+        specialized.rep_int32_count = 6;
+        ostream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        TEST(!AllTypes_encode(&ostream, &specialized));
+        TEST(strcmp(PB_GET_ERROR(&ostream), "array max size exceeded") == 0);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
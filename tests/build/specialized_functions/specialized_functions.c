@@ -0,0 +1,175 @@
+/* Check that the specialized functions give the same results as the
+ * generic functions for proto3 presence rules, arrays and oneofs. */
+
+#include <stdio.h>
+#include <string.h>
+#include <pb_encode.h>
+#include <pb_decode.h>
+#include "specialized.pb.h"
+#include "unittests.h"
+
+/* Encode with both encoders and compare the results */
+static bool encode_both(const Sample *msg, uint8_t *buffer, size_t *size)
+{
+    uint8_t generic[256];
+    pb_ostream_t stream1 = pb_ostream_from_buffer(buffer, 256);
+    pb_ostream_t stream2 = pb_ostream_from_buffer(generic, sizeof(generic));
+
+    if (!Sample_encode(&stream1, msg) || !pb_encode(&stream2, Sample_fields, msg))
+        return false;
+
+    *size = stream1.bytes_written;
+    return stream1.bytes_written == stream2.bytes_written &&
+           memcmp(buffer, generic, stream1.bytes_written) == 0;
+}
+
+int main()
+{
+    int status = 0;
+
+    COMMENT("Test empty message");
+    {
+        Sample msg = Sample_init_zero;
+        uint8_t buffer[256];
+        size_t size;
+
+        /* Fixed count array is always present */
+        TEST(encode_both(&msg, buffer, &size));
+        TEST(size == 2 + 3 * 4);
+    }
+
+    COMMENT("Test proto3 zero values");
+    {
+        Sample msg = Sample_init_zero;
+        uint8_t buffer[256];
+        size_t size, empty_size;
+
+        TEST(encode_both(&msg, buffer, &empty_size));
+
+        msg.position.x = -0.0f;
+        TEST(encode_both(&msg, buffer, &size));
+        TEST(size == empty_size + 2 + 5);
+
+        msg.position.x = 0.0f;
+        msg.position.z = -1;
+        TEST(encode_both(&msg, buffer, &size));
+        TEST(size == empty_size + 2 + 2);
+    }
+
+    COMMENT("Test round trip");
+    {
+        Sample msg = Sample_init_zero;
+        Sample decoded;
+        uint8_t buffer[256], buffer2[256];
+        size_t size, size2;
+        pb_istream_t stream;
+
+        msg.id = 1000;
+        msg.position.y = 1.5;
+        strcpy(msg.name, "abc");
+        msg.data.size = 2;
+        msg.data.bytes[0] = 0xFF;
+        msg.mode = Mode_MODE_FAST;
+        msg.values_count = 3;
+        msg.values[0] = -1;
+        msg.values[1] = 300;
+        msg.values[2] = 0;
+        msg.fixed[1] = 5;
+        msg.points_count = 2;
+        msg.points[1].z = 7;
+        msg.which_payload = Sample_origin_tag;
+        msg.payload.origin.x = 2.0f;
+        msg.flag = true;
+
+        TEST(encode_both(&msg, buffer, &size));
+
+        stream = pb_istream_from_buffer(buffer, size);
+        TEST(Sample_decode(&stream, &decoded));
+        TEST(decoded.id == 1000 && decoded.position.y == 1.5);
+        TEST(strcmp(decoded.name, "abc") == 0);
+        TEST(decoded.data.size == 2 && decoded.data.bytes[0] == 0xFF);
+        TEST(decoded.values_count == 3 && decoded.values[0] == -1);
+        TEST(decoded.fixed[1] == 5);
+        TEST(decoded.points_count == 2 && decoded.points[1].z == 7);
+        TEST(decoded.which_payload == Sample_origin_tag);
+        TEST(decoded.payload.origin.x == 2.0f);
+        TEST(decoded.flag);
+
+        TEST(encode_both(&decoded, buffer2, &size2));
+        TEST(size == size2 && memcmp(buffer, buffer2, size) == 0);
+
+        msg.which_payload = Sample_label_tag;
+        strcpy(msg.payload.label, "xyz");
+        TEST(encode_both(&msg, buffer, &size));
+        stream = pb_istream_from_buffer(buffer, size);
+        TEST(Sample_decode(&stream, &decoded));
+        TEST(decoded.which_payload == Sample_label_tag);
+        TEST(strcmp(decoded.payload.label, "xyz") == 0);
+    }
+
+    COMMENT("Test unpacked array and merging");
+    {
+        /* values = 1, values = [2, 3] packed, id = 5, id = 6 */
+        const uint8_t data[] = {0x30, 0x01, 0x32, 0x02, 0x02, 0x03, 0x08, 0x05, 0x08, 0x06};
+        Sample msg;
+        pb_istream_t stream = pb_istream_from_buffer(data, sizeof(data));
+
+        TEST(Sample_decode(&stream, &msg));
+        TEST(msg.values_count == 3);
+        TEST(msg.values[0] == 1 && msg.values[1] == 2 && msg.values[2] == 3);
+        TEST(msg.id == 6);
+    }
+
+    COMMENT("Test decoding errors");
+    {
+        /* Too many array entries */
+        const uint8_t overflow[] = {0x32, 0x05, 0x01, 0x02, 0x03, 0x04, 0x05};
+        /* Value does not fit in uint32 */
+        const uint8_t toolarge[] = {0x08, 0x80, 0x80, 0x80, 0x80, 0x10};
+        /* Fixed count array with only one entry */
+        const uint8_t fixedcount[] = {0x3D, 0x01, 0x00, 0x00, 0x00};
+        /* String longer than max_size */
+        const uint8_t longstr[] = {0x1A, 0x08, 'a', 'a', 'a', 'a', 'a', 'a', 'a', 'a'};
+        Sample msg;
+        pb_istream_t stream;
+
+        stream = pb_istream_from_buffer(overflow, sizeof(overflow));
+        TEST(!Sample_decode(&stream, &msg));
+        TEST(strcmp(PB_GET_ERROR(&stream), "array overflow") == 0);
+
+        stream = pb_istream_from_buffer(toolarge, sizeof(toolarge));
+        TEST(!Sample_decode(&stream, &msg));
+        TEST(strcmp(PB_GET_ERROR(&stream), "integer too large") == 0);
+
+        stream = pb_istream_from_buffer(fixedcount, sizeof(fixedcount));
+        TEST(!Sample_decode(&stream, &msg));
+        TEST(strcmp(PB_GET_ERROR(&stream), "wrong size for fixed count field") == 0);
+
+        stream = pb_istream_from_buffer(longstr, sizeof(longstr));
+        TEST(!Sample_decode(&stream, &msg));
+        TEST(strcmp(PB_GET_ERROR(&stream), "string overflow") == 0);
+    }
+
+    COMMENT("Test fallback to generic functions");
+    {
+        Container msg = Container_init_zero;
+        Container decoded = Container_init_zero;
+        uint8_t buffer[256];
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        pb_istream_t istream;
+
+        msg.sample.id = 5;
+        msg.other.id = 6;
+        TEST(Container_encode(&ostream, &msg));
+        TEST(ostream.bytes_written == 2 + (2 + 2 + 3 * 4) + 2 + 2);
+
+        istream = pb_istream_from_buffer(buffer, ostream.bytes_written);
+        TEST(Container_decode(&istream, &decoded));
+        TEST(decoded.sample.id == 5 && decoded.other.id == 6);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,166 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "alltypes.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_FIELD_INFO_POSITIONS(SubMessage, SubMessage, AUTO)
+const pb_tagindex_entry_t SubMessage_tagindex_entries[] =
+{
+    PB_TAGINDEX_ENTRY(SubMessage, 1, 0, 0, 0)
+    PB_TAGINDEX_ENTRY(SubMessage, 2, 1, 1, 0)
+    PB_TAGINDEX_ENTRY(SubMessage, 3, 2, 2, 0)
+};
+const pb_tagindex_t SubMessage_tagindex = {3, 1, SubMessage_tagindex_entries};
+PB_BIND_WITH_TAGINDEX(SubMessage, SubMessage, AUTO)
+
+
+PB_BIND(EmptyMessage, EmptyMessage, AUTO)
+
+
+PB_FIELD_INFO_POSITIONS(Limits, Limits, AUTO)
+const pb_tagindex_entry_t Limits_tagindex_entries[] =
+{
+    PB_TAGINDEX_ENTRY(Limits, 1, 0, 0, 0)
+    PB_TAGINDEX_ENTRY(Limits, 2, 1, 1, 0)
+    PB_TAGINDEX_ENTRY(Limits, 3, 2, 2, 0)
+    PB_TAGINDEX_ENTRY(Limits, 4, 3, 3, 0)
+    PB_TAGINDEX_ENTRY(Limits, 5, 4, 4, 0)
+    PB_TAGINDEX_ENTRY(Limits, 6, 5, 5, 0)
+    PB_TAGINDEX_ENTRY(Limits, 7, 6, 6, 0)
+    PB_TAGINDEX_ENTRY(Limits, 8, 7, 7, 0)
+    PB_TAGINDEX_ENTRY(Limits, 9, 8, 8, 0)
+    PB_TAGINDEX_ENTRY(Limits, 10, 9, 9, 0)
+};
+const pb_tagindex_t Limits_tagindex = {10, 1, Limits_tagindex_entries};
+PB_BIND_WITH_TAGINDEX(Limits, Limits, AUTO)
+
+
+PB_FIELD_INFO_POSITIONS(AllTypes, AllTypes, 2)
+const pb_tagindex_entry_t AllTypes_tagindex_entries[] =
+{
+    PB_TAGINDEX_ENTRY(AllTypes, 1, 0, 0, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 2, 1, 1, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 3, 2, 2, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 4, 3, 3, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 5, 4, 4, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 6, 5, 5, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 7, 6, 6, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 8, 7, 7, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 9, 8, 8, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 10, 9, 9, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 11, 10, 10, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 12, 11, 11, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 13, 12, 12, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 14, 13, 13, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 15, 14, 14, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 16, 15, 15, 0)
+    PB_TAGINDEX_ENTRY(AllTypes, 17, 16, 16, 1)
+    PB_TAGINDEX_ENTRY(AllTypes, 18, 17, 17, 1)
+    PB_TAGINDEX_ENTRY(AllTypes, 19, 18, 18, 2)
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_ENTRY(AllTypes, 21, 19, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 22, 20, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 23, 21, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 24, 22, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 25, 23, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 26, 24, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 27, 25, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 28, 26, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 29, 27, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 30, 28, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 31, 29, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 32, 30, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 33, 31, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 34, 32, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 35, 33, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 36, 34, 19, 2)
+    PB_TAGINDEX_ENTRY(AllTypes, 37, 35, 19, 3)
+    PB_TAGINDEX_ENTRY(AllTypes, 38, 36, 19, 3)
+    PB_TAGINDEX_ENTRY(AllTypes, 39, 37, 19, 4)
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_ENTRY(AllTypes, 41, 38, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 42, 39, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 43, 40, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 44, 41, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 45, 42, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 46, 43, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 47, 44, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 48, 45, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 49, 46, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 50, 47, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 51, 48, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 52, 49, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 53, 50, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 54, 51, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 55, 52, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 56, 53, 19, 4)
+    PB_TAGINDEX_ENTRY(AllTypes, 57, 54, 19, 5)
+    PB_TAGINDEX_ENTRY(AllTypes, 58, 55, 19, 5)
+    PB_TAGINDEX_ENTRY(AllTypes, 59, 56, 19, 6)
+    PB_TAGINDEX_ENTRY(AllTypes, 60, 57, 19, 6)
+    PB_TAGINDEX_ENTRY(AllTypes, 61, 58, 19, 7)
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_UNUSED
+    PB_TAGINDEX_ENTRY(AllTypes, 98, 59, 19, 8)
+    PB_TAGINDEX_ENTRY(AllTypes, 99, 60, 20, 9)
+};
+const pb_tagindex_t AllTypes_tagindex = {99, 1, AllTypes_tagindex_entries};
+PB_BIND_WITH_TAGINDEX(AllTypes, AllTypes, 2)
+
+
+
+
+
+/* Check that the tag lookup tables will be used */
+#ifndef PB_ENABLE_TAG_INDEX
+#error The tag_index option in SubMessage requires \
+       defining PB_ENABLE_TAG_INDEX.
+#endif
+
+/* On some platforms (such as AVR), double is really float.
+ * Using double on these platforms is not directly supported
+ * by nanopb, but see example_avr_double.
+ * To get rid of this error, remove any double fields from your .proto.
+ */
+PB_STATIC_ASSERT(sizeof(double) == 8, DOUBLE_MUST_BE_8_BYTES)
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,35 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "sparse.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(Inner, Inner, AUTO)
+
+
+PB_FIELD_INFO_POSITIONS(Sparse, Sparse, 4)
+const pb_tagindex_entry_t Sparse_tagindex_entries[] =
+{
+    PB_TAGINDEX_ENTRY(Sparse, 1, 0, 0, 0)
+    PB_TAGINDEX_ENTRY(Sparse, 100, 1, 1, 0)
+    PB_TAGINDEX_ENTRY(Sparse, 1000, 2, 1, 1)
+    PB_TAGINDEX_ENTRY(Sparse, 2000, 3, 2, 1)
+    PB_TAGINDEX_ENTRY(Sparse, 3000, 4, 2, 2)
+    PB_TAGINDEX_ENTRY(Sparse, 4000, 5, 2, 2)
+};
+const pb_tagindex_t Sparse_tagindex = {6, 0, Sparse_tagindex_entries};
+PB_BIND_WITH_TAGINDEX(Sparse, Sparse, 4)
+
+
+
+/* Check that the tag lookup tables will be used */
+#ifndef PB_ENABLE_TAG_INDEX
+#error The tag_index option in Sparse requires \
+       defining PB_ENABLE_TAG_INDEX.
+#endif
+
+/* @@protoc_insertion_point(eof) */
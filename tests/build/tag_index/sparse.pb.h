@@ -0,0 +1,89 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_SPARSE_PB_H_INCLUDED
+#define PB_SPARSE_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Inner {
+    int32_t value;
+/* @@protoc_insertion_point(struct:Inner) */
+} Inner;
+
+
+typedef struct _Sparse {
+    int32_t first;
+    bool has_inner;
+    Inner inner;
+    char name[16];
+    pb_size_t which_choice;
+    union {
+        Inner choice_inner;
+        int32_t choice_int;
+    } choice;
+    bool has_last;
+    int32_t last;
+/* @@protoc_insertion_point(struct:Sparse) */
+} Sparse;
+
+
+/* Initializer values for message structs */
+#define Inner_init_default                       {0}
+#define Sparse_init_default                      {0, false, Inner_init_default, "", 0, {Inner_init_default}, false, 0}
+#define Inner_init_zero                          {0}
+#define Sparse_init_zero                         {0, false, Inner_init_zero, "", 0, {Inner_init_zero}, false, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Inner_value_tag                          1
+#define Sparse_choice_inner_tag                  2000
+#define Sparse_choice_int_tag                    3000
+#define Sparse_first_tag                         1
+#define Sparse_inner_tag                         100
+#define Sparse_name_tag                          1000
+#define Sparse_last_tag                          4000
+
+/* Struct field encoding specification for nanopb */
+#define Inner_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, value, 1)
+#define Inner_CALLBACK NULL
+#define Inner_DEFAULT NULL
+
+#define Sparse_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, first, 1) \
+X(a, STATIC, OPTIONAL, MESSAGE, inner, 100) \
+X(a, STATIC, REQUIRED, STRING, name, 1000) \
+X(a, STATIC, ONEOF, MESSAGE, (choice,choice_inner,choice.choice_inner), 2000) \
+X(a, STATIC, ONEOF, INT32, (choice,choice_int,choice.choice_int), 3000) \
+X(a, STATIC, OPTIONAL, INT32, last, 4000)
+#define Sparse_CALLBACK NULL
+#define Sparse_DEFAULT NULL
+#define Sparse_inner_MSGTYPE Inner
+#define Sparse_choice_choice_inner_MSGTYPE Inner
+
+extern const pb_msgdesc_t Inner_msg;
+extern const pb_msgdesc_t Sparse_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Inner_fields &Inner_msg
+#define Sparse_fields &Sparse_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Inner_size                               11
+#define Sparse_size                              70
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
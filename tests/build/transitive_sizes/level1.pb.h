@@ -0,0 +1,58 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_LEVEL1_PB_H_INCLUDED
+#define PB_LEVEL1_PB_H_INCLUDED
+#include <pb.h>
+
+#include "level2.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Top {
+    Middle middle;
+    pb_size_t others_count;
+    Middle others[3];
+/* @@protoc_insertion_point(struct:Top) */
+} Top;
+
+
+/* Initializer values for message structs */
+#define Top_init_default                         {Middle_init_default, 0, {Middle_init_default, Middle_init_default, Middle_init_default}}
+#define Top_init_zero                            {Middle_init_zero, 0, {Middle_init_zero, Middle_init_zero, Middle_init_zero}}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Top_middle_tag                           1
+#define Top_others_tag                           2
+
+/* Struct field encoding specification for nanopb */
+#define Top_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, middle, 1) \
+X(a, STATIC, REPEATED, MESSAGE, others, 2)
+#define Top_CALLBACK NULL
+#define Top_DEFAULT NULL
+#define Top_middle_MSGTYPE Middle
+#define Top_others_MSGTYPE Middle
+
+extern const pb_msgdesc_t Top_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Top_fields &Top_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Top_size                                 120
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
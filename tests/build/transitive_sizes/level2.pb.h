@@ -0,0 +1,57 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_LEVEL2_PB_H_INCLUDED
+#define PB_LEVEL2_PB_H_INCLUDED
+#include <pb.h>
+
+#include "level3.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Middle {
+    Leaf leaf;
+    bool has_count;
+    uint32_t count;
+/* @@protoc_insertion_point(struct:Middle) */
+} Middle;
+
+
+/* Initializer values for message structs */
+#define Middle_init_default                      {Leaf_init_default, false, 0}
+#define Middle_init_zero                         {Leaf_init_zero, false, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Middle_leaf_tag                          1
+#define Middle_count_tag                         2
+
+/* Struct field encoding specification for nanopb */
+#define Middle_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, MESSAGE, leaf, 1) \
+X(a, STATIC, OPTIONAL, UINT32, count, 2)
+#define Middle_CALLBACK NULL
+#define Middle_DEFAULT NULL
+#define Middle_leaf_MSGTYPE Leaf
+
+extern const pb_msgdesc_t Middle_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Middle_fields &Middle_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Middle_size                              28
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
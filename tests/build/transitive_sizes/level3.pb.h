@@ -0,0 +1,53 @@
+/* Automatically generated nanopb header */
+/* Generated by nanopb-0.4.0-dev */
+
+#ifndef PB_LEVEL3_PB_H_INCLUDED
+#define PB_LEVEL3_PB_H_INCLUDED
+#include <pb.h>
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Struct definitions */
+typedef struct _Leaf {
+    int32_t value;
+    uint64_t stamp;
+/* @@protoc_insertion_point(struct:Leaf) */
+} Leaf;
+
+
+/* Initializer values for message structs */
+#define Leaf_init_default                        {0, 0}
+#define Leaf_init_zero                           {0, 0}
+
+/* Field tags (for use in manual encoding/decoding) */
+#define Leaf_value_tag                           1
+#define Leaf_stamp_tag                           2
+
+/* Struct field encoding specification for nanopb */
+#define Leaf_FIELDLIST(X, a) \
+X(a, STATIC, REQUIRED, INT32, value, 1) \
+X(a, STATIC, REQUIRED, FIXED64, stamp, 2)
+#define Leaf_CALLBACK NULL
+#define Leaf_DEFAULT NULL
+
+extern const pb_msgdesc_t Leaf_msg;
+
+/* Defines for backwards compatibility with code written before nanopb-0.4.0 */
+#define Leaf_fields &Leaf_msg
+
+/* Maximum encoded size of messages (where known) */
+#define Leaf_size                                20
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
+/* @@protoc_insertion_point(eof) */
+
+#endif
@@ -0,0 +1,27 @@
+/* Automatically generated nanopb constant definitions */
+/* Generated by nanopb-0.4.0-dev */
+
+#include "flatten.pb.h"
+
+/* @@protoc_insertion_point(includes) */
+#if PB_PROTO_HEADER_VERSION != 40
+#error Regenerate this file with the current version of nanopb generator.
+#endif
+
+PB_BIND(TopLevelMessage, TopLevelMessage, AUTO)
+
+
+PB_BIND(NestedMessage, NestedMessage, AUTO)
+
+
+PB_BIND(NestedLevel2, NestedLevel2, AUTO)
+
+
+PB_BIND(NestedLevel3, NestedLevel3, AUTO)
+
+
+
+
+
+
+/* @@protoc_insertion_point(eof) */
@@ -0,0 +1,175 @@
+/* Check that the generated size functions give the same results as
+ * pb_get_encoded_size() for different field types and values. */
+
+#include <stdio.h>
+#include <string.h>
+#include <pb_encode.h>
+#include "sizes.pb.h"
+#include "unittests.h"
+
+/* Compare the generated size function against pb_get_encoded_size() */
+static bool check_sizes(const Sizes *msg)
+{
+    size_t size1 = 0, size2 = 0;
+    if (!Sizes_get_encoded_size(&size1, msg))
+        return false;
+    if (!pb_get_encoded_size(&size2, Sizes_fields, msg))
+        return false;
+    if (size1 != size2)
+    {
+        fprintf(stderr, "Size mismatch: %d != %d\n", (int)size1, (int)size2);
+        return false;
+    }
+    return true;
+}
+
+int main()
+{
+    int status = 0;
+
+    COMMENT("Test helper functions");
+    {
+        TEST(pb_varint_size(0) == 1);
+        TEST(pb_varint_size(127) == 1);
+        TEST(pb_varint_size(128) == 2);
+        TEST(pb_varint_size(0xFFFFFFFFu) == 5);
+        TEST(pb_svarint_size(-64) == 1);
+        TEST(pb_svarint_size(64) == 2);
+        TEST(pb_svarint_size(-2147483647 - 1) == 5);
+    }
+
+    COMMENT("Test constant size");
+    {
+        Fixed msg = Fixed_init_zero;
+        size_t size;
+        TEST(Fixed_get_encoded_size(&size, &msg));
+        TEST(size == 32);
+    }
+
+    COMMENT("Test empty message");
+    {
+        Sizes msg = Sizes_init_zero;
+        size_t size;
+        TEST(check_sizes(&msg));
+        TEST(Sizes_get_encoded_size(&size, &msg));
+        TEST(size == 2 + 32);
+    }
+
+    COMMENT("Test scalar values");
+    {
+        Sizes msg = Sizes_init_zero;
+        msg.small = -1;
+        msg.large = 1234567890123LL;
+        msg.unsigned_value = 300;
+        msg.zigzag = -100000;
+        msg.color = Color_BLUE;
+        msg.flag = true;
+        msg.ratio = -0.0f;
+        msg.last = 1;
+        TEST(check_sizes(&msg));
+
+        msg.color = Color_GREEN;
+        msg.small = 127;
+        msg.ratio = 1.0f;
+        TEST(check_sizes(&msg));
+    }
+
+    COMMENT("Test strings, bytes and submessages");
+    {
+        Sizes msg = Sizes_init_zero;
+        strcpy(msg.name, "123456789012345");
+        msg.data.size = 16;
+        msg.inner.value = -5;
+        TEST(check_sizes(&msg));
+
+        strcpy(msg.inner.text, "abc");
+        msg.inner.value = 0;
+        TEST(check_sizes(&msg));
+    }
+
+    COMMENT("Test arrays");
+    {
+        Sizes msg = Sizes_init_zero;
+        msg.values_count = 4;
+        msg.values[0] = -1;
+        msg.values[1] = 0;
+        msg.values[2] = 1000;
+        msg.values[3] = 1;
+        msg.stamps_count = 3;
+        msg.names_count = 3;
+        strcpy(msg.names[1], "abcdefg");
+        msg.inners_count = 2;
+        msg.inners[1].value = 1;
+        msg.bits_count = 2;
+        TEST(check_sizes(&msg));
+    }
+
+    COMMENT("Test fixed count arrays");
+    {
+        FixedCount msg = FixedCount_init_zero;
+        size_t size1, size2;
+        TEST(FixedCount_get_encoded_size(&size1, &msg));
+        TEST(pb_get_encoded_size(&size2, FixedCount_fields, &msg));
+        TEST(size1 == size2);
+
+        msg.vals[1] = -1;
+        strcpy(msg.words[0], "abc");
+        msg.inners[1].value = 100;
+        TEST(FixedCount_get_encoded_size(&size1, &msg));
+        TEST(pb_get_encoded_size(&size2, FixedCount_fields, &msg));
+        TEST(size1 == size2);
+    }
+
+    COMMENT("Test oneof");
+    {
+        Sizes msg = Sizes_init_zero;
+        msg.which_choice = Sizes_number_tag;
+        msg.choice.number = 0;
+        TEST(check_sizes(&msg));
+
+        msg.which_choice = Sizes_nested_tag;
+        strcpy(msg.choice.nested.text, "x");
+        TEST(check_sizes(&msg));
+
+        msg.which_choice = Sizes_constant_tag;
+        TEST(check_sizes(&msg));
+    }
+
+    COMMENT("Test errors");
+    {
+        Sizes msg = Sizes_init_zero;
+        size_t size;
+
+        msg.values_count = 5;
+        TEST(!Sizes_get_encoded_size(&size, &msg));
+
+        msg.values_count = 0;
+        memset(msg.inner.text, 'a', sizeof(msg.inner.text));
+        TEST(!Sizes_get_encoded_size(&size, &msg));
+    }
+
+    COMMENT("Test fallback to generic function");
+    {
+        Outer outer = Outer_init_zero;
+        Fallback fallback = Fallback_init_zero;
+        size_t size1, size2;
+
+        outer.sizes.small = 5;
+        outer.others_count = 2;
+        outer.others[0].id = 1;
+        TEST(Outer_get_encoded_size(&size1, &outer));
+        TEST(pb_get_encoded_size(&size2, Outer_fields, &outer));
+        TEST(size1 == size2);
+
+        TEST(Fallback_get_encoded_size(&size1, &fallback));
+        TEST(size1 == 0);
+        fallback.other.id = 1;
+        TEST(Fallback_get_encoded_size(&size1, &fallback));
+        TEST(size1 == 4);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,58 @@
+/* Decode the output of encode_alltypes and check that the generated size
+ * function gives the same size as the original data. */
+
+#include <stdio.h>
+#include <string.h>
+#include <pb_encode.h>
+#include <pb_decode.h>
+#include "alltypes.pb.h"
+#include "test_helpers.h"
+#include "unittests.h"
+
+int main()
+{
+    int status = 0;
+    uint8_t input[1024];
+    size_t input_len;
+    AllTypes msg;
+
+    SET_BINARY_MODE(stdin);
+    input_len = fread(input, 1, sizeof(input), stdin);
+
+    COMMENT("Test size");
+    {
+        pb_istream_t stream = pb_istream_from_buffer(input, input_len);
+        size_t size1 = 0, size2 = 0;
+
+        TEST(pb_decode(&stream, AllTypes_fields, &msg));
+        TEST(AllTypes_get_encoded_size(&size1, &msg));
+        TEST(pb_get_encoded_size(&size2, AllTypes_fields, &msg));
+        TEST(size1 == input_len);
+        TEST(size2 == input_len);
+    }
+
+    COMMENT("Test errors");
+    {
+        AllTypes copy = msg;
+        size_t size;
+
+        copy.rep_int32_count = 6;
+        TEST(!AllTypes_get_encoded_size(&size, &copy));
+        TEST(!pb_get_encoded_size(&size, AllTypes_fields, &copy));
+
+        copy = msg;
+        memset(copy.req_string, 'x', sizeof(copy.req_string));
+        TEST(!AllTypes_get_encoded_size(&size, &copy));
+        TEST(!pb_get_encoded_size(&size, AllTypes_fields, &copy));
+
+        copy = msg;
+        copy.req_bytes.size = 17;
+        TEST(!AllTypes_get_encoded_size(&size, &copy));
+        TEST(!pb_get_encoded_size(&size, AllTypes_fields, &copy));
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
@@ -0,0 +1,55 @@
+'''Call the generate() API from several threads at once on the same
+descriptors, and check that the results match a serial run.
+Each thread uses different options, so that any state shared between
+the calls would show up as differences in the output.
+
+Usage: test_threads.py path/to/generator descriptor_set.pb
+'''
+
+import sys
+import os
+import threading
+
+sys.path.insert(0, sys.argv[1])
+import nanopb_generator
+import google.protobuf.descriptor_pb2 as descriptor
+
+fdescs = descriptor.FileDescriptorSet.FromString(open(sys.argv[2], 'rb').read())
+optpath = os.path.dirname(os.path.abspath(sys.argv[2]))
+
+option_sets = [
+    ['-T', '-I', optpath],
+    ['-T', '-I', optpath, '-s', 'long_names:false'],
+    ['-T', '-I', optpath, '-e', '.nano'],
+    ['-T', '-I', optpath, '-s', 'anonymous_oneof:true', '-L', '#include "%s"'],
+]
+
+expected = [nanopb_generator.generate(fdescs, options) for options in option_sets]
+
+results = {}
+def worker(index):
+    for i in range(4):
+        output = nanopb_generator.generate(fdescs, option_sets[index % len(option_sets)])
+        results.setdefault(index, []).append(output)
+
+threads = [threading.Thread(target = worker, args = (i,)) for i in range(8)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+
+status = 0
+for index, outputs in sorted(results.items()):
+    for output in outputs:
+        if output != expected[index % len(option_sets)]:
+            print("FAILED: output of thread %d differs from serial run" % index)
+            status = 1
+
+if len(results) != len(threads):
+    print("FAILED: some threads did not finish")
+    status = 1
+
+if status == 0:
+    print("OK: %d threads gave the same output as serial runs" % len(threads))
+
+sys.exit(status)
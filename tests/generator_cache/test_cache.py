@@ -0,0 +1,72 @@
+'''Check that the on-disk cache of generated files is used when the inputs
+are unchanged, and that changing the .options file of an imported file
+causes the file to be generated again.
+
+Usage: test_cache.py path/to/generator descriptor_set.pb
+'''
+
+import sys
+import os
+import shutil
+import tempfile
+
+sys.path.insert(0, sys.argv[1])
+import nanopb_generator
+import google.protobuf.descriptor_pb2 as descriptor
+
+status = 0
+def check(condition, text):
+    global status
+    if condition:
+        print("OK: " + text)
+    else:
+        print("FAILED: " + text)
+        status = 1
+
+# Count how many times the main file is actually parsed
+parsed = []
+parse_file = nanopb_generator.parse_file
+def counting_parse_file(filename, fdesc, options):
+    if filename == 'cache_main.proto':
+        parsed.append(filename)
+    return parse_file(filename, fdesc, options)
+nanopb_generator.parse_file = counting_parse_file
+
+fdescs = descriptor.FileDescriptorSet.FromString(open(sys.argv[2], 'rb').read())
+
+tmpdir = tempfile.mkdtemp()
+cachedir = os.path.join(tmpdir, 'cache')
+depoptions = os.path.join(tmpdir, 'cache_dep.options')
+options = ['-T', '-I', tmpdir, '--cache-dir', cachedir]
+
+def run():
+    del parsed[:]
+    output = nanopb_generator.generate(fdescs, options, ['cache_main.proto'])
+    return output['cache_main.pb.h'], len(parsed)
+
+try:
+    with open(depoptions, 'w') as f:
+        f.write('Dependency.text max_size:16\n')
+
+    header1, count = run()
+    check(count == 1, "first run generates the file")
+    check('#define Main_size' in header1, "size of the message is known")
+    check(len(os.listdir(cachedir)) == 1, "result is stored in cache")
+
+    header2, count = run()
+    check(count == 0, "second run is a cache hit")
+    check(header2 == header1, "cached output is the same")
+
+    with open(depoptions, 'w') as f:
+        f.write('Dependency.text max_size:32\n')
+
+    header3, count = run()
+    check(count == 1, "changed options of an imported file cause a cache miss")
+    check(header3 != header1, "output reflects the changed options")
+    check(header3 == nanopb_generator.generate(fdescs, ['-T', '-I', tmpdir])['cache_main.pb.h'],
+          "output is the same as without cache")
+    check(len(os.listdir(cachedir)) == 2, "new result is stored in cache")
+finally:
+    shutil.rmtree(tmpdir)
+
+sys.exit(status)
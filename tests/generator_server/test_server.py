@@ -0,0 +1,81 @@
+'''Start the generator server on a temporary socket, and check that it
+gives the same response to a plugin request as processing the request
+in-process. Also check the exit status and error messages that the server
+sends back when the generator exits.
+
+Usage: test_server.py path/to/generator descriptor_set.pb
+'''
+
+import sys
+import os
+import signal
+import shutil
+import tempfile
+import time
+
+sys.path.insert(0, sys.argv[1])
+import nanopb_generator
+import nanopb_server
+import google.protobuf.compiler.plugin_pb2 as plugin_pb2
+import google.protobuf.descriptor_pb2 as descriptor
+
+status = 0
+def check(condition, text):
+    global status
+    if condition:
+        print("OK: " + text)
+    else:
+        print("FAILED: " + text)
+        status = 1
+
+fdescs = descriptor.FileDescriptorSet.FromString(open(sys.argv[2], 'rb').read()).file
+request = plugin_pb2.CodeGeneratorRequest()
+request.file_to_generate.append('server.proto')
+request.proto_file.extend(fdescs)
+request.parameter = '-T'
+data = request.SerializeToString()
+
+expected = nanopb_generator.process_plugin_request(data)
+
+# Requests that make the generator exit
+process_plugin_request = nanopb_generator.process_plugin_request
+def exiting_request(data):
+    if data.startswith(b'exit '):
+        code = data[5:].decode('ascii')
+        sys.exit(int(code) if code.lstrip('-').isdigit() else code)
+    return process_plugin_request(data)
+nanopb_generator.process_plugin_request = exiting_request
+
+tmpdir = tempfile.mkdtemp()
+socket_path = os.path.join(tmpdir, 'nanopb.sock')
+pid = os.fork()
+if pid == 0:
+    sys.stderr = open(os.devnull, 'w')
+    try:
+        nanopb_server.serve(socket_path)
+    finally:
+        os._exit(0)
+
+try:
+    for i in range(100):
+        if os.path.exists(socket_path):
+            break
+        time.sleep(0.05)
+
+    result = nanopb_server.forward_request(socket_path, data)
+    check(result is not None, "server responds")
+    check(result[0] == 0, "exit status is 0")
+    check(result[2] == expected, "response is the same as in-process")
+
+    result = nanopb_server.forward_request(socket_path, b'exit -1')
+    check(result[0] == 255, "negative exit code is sent as 255")
+
+    result = nanopb_server.forward_request(socket_path, b'exit Invalid options')
+    check(result[0] == 1, "exit with message gives status 1")
+    check(result[1] == 'Invalid options\n', "exit message is written to stderr")
+finally:
+    os.kill(pid, signal.SIGTERM)
+    os.waitpid(pid, 0)
+    shutil.rmtree(tmpdir)
+
+sys.exit(status)
@@ -0,0 +1,69 @@
+/* Check that reordering the struct members reduces the struct size,
+ * but does not change the encoding. */
+
+#include <stdio.h>
+#include <string.h>
+#include <stddef.h>
+#include <pb_encode.h>
+#include <pb_decode.h>
+#include "padding.pb.h"
+#include "unittests.h"
+
+int main()
+{
+    int status = 0;
+
+    COMMENT("Test struct layout");
+    {
+        TEST(sizeof(Mixed) < sizeof(Reference));
+        TEST(offsetof(Mixed, ratio) < offsetof(Mixed, flag));
+        TEST(offsetof(Mixed, big) < offsetof(Mixed, small));
+    }
+
+    COMMENT("Test initializers");
+    {
+        Mixed mixed = Mixed_init_default;
+        TEST(!mixed.flag && mixed.ratio == 0 && mixed.small == 0);
+        TEST(mixed.values_count == 0 && !mixed.has_count);
+    }
+
+    COMMENT("Test encoding and decoding");
+    {
+        Mixed mixed = Mixed_init_zero;
+        Reference reference = Reference_init_zero;
+        uint8_t buffer1[64], buffer2[64];
+        pb_ostream_t ostream1 = pb_ostream_from_buffer(buffer1, sizeof(buffer1));
+        pb_ostream_t ostream2 = pb_ostream_from_buffer(buffer2, sizeof(buffer2));
+        pb_istream_t istream;
+
+        mixed.flag = reference.flag = true;
+        mixed.ratio = reference.ratio = 0.5;
+        mixed.small = reference.small = 200;
+        mixed.big = reference.big = -123456789;
+        strcpy(mixed.name, "abc");
+        strcpy(reference.name, "abc");
+        mixed.values_count = reference.values_count = 2;
+        mixed.values[0] = reference.values[0] = 1;
+        mixed.values[1] = reference.values[1] = -1;
+        mixed.has_count = reference.has_count = true;
+        mixed.count = reference.count = 42;
+
+        TEST(pb_encode(&ostream1, Mixed_fields, &mixed));
+        TEST(pb_encode(&ostream2, Reference_fields, &reference));
+        TEST(ostream1.bytes_written == ostream2.bytes_written);
+        TEST(memcmp(buffer1, buffer2, ostream1.bytes_written) == 0);
+
+        memset(&mixed, 0, sizeof(mixed));
+        istream = pb_istream_from_buffer(buffer2, ostream2.bytes_written);
+        TEST(pb_decode(&istream, Mixed_fields, &mixed));
+        TEST(mixed.flag && mixed.ratio == 0.5 && mixed.small == 200);
+        TEST(mixed.big == -123456789 && strcmp(mixed.name, "abc") == 0);
+        TEST(mixed.values_count == 2 && mixed.values[1] == -1);
+        TEST(mixed.has_count && mixed.count == 42);
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
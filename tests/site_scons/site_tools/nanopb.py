@@ -26,6 +26,11 @@ defined manually:
 
 env.SetDefault(PROTOC = "path/to/protoc")
 env.SetDefault(PROTOCFLAGS = "--plugin=protoc-gen-nanopb=path/to/protoc-gen-nanopb")
+
+The command for running the generator directly, without protoc, can be
+defined in the same way:
+
+env.SetDefault(NANOPB_GENERATOR = "python path/to/nanopb_generator.py")
 '''
 
 import SCons.Action
@@ -33,6 +38,7 @@ import SCons.Builder
 import SCons.Util
 from SCons.Script import Dir, File
 import os.path
+import sys
 
 class NanopbWarning(SCons.Warnings.Warning):
     pass
@@ -90,6 +96,21 @@ def _detect_protocflags(env):
     else:
         return e('--plugin=protoc-gen-nanopb=' + os.path.join(n, 'generator', 'protoc-gen-nanopb'))
 
+def _detect_nanopb_generator(env):
+    '''Find the command for running the generator directly.'''
+    if env.has_key('NANOPB_GENERATOR'):
+        return env['NANOPB_GENERATOR']
+
+    n = _detect_nanopb(env)
+    p1 = os.path.join(n, 'generator-bin', 'nanopb_generator' + env['PROGSUFFIX'])
+    if os.path.exists(p1):
+        # Use generator bundled with binary package
+        return env['ESCAPE'](p1)
+
+    # Use the same Python interpreter that runs SCons
+    e = env['ESCAPE']
+    return e(sys.executable) + ' ' + e(os.path.join(n, 'generator', 'nanopb_generator.py'))
+
 def _nanopb_proto_actions(source, target, env, for_signature):
     esc = env['ESCAPE']
 
@@ -132,6 +153,7 @@ def generate(env):
     env['NANOPB'] = _detect_nanopb(env)
     env['PROTOC'] = _detect_protoc(env)
     env['PROTOCFLAGS'] = _detect_protocflags(env)
+    env['NANOPB_GENERATOR'] = _detect_nanopb_generator(env)
     env.SetDefault(NANOPBFLAGS = '')
     
     env.SetDefault(PROTOCPATH = [".", os.path.join(env['NANOPB'], 'generator', 'proto')])
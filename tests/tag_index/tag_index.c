@@ -0,0 +1,81 @@
+/* Check field lookups through the tag lookup table of a message with
+ * sparse tags, and decoding of fields that arrive out of order. */
+
+#include <stdio.h>
+#include <string.h>
+#include <pb_encode.h>
+#include <pb_decode.h>
+#include <pb_common.h>
+#include "sparse.pb.h"
+#include "unittests.h"
+
+int main()
+{
+    int status = 0;
+
+    COMMENT("Test table layout");
+    {
+        TEST(Inner_msg.tag_index == NULL);
+        TEST(Sparse_msg.tag_index != NULL);
+        TEST(Sparse_msg.tag_index->first_tag == 0);
+        TEST(Sparse_msg.tag_index->count == 6);
+    }
+
+    COMMENT("Test pb_field_iter_find()");
+    {
+        Sparse msg = Sparse_init_zero;
+        pb_field_iter_t iter;
+
+        TEST(pb_field_iter_begin(&iter, Sparse_fields, &msg));
+        TEST(pb_field_iter_find(&iter, 3000) && iter.tag == 3000);
+        TEST(iter.pField == &msg.choice.choice_int);
+        TEST(pb_field_iter_find(&iter, 100) && iter.tag == 100);
+        TEST(iter.pField == &msg.inner && iter.submsg_desc == Inner_fields);
+        TEST(pb_field_iter_find(&iter, 2000) && iter.tag == 2000);
+        TEST(iter.submsg_desc == Inner_fields);
+        TEST(pb_field_iter_find(&iter, 1000) && iter.tag == 1000);
+        TEST(iter.pField == msg.name && iter.required_field_index == 1);
+        TEST(!pb_field_iter_find(&iter, 999) && iter.tag == 1000);
+        TEST(pb_field_iter_find(&iter, 4000) && iter.pField == &msg.last);
+        TEST(pb_field_iter_find(&iter, 1) && iter.pField == &msg.first);
+    }
+
+    COMMENT("Test decoding fields in reverse order");
+    {
+        uint8_t buffer[64];
+        size_t len;
+        pb_ostream_t ostream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+        pb_istream_t istream;
+        Sparse msg = Sparse_init_zero;
+
+        /* Encode the fields with the highest tags first */
+        TEST(pb_encode_tag(&ostream, PB_WT_VARINT, 4000));
+        TEST(pb_encode_varint(&ostream, 44));
+        TEST(pb_encode_tag(&ostream, PB_WT_VARINT, 3000));
+        TEST(pb_encode_varint(&ostream, 33));
+        TEST(pb_encode_tag(&ostream, PB_WT_STRING, 1000));
+        TEST(pb_encode_string(&ostream, (const pb_byte_t*)"abc", 3));
+        TEST(pb_encode_tag(&ostream, PB_WT_STRING, 100));
+        TEST(pb_encode_string(&ostream, (const pb_byte_t*)"\x08\x0b", 2));
+        TEST(pb_encode_tag(&ostream, PB_WT_VARINT, 1));
+        TEST(pb_encode_varint(&ostream, 1));
+        len = ostream.bytes_written;
+
+        istream = pb_istream_from_buffer(buffer, len);
+        TEST(pb_decode(&istream, Sparse_fields, &msg));
+        TEST(msg.last == 44 && msg.has_last);
+        TEST(msg.which_choice == Sparse_choice_int_tag && msg.choice.choice_int == 33);
+        TEST(strcmp(msg.name, "abc") == 0);
+        TEST(msg.has_inner && msg.inner.value == 11);
+        TEST(msg.first == 1);
+
+        /* Missing required field is still detected */
+        istream = pb_istream_from_buffer(buffer, len - 2);
+        TEST(!pb_decode(&istream, Sparse_fields, &msg));
+    }
+
+    if (status != 0)
+        fprintf(stdout, "\n\nSome tests FAILED!\n");
+
+    return status;
+}
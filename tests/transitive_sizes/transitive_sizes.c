@@ -0,0 +1,29 @@
+/* Encode a message of maximum size, using a buffer sized by the
+ * _size define that depends on a message from an indirect import. */
+
+#include <stdio.h>
+#include <pb_encode.h>
+#include "level1.pb.h"
+#include "unittests.h"
+
+int main()
+{
+    int status = 0;
+    uint8_t buffer[Top_size];
+    pb_ostream_t stream = pb_ostream_from_buffer(buffer, sizeof(buffer));
+    Top msg = Top_init_zero;
+    int i;
+
+    msg.middle.leaf.value = -1;
+    msg.middle.leaf.stamp = UINT64_MAX;
+    msg.middle.has_count = true;
+    msg.middle.count = UINT32_MAX;
+    msg.others_count = 3;
+    for (i = 0; i < 3; i++)
+        msg.others[i] = msg.middle;
+
+    TEST(pb_encode(&stream, Top_fields, &msg));
+    TEST(stream.bytes_written == Top_size);
+
+    return status;
+}